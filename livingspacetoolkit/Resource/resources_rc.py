@@ -1,3500 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.1
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x13$\
-(\
-\xb5/\xfd`\xe6\x99\xd5\x98\x00\x9a\xcb\x98.K \xd6\
-2\x0fv\xcf\x90\x1b \xc7\x87\xf5\x81\x0f\xd2\xd8'\x9d\
-\x15\xe6L8\xec\xd8\x19B\xabh\x8b$-\xa2GG\
-\x86&\xc80\x8dC`8c\xc6\xb0\xa6-\xc9\x04\xb2\
-\x88\xee\x1c\xaf'l\xe24\x92\xc0\x96\x94&z\x1eF\
-\xd8\x7f\x19\x92\xc5\x10\xfb\xafS\xd1\x02\xce\x02\xd6\x02t\
-\x15j\x7f\xe6\xc3~\x07/\xfb\x1c\xbc\xfbD>\xaf\x13\
-\xb9@\xca\x8f qr)+\xc1\x1bi\xd2\xe4B>\
-\xea<e\xe1\x06\xe4\xbaA$\xe4\xfa;G\xa1\xb5`\
-\xf4?|\xd3\xf7\xe8U/\xf4\x9b\xda\xb6\xa0\xfd#$\
-\xf6eB2\x7f\x96\x96\x98\xf7\x1bl~g\xc4\xde\x16\
-\xa4\xaf!\x18\xc9u\x00O\x9eP\x8b\x8aI\x9cn\x8e\
-\x8cUYj\xe7\x95\x9d\xef-\x89Ik\xe4H\xf6z\
-\x8e\x1e\xda9\xe2\x95\x02\xdb\x90\xe9\xa2\x88\xe4\xa4L-\
-\xe6:\xeeX\xa5\xa2\xb1\xf5\x94\x05\xc4I\xd3\x18I4\
-\x08B\xbcD\xe8\x94\x185\xe2\x86\xdb\xbb\xad\xbc@\xad\
-\xe7\x8c\xd9\xbb\xb5\xfd\x97\xb6Z\xd5\x9a\xa8\xbc`\xda\x08\
-\x19\xa6\xe5\xa7]bN\x8d\x86\xd2\xeb\x8c\xd7\xdf\x866\
-\x8e\xc6\x86\xe5\x86U\x9f\xff\xad\x02\xb3 H\x80x\x81\
-\xcb\xbb\xf3\x94\xbe\xcep\x8b\x99.\x80\x90\x9c\xb4F3\
-%\x0c\xe6\xdc\x80J70\xb1\xbe\x1d\x05\xa5\x94\x82 \
-\xb3\x98\xd8\xd1\xf5\xb5\xaa\x84K\xf4b\x8a\x9f\xaa\xda\xa5\
-\x1dpJ\x12\xb7\x9f\xd6\xb5&\x03\x1b\xa1E\xba\x9f\x94\
-v\x02\x1a\x93\x11\x10\xdc\xb8I\xed\xc0\xa5\xa50\x86\xc8\
-[(\xa0\xa0\xe0-7\xc8<\x5c\xbc\xfe&\xdf\xba\xe3\
-\x97\x95\xf6[\xa6h\x85\x9eZ)\xa3a\xd3\x89\x97x\
-\xdf\xa5\xa9\xf6\x9b-\xa3\x22\xb3\xbd\x1d\x11\x95+\xe0\x84\
-\xf6a$\xb6\xae\xef\xca\xf6u\xc6/\x1cv\xf2U\xc8\
-\x8d\xad\x88\x8c\xa4Lk?,7\xb6`\x16\xfa\xb4\x93\
-\xa3\xa3N\xa3\xd9\x19\xc3GW\xb5\xb3\xd9\x90-\x0fv\
-\xf2\xfd\x1c\xaeh\xbd-\xe8|\x89\xd5\xc3\xc4i\xd8n\
-\x96\xe6\x96\x92\xd5\xd6'\x8e[#\xb0\xecUF\x97d\
-$;\x1dFwE\xea\x0d\xb0\xfc,\x1e\x0d\x95<o\
-_\xc4OP\x8e=\x0b\xc4f\xd8\xd1L;6\xa2\x94\
-J\x15\xe2\x8aS;\xb6\xd9~\x81\xe6\xebJ\xee\x80]\
-\x07(IJi\x03 B\x04+\x87Q\xb2*f\xeb\
--\xd1\x0c\xf5\x94\xd8(\xf4.\x8e\xbe\x1e\xa6\xb1B\xd4\
-z\xce\x10r\xbc\xc4-\x00`\x18I\x1b\x01n\x9eJ\
-\x02\x13\x9f\xd6\x22\xa6\xab\xb2\x1aPYf\x1b\xda\x7f\x89\
-\xd4\xe7\xdeY\xfa\xb4o\xc2\xe7]\xdaz\x1c]\xbd;\
-S\xcblB\xbb\xcc\x95k1\x1d\xb1NR\xfb9k\
-\xdcp\x89\xd4p\x7fV5fs\xf5\xd6\x11\xa1-\xbc\
-t\x95\xcd\x0d\xb8\xbc\x8e\xc6\x1e.\x82=g\x0c+^\
-\x8f\x9b\xa7\xd2\xe3\xe4\xe9a\xfa\x8a\xbd>w\xfc\xfa\x0e\
-\xf9E\xe6\x06\xbdZ\xb0\x0d\x9f-\xb8\xf3]}}[\
-5\xdc\xb9Z\x03\xc8\x5c\xed9T\xcd\xa6\xb4\x04\x0a\xae\
-i\x09\xc5\x06\xbc\xa1\xd0\x82V\xda\x90Y\xe3\x82[4\
-\xec\x82YE\xe8\x86V7\x18\x09\xb1\xa6\xf0\x8f\x0b\x0a\
-\x11\x13\x0am\xd6\x82B\x1bB\xa1\xc0F(\x0e\xc7\xcb\
-\xc0\x00#\xa3\xd1\x01\xa4$\x92\x03\x96\x92\xc9\xf6\xd6\xc2\
-\xe3BR\x02\x04\xda\xf6\xbe\xa1\x9d\xd1\x12I\xf2\xb4m\
-<\x9a\xb2\xc2\x9a\x00\x1eLQt\xb0\x09\x9bT\x00\xe0\
-x\x8b\xdc5Mc\x0b\xd6g\xe6{\x09*\x107 \
-\x93z\xbf\xb1\x01\x9b\x01\xdcxX%\x149I\xbds\
-UL\x88g\xa5\xa2\xd5\x11#\xe1\x80Vv\x11k4\
-\x1bBy\xd4b\xeb\xb0\xb6\xefW\xab`[\xaexm\
-\xb2\x09\x9d>p@\xa2<q\x03b\xd9:x\xd4\xdf\
-SF\xb7s\x93\xa3lrCeQ\x90\x9f\x94\x0a\x1d\
-:\xe2&\x91\xb0\xeb8c\xdc\xb3\xe6\xe0\x85]\x87\x10\
-\xe89\xb8zO\x07\x0c\xcf\xd7M\x86\xf6@AU\x81\
-\x87\xf7w\xc8\xb0\xdbh\xb1}\xa2_\xf4\xb3\xb8\xfe-\
-\xd8|\xd1\xbc\xfcM\xae\xcfCV\xb9\x95\x14\xfdl\x96\
-\xd2\xabY\x8e\xce\x81r\xe8Cl\x81\xa1;fm \
-H\xa9\x8e!\xf2\x95\x11/\xf4KE\xbc>'\xa9\xca\
-r\x0d\x9a,\xf9\x97\xeb\xd1s\x08!\x82\xf3\xa0\xc5\x83\
-\x18\xb73&\x85\xf6?A\xccX\x1d:b\xda\xcb\x09\
-\xd3\x85\x8b\xcf\xd7p\xe9\xb2\x86\x84w\xbe\xd3X\xb54\
-Xk1\xf4?%Y\xbf\xa0\x8a\x06\x8f2%\xca\xa7\
-Tyr\xab(\x0d\xae\xa4\xba\xe0\xca,\xc7+\xad\xe4\
-cE\xf5\xae%5\xe4\xcb(\xa7/\xad\xf0\xce\x05\xe5\
-\xfbS\x0a\xf8:\xeaw&\x14\xef\xcf)\xdd\xadYz\
-\xbcL\x95\xc6\x8f\x10\xe1\x81\x05\xcef\x84\x14+Z\xbc\
-\x8d\x1b28c=g\x02\x0e\x9c/='\xf3\x82B\
-\x85\x11\xbb\xd9n\x93\xae\xdc\xbcm\x9e\x16\xf9\xf8E{\
-\xd4\x079I\x9b\xac\xd7\xe1t\xfd\x8e\xde\x0e\x1e@M\
-\xbd\xaf\xf3\xe0\xc1\xbb>\xa8i\xfaYoy\xa5\xe3\xd5\
-\x83\x15\x5c\xbdh\x01\xd5\x8bOT\xa8\x9c\xf8\xc4\xe4\xf3\
-\x13\x92;a\x82\xbc\x16\xe7\xee5Ly\x9c\x06\xab\x8c\
-\x9b\xb1Bp3R\x08\xde\x03X\x8c\xab\x19kq'\
-\xc6\xda\xdb\x19\xe3y\x9d8`\xda\xb3Qc\xe4\x95\xbd\
-x\xda\xb74\x80\x868y\xd1\x8fK\x18=\x11P\xea\
-\x93\xfe\xc7\x8f*\x14C\x1f\x14\xfb\xa2\x87{\xd0\x17\x09\
-\x9b\xbf\x01\xed\xbf\xbd\xae\xfb\x92Q\x1e\x85\xa5\x82?\xad\
-\x96~G\x05\xb9]%\xe4#\xd4>~\x04\x17\x02\xbe\
-\xf8\xdc\x8d\x97\xf6p\xbc\xf8<\x0e\x09)\xfe\xe6\x0b\xcf\
-\xdf\xfc,\xc1e\xc5\x8fl\xc3\xa9\x09\x99;\x86zP\
-\xed\x8a\x193\x90\xd1\x1a/\xeb\xb9#X\xed\xd2\xec\xd7\
-\x84Pi\xf5;\x9a\xb2\xdf\xe1\x04v\x5c\x90y\xda\x82\
-*G*arc\x92%\xc7\xf2$~\x0aT\xa2\x9f\
-\x01c\xe08\x5c\x1dx\x11b\x07<N\x13a\xda\xcf\
-\x09\xc3\xf35$\xa0\xb8\x1a.*N6\x86\xca\xf1@\
-0\x12L\x0bLT\xa6xzz\xca\xc5Zip\xb3\
-\xd4\x16\xdb\x1f\xf2\xdd\xf7\x11D\x14\xdf\xb6a}7\xae\
-\x7f<\x12\xe5\xcd\xaa\xf8U\xab\xf7[\xbc~\xbc\x08/\
-0^\xa7K\x8a\xd3A\xa1\xbd\x14+\xc4\xf7p\xc2\xca\
-\xd18/\xf1f\x02BW\xb5Z\xe0\xe1\xf3p\x1fs\
-\x95\xe0ECg\x19\x8e\x8e\x0a\x85\x10\x9bL%J\xae\
-p\xb0\xf9\xb7\x88uj\xbd\xf0\x81\xeeIF\xb2t\x99\
-\xc2\xad\x99\xac\x8d\xd3\xe6\xfa02[\xdd\xc9\xd16\x01\
-\x9e,\xe6\x84lWI\x19\xcf&\x8cO\xcfc\x10\xe3\
-q%$W\xd0o\xfa\x9a*x8\x5cl\x10\x8b\xe0\
-5\xf9\xcdM\x18\xcdQ\x14C\xa3\xcczT\xbf\xcdR\
-\xa1\xd7\x83\x86\x5c\x9f5E\xe4n\xc0\xac\x88!L\xc7\
-\x97\x90J\x22\xe0\xf3L\xc8'7\x02\x04\x16=q\xc6\
-\xda/\xb3\x14?d\xb4N\xb9\xc3.\x9e\xf6\xed\x19\xda\
-\xaf\x0b\xca\xbc\x90\xaf\xfa.\xaa\x22\x8a4e\xb28\x9e\
-\x94d\x1e\x08H\xfd\x1b|^\x08\x18\xfd\xd5\x14\xdf\x1b\
-0m\x8b6\x5czN\xa7\x84\xf6)\xd8@\xdf\x0d\xbd\
->\x8b\xa7E>ekc\x1a\xd6H\xe4\x88\xd2[I\
-=S\xaa\xc8\xe5\xd0 f\xe3J\xc9\xae\xa0&\xea\xaf\
-<)\x1e\x07\x0e\x1ah\x1f\xe7K\xfb\xe2\xd5\xad\xa3\x0b\
-9.O\xf4\x93\x92)\xb9\xbc*mT\xed\x07\xbd\xee\
-(V\xdb\xd0sE\x0d\x0fgl\xc5\xdb\xa4aAF\
-\xe9\xd8\xbc\x0f\xdb\xfa D\xaaN\x81\x92%?\x92\xa4\
-\xc9\x8b\x5c`\xe53\xa0\xf4\xb3\xdf]\xdb\x96HHH\
-_4\xa0\xd7_:[O\x8f5\xd5t&\xc6P\x9c\
-\x0d\x17\x01\xca\x84\xdd8\x13\x11-!\x1fu\x1a\xc5\x15\
-\xb3\xb7P\xafn\x81\xde_\xd5\x13\xb8:J}\x16\x16\
-\xa6\x1e56pp\xe3\xbc\x22\x5c\xae;\x8c&\x81\x1b\
-6\x89\xde\x99\xaaG-\xe8u!'\xe9\xb7\xa2\x84\x9c\
-\x0cL\x0f\x0b\x16f\xb4\xe0\xf8\x90\xe4\xd5\x83z\xc7,\
-\x8f6|\xe2vGg\xec\xcc\xde9\xe5t8mX\
-\xe4\xf0e\xe3C\x90\xcc\xacsHc\x9bl@\x18r\
-C\xacg\xf3B?\xe8\xa7S\xc0\xcbi\xc1\x84\x0e`\
-3\xeeTDY\xado\xc4\xe9\x187\xc8\xe5Cn~\
-\xbaE\xc1\xe7\x87x\xf5\xa3UBR\xc8\xd9\x01\xac\xc6\
-\x9b\x92\xca\xf7h#@\xd1\x12\xd4\x19Z\xb0\xe6\xfa\x13\
-\xea(\x8d\x0eb\x0f\xfcg\xe4\xfar\xde\xec\x17\xc5\xd2\
-\xe6\xa1U9\x15-~\xe2\xe4\xa0\x85\xc6\x81I-k\
-\xcf\x0e\xb4a\x17-\xbe\xbdn\xc7\x11\xe3\xe3\xa2\x85\x12\
-\x0b\x1cX\xe4\xaa\xbe\xcd\x94\x84Q\xda\xd8\x84\xcbgQ\
-0\xfa\xa1 \xd0K\xa9t<.X\xfc\xa0e\xc6}\
-D\xac\xb0H\x9a`\xa2M\x14\x94~\xa8\x89\xeb\xd3+\
-\xb7\xcf\x11\xd3\x02\xf03\xc2X{ \xc0\x0e\xb8\x10I\
-u \xdf\xf0\x86s\x13:\x81\x94~UMt\xb4\xd6\
-q4\xb4\xe6\xfa\x96\xc7N\xb9\x9f\xf3#\xc7\x870\x07\
-\x1e4B\x1d\xa8g\xb5\xad6\x08B/\x0f?\xef\xa3\
-W\xbd\xf2\xcaoM\x1a\x04\x0e\x9c\xa3\xee\xa3\x89\x8e-\
-\xd8\x84\x95\x80ZE\x9c\x8eXwrs\xcd\x9b>k\
-u{\x13b\xda9=|\xc1\xf8/y\xe53\xe0\xb4\
-\x16l\x0e\xc1<( %y\x8a\x9a%\xe4\xa0\xd0\x1e\
-\xcb\x15\xe2\x039,e?w^\xa0\xb9\x93\xab\x83\xe6\
-\xc7\x07\xeaG\x85\x17hd\x90\xe5\xea`)\xbb\xc3\xd3\
-\xfa\xfc\xbcPAF\x0eKY{\x87\xa7\xf5y\x81F\
-\x06Y\xaeN{\x87\xa7\xfdQA\x06\xd9O\xdb\xde\xc1\
-R\x06u\x06vB\xa8\x84\xd5\x98\xfd\xaa\xbe\x19p\xca\
-\x04[\xdc\xe5\xb4\xb9\xb6\xf8\xf9B\x09o\xec5\xd7p\
-\x7f\xcf\x1a\xee\x5cu\xa0)I\xa5%\xda\x09a\x92\xa4\
-\xa8\xe7t\xb2;^\x95\xc8\x09\xb3\xca\xcaj?h\x15\
-\x9e\xab\xd0\xb2\x22\xe1\xb3\xcc&?\xd7\xe4\xe4\xad*H\
-E\xaaI\x8c\x8a\xd7!\xa2#&\xad\x8a8\x8e\x19\xd8\
-\x1d\xc1f\xdd~V\xf7\x1a\x1bp\x0b+\x16\xbd+\xbc\
-m[\x8e^\x97\x04Sc\x8b\xbd\xc6\xc0\xb3u\xcb\x05\
-Z1P\x8b\xb1>[\xe2\xb8uQ,\x16\x93B\x8e\
-W\x12\xe0\xd9I\xc7%\xdaw\xe7\xfb\x95\xa5\xf5;O\
-\xaf\xa3\xbfn\xc1{\x8b.X'wB(\x02\xbd\xa2\
-\x93v\x80 xI\x06\xae\xf0\x8a\x8c\x8e\x9e\x1e\x09\x09\
-\x06\xfd\xcex5\xa3\x9b\xef(\x9dpY@R\xdc\xd5\
-\x0e\x00\x07!i#\x19K\x04\xcd\xa7\xbc\xcd\xba\xe6\x16\
-\x5c\x1e9*\xde1\xe8\xa7)\xad\x11\xc8|\x15\x03.\
-\xae\xaf;\x86\xdd%\xceP\x1c`\xb9f\x02\xf1d\xad\
-\xaa\xdc\xec\xb45\xf1\x12\xafP\x9c\xb0\x06\xfaa\xe4\xa4\
-\x05\xe2\x83I\xb9\x04\x0c\x1b\xaf\xd0\xbf\xb4U\xcd-h\
-\xc79\xe1\xb3\xd7\x93B\xb5#F\xe7\xd4\xc4i\xd9;\
-C\xa3\x0c1\x02\x16\xc3\xf7T\xd5&`\xc4\x93\xca\x80\
-\x03:\xb1I\x14\x80\x99I*Fq\xdcx\xcb\x16\x86\
-\xfc$\xe6\xc2\x8eH\xcd\xd6\xba\x22\xb6\x87\x9cl\xa5\x01\
-\x84\xa4\xd5\x00\xd0\x12T\x19W(\xfd\xee\xf8\x95\xa3\xa9\
-;\xd4\x827\x8e[\xbcl\x15\xd0\x01C\x95\xf9\xe1\xb4\
-\xbc[\xc3\xc5+\x10\xb7\xe1m\xa3\x16w\xb5\x0a\xcc\x90\
-[\xca\xd4\xae.\x91\xea\x94\xa0\xe7\x8c\x81\xa8\x0e\xc2\x95\
-\xa1\xed\x02\xb7a\x93\x0c\xad\x88\xe5\x01G\xbcq(\xd1\
-X1\xbc\xbe.\xac\x91\xd1\xca\x83N\xc8Ul\x85?\
-\x96\xa2~\x9b\xa1\xc7k\xb2M\x022\xdfd\xaeL\xb5\
-\x93+N\x7f6\xd9\x0a\x86\x87\xc8\xd5f^\xa1\xd7\x8f\
-\x8d\xa5\xa5\xf6JMx\x9f\x16\xbco\xc3\x15\xb1\xcf\x97\
-\xb6[\x1aH\xc5\xa948y\xc6\xa3iz\x9a\x8f\xeb\
-\xb8X\xcb\x95\xaay\x89R\x08v\xc2\xacv\x05\x12\x0a\
-\x8a\x05\x98\xe6:\x5c\xcc\xde\xfeP|\xbd\x5c\x81\x95g\
-\xaft\x07\xb3\x8c\xe0a\xea\x19\x17\xa1\x8bv,T,\
-\xf8\x0ch\xbf\xf6\x8b\x16\xb1)\xd4\x80Y+`\xe4\x8c\
-v)G\x8cz\x0e)\xfd-\x08ug\xb1\xf3P\xac\
-d\xf0$D@\xe0t\xe8\xc8\x11\xa3\xe2R\xab \xd6\
-\xa1}\x9c|\xc7BLWZ2.\x1c\xd7D1\xf4\
-:\xba\xf93u\xbc\xf0\xfcpA\xd1\x1e\xc9\x92\x22\x1f\
-\xfaI\xabgj\xbde\xfb\xd3\xc9K:0\xfd\xfc+\
-d~)\xe9t\x85~\xf7\xabHA\x9eM\x17\x15_\
-3\xc6\x13\x83/\xa8R2\x11c\xca0\xc5P\xc9\x88\
-&\x05I:\xf2a\x9cA\x18\x88\xe1QM%\x1f\x22\
-B\xa6\xc1\x18\x06!\x02B\x08\x12\x1cB\x04\x88\x10\x22\
- \x02B\x04\x84\x08\x08!\x04\x11\xa4\x9c\xd6\x185X\
-l\x8b\x96\xebC1W\xd0T@\xac\x97gB\xfa\x89\
-\xe8{\x1ed\xc8\xa3\x9d%\xf6I\xdc(A\xc0S\xb4\
-5CQ27\x1f`\xa7\x0bq\xb6>\xab\xf9\xe0\xdd\
-T#\xcd\xbc\x9f\x81p\x8do&\xa5A\x0e\x1e7\x8f\
-&\xa3\xbb\xf6\xd23\x19'=[}\xe2\xd3\xdc}3\
-\xee\x1c\x9e\xa4\xdc\xc7\xff\x7fi\x00\xfe\xec\xe7r\x1dO\
-\x17.F\xb2\xda\xae2)\xb3\xafb.}\xb4\x5c\xaf\
-\xf7\x19\xed#\x80u\xc4\x95\x8fe\x01q\xdc\xac#\xe6\
-9\x9cC\xc9\xb3\xc4\x8f\xffy\xff\x0f\x06\xeb\x85\xf7k\
-8\x15\xcb\x82B)\x1eL\xb2\xecF\xb8\x81\x90\xbd[\
-~\x09m9\x87\x17\xc6\xaf2\xd6\xd54m{\xc8(\
-\x1a\x0af\xc1\x9dW\xe3s\x7f\xe8\x7f\x86\x9ctOx\
-\xb9\xfa\xbd'\x14\x87\x00%\xedW\xe1\xe9\xc7\xda\xc8\xce\
-\xfbL\x84;\xc5\xc4\x87l\xf3\x14\xe0T\x8a\x01w\xea\
-g\x97\x8d\xdf\x1eB\x1b\xd4F\xccL\xc5\xa3\xa3\xb9\xe9\
-5o.\x1a\x0f\x8e\xb8\xf9\x82\xecc9\xf8]\xf4\xe1\
-\x94\x8a\x90\x09\xfb\x89\xf1\xfd\x87\x9c\xd3P\x86\xf1 }\
-\xc5\xf2\x08\x08\xb3_\xbd\xbc\xbc\x8b\x99\x8b\x1b\xb5~\x8f\
-\xf0W\xeb\xc2\xb5\x88w\xe6\xce=\xe9u\xcd\xf6\xd2\xca\
-\xfc\x18(\x0c8\x94\xd1P\xa3\xec\xbeaX\xf2\xcc\xba\
-\x0a'p\x91/\x9d\x9f\xbf}\xff\x8c\xc9\x86!P\x8d\
-4\xf2`SH\x87\xb8\xf7\xca\xf8\x14\x02t0kS\
-\x09\xefua\x1ecM\xfc\xe92\x87\xda0\xc4\x8d\x07\
-qg\xf7!\x06B\xd4\xbf\xf4\xbe\xc1?1\x7f\xb1l\
-U\xb3ey\xc1\xa5\xc3\x9f\xae\xf6OT\x86=\xdc\x9b\
-\x8a\xca\x04\x08<^Nk\x9e\xf3\x85q\xa7\x01\xb2]\
-\x87\xc4\x9c\x0d\xab{\x9d\xc3\xe1\x92\xc5};\x88\x89D\
-G\x90H\x13WM\x13yh\xfaTc\x13 \xbf!\
-\xf8i\x1c^\xf9\x9cul'\xb3\x96\x17K\xce\xda\x18\
-c\xdc7\xa0\xc42f\x0dK\xc4\x9f\xf7P\x96\x06\xe9\
-H\x89\x8eu\x0f8\x1dY\x14;\x11\x00 \xc9\xe9\xaf\
-\x89\xecB\xe2\xdf\xca\x06\x7f'\x9b\xe0\x19;\xbeP\xcf\
-p\x0b\xd7\xc4\x01\x8a\x89\x05)\x8a\x1d\xbc\x0a\xfd$\xde\
-x$`\xf4\x99\xd7\x1f5[\xbd\xf9\x9b\xb2t\xfeR\
-\xc9E\x8d\x0d\xa6\x075\xdd\x13\x86\x15\xb3\x1c$\x01\xcb\
- \xd2_\x90\xd4\x1f\xbe\xcc\x9e\xd4&R\xa4E\xb2V\
-\xeb\xb4\xf0\xf9\x00\x04\xee\xdak\xca$\xaf\xe0\xbe\x8f9\
-\xa7hC\xfc\xc0\xbc4\xef\x18F\x0f\xbd\xf2P\x90\xcc\
-\x93-J\x87\xc9 \x85\x19P\xb2\xb9\x07\xa7\xf6=[\
-\xac\xedJ\xf5\xab\x82_\xa2\xd9\x1d8\x94\xbc\xa4\xac\x12\
-\xb6j\x13\x87P\xb8\x8c\x9e$c8\xf2BI\xc5\x0a\
-\xa4\xc1#\xa4/\x0a\x8d8\x0b2_\xe0\x0a\xd6\xf3\x1d\
-\x18<\x97\xae\xe8\x843\x813\x12@9S\xfd\xbb\xcc\
-\xb0\x05\x18\x94o\x13\xac\xc9\xc5\x1c\xe73Y.\x9e\x05\
-\xf7\xa0I\xfe\x0d!<'\xe4\x99\xe6\xd5\xa8\xd8Hf\
-,yys\xa9B7\x01V\xbe\x81\x14\xec\x81Z\xec\
-\x98@;9q\xd1\xe4\xcb\xa1\xf4\x0e\x17>\x09\xf1\x16\
-\xf96\x04\xf3T3\xc6\x91D\xe4@\xf1\xa0\xd1\x06\x93\
-\xce&9\xf9_\xc8v5q\xdc\x1f*T\x8d6\xd4\
-\x7f(\xc0\xf5w\xac7B\xca\xf3\xf2\x5c\x0b1(\xc3\
-\x81\xbdG\xc7\xe0\x8b\xe4\x9b\x10|u\x88'\xc2\x9a\xc6\
-\x88\xea1\xf1A\xc6I\xf3\xd0k\xc0cc\xaeZ\x95\
-p\xed\x19\x10\x146X\x91\xde\xa7\xbe\xb6\xf7\xc6\xb98\
-\x9eN.\x13\xb0\xa0\xfeO\x90\xf4=\x91\x7fj\xac@\
-\x01I\x03\xc4\x1f\x5c\xd3\x8b0\xa8\xf0 \x06\xcc\x9f>\
-I(\xcf\x81\x5c\x97M\xf4l\x83x\xc6\x17{y8\
-\xbe\xfe=f\x84\x84\xa5\xa51u|p\xd5\xe9[j\
-\xeaa'\xf6\x17\xfb=\xfar\x87d\x07+\x8c\xd1\xce\
-\x83\x8f\xb8\x06\x85\xe0\x0cR\xa2r\xde\x15\xffD\xd5'\
-\xfe\x9f'\x81\x03s\x1f\xa7qg\xa4>\x9bc`\xaa\
-\xc1 \x92\xc1\xe2\xfaL\xb4\x0d\xb6\x1c\xd1}\xdb.\x9a\
-\x13\xca\x08j\x10\x00t\x02\xe4&\x9dc\xd0\x8c\xe7\x87\
-\x11\x05\x1aM+\xbfC\x12\x1b\xa4\xc8h\xe4=f\xff\
-\x9b)x$\xaenZ|\xdd\xd1\x81\xca\xda#,\xdf\
-\x13\xe5v\x18\x1f!\x9dM\xa7\x0d\xbe\x13\xcd4q\xa2\
-;f#\x9d\xb6\x91L\xfa>%\xff\x5cF\x06\x04=\
-H\xbd\xd1\xb2A\x7f\xe9\x1a\xf6\xf6\xeby%\x85\x9bl\
-q]\x977\x87H<B\xc2@\xdf\x7f\xa1SD\xc3\
-!\xa4\x9b\xa9KR\x06\xa9\xf2\x08~S;\xe2\xdf\xb2\
-\x91\x0d\x92X\x03\xe7\xfbGN\xac8\xa9\xbf\xd4X\xb8\
-\x0emb\xe9\xc3\xe2c\x11\x81\x0buV\xb5\xfaE=\
-\x98\x9f\xee\xe5\xe2?\xa9\xd8\x87y\x0c\x92\xfb\x824\xd9\
--\xcc\xd9\x1d\xa0\xb3Z\xee\xa7\xd2\xc5\xf2O\xc4m\x0b\
-%s>\xce\x81\x96\x1f\xda\x92\x18\x9f\x00Z\xf7&7\
-,\xfdm\x1a\x81\xa3\x05\xc3\xff\x16\x8ez\xc6\xbb\xfe\x1e\
-Y\xe9\xb8\x0e\x87\x11\xe6\xa3\x8bwA(\xd3\xb90\x9e\
-/\xba\xc3\x18\x9b+\x97\x1b\xeb\xc3\x5cA0v\xe9\xb5\
-\xd5\x86\xd4\xaa\x1c\xa5\xea\xa0\x1c \xc5\xec\x0ecx\x97\
-_\x04\xe4WzT\xcc\x89\xe8\xb8\x0fw\xf3\xbb\xd9l\
-\x85w:\x12\xe0\xfb:\x90\xdeP\x87K\xc3\x83\xe3Y\
-\xe3.Q\xf2\xbdD\xab\x0b\x9b\xd5\x87\xe6<~\xe2>\
-\x8f\xa7\xe69Xo\xb5\xe5\xd5\x08/\xac\x82\xa9\xb7\x09\
-\xb0?\xf49\x19\xc1d\xdc\xee\x95L\xad\xf5\xd4^H\
-7\x16\xca|'\x9d\xe4\xff\xd7\xf1?\xd1\xb7_\xef \
-\xf3\x1av\xc3C\xef\xbdrHxg\x8a\xfb\xcc\x94\x11\
-\x1f\xfc\x9c\x1a\x9aLf\xb7\xb7\xdf\x0b\x7f:\xbc\x955\
-\xa7\x96w\x8a\xb6\xeaC\x07\x9fI\x9d\xed\xe1C\x9d\x96\
-\x99\xe7\xe3\xf8\xb7N\xcfO\x10\xb0\xfe\x1f\x19'\x85\xcf\
-\xe8\xb7=1;\xb5\xf8U\xbc\xb7N\x8e9'j\xfa\
-&l\xbd\xb5\xdd\xdf\x80\xc3\x85\xe4\xa2\x04l\xd9\xf0\x89\
-\x14\xb0\xde\xf1\x1f}ra\xda\xbdsEx\xe60\x07\
-\xea/i\x87\xa1)\x1e\xdeE\xb6e\xff\x08@\xff\x02\
-\xed\xf0r\xf0o}~\xb2Wq\xbf6<6\x0f\x16\
-d\x849\xcc2\x0b\x09\xa0\xf3'\xb4]\x02_\x19\x9c\
-\xef\xf0rt\x86\xcb\x99\xc7\x99\x8c\x80lq&w\x8f\
-\xd5^\x96\xd2s\x88?\xd4w\x89\xae\xa9\xa5g\x95O\
-}\xed\xa4\xd8k\x0d\x7f\x83\x15\xfe9\xfb\x1am\xfe/\
-\xc6\xc4\x85\xcfD\xdb\x1e9\x08a\x04\xd6\xb8\xb17\x19\
-\x00\xd5\xd7\xec\xb5\x9b\xe0\xf0\xe8\xcf\xc2\x97t\x12\x83\x13\
-\x87_\xf7\xac\xf3\xc8NTN\x0cK'\xc1\xf8\x1d.\
-}\xf1\x0a\x19\x98\xa7\x9b\x00\xaf\xcd\xce\xa5\x09\x0c\xceU\
-0#\xff\xd9\xbc+\x83G\x00|\x94\xb5\xfa4\xc8\xdf\
-\xd1\x19+\x8f9F\x99\xd8\xc1,1\x84\xf0b\xfa+\
-\xeak\xf6\x01\xee;\x18\x93\x9b\xb0\x13\xc0\xc7\xe0U\xdb\
-\xba\xaf\xab\xdd\x9an\xdfO\x81\x95\xb0\x949\xef\xfe\x8d\
-\xf4\x07I\xa5pI\x1c\xfc*K\xe5KC\x1d\x81\xe2\
-A\x1cj+\xbb_\xbf\xc3n\x15\xab\xea\x90\x0b\xb7\x13\
-\x8eT[:\xf8}B\x97\x13\xc3\x83\x06\x87\x93\x7fg\
-N\x12\x99\xcb\x1e\x90\xfe>\xd2\xbe\xd2\xf4\x91\x1c\xf8\xee\
-!\xd1\x08\x08\xbb\x93\xc7\x97\x86\xc9\x81\xe5+\xef\xf8\x7f\
-X\xf1\xa7\x15\xcdE\xadc\xd5v\xd2m,\x8f\x0d&\
-\xe5\x0d\xcf\xb5\xceH\x1b\xa7\xd2\x8d\xc3a{\xf92K\
-n\xc2\x1d\x86\xf0l2\x94\xa0\x09\x90`\x09\xe5r6\
-]\x88\xc5e\x89Ki&\xa2\xe4\x95\x96\xe3<x%\
-\x8b\x8b\xb4\xa1D4.[j\xed\xae\xe2\xad\xb4\xaaz\
-\x12I\x01\
-\x00\x00d=\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01~\x00\x00\x00g\x08\x06\x00\x00\x00\x07t)\x1b\
-\x00\x00\x09fzTXtRaw prof\
-ile type exif\x00\x00x\
-\xda\xad\x97i\x8e\xec8\x0e\x84\xff\xfb\x14s\x04m\xd4\
-r\x1cJ\xa4\x80\xb9\xc1\x1c\x7f>:\xeb\xd5\xeb\x0d\x0f\
-\x0dtWVnN[\x0b#\x18\x11~\xfc\x7f\xff\xbd\
-\xcf\x7f\xf8+5\xb5\xa7\xc9\x98}\xf5\x9e\xf8k\xab\xad\
-\xa2|\x98\xe9\xf3\xd7xn\x9e\x85\xff\xf29T=\xfd\
-\xf8\xcb\xef\xef\xf9\xf3\xe5\xe9\xf9\xfb\xf0\xef~\xe8_\x17\
-\xe6\xc2\x91\xfa\xf3\xf8\xf7\xef__\xbb\xf7\xdb\xad\xe7\xa7\
-\xd7QK*VXO\x1c\xe8\xa3\x0b\x9fO\xbfC8\
-\xe9\xfdVk\xf1\x9ak\x89W\x9e\xad\xb2\x97\x1a#\xd5\
-\xf7\xf9N\xf4|\xcf\xd4\xbfg,\xbf]\xd9\xd4\xaf\xe3\
-\xe5\xf7\xc7\xfb\xfd.\xc0gk\xf7\xda\xbc\xd7?[\xd6\
-\xd6\xa9S\xff\xdah\xfe\x8c\xfe\x99\x81\xf3\xa8V\xabo\
-\x05;\x8f\xc1S\xf8<\xde\xc7z\xd2\xe2\x8b\xa6\x93[\
-\xb2t(\xed\xe6\xf3\xca%\xd7ts\xcb\x965\xdf\xec\
-\xef\xfb\xc9\x87e\xb5\xe2e\xf0^\xca)\xf5=6\xeb\
-(\xeb)\x87\xfdf\xf6\xcd#\xdf2\xea\xaaV'U\
-8T\xa3F=\xbe\xd7\x92\x994\x1e\xe7\x9dl2\xb1\
-e\xce,\x99\xc1\xf2\xc3%\xff\xca\xe3\x97\x03\xdd{\xa2\
-\x5c9\xca\x1at\xe8\x81O~\x19\xc52\x02\xadx\xe5\
-,@x\xf2\xfd\xc2J\xbe\x0a\xfcU\xe6?\xfc\x05\x96\
-\xf0\x97\xb3\xa2\xcc\x93\x0dj\xda\x9f!\xb6\xc4\xe9O\xfa\
-\x10\xae\xbe\xe0VN\x14\xde\xdb\xe7\xe2a_\x03P\x22\
-\xe6\x16\x16\x93+\x08\xb0\xb4*\x99\xf5\x8dRF\xce\xd4\
-q\xe6g\x01G\x9a\xa5\xb6\xb2\x81 \x8b\x14c\x91\xa5\
-\xd5\xda\x01g\x96\x98\x9bkF\x9e`\xa9E\xca\xe70\
-\xad\x04\x10R\x83\xcf\x13\x80\xf4\x01\xac\xd6\x04\xfe\x8c6\
-\xe1\x90J\x95&\x22]\x86LY\xa2\xbd\xf6\xd6\xa5w\
-8\x1e=\xa9\xa3\x8e6d\xf41\xc6\x1ck\xe8\xac\xb3\
-M\x99\xfd\x99c\xce\xb9\xa6\xae\xb2*=+\xab\xaf\xb1\
-\xe6ZK\x95I\x95\x91\x95\xab\x95\x13Tw\xd9u\xb7\
--\xbb\xef\xb1\xe7^[\x0f\xec9\xed\xc8\xe9\xcf\x19g\
-\x9eu\xd4\x8aUk&\xd6m\xd8\xb4e\xea\xd9\xa1\x92\
-7\x17\xef>|\xfar\xbdP\xed\xd6\xdb\xae\x5c\x9a\xf1\
-\xce\xbb\xae\xfeD-\x7f\xb5\xde\x1f\x1f\x7f\x1f\xb5\xfc\x03\
-\xb5\xf2\x22\x15'\x8eo\xd48:\xc6\x8f!rH\x8c\
-\x04f VZ\x06\xf1\x11\x08\x84$\x04fi>\xb9\
-\xb5\x12\xc8\x05fi\x15\xbaB\x0a\x8b\x94\x00\xc7r \
-\x06\x82\xcds\x91\x9b\xbf\xb1\xfb\x89\xdc7n\x0f\xf5\xfc\
-\xa7\xb8\x95@\xee\x09\xe8\xfe\x0d\xe4\x9e\x80\xee\x17\xc8\xfd\
-\x19\xb7\xbf@\xcd4\x8a}^\xc4>m\x18EM\x95\
-\xee\xe3\x04\x9fZB\x1ey\xd9\xa6\xa3/\xb6\xaa\xeb\xec\
-\xddS\xbb+\x0d\xf3\x95\xf7\x14Q\xdf\xce\x92\x1eZ!\
-\xf7\x8e\xb2\xe9\xba}\xaeq7\xf2\xed5\xea\xcd'\xce\
-p\xb6\xb5{\xad\xcb\xda<\x83\xc2\xce\xd9\xad\xc4\x12\xaf\
-\xb5\x06\x84\xcc\xe9\x08[\x15J7\xc7\x96p\xa4\xb9\xcb\
-8\xf9J\xa9\xf7\xf4mi\x81\xb9$\xd5Tt\xfa\x09\
-m-\xc6\xbaN:Cw\xcdC\xec\xb66\x96m\x07\
-~\xd5\xd3AG\x8f\xb6\x93n;\xb9\xb2pUh\xb0\
-\x8fu\xb7\xddY(bI\x89\x14\x13\xd4\x05\xe2mZ\
-\x11h\x83\xden]~\x0e\xc2V\xe6B\xca\xeb\xed2\
-M\xc60\xc9\xce\x1a\xf9\x94\x150%v\xb1\xcb\x054\
-?\x08\xb1&\x97t\x91p\xdd+m$x/\xab>\
-j\x96\xe7\x9c.\xb2wvM\x17\x11\x1e\xd9Ds\xd5\
-A\x05\xbb%]y\xf5#=\xea\x8e\xce\xa0\xf7? \
-\xd81\x9d\xe5\x0e\xc8}\x00\xf9\xa3\xb2K\xbe\xcb.X\
-1\xd6\xd0s!\xc9X\xc5\xdd\xb5n\x18\xd6\xc5[?\
-Io{I4!\x8e\x95\xba\xfbl\xe3hh\x91a\
-h\xe3)}\xebN\xd6\xaaA<\xbfA\xe2\x98\x82\xca\
-\xedAC\xa3\x8c\xb6\x1b=\xda\xe8(\xe4/\x03x\x16\
-\x0ad\x1dJVq9,\xe5\xe0k\xdb\xdb\xa8T\xd9\
-Yk\xbf\xb7\xc5\x98\xcd\xf7\xb8l\xbd5\x9a\xb4\xcer\
- \xde\x19\x5c\xba\xfb\x98\xfbT+l\x198\x96J\x19\
-\xac\xd2\xf5\xf83f\x1c.\x90]\x9b\xa9X;\xe7S\
-\x10@\xfcY\x118ye5\x00\x10e\xe7\xc77\xe0\
-\x19\x95\x90\xea\xb4\xd1\x91\xfc\xb4\x18@\xd6\xb4J\xc1\xbb\
-\x01\xe6Z\xd5\xd7\x18\xadg\xdc[\xda-\xd3\xabV\x18\
-!\xe2\xf3B\xce\x15='s\xb7\xd20\xa7\xe9tu\
-\xb5\x07\xe3\x9fYo]\x5c9\xcd\x16B\x01\xcb\x07\xc5\
-\x01\xb6M\x0f6\xc9p\x83.\x8c\xf6\x97\xba.~G\
-(y\xd7\x0a\xf0\x0d\x84o\x1a\xf2h\xea\xcb\xc7&\xc6\
-xB\x94\x86\xd3\xe6\xd7\x97\xd0\xb6(\xcd\x14\x92L\xf6\
-)D\x01W\x87z\x14\x8fgS[z\xfb \x1f\xb8\
-h\x9b^\x1e\xb8\x7fKg\xb0Y\x95^R\xa1\xb7v\
-=\xc1\xf3\x0e yB\xe8\x94\xfd^\x15\xe6\xda\xdb!\
-sf\xf9\x874\xa5\xd6[\xaeg\xd5d\xd8\xd1\x94\xca\
-\x84vn5\xdf\xd3(\xf3\x84\xa8\xf0\x88\xf5\xd5\xb9g\
-/>\x86\xb3\xed\xadt\x89m9\xf4}\xaf\x05\x01\xd4\
-\xe6\xab\x8d\xde\xb3\xd8|\xfa$\xb4P\xc7y\x1dNS\
-\x92\xbc\x96\x0dg\xfc}'\x85\xf2\x01W\x81\x08\xd47\
-\xadqK\x85\xa0\xbc\x0d\x0f\xf2\xa2\xda\x94\xe4\x8e\xeaO\
-0\xfa\xe8\x8e\xca\xac\xe5(H)\xdd6\x99\x06\x95\xd6\
-\xc1\xca\xeeY\x14\x0e\xa9\xa8\x96\x11\x80P4s\x09\x04\
-\xf7=\xec\xc3\x0d\x84\xcbx`\x91\x5c\xec\xf9\xa0^@\
-\xb2X\x9a4Z}\x84\x90d\xdf,S&\xbfx\xe9\
-S\xa5Q\xdd=i\xf6\x9d\x9cT\xe8x\x91\xd1\x91\xcd\
-(\xf6;\x0c%\xea\x135%\x7f2\x06Lc\x9d\xd3\
-\x86f\xa4\x10?:4\xc5\x1c\xa7m\x16\x83|\xdd\x13\
-\xad\x09~\x15a\xf2T\x8d5?\xb7\xac{\x90 ~\
-Ei\xf5\xa5\xc7U\x94Q\x13^;Nt\x1e8\x9b\
-L\xfa\xaf\xbaP\xc0q\xd9&B1\x84\xc2_\x8e\xd7\
-\xd4\xcf\x03\x88\x02,\x05\xa8\x1bK\x99\xb1\x96\xe8;\x96\
-\xe9\xf5\x18BJ[YF\xb33\xba\x92\xa1'b\x90\
-m\x22Mw\xe2\xb9U\x13\x8e\x92\xfaS\xa9>B\xdf\
-:b\xbb\xd3=\xa4\xc8\x81\xc7\xf02\x96\xf7\xb2B>\
-|&\xac\xc3\xd1\xcc\x05b\x8c:\x14eh\xb4\xf3\xb8\
-0U\xc1\xe2<\xa8\x1eM^`+K\xc3\x08l!\
-\x0c'\xc4\x86\x1a\xb2\x0b5\x22\xabP\x1a\x8e\x5c\xc7\xcd\
-k\xd0\xb2\xa2\x13zY\x13\xb4\xb3\x06\x16\xe3\xd9\xa3\x19\
-\xfee%|\x8b=v!/\x9f\x9b\x11Q\xb4\x91\xee\
-\xfbh\xc1\xc5P|a\xd3\x8b\xcag~\xaf\x00\xa0\x09\
-\xed84\xb7l}HnW\xcb\xd2N\xfbk\x0a\x82\
-#\xb6\x05*\xec\xca{\xe8A9@\x91\xd9\x95\xa0\xa8\
-\x8b\xea\xd3h\x0d\xce\x868\xec\x81\x1e\xe5\xa9-=\xb3\
-\xb7\x83Q\xb1iK\xec\xfdle\x8fdJ\xba\xa6\xa1\
-\xa9uqn\xf7\x02#7\xe9\xe0`\xfa\xf3\x16t\xa7\
-@\xa0\xebt\x07}\x1d\x1e\xf5 \xe0K\x1a\x12\x88\xdc\
-\x11?i\x01\xac@\xce\x0eXaNEQ/\x0a(\
-\x07\xef\x08!\xed}7\x08\xb5#L\x22\xce\xb7\xb6\x81\
-\x02\x87\xb01\xc5\x01\xdc\xcd\x89mc\x0bWW\x8c\xb5\
-X\xce\xa1\xab+\x1c\xccV\xa3\xe8\xfd\x22\xd1M\xcf\x99\
-\x1ci+d\xab\xa4\xe9\xaf\x95^\x062\x89 \xb3K\
-:m\x86\x11\x11\x82\xef&\x1b\x04\xe7\x14\x88U\xd5\xfc\
-\xd8:&\x1e\x12\x18-n\xfd\x86;/l\x83l\x22\
-P\x1b\xefw[\xe8O\xef6U\x1b\xdc\xf2\xb2\x89P\
-e\x22b\x05\x15B]+\xb3\x86\xc4\x0aa\xa5\x9e\xed\
-\x97\xbc\xec\x1b/\x22Mx\xc5#\xf5\xd8\x83\x19\xe3*\
-\x00S\xc1\xad\xadsC\x9e\x12I+\xadq\xc8I\xc5\
-\xf6\xa4R\x10s\xdc\xd10\xfc\x8e\xb2QPd\xab\xac\
-\x91\xac\xcbn\xd1\x0d\x8fG\xf5\x0d\xf1\xe1\x0b\xfa\xbf\x0f\
-\xe7\x12x7\xea\x04G\x18\x8cX\xa0\x07s\x80\x7f\x07\
-\xc4\x90\xdb\x8eJ@\x13\x94\xa4\x11\x07#2a{\x0f\
-\xb2H\xb8\xbb{\xa6\x12l\x05\xfe\x82\x9e\x82$\xfd\x83\
-Ar#u\x0d\x0b\x00c\xdd\xdb\xb8\x81u\x80\xa2\x1b\
-\xb1\xd5\x9cC\x9e\x1b\xc6\xa8\x99\x10\xc1|\x978\x98\x07\
-I'\x1c\x8fi\x04\x9f9\xeb\x22U9\x0c\xae,\x0f\
-C\xab\xd1b)\x90-\xd8\x14fX\x89\x88\x84E\xe4\
-\x84\x86|\xe8pTs\x0ad1.\xca\x94}]n\
-^\xae\xb0\xd3\xebD\xa0z'b7(p\x87\xff\xce\
-\xfb\xed\x0bVC\x8c#\x97\xc4\x96\xfb\x06\xb5\xbc\xc3\x1d\
-\x1c)\xe6\xe6\xe6B\xb6/\xc7J5\xe2\xd5!J^\
-\x1cx\x18\xf9\xf2D\x00\xef\x11\xa3\xd9\x0b\x1e\x05\x92\x92\
-\x1b\x86\xb7P\xc9Hl\x8819\xd5B\xd31\x81\xf0\
-X<\xf4\xa4Ak\xd2\x9b$\x0d\x0aZ\xf0U\x80(\
-e\x91\xb2z\xa3E\xca\xa0e0\xcc\x8f\x9d\xca\x83r\
-\xf6\xb8\xe9\xc0ah\xc7m\x84\x04#8\xc0\xbb:;\
-\xb7\x08\x83\x9b)'\x1f\x9c^\xba\x1a\xc1\xa1\x93\x8b0\
-4\xc6A\xe5`\xdfF\xd7\xb5\x13\xb4h3\x02\x1e\xdb\
-\xbaLqW{s\x09\xa7\x13\xc0\xd9=\xb1\x0fF\xc6\
-\xbd9a\xacy-\xb6\x16fG\x90\xa0m\xb9\x93\x80\
-\x82\x18\x1e\xe1\xfd\x91\x13\xe1\x05\xf5\xf2\x88Pw/\xf6\
-\xd3C\x8aB\x12=!\x19\x93\xd7\x06d\xccLNd\
-\xb0L\xb2\x22\xbe\x8c\x9d)\x12\xf7|o\xb3=\xdc\x14\
-0\x17\x0d\x06\xfb|\xa2\xa9i;\xc5r\xf4\xe1M\x91\
-\x18~'7\xd2\xd7\x91\x9f\xd9(\xe4e\x7f5\xce`\
-^\x98\x8e\x95\x9d\xc6}?)\xafa\x9a\x10\xce\xe0\x1d\
-\xd2\x0d;q\xe5\x0c\xcd\xce\xc4\xb9y \x80{\x86\x84\
-\xf7\x08}\xa8[\x8d]\xa1\x1b4\xb2\x1d\xa7}\xca|\
-x\xa6\xf4\xca\xe9o\xdfk\xe5~\x01\x95\xe1~+\xae\
-\xf8\xc5;w\xeb\xd7\x16\xbd\xf6\x7f\xfe\x9b\xc0H\xfe\xd9\
-\x10\x9d\x00\x00\x09uiTXtXML:co\
-m.adobe.xmp\x00\x00\x00\x00\x00\
-<?xpacket begin=\
-\x22\xef\xbb\xbf\x22 id=\x22W5M0Mp\
-CehiHzreSzNTczkc\
-9d\x22?>\x0a<x:xmpmeta\
- xmlns:x=\x22adobe:\
-ns:meta/\x22 x:xmpt\
-k=\x22XMP Core 4.4.\
-0-Exiv2\x22>\x0a <rdf:\
-RDF xmlns:rdf=\x22h\
-ttp://www.w3.org\
-/1999/02/22-rdf-\
-syntax-ns#\x22>\x0a  <\
-rdf:Description \
-rdf:about=\x22\x22\x0a   \
- xmlns:crs=\x22http\
-://ns.adobe.com/\
-camera-raw-setti\
-ngs/1.0/\x22\x0a   crs\
-:HasCrop=\x22False\x22\
-/>\x0a </rdf:RDF>\x0a<\
-/x:xmpmeta>\x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-           \x0a<?xp\
-acket end=\x22w\x22?>c\
-\xcd9\xd6\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\
-\x00\x0e\xc4\x01\x95+\x0e\x1b\x00\x00 \x00IDAT\
-x\x9c\xec\x9dw\x9cV\xc5\xd5\xc7\x7fgfny\xca\
-\xf6\xa5\xa9\xa8X\x89-*v!\x88\x8a\x1a\x15\x15\xe9\
-(\xa21\x22j\xb0E\xa3F\x93u\xed\xbevQ\x14\
-\xacDQ)6\xec\x01\x0b\xc6\xaehLb\xc7\x1a#\
-(e\xdbS\xee\xbd\xd3\xde?\x9e]\xea\x96ga\x17\
-H|\xbe\x9f\xdc\xf0q\xf7\xce\xcc\x99\xbb\xf7\x9e\x999\
-s\xe6\x1c\xa0@\x81\x02\x05\x0a\x14(P\xa0@\x81\x02\
-\x05\x0a\x14(P\xa0@\x81\x02\x05\x0a\x14(P\xa0@\
-\x81\x02\x05\x0a\x14(P\xa0@\x81\x02\x05\x0a\x14(P\
-\xa0\xc0\x06\x846\xb4\x00-q\xf4\x89\x17\xf7\x5c\x1am\
-\xe5 \x08a\x9d\xec>\xcc\x88\x93\x0cw\xe2\xd0\x80\x05\
-@\xabIn\x1b\xff%\x00\xc4\x0c\xac\x8e\xb2\xa1IM\
-\x82\xdd\xf4\xef\xbe\xef\xc3\xad\xfb(|\xe9\x99\xab\xfe\xb3\
-\x9e\xbbQ\xa0@\x81\x02\x1b\x1d\x1b\x95\xe2\xdf\xf3\xe0\xb3\
-\xf7(\xea\xfe\xcb\xbd\xb9k\xcb\xa2l\xcd\xd9\x12\xb1R\
-m\x00\x07\x8c\x0b\xee\xc20B\xa3\xda\xc7\x0aU\xdf2\
-FF\xd0\xcaj&\x0c\x042K\x98\xd7\xe5\xfatC\
-C6\x19}\xf5\xeeK\xcf\xdc\xf4Ng\xf7\xa7@\x81\
-\x02\x056F6\xa8\xe2\x9f1l\x18\xbf\xd1\x1e\xd1\xdd\
-\xb1?\x9c#\xfc\x1e\xbb\x84Q\xfdn\xb1De\xa5!\
-\x8b(H\x83\xac\x85%\xca\xfdk-\xf2Q\xf6+ \
-\x108@:W\x8es8n\x11\x8c\x94\x90\xc1\x92\xa5\
-\x9c\x15\xbdo\xf5\x92\xbf\xbb\x95\x9b\xdcR\xb1\xec\x99\xc5\
-3g\xce\x8c:\xa9\x9b\x05\x0a\x14(\xb0Q\xb1A\x14\
-\xff\xe0\xe3\x7f\xdf\xb56\xda\xf6\x08k\xd5\xaf%\xb9\x83\
-\x88[\xdf\xe1q(\x13\xc2\xe8\x08\xb0vM[NG\
-\xd0X/c\x0e8w\xa0L\x04\x90\x0e\x84Us\x92\
-\xa2\xe8\xf1R3w\xc6\x83\x0f>\x98\xee\xf8\x86\x0b\x14\
-(P`\xe3a\xbd*\xfeC\x86\xdeP.\x19?\x0b\
-\x22~\x0c\x09w\x17\xa9\x0d\xac\x89r\xb3y\xdb\x9e\xd9\
-|\x07A\x04\x02\x81\x09\x17\xbep!U\xf0V$\x17\
-?\x92Z\xb4h\xea\x87\xf3n\xa9]\xff\x02\x15(P\
-\xa0@\xe7\xb3^\x14\xffq\xa7\xfc\xb1\xc7\x8f\xc1\x96G\
-g\xc3\xcc\x15\xdcIV\x00\x1cZe\xd7G\xd3yc\
-\xad\x85\xe3% e\x00\x1de\xbfK\xb8e\x17\xebO\
-^~z\xde\x87S\x0b\x03@\x81\x02\x05\xfe\xa7\xe8t\
-\xc5\x7f\xd0q\xb7\x1e\xa1\x0d\xbf\x9ay\xc5;\x87Q\x1a\
-0\x00\xac\xe9\xecf\xd7\x1e\x22\x10w\xe0\x88\x18t\xb6\
-\xf6m\x87\xd7Oz\xf1\xe1\x8b\xfe\xb2\xa1\xc5*P\xa0\
-@\x81\x8e\xa2\xd3\x14\xffn\x07\x9e\xb7KQ\x97^\xa7\
-[\x91\xf8\x0d`\x1c\xad\x82\x8d\xcb\x85(\x0f\xb8\x13\x07\
-Y\x05\xd8\xecU\xc5&;\xfd\xa9G\xfe\xf0\x8f\x0d-\
-S\x81\x02\x05\x0a\xac+\x9d\xa2\x8b\xfb\x8f\x984LY\
-\x9a\xc4\x5c\xbf\xd2\xaa\x10vc\x9e\xe1\xb7\x01\x11\x83p\
-}@\x86\x8bk\xeb\xd3\xa3\xff\xfe\xcc\xb9s7\xb4L\
-\x05\x0a\x14(\xb0.t\xa8\xe2\x1f|\xca\x15=\xa4\xd9\
-bl]6}\x05\x91\xe0ZF\x1b\xd9I\x81\xb5\xc5\
-\x82\x98\x00\xac\xc9:\x8cn,\xc9|s\xd3\x13O\x5c\
-\xb3tCKU\xa0@\x81\x02kC\x87\xa9\xe5\xfd\x8e\
-\xbai\xfb\xa2\x92\xf8\x0c\xf8\x89]2\x0d)\x98\xff\xe2\
-Y~K\x10\x13\x10\xae\x07\x93N\xbd#B\xf7\xa8\x97\
-\x9e:\xe5\xc7\x0d-S\x81\x02\x05\x0a\xb4\x97\x0eQ\xfc\
-\xbb\x0c\xbc\xaeWie\xe5s\x5c\xb0\xed\xc3\xb0\x01D\
-\xd4QUotXX8n\x11\xb8\x91\xafwK\xf8\
-\xc7<<\xe5\xb8%\x1bZ\xa6\x02\x05\x0a\x14h\x0f|\
-]+\xd8o\xe8M\xdb;\xf1\xa2\xd9\xc2\xa1\xdeRf\
-\xff\xa7\x95>\x90;\x0flt\x08\xe1\xc67\xafIg\
-\x0e,\xe9\xb9\xfbs?-\x98W\xbf\xa1\xe5*P\xa0\
-@\x81|Y'\x0d\xbd\xcf\xd0\x1b\xb6\xe1\xa2\xe89\xc7\
-q\xb7\x91Q\xa6\xa3d\xfa/\xc1\x82\xdc\x042\xa9\xda\
-\xf7\x82e5\x83>\x9eW\xbdhCKT\xe0\xbf\x9f\
-\xe3\x8f\x1f\x98\xf8)\xda{\x1b\xc8\x044\xaf1\x9b\xed\
-\xf8\xf6\x17S\xab\xe7\x05\x1d\xd9\xc6\xe4q\xe3\x9c\xc7\x97\
-\xf5\xd86d\xc5\x0ed\x1a\x8c\xa7L\x22Z\xf2\xcd\xec\
-\xd9\xf76td;?7\xfa\x1f{Qof\x8b=\
-\xc7\x01\x8aM\xf0\xefY\xb3\xaa\x97mh\x99Zb\xad\
-\x15\xff\x9e#&n\xe7\x8b\xd8\x93\x8c9\xbdU\xf4\xf3\
-\x8dr\xc0\x9d8\xa4\x8e\xdeSn\xe9\xa0w\xa7\x0e\xef\
-4\xe5?ppU\xd7\xc8+>9\x84\xbb\xc6\xef\x1c\
-\xd6\x05a$\x9f|g\xd6\x98\x8f\xd7\xa5\x8d\xfdGN\
-\x1c(\xdc\xa2=\xc2h\xd5\xef\x9f\x0b\x81X\xb0d\xd1\
-\xfe\xb3\xfe4\xb5:w\x12\x03;\x0c\xabr\xcb\xd1e\
-\xbcuxB\x1b\xd5b\x9d\x0e\xf3a\x039\xfd\xb5\xc7\
-N\xff\xaa\xb9\xdf\x1f1\xfa\xc2\xb2TT~\xbcr\x8b\
-\x92-\xd5\xc3\xc1`H\xdb\xb8Y\xfa\xd8\x8b\xd3\xab?\
-o\xfay\xbf\xc1w\xf601{\x22L\x04\x0d\xb6\xa2\
-\x80\x11pD\x19TP\xf7\xf8\x9b\x8f\x9d\xfa\xe9\x8a\xfe\
-\xdd<P\xb8\xc5{\x84\xab\xbd\xaf\x1c.t$\xd5\xd2\
-\x1f\xfe\xf9\xd0\x17oM\xce;\x82\xeb\xc1\xc3\xae)\x09\
-\xc8?\xd52\x8fk(8\x22\x01\x15d\xbexs\xd6\
-\xeff\xe5[\x07\x00\x1c;\xfa\xf2-\xeaX\xd7\xd1Q\
-` \x90\x1a`\x1d6\xd0X\x0e \x80 \xf1Lh\
-\xf9\xeb2\x08a\x1bj\xa7\xbc\xfb\xe2\xda9\x15\x8c9\
-mj\xffo\x1a\x82\xfdB\x15 \xa1\xed^d\xf4\x11\
-\xca\xe5\x0e\xac\x01\xd9\x08L\xbb/g\x1c\xfe\xa2\xd0E\
-\xc6f~\xf8\xfc\x8d\xa7/y\xb4\xb5\xfa\x86\x0e\xfd\xe3\
-\xa6\x8by\xf9\x98\x90b\xd4\xf8J\xb4\x0bn\x18\x18\x5c\
-\x08]\x1bT\xb2\xaf\xef\x9a9sR\xaa=\xe5\xfb\x0e\
-\xbd\xa7\x8b\x12\xea\xb7\x1c\x11tKm\x80\xc1X\x98\x8a\
-\x121\xf1\xe9)\xa7v\xf8\xcc\xf4\xc8>G\xc6\xeb\xb6\
-\xec\x7f\x82\xf4\xba\x94\xb9\xb2~[\xae\xc3\x11Z\x888\
-1\x02W\xf4v\xe0\xb0\xa7\xb8vM\x82~\x9a\xf1\xfc\
-\xf4?}\xd9V}\xfd\x87\xdfx0\xdc\xa2=C\xd5\
-q\xe3\xbc\xc3\x04\xac\x0c\xd2\xcbP{\xe7\xc73\xab\x97\
-\xc7#\x13kS\xd9\x9e#\xae\xdf\xcec\xce\xb3\x8c\x89\
-\xadU\x94\xc2\xff\xb2i\xa7-\xb4L\xc3\xf5\x8b\xf6\xd0\
-Q\xed\x13\xbd\x8f\x99x\xc4\xa7OL\xe8\x14o\x1f\xb2\
-~O\xe1\x15_E\xf0\xb1z\xb0:\xe1\xc4\xa0e\xfd\
-B\x00\xeb\xa4\xf8a\xf9(\xd7/9\x89\x88\xad\xf2c\
-\xc69t\x90\xfe\xfa\x95\xfeU\x0f`^\xb5\x01\x80\xd2\
-\xb0\xa7\xa7}uC\xcc/\x16F\xb7\xa4\xf8\x09\xcc\xf1\
-\x10\x98\x1f?\x02\xd0\xac\xe2\xa7 \xd5\xcd\xb2\xf2\x1b\x5c\
-\xaf\xd4\xb1F6_\x0b1X\xab`\xb3\xb5\xdf\x00X\
-\xae\xf8\xc38\xdb\x22\xe9\x17]e\x95\x5c\xf5\x89X\x82\
-p=h%\xbf\x03\xb0\x5c\xf1C\x8bQ\xae_v\x12\
-\xd1\xea\xaf=\x83\x17s\xc0\xd9/w\xf8\x028\xa9\x85\
-\xce\xac\x81u\xdc\x0a\x87%\xae%\x1e\x83\x81\x81p\x13\
-\xd0Q0\x0f@^\x8a\x7f\xf7\xc3.\xdf:^Ry\
-\xceRr\x0e\xe7\xc2\xef%\xe2\x16F{P:l\x0c\
-@\xeb\x83\x98{\x84#\xf8\x11B\x18\x98D\x97\x13\xf6\
-\x1f9\xf91\xa4j&\xbf\xfe\xf4\x85\xdf\xe5\xd3F\xbf\
-\xc17\xeeNBL\xfc\xbe!\xbb\x93\x10E\xc5\x8c\xc7\
-`\x94\x82\xd6\x12\x16\xba1&V\x1c\xc2u\x06\xf8\x8e\
-\x18@V@\xdab\xdb\x7f\xf4=oe\xa3\xe0\xcaw\
-f\x9d\xf1Ls\xf5\x06Nv\x1b\xd7M\x5cMT\x02\
-\xd8\x96\x07\xfe\x16\xb1\x00\x81\x01\x86\xe1G[\xf1\x9b\xbe\
-\xc3\xef\x9c\xb5,\xb3\xf0\xbe\x8f\x9f\xae\xce\xab_Z\xa4\
-6\xf3\xfd\xf2\xab\x08\x89V\xdc\xc5\x09\x9c[\xd45\xfc\
-X\x0e\xe0\x82\xf6\x0b\xd9<{\x1e~^\xf7\xe2\xf2m\
-.\xaf\xb7\xb4\x17Y\xda\xc5s\x1c\x80\x15C\xab\x10\x06\
-\x1a\x16\x04\xeb\xba{\xbb\x8e\xb37Y\x86\xfa\xb0l\xfc\
-\x01\xa3'\xff\x871S\xf5\xd2\x83\xa7\xcdi\xb1O\x86\
-\x8f\x8c%JN\xa6\xc0\xeb(Q\xc1\x98@F+\x1d\
-\x89\xf2\xfb\x01\xac\xbd\xe2?\xf4\xb8k\xb7\xcf\xa2\xf8\x09\
-b\xde\xd6\xb9\x99\xfe\xcfW\xe9\xe7 \xa8 \x85\x98\x1b\
-\xdf\x9b\xf9\xfa\xe9\xfdFN\x1c\xf2\xc6#\x13~\xe8\x8c\
-fd\x98\x86\x86Z#\xae\x915\x16\x0cQ\xd8\x01\xad\
-\xa4d\xd0\x00\x19\xae:\xf9\xe2\x9c\x83\x81\xd7\xac\xfc3\
-\xc7+\xb6\x11j\x96\xca \xd5\xadU\xc5\xaf#\x18P\
-\x8b\x91O-\x98\xb6\xa0\xa52HuoC\xf1[\x8f\
-\xb1U\xfah\x99Q2H\xc1*\x05\xbb\xda`h\xad\
-\x82ez\xb5g\xc2\x9a\xed_c#\xe01\xff\xc4~\
-#&\xd6\xffm\xfa\x84\xb3Z\x92we\x0c\x5c\xad\xa2\
-\xac\x04S\x8e\xb1\x16\xd6\x18X\xd8\xba|\xca\x1e4d\
-\xd2\xd8\x90\x9b)L\xb8\xae\x01\xa0\xb2\xabm\x13\xd9\xdc\
-\xff)\x15\x00\x0a\x00\x08\x5c\xb8\xbd9w\xff\x88d\xf1\
-\xa9\xbf:\xe6\xa61\xaf>q\xces\xad\xb5q\xf0\x98\
-\xdb\xfaF\xc6\x9b\xc9\x98\xdb]\xaa\x00V\xae&\x9am\
-\xfavmn\xb0i|\x5c$<\x02\x17\xfb\x0a\xd7y\
-\xe2W\xc3n\xaczu\xe6\xb9\xff\x87F)\x96\xf7\xdd\
-\x90\x94a\xcaJpZ+\xc5\xbf\x1c\x02s\xdc\x9d\xc8\
-\x15;\x95\xa1\xdb\x84_\x1e~\xed\xb0\x0f\x9f\xbd\xe0\xe5\
-\xb6JY\xa6\x94\x0c\xebA\x96\xb7zN\xc8\x0a\x0f\xda\
-\xc6~]Uu_Uu\xf5I\xeb<\x95\xee7\xf8\
-\xfa\xe3\xb4\xe3^&\x11\xdb\x8aHBi\x05\x04\xb5X\
-U\x0fZh\x1dB7>O\xce\xbd\xcd-\xf76\xcf\
-\xca\xf4\x93\xfb\x0f\xbf\xf9F\x95\xfdq\xe2\xdbO]\xdd\
-\x8cG \xa5d\x90\x82\x0c:n\xc6\xcf8\x87\x05-\
-\xe5^b\x95\x0f\x84\xb5T\xa09\x06\x0e<>\x11)\
-\xf1\x84\xc3\x9d\xde\xb9\x99~\x81&d\x94\x85\xe7\xc6\xf7\
-\xe1\x91|\xac\xaa\x7f\xff\xb5ZI\xb5\xc9\xf2\x8d\xf3\xce\
-\x1cl\xf3\xaf\xdf6\x85Pm\xf1v\x82\x05\xb5\xb8\x14\
-\x07\x00\xce\x88\x81l\x1b\xcf\x8b\x00\x10\xc167QY\
-\x9b\xe7\xd1\xcc\xfd\xd6B\xab\x08\xcc\xf1\xcf\xdc\xef\x98\xea\
-\xa3\xdbYa\xdeT\xf5\x878h\xcc\x9d\xd7\xea\x98{\
-\x0fs|W\xab\x10F\xad\x18\x9f\x98\xf0\xe1x\xc9\xe5\
-\x17\x13~\x93\x80\xd0*\x84V\x01 \xbc\x0a\x13O\xcc\
-\xecs\xecM\xc7\xb4\xd4\xce\xa1\xc3'\xee\x1eH\xfe8\
-\x11\xef\x1eE\x0d\xb0&\xf7W\xe0N\x0c\x8e\x97\x84p\
-\xe3\xe0\x8e\x07.<\x087\x06\xc7K\x80;q\x00\x04\
-k4d\x94\x02\xb7V\x90Wz\xe5\x81#'\x0eZ\
-i\x94\x00\x90\x9bK3\xc6\xa9\xe9\xbf\xd6$\x9f\xbfI\
-.\xaf\x86\x91!\xac\x8c\xc0\x85W\x91,*\x7f\xa2\xdf\
-\xf0{\x0f\xcd\xa3\xf0j\x125\x8f\xd2\x12\x8c\xc7\xb6{\
-\xee\xa3e\x83\xf2\xa9\xb35v\xfb\xf5U\xe3\x8d[\xf4\
-\xa0p\x93[i\x99\x82\x92\xd1\xf2\xf03+\xfen\x09\
-8^\x02\xc2K\xe6\xce\xfe\x000ZBF\x0d\x10@\
-\xcc\x8dU^,b\x9b<\xd9\xff\xc8\xeb+\xd7l\x81\
-\xa1\xf5\xf7ym\xdf\xf55C\x1d\xb7K\xf1\xa7\xca\xf6\
-\x1dn\xfd\x8a\xdeQ\x98Y\x0b\x01\xfe\xb7!X\xe8(\
-\x0b\xe3\xc7\xf7\x9e\x1d\x1f0\xa4\xa3\xeb\x0f\xb4d\x8c\x09\
-\x08\x97\x838\x83\xcd\xe7\xado/\x86b\xc2\xf1\xe1\x08\
-\x17\xab\x9b{VG\x16\xd5\x93`\xb2\x88\x8b8\x5c\xe6\
-\x811\xbef\x84Un\x11\xf7=\x94\xc5ZV\xec\x99\
-\xda\x86\x06kL\x03\xf7<\xd8\xd5fMD\x02\x0e\xf7\
-\xe0\x08\x17\x8c\xbbP\x96Vq\x9de\x16\x5c\x08\x17\xc2\
-q@\x9c\xa3\xed|\x0d&\xc6\x9dx\xae\x7f\xcd\xbd\xbf\
-\xc6\xc0X\x06\xe3t\xab\xda\xef\xe0\xaaM\xda\xa8l\xad\
-\x98\xb3\xe9\x0d\x7fV\xe4\xff\xc1(\xcd\xb5j\x5c\x08\x11\
-\x81\x1c\x0f\xae\x17\x03T\xfa\xad(H\xdd\xd3tY\x95\
-z\xd3qb\xe0\xc2o\xfc~-\xb4\x0cAD\x09\xdf\
-\x8f=:`\xf4\x94S\x9akG\x11\xee\xe0\xae_\xa9\
-d\x00\x02\x83e\x04!\xe2P\x99\x86Wru7L\
-VQ\xeaz%3\xd7F\xd9\x86;\xa2\xa0\xe1\x1e\x15\
-\xd5?-\x5c\x17 \x9e\xf3^3\x1a\x16\x16\x812\xb7\
-\xf79\xf2\xd2\xd8\xca\xf5Gvi\x8d\x94*\xe3\xb81\
-pnW\xd3\xc2\x16\x5cpp'\x06.\x9a\xbf\x84\xf0\
-!\x1c\x17$\x5c\x80\x18,\x00\xadCpa\x8a\x8d\x0e\
-f\xf4=\xfa\xca\x83Z{\x8e\x0c\x9a{\xcc\x0353\
-\x17`\xcc\x05Q\xe3\xfb`\x0d\x18q\xcfw\xdc\xe3\x86\
-\x9d~[\xb2]\x7f\xac\x95\xd8o\xe4\xed\xe3\x8b\xcb+\
-\xef f\xa0e\x00\x80r\xff\x13\x1e\x5c\xa7\x18&\xac\
-\xfb\xa0\xf1\xb9\xde\x13\x05\x0d\xf7\xc8 u\x8f\x95\xa9\xac\
-p\x13`L\x80\x00\x18k\x11\x05\xf5p\xfc\x92\xbdy\
-Ir\xceQC/\xdb~\xe56,\xb21!\x1cp\
-\x97\xaf\xa9^\x89\xc0\x1d\xd18X\xc7[|\xae\xab^\
-qp\xe1\x813]T\x12\xa6W\xa91\xef\x99\xe9~\
-\xa3\xae\x1e\xe2\x08\xefN\x15fW\xfb@\x0b4a\xad\
-\x01Y\x81Di\xcf\xc9\x07\x8f\x9aR;\xf7\xe1q/\
-tT\xdd\x0a\x0d\x0bl \x06q\x8f\xc3c\xc9\xa3\xac\
-\x9f<%\x08\xd2\x1d\x9a\xb6\xc0\x90\xbdEF\x99'E\
-\xd0\x00\xc9\x9d\x89L\xb8[\x1a\xdd\xbc\xf9\xc5\xe9\xf9\xef\
-,\xff\xb2\xe8\xe8(\xf4=\x1ef`<v\x86\xe3'\
-\x0e\x93\x8d\x93\x02\xe2\x1c\xda4\x5c\xe9\xc1\xbe\xb5e2\
-\xfe\xf6_[hs\xee\xdc{\x7f\xd8g\xf0\x15Ca\
-2\xbf$\xb2\xf7\x12\x08\xd6\xe6NJ\x1b\x19\x05J\xa6\
-\xaa\xb8\x9f\xf8X\x92\xa3\x96\xd4'\xdfX\xb9\xac\xdf\x90\
-\xfd\xcc$\xe4 \xad5\x0c\xf8`\xc7I\xfcF\xc9\x96\
-\x97\xc9\x86\xd4-*J?\x89\xa0\x01~q\xf1\xadQ\
-hzi\xbd\xaa\x15\xca\xa8\x10\x9e\xe7\xed\x86\x8a\x8a\xa7\
-\x0f\x1f[u\xf8\xb3S;\xca[\xab\xbf\xd8\xfd\xe8#\
-\x8e\xe7\xac\xe8B-\x83\xe5\xe6\x09&<8\x82\x0c\xac\
-\xbcA+zu+\x7f\xc9kS\xa7V/\x8f\x08{\
-\xf4\xd1g\x95\xa6\xb0}_\x03q\xa4\xe3\xc6O\xd5:\
-\x82QQN\xd1Zf\x85c\x9bUfiCqO\
-\xe7\x06Bb\x1c\xb0&2Q\xc3\xb8\xf0\xcd\x7f\xcd\x9c\
-\xbfpJ\x8b\x1b\x9d\xfdF\xdfx4\xa7\xc4\x140\xb7\
-\xab\xd6\x11\xac\xd6 .\xbc\xb2MvtV\xbeo\xce\
-\x8c{?\xd9k\xf05\x07\xc5T\xb6\x92\xabe\x87Y\
-V~\x86\x01\x01\xd6\x82\xb8\x0b)\x1b\xae\x04\xf9o\xb5\
-\xd4\x0eW\x1a\x10\x1a:\x92G\x09\xbf\xf8\x04\x03\xee\xc1\
-*h\xa5\xe0\xc4\xe2\xc5F\xca\xf3'Lx\xf6\xb5\x89\
-\x13\x0fo\xde\x84\x99\xb2_rG\x1dlH\xdfD\x9e\
-\xbf\xb3nZ5\x11Y\x98\xecg0\x94 \xe1\xf6\xb4\
-F\xc1\xc8,\x98\xef\x1f\xbd\xa4~\xd1.\x00\xdeh\xb6\
-\xbeV\xf8\xe5\xa1U'\x12\xf8$c\x09\xd6\xe4\x12B\
-\x11\xf7\xc0\x99\x85\x91\xa9g\xc9\x96\xdd\x19\xaf\xfb\xec\xed\
-9s\xee\xfci\xe5r\xfd\x07\xff\xf1n\x95\xf5\xb6#\
-\xd8?\xf3D|k\x1d\x04\xc8\xcd\xb5-\xc8dk,\
-\xc2U_>[w\xab\x8c\x12OI]\x0b\xb2E\xb7\
-p\xeeoe\xb4\x041\x01k\xe42\x15\xd5\x8f\xb3\xe4\
-\x86\x80\x87\xd5,o- \xc0\xad\x02g*r\xb6\xa9\
-[\xe5o\x9e\x97\xda\xd8\xe6\xb0\xc3\xbc\x1e%\xbf~\x87\
-\xbb\xa5\xbb\xc8\x9f\xf9fn\xdbXp7\x09\x8aj\xbf\
->`\xd1c\xdbU\xcf\x9b\xb7.\x06\xd0f9x\xd8\
-\x94Sl<6%\x08r\xde7\xc2M@\x07\x0d\xa3\
-_\x9b\xf9\xbb\x87;\xaa\x8d\xfdG\xdc\xfe\x01\x17\xfe\xae\
-Z\x859\x1b\x7f\x94y\xdf.\xae\xdd{\xde\xbc\xeaf\
-\xfbs\xd8I\xb7\x1f\x9f\xd1\xfed\x1d\xc98\xac\x01\xe3\
-\x1e\x1c\x04\xaf\xbd\xf4\xd0\x19\xfd\xf2jo\xe8e\xa3E\
-\xac\xc74\x15)\x00\x16\xae\x9f\x84L\xd7?\xfa\xda\xac\
-\xdf\x0d\xcd\xa7|\xdf\xe1\xb7\x9f.\xfc\xe2\xdbe\xd8\xf4\
-Lb\x88d\xfd\xb07\x1f9\xab\xd9\x8d\xd6\x01c\xee\
-\x98\xaf\x8d\xb7\xbbn\xc1\x83\xc2\x8d\x15\x83\x82\x85S^\
-z\xe4\xfcS[js\xc0\xe8\xdb\xb6P\xca|\x01\xe6\
-8\xc6Z\x087\x8e(L\xcf~s\xc6\x19k\x98\x8a\
-\xba\xecx\xc2\xd6=\xb7\xdaiAQIy\xceD\x00\
-\x0b\xee\xc4aU8?\xe9G\xd7=w\xff\x99\xd3\xdb\
-\xea\xe3^G]\xfbg\xaf\xa8\xf8T\xe1\x14o\x12d\
-S\x8b\x83t\xfd\xc9\x1f<}\xfeS\xab\xdfw\xd0Q\
-\xe7\xee\x96\x8d\xf5x\x81\xf1\x92.V+p\xe1\xc2\x83\
-zv\xce\xb4\xf1G\xb4\xd5\x06\x00\x1c0\xfc\x86{\x8c\
-(\xfe\x8d62\xb7\x01\xcb\xa4\x8a\xe9\xec)s\xa6\xff\
-\xe1\xfe\xe6\xee?pd\xd5\xf1\x86*\x1f\x90\xd6\x01\xac\
-\x05w\x1cH\xb9\xf4\xe07\xa7_\xf0b>\xed\x1d<\
-\xe2\xbac\xb3,1\xcd\x82\xfbdr\x9b\xa3\xb1XL\
-9<}\xec\xf3\xf7\x9c\xb1F\xff\x9a\xd8{\xef\x91\xdd\
-\xdc^\xfb\xbf\x04\x1e\xdb\xc1\xa8(\xa7 \xb5\xca\xc6\xec\
-\xdf{H\xdai\x12\xf9e\xa3e\xd8\x90[\xdd9\x02\
-$\x97\xbe\xfc\xb7\xe9\x17\x1e\x98\x8fLM\x0c:\xf9\xca\
-n\xf5\xe9\xe2\x0f\x0cK\xf40:\xf7\xae\x10\x13p8\
-\xa4\xef\xca\xf3\x93\x0d\xaf\xdc6s\xe6\xcc\xd6\xac\x99\x18\
-x\xfc\xad\xbd\xa4\xa1\xc75\xf3\x7f\xc9\x19\x03\xd3u\x8f\
-\xd5\xd5\xbd4f\xfe\xd3O\xb78\x00\xef7|\xd2{\
-\xc2\xf1\xfah\x15\x82q\x07F\xc9\xef_\x9fqz\xcf\
-\xf6\xc8\xde\x1ay\x99z6\xa98\xe6&rKw\x91\
-\xe1\xdam\xe6Z\x10\xb4\x150\x10kU\xfe\xbf\x0b\x82\
-\x91\x19XQ\xd4\xeb\x85\xee\xc7\xfe\xb13ZPV\xc7\
-m\xe7'\xaei\xd7\xe1\xbe\xe7\xef;\xe3\xc1(\x1b.\
-\xe3<71\xb4V#\xd4\xe8=\xe8\xb7\xd7\xf5\xca\xa7\
-\xbc4\xf1jk\x1agC\xc4\x11\x85\x99\xb4\xc1\xb2\xbc\
-\xc3a[\xd8X{RsZm\xf9*\xf7\x13\x81\xf1\
-\x15\xae\xb22\xcc\xc0\xc6\xba\x0f9\xe4\xa4{\x8e\xcc\xbb\
-\xd2V\xd8v\x87=\xcf/*\xadhT\xfa97`\
-k\xc2w]G\x1e\x9a\x8f\xd2\x07\x80wf_p\x99\
-\x90\xb5\x87\xebH\xbehtt\x5csJ\x1f\x00\xdc\x98\
-\xf7\x0bN\xe8\x92[U\xe4\xec\xc2\xcad\xf3j\x03\x00\
-B\x98\x9b8\xf7\xe0\x89r8\xbc\x04\x9eW*\xac\x0a\
-\xf7l\xe9~\xcb\x10_\xed' P\xdef\x95\xb9\xd3\
-\xcf\x7f\x8c\xe9h\x8a\xe0\xb9\xfd\x0c\x82\x85\xd2$\xb2\x0d\
-\xa6\x12\xad(\x0cg\xd3\xdd\xce\xe0^\xf1\x0e\xa6\xd1d\
-F\xc4 \x8c~\x7f\xee\xcc)u\x0e2\x13M\x94\x95\
-\x8c\x04,,\xc8\x02\x86\x8a7?r\xdc\xb9\xcd\xd8\xd6\
-[&\xdd\x10\xbf\x8e\x9c\xe2\xe5J\x9f\x13\x87 \x01\x11\
-\xd4\x9c\xfd\xdc\xbdg\xdc\xd2\x96\xd2\x07\x809\x0f\x9e\xf9\
-u\x17g\xc9a\xbe+\xdf\x15\xa6f\xf2\xd1{}=\
-\xba5\xa5\x9f{\x06k|\x7f\xac\xcf\x91\x93\xe3\xcd\xde\
-\xbc\x16\xb4\xa9\xf8\x07\x8c\xf8\xbf\xad-\xf80\xab\xdb\x17\
-p\x8d\x90Kn\x92\x8d<d\x02\x01\xd7\xd6\xc1\xca\x06\
-\xd4\x07\x0e\x22\xcd\x1b\xcd\xc1\xff\x9b\x83\x80m\xcc\x11\xec\
-\xb2\xf8\x19\x03\x8f\xbf</\xc5\xf7\xbf\x80\x136\xbc\xda\
-\xe4]c\x8d\x82\xe3\xc6*jj\xdd\xd3\xda*w\xf0\
-\x88\xdb\x7f\xe1\xc7*\xbd\xa6\xc1\x8c\x18\x87\xca\xa6\x837\
-f\xfd\xf9\xe9\xce\x958\x07\x11A)]k\xac\xfc\x5c\
-8\x1e\x00\x0b\xab%T\x14V\xc8H\xcd\x1cx\xdcU\
-\x87\xacK\xfd\x87\x8c\xbd\xb57w\xdcc\x8d6\xb0\xc8\
-)(\x87\x03e\x22\xba\xed\xc5\x07\xda\xe7\xfe\xfb\xf2\x8c\
-\x8b>\xfc\xe1\x9dG\x8ex{\xd6\x84\x16\xdd\x02M\x90\
-yC\x1b\xf6oF\x02\x80\x85\xb1\x1a\x8cy\x97\x8d=\
-\xbd\xaa{>mlU\xb2\xd5R\x06=;%\xd3\xb3\
-\xb3&;;j\xc8\xce\xe6\xd6\x99\xdd\x1e9\xdb\xcb\xe2\
-\x1f\xde\xbc]\x06\xcb\xbek\x1a|\x8d\x8c\xe0\xba\xe1e\
-CO\xae*k\xee\xfe\xa1']\xd9\x85;\xb1!Z\
-\xaeX\x802!\x90Ax\x07\x00\xcc\x9dq\xe1[J\
-g\xe6\x12o\xdc`U\x0a\x8e\x9b\xe8US\xb7\xf9q\
-\xed\x91K\xc2\x1d\xa0\x1a\xbd\xcd\x88\x18\x0c\x13\x81\xcc\xa6\
-\xcf\x993\xeb\x82I\xed\xa9g\xe6\xd4\xeaE\xbdz\xf2\
-\x03\xe6>x\xde\xf8\xb3\xce\x9a\xd8\x11\x1ex\xebD\xab\
-6\xfe\xfec\xb7\xf0\xc34\xeev\x5c\xb7\xb2\xbd\x87\xb4\
-\xb4\xe2Pd0h\x87\xf7\xb0k\xc5\x07\x88y\x8b`\
-\xa5\x83\xc5\xc1fx\xee\xeb\xbe\xf8b\xd9\xd6\xf0\x91\xcd\
-kg\xfe\xbf\x11\xad\x02\xb8^QWe\xe3S\xc7V\
-U\x1d2\xb5\xba\xbaCO_n\x8cx%\xee\x15\xa1\
-\xd6\xa3A9[\xaf\xd6\x96\x98\xe3\x0c>x\xcc5\xf7\
-\xcd}\xe0\xc2OZ(FY\x8b\xf1\xae\x10=\xa3 \
-7\x09\x22\xc6\xc1`o__r\x13c G\xfc\xe4\
-\x12\x1d\x12)\xf9\x04\x13\xfe\xaeF\x850*\x82q\x13\
-~\x10\x95]\x01\xa0\xa5m\x8a6\xc9F\xf4[\xc7K\
-t\x09\xb3\xf59\xb3\x03w\x10\xaa\xcc\x15/N;s\
-\xad\x12\xfc,X\xf0|\xab\x8a\xe3\x85'o\xf9f\xff\
-\x11\x93\xd2\x8cX.\xef\x91\xd6\x88\x18\xdb\xe2\xdb\x9a\xcd\
-f\xef;\xe8\xaaG\xd3\xc1\xd2\xdbv\xdbd'=u\
-j\xf3\xee\x8d\xd3\xee\x1a\xb2\x10@\xa7y65\xc7\xa7\
-\xafM\xff|\xff\xe1\x07|\xca\x98\xd8\xdc\xe8\x08 \x83\
-P\x89\xf2E\x8e\xdb\xec\xca\xf3\xbb%\xfe\xd6n\xc2\xdf\
-\x01\xa6i\x05\xe5#\x8a\xea\xdf\xaf\xcd\x06\xaf4\xdd#\
-\x5cs51\xf3\xeb&\xef!\xa5#\xe6\xba\xe2\xe4\xb1\
-\xa7\xdf7}\xea\xa4\x93\xda\xdc\xbb\xe9;\xe4\xaaQ$\
-\xdc\xe2&\x8f(\xe2\x022L/x\xeb\xf13o^\
-\x9b>N\xa9^\xa7Cdf\xfe\xd3\x1dw\x08\xadU\
-\xc5\x9fZ2vP\xa2\xb8\xf4\x00%\xdb\xd7\x9e\xb1\x06\
-\x121\x9c\xdag&F\xed2\x17$\x22X\xd3\xb8v\
-\xb1_`\xe0\xf6\x1f\xe1\xe6\xf7G\xe1\xa5O\xb7\x85\x07\
-\x82\xed\x8c\xc4\xea\x1b\x18\x22\x82\x0c3\x10\xf1\xe2~_\
-\x7f\x91\x1a\x00\xa0U\x9f\xeb\xff\x05~Q\xfa\xd5W\xef\
-/\xdd\xf1Q.\xe2C\xb4L\xe7b\x1ay\x89mj\
-k\x83M\x014\xab\xf8\x7fu\xf85\xbd5\xd4\xf1\xb2\
-ib\xc1\x18\xa0\x83\xa5\x89x\x8f\x07\xb16GB\xd7\
-\x12\x0b\x9b|\xf9\xa1S\xbe\xdd\xfb\xd0\xdf_\xeeUl\
-\xf7(\x88\x01\xd6@\xc94H\xf8\xbb\xf5\x1fr\xf7\xf5\
-\xf3\x1e\xfd\xedykS\xb7R\x5cs\xa7q5c-\
-\x18'\xa4\xc2\xb0\xd5\x81\xe4\x88\x13o\xdeV\xbb\xc9\xcd\
-\x83tk\xf3\x05\x85Lf\xa1\xed\x12\xa3\x0f\x9ey\xe8\
-\x9aU\xceY\xc4\xb8yOq\xd1;\xb7\x07ha\xb4\
-\x05\x5cwO\x9e,\xdb3\x11+;\xf3\x9b(m\xfb\
-\x0f\xbd~n\xe4%\x1f\x80R\x80\xaa\xc3\x9b\x8f^\x9c\
-\x97M\xbe3\xd8\x01p\x8dQ\xc5M\xe67\x0b\x0bR\
-\xda\x8d\xd5F\xcd*\x07\xdfc\x97C0h\xa9@\xc4\
-@d\xa5\xc9\x86\x0f}\xf1\xcc%\xcbO^\x0f\xd8\x86\
-\x7f\xf8\xea\x97\xf2E\xee\xf8\x07i\x99\x85U\x11\xac\x9b\
-\xd8\xf9\x8b\x85\x0b\x0f\x020\xad-\x99\x98Sv\xa0\xf0\
-\xe2\xc5a\xa6\x16D\x0cRkD:}aG\xf59\
-_\xac\xb5\x00!v\xd8\x89w\x1d\x1e\xc80\xaf\xd5\x82\
-\x10\x02\xaa!\x0a\xfa\xef\xbc\xf4\xcd\xea\xea\xea5\xbe\xa3\
-VM=\x9eW~)\x98hw\x22t\xa9=\xec\xd5\
-\xf35\x0c\xdd\xf5Y(e\x90\x0eb\xc8D>\x1a\x22\
-\x1f)\xe9\xa1\xccY\x8c\x13~\xf18\x92\x9eEd\xf9\
-Z\x1b|\xa4\x02\x8c\xd9\x00I\xda\xf3\x85\x0cH\xbb0\
-\xba\xec\xcf\x1bZ\x94\xf5\xc1\xc4\x89\x13C\xe8\xec\xbb<\
-g\xd0\x00\x00h%QT\x14\xfbmKelY\xac\
-'s\x93\xe5\xd6\xe6fU\x8e[\x04%\xe9\xd9\xb9\x0f\
-\x1f\xf7\xc5z\x11z\xb9 \xb0;\x0c\x9b\xe1\xbe\xfd\xc2\
-\x0d\x8f\xb9&\x9a\xe4\xf9I\x00\x94\xf3\x08\xd4Y!\x92\
-\xe2\xf7\xfd\x87^Z\xdd\xdej\xfb\x1f9\xae\x92(8\
-@7zG\x91p\x01\x95\xf9P\x88\xba\xaf[+\x97\
-\x89\xf8\x990\xc9\xb9\x8c\xdc\x16.o.\xb1\xe4\xdc\xa2\
-\xc4\x16/\x9aH\xfcz\xf5\xf2\xc4\xb2\xe3\xc3L\xfdl\
-\xee&\x1a\x7f\x00\x18\x19\xe4N5\x0b\xb1\x89!oS\
-r\xcb\xc6r\xf2\xe627>\xd7\xf1J\xe6\xf6;~\
-\xd2c\xbf:\xe1\xde[\xfb\x1d{\xed%UU\xb6]\
-\xae\xde\xebJ\xf1\xe1\x97\x1d#\xb8\xbbk\x93w\x0e1\
-\x01F\xd1\xd3%\xbc~\x8d\xf8A\x87\x8e\xba\xe6P\xe6\
-'\xf64z\xc5L\x5ck\xb3\xe4\xb0]\xcf\xbbe\xe5\
-\xfb\xaa\xab\xcf\xaa\xd7Q\xf0\x01[>\xb1$hm\x00\
-\xe6\xe5\xa5\xbc\x15\x93ic4\x00\xcaY&\x8cB(\
-\xc5Om\x95\xebh\xacQ \xa2\x0ae\xf1\x0ccN\
-+\xef\xc4\x8a\x0b\xf0\xe6*\xce\x9e\xfc\xf8\xe3\x1d\x9b\x9d\
-\xdc\xb7\xf8\xc7=r\xf4\xad#D<\xb6}K\xee|\
--a,\x03wB\x1c\xb3\xeb\xeb K\x88\xe0`\xe5\
-M4\x0bBJ{\xe8^\xb4\x08\xfb\xf7\x9c\x0fmX\
-\xbb\xddC\x09@ ]T\x14\x1b\x08\xa6\xb11\xeb~\
-\x15e!\x9c\xe2]\x0f\x18us\x87\xfb\xf6o\x8c\x94\
-\xf2`\x8aR\xe1\x02.\x9a6J5\x82l\xf6\x98}\
-\x8f\xf8\xfdN\xcd\xdd\xefX\xb7\x8a\x0c\xe5\xdc\x13\x89\xc1\
-\xea(\x8c\xb9\xd1{\xebQ\xe4\xe5t\x89wa\x000\
-\xf7\x91\x09g\xa80\xba\x13\xdc\xb59\xe5O\x08U\x04\
-\xc5\xbb\xfe\xae\xef\xb1Wo\xd5\x9e:\xa9\xb4\xdb\xd6\xae\
-\xa0\xbdl\xa3B\xe3\x8e\x0b\xcb\xcd+\xefL\xab\xfe\xbe\
-\xb5r\x81\xe2Q\x10I\x84R\xb5pI\x84\x91\x02q\
-\x0f\x96\xb3\xd8\xea\xe5\xe7<x~\xba\x8e\x16\x0fK-\
-]\xfa\xa8\x1b+\x01s\xbc\xc6\x13\xd0\xb9\x03EFK\
-H\x1d\xc1\xca\x00\x90!\x8c\xe1 \x16\x1f\xcc\x99;\x81\
-b\xe5\x97\xbf\xf4\xe9\x94\xcf\xf6?\xf6\xd6\x93w\xd8\xf3\
-\xf4\xbc\xf6\x05\xd6\xe8\xb7\xa5\xbcWk\xbbt\xeb\x96\x10\
-\xc9\xa2\xf3\xc9\xf1\xfc\xdc\x86\xb4\x85pb\x08E\xc9\xf4\
-Y\xb3n\xca\xae~\xbf\xa2\xa2\xc1\xccI\x96X\xa3r\
-\xe7\x0d\x14G\x98m\xb8\xab\xba\x9a\xd6\xf08\x13,s\
-\xbd\x91\x99:\xb6\xdc\xe9@\xc1\x89\x15\xf5\x1c}\xfa#\
-\xbfjK.\x8f\xf9+\xce{X\x0b\xe1\x10\xca=\xd7\
-i\xbdT\xe7`\xadE6\x88\x10F\xba\x95wb\xd5\
-Kr\x9e\xf9\xa8\x85\xfaZT\xfc\x19\xe3\x1d\xcaD\x8c\
-\x9b\xb58\x8eM\x8c\xa3\x1bS`\x8d\xc7\xceW\xc7\x00\
-\xf0\xdc\x08{o\xfd\x0d\xb4i\xdf!W\x82EZ\xba\
-\xa8,\xff\x09\x97\x1c\xf1(\x8e\xfa\xe5\xbbHG\x89\xc6\
-\xc4/\x1b\xdf\x08`a\xa0\x89|\xab\xd9\xa0[&L\
-\xe8\xb8 \x1c\x1b)\xcf<tQ\x8d\x03\xfdW4n\
-\xde[\xa5\xe1\x17\x97{\x89.=\xcf_\xfd\xde\x83\x8e\
-\xae:@*\xfa\xa5m\x0c\xce\xc68\x83\x8c\xea\xff\xf3\
-\xe2Cg\xde\xba\x9e\xc5^\x83\xae\xf1o/v\x85l\
-\xe0\x22\xb7\xd9k\x94\x02s\xe2\xe5p\x8b\x1e\xee7\xf8\
-\x8f=\xf2\xadG\x90\xeb4y:\xe5 X\xe5\xb4\xf9\
-Q\x11\x91\xc5\xf2\x95SK'6-\xac\xd50\xb6y\
-\x93\xd8\xc73\xab\xa3\xad\x96\xbd1\x06\xa9\x9f\xfe`2\
-\xa9\xb7\x8d\xb6 ar\x87z\x1c\x17L8h\xda\x8f\
-\xb1\xd6B\x87\x19D\xd9zh\xad\x00\xc1\xb7a~\xf2\
-\xee\x8a-\xb6\xf9\xeb\x11\xa3.\xdb6\xdf\xfe\xe6db\
-\xc8\xd7)l\xc0\xe0\xaa\x03\xbb\x1e~\xf9\x83\x10\xf1=\
-t\xa3I\x99\x0b\x1f2L}\xa3\x8cx\x7f\xf5\xfb\x8f\
-\x1cs\xcd\xe6\x1a4(\x0a\x1a\xdd\xca\x89\x00\xaa\x03l\
-\xcd\xf3\xcd\xd5\xff\xd2#\x17\xffHZNf<\xf7\xe9\
-\x19\xa3\xc0\x9dx\xc9\x8fu\x99\xe1m\xc9\xc6V~\xaa\
-6\xb7\xb9\x8b5\x86\xd8\xf5\x09\xad\xf4o>W\xcb\x0a\
-\xb1Y\xad\xbb\xd7\xd0;v\x08-\x86P\x90m\xfe\x84\
-ck\xd8\x9c\x1dS\x8b\x96\xcb\x11Y\x98\xc0\xc1w\x8b\
-\xba6>\xdd\xfc\x146\xc1\x22\x15\xc5\xd0\xbd\xa4\x06\x97\
-\x1e\xf80v\x8b\x7f\x84\xde\xbb\x13\x22E\x981\x7f\x00\
-\xe2^\x00FM.l\x1b\x0fFe`\x88\x1d7w\
-\xf1\xbe\x17\x00\x13\xff\xe7\xb3v\xd5g\x96\xdc\x1d\x8bo\
-r:!7\x91\xd7\xca\x22\xab\xdc\xee\x07\x1f|M\xc9\
-\xdc\xb9\x17.\x0f\x18\x93u\xca\x8fqc\xc9\x84\x0cr\
-\x9b\x9e\xda2h\x93}p\x03\x8a\xbe\x9cY\xf7T/\
-\x1bt\xea\xfd\xa74dq\xbf1N\x0cF\xc1\xc8\x0c\
-\x1c\xafd\xaf \xac\x9f\x06\xe0@C\xae\x06Z\xdf\xb3\
-\xb7H\xff\xa4T|1\xb1d\x17k4\x8cV\xb02\
-\xbb\xfd\xb0aU\xc9\x993\xab[\x8c{ba\x93\x8e\
-_\x8cU&\xceV\xe4f\xeb2\xd3\xdc)\xfc\xe6\xfb\
-\xf1\xd6\xac,0\xeb\xba}\xf69\xe7\x1et\xdbjS\
-\xdf\xc9\xf6\xb123!\xe2qf\x8d\x8d;\x82oG\
-\x22\x01k\x09\xd6(\x18\x1d\xc0Z\x9b;$\x06\x82\x9b\
-\xa8\xdc\xb9^\xd2_\x00\xec\x9bW\x83\x00\x8c\x8a \xc8\
-\x9b\xd8\x7f\xe8\xadW6\xf7i\x1b\x0b8\x0e\x83e\x1c\
-a\xa8z\xc5\xe0'\xad^\xe1<\xc2\x85\x07\x95ix\
-\xf8\xdd\x99g\x7f\xbez\xd9\x9aZ\x7f\x80[\x12\xdf\xc4\
-6\x0d\x12n\x1c*\x88\x9e\xee\xdb\xab\xf4\xef\xef\xb6 \
-\x0fc%S\xb4\x8cN\x01\xe3ed4\xa2 \x0d\x18\
-;r\xbf\xa3n\x9a\xf8\xc6\xecs>k\xa9\x1f\xa12\
-\x10+iH\xce|p\x11\xdb0\xb3K\x22\x087\x09\
-P~\xfa\x92s\x072%+\x80\x1d\x9a\xfd\xfd\x9a\x8a\
-\xdf\x82\xdc\x91\xd9Q\xdc++V\xe1\x1a\xab\xac<\xe4\
-3\x88\xa4\x87W\xbf\xd9\x07\xdb\xed\xfa\x05\x18\xe5\x8e\xc1\
-\xaf\xa8\x1ep\x99D]\xe8\xe1\xd9\x05[\xc2\xa5\xdc\x0b\
-\xd6vgrJ\xbfGI\x1d\xaa\x06\xde\x8b\x9d\xcb>\
-B}\xe8\x813\xe0\xf4=g\xc0!\x81\x87\xde\xf9\x15\
-\xfcx\x1d8\xdc<\xea[\x7f\x90\x01,\xf7\xc4\xa2\xcc\
-\x97'\x01\xb8fC\xcb\xd3\xd9lVR\xf6\xddR\x15\
-\xbe\xc2D\xec\x00-\x03(\x99E\xccK\x1eb*\xe9\
-@\x00\x8f\x03\xc0a\x83o\xd9,\xe5\xb8\xfd\x9al\xba\
-\xc6Z\xc4=\x17\xf1\xb2\xcd[<\xb0\xb3\xbeyj\xf2\
-\x893\xf6\x191Q\x08\x11\x9bJ\x96\x0bk5d\x94\
-\x86\x17\xef\xde\xf7\xe0\x13\xa7\x1d.\xed\xe7/AV\xb4\
-Z\x87z\xe0\x9a\xaf\xc2\xe17?\xe3z\xfe\x89\x88\xd2\
-P2\x80\xe7yG\xd6\xa4c\xbb\x02x\xad\xa5r\x96\
-\xd8\x13a\x94\xfa)\x92M\xde\x9e\x06P% \xb2}\
-\x84\xf0\x0e7\xba\xc5\xb8w\xcd\xf2\xd6[7-\x03\xb0\
-\x0c\xc0?\x01\xdc\x0f\x00\xc3\xc6]P\xb2xY\xecD\
-\xa5**\x22\xc5\xe0q\xd5\x0fp\x0f \xc1am.\
-\x18\xa0\x0c\xb3 \x96\xe83p\xd4\xcd#\xe7<|\xf6\
-#\xf9\xb5fa\xb8\xbb\x05\x89\xe6\x0d\x0a\x84\x15\xe7N\
-\x99\xc7\x91M7f\xed#\x82\x17K@\x85\x0d\x0f\xbe\
-\xb1\xc3Y\x97\x00g\xafQ\xd6x\xe2O\xca6\xad\x10\
-\x05\x8c\x0c\x97.[\xb4\xf8\xffn\x9aqy\x8b\xca\xea\
-\xe5\xe9'~\xb9\xff\x90\xdb\xee\x13\x89\xe4\xb9*\xcc\xc0\
-\x1a\x03\xe6x\x152\xfd\xe3ih\xae\x91F\x02-\x9b\
-vH@\x04\x18e\x10dt\x9b~\xfb\x1dM\xceD\
-g\x1a\xc2 {;XV\x82Eh\xcb\x13\x9fY\x17\
-\xa4\x9c\xba\x1d\x1f\xdbQ7\x17\xb2wM\xc5O\xb0\xf2\
-X:\x91\x89\xf6\xbdX+\x84\xcc\xcd\xe8g\xffc\x0f\
-\xfc\xb2\xecC\xec\xb3\xcd?\x90\xcd0h\xb8\x00\x18<\
-7\x03n\x80i\xf3\x7f\x8dE\xa9\xad\xe11\x8d\xb6\x94\
-4\x83E\x9d\xf6\xd1\xa34\x85\xcb\x06\xdc\x89\x1d+>\
-CC\xe8\x83\x08\x90\x16p\x94\xc2\xf8=\xfe\x02A\x12\
-\xd3\xde\x1f\x00\x88\x148\xb9X\x8fN!\xadba\xc1\
-\x19\x07\xe7\x891\xf8\x19(\xfe'\x1e\x98\xb0t\xdfa\
-\x93\x1f\xf0\x04\xef\xafAD\xb0\xd0F\x81\x91\x1c\xd7\x7f\
-\xec\xd8\xe7\xe6M\x9d\x1a\xd4\xaa\xfa\x83b\xce\x16\xbbG\
-\x8d\x912\x1d/\x01#\x83\x07\xb6\xdd\xd2o\xc9\xeds\
-\x83\xf0\xd6\xf4\x09\x0f\x0d\x18~\xf38\x8a\x97\xf7\x0f2\
-\xf5 ka\x84q\x94L=\x88\xb0\xf2\x0f\x96l\x96\
-,9-\xbd\xc3\xf3\x00\xb5O\x14_\xc2c\x0e4\x00\
-f\x01\x05\x1fiO\xf5B+\x8a\xff\xadG\xc6?\x0f\
-`\x0d\xf3\xc5~\xc3o;\x8e;\xf1V\x15\x7f\xdf\xa1\
-Wv\x89'\x8a*ry\x15<x\x00\xdc\x86\x86\xef\
-\x9e~\xbaz\x15\xf7\xbc\x99S\xae\xad\x03\xb0|Ct\
-\xbf\xa3\xce/\x8a\xcc\x96\xbd\x85\x1f\x5c-\xdc\xc4AV\
-+X\xab!\x9c\x22'\x08\xb3\xc7\x01\xc8S\xf1\xe7\xf6\
-\x11\xf2\x85\x88@L\x80\x1c\x07\xa1L?p\xf0\xb6\x15\
-\xbf}\xb5z\xcd=\x82}\x87]\x7f\x86\x17s{\xca\
-H6\x15\x04\x83\xae\xdft\x8b\x9d\xbf\xed:jr\xef\
-\x16\x1b\x08\x01\xe1\xaa\x22cm\xa3\xf1\xcc\x82i\x0d\x11\
-K\x8e\xed3\xae\xcf\xf9\xf3\xa7\xccoV\xd8b7\xfa\
-V\x9b0\x021\xd7Z\x03\x0b\x03kT5\x8056\
-\xd3;\x13b\x1cV\x99\xba\xb7f\x8c\xbb\xa8\xfd\xa5\xc7\
-7\xfb\xd35\x86\x8d\xbe\x83.>\x8c;~\x91Y\x07\
-\x9d\xe9\xb2\x08)\x19\xc7\x0do\xfd\x06\x0f\x7f8\x10\x9a\
-\x8a\x10\x13\x01\x1c7\x83ok7\xc3\xff\xcd\x1b\x83G\
->:\x02.\xb3y\xadX\xeb\xa3\x046)\xaa\xc3\x95\
-\x03o\xc5/\xba|\x86t\xe8\xafb\xedRF@J\
-\xc2\xa9\xbb\xcf\xc4\xd8]_G6J\xc0\xa2\xfd\xab\x95\
-\xce\xc4h\x05\xcf/*=|\xc4\xed\xfbmhY\xd6\
-\x07\xc5\xea\xdb\xe7d\x94\xfa\x9299\xfb\xb6\xd1\x0a\xca\
-\xb0\xfe\xf8fK\x01\x00\x869\x17\xaa\xa6 e \x90\
-5`:\xf3\xce\x0d\xe7\x9f\xb0\xd1e\xf5\xa9(.?\
-0\x09\x8b\x07\x00\x00 \x00IDATIf3\xff\
-\xcc\x05\x14#\x18\x19@\x1b[f\xb8\x7f\x97a\xac\xc8\
-P\xeb\x93\xc0\x8a2\xfd\x86\xd1\xd9\x060\x96\xf3\x0e\xb1\
-\x80c\xe9\xaa\xb5\x91\x85\x80d[^v\xc4\x12g)\
-\x1b\xff\xc4\x98\xc4'\xc68\x9fD\x14\xfb\xa4\xd6+j\
-\xd3T\xf3\xc6\xec\xeb\x1a\xde{\xfa\x8cw]\xe3\x9f\x06\
-m\x96\x9b\x93\xac5\x88\xc8\xcb?;\x97%0\xc6A\
-\xc2i\xf5\xe2\xcc\x83\xe0\x0e\xc8\xf5!\xa0\x94\xa3\xc3\x9b\
-^\x7f\xf0\xb4\x13\xaa\xab\x87\xaf1\xaa\xfd\xe6\xfc\xbb\x8b\
-\xb8\x13\x1bd\xad\xe36\xf5\xdf(\x09\xa5M\xafl\xb4\
-\xf4[e\xcc'-^\x8e\xf9$k\xf8)a\x94i\
-\xd4\x1b\x16\xda\x00B\x94\xfa\xf1\x9a\x11-\x1e\xe8z\xe9\
-\xe1\xdf\xff_6\x95Y\xc8\x1a\x0f\x81Y\xab\xe1x\xa2\
-\xef\x9e\xa3ojsc\xb8\x13\xe8\xdc\x93\xbb<Q9\
-\xc6\x8f%K\x8cY\xb7\x15\x8d#\x22\xfc\x98\x8a\xe3\x8e\
-\xb7\x86\xe3\xc2\xbf\x9e\x89\xf3\x9e=\x17\xe7?{6.\
-\x9cs\x1af/8\x10q?j\xb4\xc7\xb7\x0c\xc1\x22\
-\x13\xc5\xd0\xa3\xb8\x01U\x07\xdd\x8a\x1d\xca\x16 \x1b\xc6\
-\x9a\x9d[)\xcb\x11j\x85\x13\xf7\x98\x86\x13v\x9b\x83\
-L\x18\x83\xde\x88N\x87\x19#\xc1Db\x93\x1a\xc5\xf3\
-\x0a9\xfb\xdf\xce\x0b\x8f_\xb5\x90\x99\xf0\x83\xa6\xff\xb6\
-\xc6\x00\x8e\xe7\x06\x15\xc9\xb37\xdb\xe7\x9c\x98\xe7\x97U\
-4\xad\xc88w!ej\xd1\xb6\xa5\xd96}\xab7\
-\x04\xb3\xee>\xe1\xeb\xc5\xb5\x89C\x89\xe9\x85\x8cs\x00\
-\x0c\xc6\x18\x18R 0j\xeb\x14\xe23\xf7\x9d\xf6\xb8\
-\x0c\xeb>\xe7,\xe7\xe1fM\x04\xe2\xf1n\xbb\x1dv\
-\xc3\x95\xed\x95\xc5\x02\xa9\xb6\xf6\xb04\xb9\xcc\x92\x0fK\
->\x0c\xf90,\x01K^\xde\xee\x99n\xb1\x87\x5c\xb0\
-\xd3\xc6\xa8\xdb\xed\xfd\x8e\x18 \x95^\xaa\x94\xf9V\xe9\
-\xe6/\xa9\xcd\xb7J\xc9o\xad\xce|\x0b\xd4\x9f\xe1\xeb\
-\xf4~/M\x1b\x7fnKU~\xfd\x9fh;\xb2\xce\
-\xc0f\x83\xf0\x11\xb5y\x11\xccJ\xfb\x95\x04\x8b\x08\xcc\
-q|\x8d\xf8\xd1\xfb\x0c=\xa7\xa5-[[\xe4\xd8\xef\
-Yc\xa4Zk4\x18\xb3\xc9\x98\x89\xcf\x1e8\xb8\xaa\
-]1\x7f\x00P\xdf!\xd7\xdc\xbc\xf7\xb1\x17\x8ehg\
-\xb9Na\x8d\x97!\x1d\xbai\xa5;\x22\xfe&\xc1\x15\
-\x0a\x1eE\xf8\xe0\x87\xcd\xf0\xce\x0f;\xe0\xdd\xff\xec\x8c\
-\x1f\x1b*\x90t\xb2\xa0<l\xf0\x0dQ\x1c\x9b\x94-\
-\xc1\xe5\x87L\xc4/\xba~\x83t\xe8\xc3R\xf3\xe5V\
-\xcc\xfc]\x8c\xdbs\x16F\xf5y\x0e\xd9\xc8\x81\xee\xfc\
-\x986yA\xa0\x5c\xd2\x06\x0a\xb7\x1a8p`\xa2\xed\
-\x12\xed\xc3\xa2\xd5\xb0\xf7\x1b\x04+\xcd%FF\x8d!\
-\x9e\x0d\x08\xc4\x19/\x19\xdc\xb3\xcb&O\x80\xa32\xe7\
-\x87M0\xb0\xb0\x90\xd3\xee\xb8\xe3\xa2\x9a\xb6\xea\xdcP\
-|\xfa\xc2\x98\x85\x82\xa5'\x8b\xc6\x98\xf5\x00\xdau\xbe\
-\xc5\xd5\xf6\x0e\x82\x00\x88\x1aCz(\xa7\xa8\xb2\xe2\x8f\
-\xfdG\xdcy}\xbb\x04a\xf6P\xd3J\xaa\xcb\xdc-\
-D\x166\x17\x01\xb4\xf1\xd2MG\x5c\xf3\xa06\x8b@\
-iZ\xb1\x1a'\x02\xe7\x22\xef\xd8M\x9c;`V\x9e\
-%K\xfal+\x8b\x9b\xbfTq\x9fm\xc32\xda6\
-]\xe2o\xfb\xda\x03gOz~\xc6\xf9-\xed\xcd\x02\
-\x00R\x99\xba\xe1`\x82\xad\xf2\xcc\x89\xe5\xae|X~\
-\xef\x0a\xe5\xaf\xa24\x84\xf0\x8e\xf2\xec&{\xb7TL\
-p}\xaaUa-5zfi\xa5\x00\xceJ\xc2x\
-\xe9\xc3\x87\x8e\xb8\xfa\x80|\x9a\xee\xd3\xa7\x8f\xd3\x7f\xd8\
-\xd5\x0f8~\xf7\xb3\x04\xef\xfe\xf0\x01\xa3\xae\xba8?\
-\xa1W\xa5N\xf5\xec\xb0o|\x15\x1b\x7f\xbfQW\xec\
-E\xd6\x0c2\xb2\xe3\xcc$\x96\x11bLce\xbd\xd4\
-\xd6\xe7B\xb0h\x88\xe2\xd8\xa2|\x19.=\xf8.l\
-[\xf69\x82\xac\x9fWx\x07\x8d\x10\x91r1n\xf7\
-\xa7@J\xe1\xa1\x0f\x8f\x85\xef*pR\xd8\xd0\xde>\
-Ve\xe0p;:[|\xc0u\xc0\x9c\x7ftd\xdd\
-\xae0~\xdbw\xad_\x92\x89\x86E\x19\xe3\xbem)\
-\xbe\xb7\xd5\x11L\x14B\x08\xda\x9d\x8a\x8b\x90;\xd0\x94\
-\xfb\x10\x19cH8\xbdn\xdb\xd0\xf2\xb6E\xff^\xbf\
-\xbf\xf2\xd5\xaf\xee\xed!\x9c\xf8\xa9\xb9\xd3\xec\xf9+\xfe\
-.\xfc\xd0\x07\x16F\xaf\xfdJ\xf8\xf1\x13T\x94\x06\xac\
-\x81Q\x01\x98\xc3\x7f?p\xcc\xe4]\x93V^/k\
-\x17\xbf\xba\xba\x1d\x1e\x00\x8e;\xae\xaa\xf8\x9b\x06\xff\x18\
-J\x94\xfe\x96\x91\xd3O\xb7\xf1}j+3L\xebF\
-_\xd0\x9c\xcb\xa7\xeb$\xff|\xfa\xe93\x8e\x9e4i\
-x\xab\x19\x94\xaaP\xc5^\x02]\x01\xc6`\x9a2\xa2\
-\x91\x81\x97\xf7\xc0A\x00YX\x11\xd5\xce\x9f\xb2G\xfb\
-\x0e\x01\xb5\xc0\x91\xa3\xaa*\x7f\xd4\xeex\xd8\x15:\x84\
-\x0b\x07\xd6\xe8vz\x1d\xe6BFk\xa3`\x8d\xca\xfd\
-\xf98g\xa1\xd6\xe7\x00x\x15\xcdl\x0a\xbe\xf0\xc8\xb9\
-\x1f\x1d|\xd2\xadwX*\xbd(H\xd7\x22\x97\x10'\
-\x02w\x8a\xbb\xa6\xc9}b\xf7#\xae\x9a\x88z\x7f\xd2\
-\xfb\x7f;w\xe1\xeae\xfb\xf4\xb9\xa0$\xb9u\x8f\x9e\
-\x92\xf8U\xf0\xe3\x83t\x98\x01\x898\x91Sr\xc5\x01\
-#o)\xf19\xaex~\xdaY\xf5\xab\x97k\x89M\
-\xb3\xd3iA;z\xdb\x1a\xab(\xfe\xc8\x96w\xf7\xbd\
-dw\x1bl\xc8\xecZ9\xef\x9d\xcdK\x7f\xc4\xe5\x03\
-\xef\xc3\xb6%\x9f\xe76r\xf3.OP\xd6\xc2\xd1\x1e\
-\xc6\xed\xf3\x1c\x18#<\xfc\xc1\xd1 W\x81\xd1\x86\xf6\
-\xf6\xb1\xb0<\xc1\xac\xf5:t\x04\xd22\x001\xfb\x87\
-\x01\xa3\xaf\xdf\xcfZnm\x9eks\xc6\x5c\x1e\x85\x0d\
-o\xbe>\xf3\xa2{;R\x9e&\x9e\x9fV]\x7f\xc0\
-\xc8\x1b\x1e\xe2\xae\xbbw\xa0\xa3\x9c}\xdc\xd8\xc6Yh\
-n\xa6\xc6y\x1cd\xd2/nU\xf4i^)\x0b7\
-$\x8d\x07\x84\xc6\x1f0j\xf2\xb6\xc2\xf1\x0fT\xed\x98\
- \xcd\x9c\xb9S\xb4\xff\xa0K\xfeO\xda\x8a!\x8e_\
-\x9aP2\x0bk\x0d\xb42\x88\x5c\xff\xa0e\xda\x1e@\
-^\xc9\x9b\xfd\x86O\xb9\x13\xae\x06t\x04H\x0e\xcd8\
-\xbe7\x99\x8b(\x91\xdc\x91\x09\x07:\x8f\x0c\x9b\xb1\xe2\
-\x85S\xb2i>\xce\xe1\xfef\xb9\x14\x80\x12\x9e_t\
-\xe0'u5\x8f\xf5\x1b5e\xaa'\xbf\xfe~\xee\xac\
-\xab\xe7\xad\x5c\xa6\xff\x90\xf3\xf7 w\xfb\xed\xe7\xaa\xf0\
-H\xc7\xe5#U\x94\xeb\x1b1\x81l\xba.\x12j\xe9\
-\xe4\xf6<+\xb2meU\xcb\x9f\xc0\x96\x5c\x94\x88\x15\
-\x17\xc9@.\x97\xc9\xc8\xbaW\x84J\xcd\x15,\x7f\xb3\
-7#hi\x9d\xeeZ\xf8'\x12\x13%\xd6h\x18\xa3\
-\xc0\xdc\xc4\xa1\x87\x8f\xbe\xbc\xe7\xb3\x0f\xfd\xe9\xdb\xe6\xca\
-\xed\xbf\xf9\x84K\xe6~zo\xa5\xe3%OQQ\x0a\
-\xd6\x02:\x0a@\xdc)\x89\x17U^\xa2=y\xf6^\
-G_\xfb\xa8p*\xe6\x18'\xa7\xc7\x99.\x86\x0dj\
-/\xb6,\xd6\x8bs\xee\xcb0\x04Y\x0bX\x09k\x1c\
-\x80\xf88\x15\xa4g\x00h\xf3\xb0\xa25\x1a\x16\xa6T\
-V\xec0\xe9\x80\xd17\x06\xb6\x1d\x09\xb489L\x07\
-\xe9\x85\x8b?\x99\x7f\xe5\xc7\x1f\xcfl>\xe7.\x97D\
-J\xd8\xfc\xbc+;\x01\x82ACT\x8c\xcdKjq\
-\xd5\x81wc\xeb\xe2\x05HE\xedQ\xfaM\xf5X(\
-K\x10\xd2\xc1\xb8\xbd\x9e\x86\xcf\x04\xee\x7f\xefX\x08\xb7\
-\x1e\x9c\xe5\x93\xa9\xa9s\xc8\x9dg3p}]\xd2\xa1\
-\xf5Z\x0dec;\x12+\xda\xb1=\x99Y\x98\x9b\x80\
-\x8a\xc4\xe6\x00:E\xf1\xe7d\xab\x9f\x9d\x95\xb1\x93\x85\
-\xf0v\xc9\xb9n\xd2\xf2\xc7O 0fu:\x95y\
-\xf4\x8e\x876^3\xcf\xea\xc8\xfa\xcf/\x0fD\x8f\x01\
-\xc9d\x19)\x95\x7f\xa0\xc5\xd7\x9f\xba\xe2\xa3_\x0d\xb9\
-\xe4\x04+\x9di\xc2M\xf8*\xca\x02\x16Pa\x00\x10\
-q\xe6\x15\xf5\xe5\xdc\xeb\x0b\x06\x80\xf9\x00'0b\xd0\
-Z\x00FCG\xf9\xc5\xf9{\xe9\x9e\xab\x7f\xdc\x7f\xc8\
-\xb5O\xf1D\xd1iZG9\x8bvP\x0f\xe2\xb1\x81\
-\xc2\x11\x03\x03\xdd%\xd8\x7f\xf8m\x7fE\xce/\x10\xd6\
-\x1a\xa6I\xf6w\x1c\xaf\x823\x82\x8c\x1a\x80Fc,\
-\x17\x0e\x1c\x95\xfe\xd7kOT\xbf\xbe\x16\x8fj\x9d\x19\
-t\xf2E\xdd\xea\xd2n_(FM\x07\xda8\x03\x98\
-\xc2y/?v\xe9\xfc\xb5\xa9\xb3\xdf\xc8\x9bv\x02/\
-:\xc8\x1a\x0dk4\x84\x93\xf0\xea\xb3\xfa4\x00\xcd\x86\
-r\xa8\xae&\x03T\x8d\xdfwx\x0f\xe6\xf9\xc9\x93U\
-\x94n\xf2\xf0\x01\x11\x81\xfb,)X\xd7\xb1\x0cb\xac\
-ee\x00,H80NI.\x8b\x99\x8a\x1aU*\
-A8q\x10EK\x94\x09\x8e~\xe5\xd1\x0b\xf2:\xa1\
-n\xad\x01\x11\x8f\xb3X\x97\x93t{\xb5!\xe7\x88\x04\
-\xcb&w\xeb{\x03VR\xfc\xcbG\x8eq\xe3\xc69\
-\x9cg\xce\x80\x95\xd80!3-\xeae\x1c\xbd\xca\x97\
-\xe2\xea\x83o\xc4\x96]\x16 %\xd7\xc5z\x91S\xfe\
-\x91\x8c\xe3\xa4=\x9e\xc0\xf8=fC\x1a\x01\xbdN\x89\
-\xa1\xd7\x11k\xc1\x18\x87\x89\xd2\x1d\xee\xd2i\x8d\x82Q\
-\x01\x8c\xca\xe6\x7f\xc9,\xc8\xb2\x0e\x8b\xf8\xd7\x1c\xf3\xa6\
-W\x7f\x13\x83\xfa6\xb7)\xba*Lx\x08d\xea\x93\
-xM\xc3}\x9d)CG\xf3\xfa37\xbc\x12s\xc4\
-h\x102\xc4\xda\x95\xb6\x00\xaf>z\xc5c&\xb5p\
-\x90Q\xf5s\x85\x1b\x03\xb1\xc6XU\xd66\xe6fM\
-A\x06)\xc80\x0b)3PQ\x0aV\xcb\xc6\x8f\x9f\
-\x81X~\x93=\xd7\xb2k\xa3\xb0\xf6+\xe1\xc5\x01\x96\
-\xcb}lu\x90K4\xcf\x93\xbe\xf0\x92G\x09/1\
-Tx\x89\xa1\x8e_t,D\xb2\x22\x0a\x1b\x90\x1b\x9c\
-\x19\x88\x00\xc7K\xc2\x9a\xf0'O\xd4\xff\x0e\x1bh\xb6\
-\xb4\xac\xae\xdb.L\xc4\xf7jJS\xc9\x84\x0f\x1de\
-\xde\x13j\xe1\xbf\xd7\xb6N\x87\xfc?\xb2\xa6\x8d_\xd8\
-\x5cXn\x87\x0e\xea}\xe8)\xad\x9c\xc8\xae6o\xce\
-\x18\xff[\x84\x99;\xbdX\x12\xc4\xdd\x5c.-ka\
-\xb5\x85\x91Y(\xd9\x00\x1df\xa1\xc3\x10*j\x80Q\
-2\xe7\xd4\x00\x02\x11\x87\xeb% (\xfb\xad\x87\xfa\xc1\
-\x7f\x9b~^;3\x81\xd9\xf6\x7f\xdfM\x17lC]\
-K\xc9\xd6\xff\xfe]\x8f\x98\x86\xb7\x07\xdb\x00\xa1\x0f\x08\
-@*J\xa0WI\x1d\xae\x1a0\x11\xbd*\xbfA6\
-\xec\x18\x93\xb5\xb1\x06Y\xe9`\xf4\x1e\xb30n\xf7\xa7\
-\xa1\x02\x06e\xd1\xfe\x13\xc9\x1d\x06\x01\xbc\xb8\xf5S?\
-m\xe3\xe5\x92e\xc7\xd6\xe9\x12n\x1c 4\xbf\xd1L\
-\xb6\x887\xb5\xe1\xc6\x01\xb2Ek+lq\x8cM\x82\
-5\x10^rE\xfbn\x1c\xc2\xf5\xe10\xf9\x8fy\xf3\
-\xd6=d\xb5%x|\xa5g\x22\xdc\x048x\x8bq\
-U\x88h\xa5\xfe\xc5@D%a\xfa\xa7\xbc_\x8a\xd7\
-f\x9d\xfd\x88R\xa9\x8b=?\xd6\x98\xb8<\x0e\xe1\xc6\
-A\xa067\xee_{\xe6\xca\xb9\x7f{\xf8\xac\x81.\
-E\x13]\xc1\xb3\x10\x0e\xb8\x13\x071\xa7\xd9/\x8f\xb8\
-\x00w\xe20\xc6 \x0aC+\x1as\xf0r\xe1C8\
->\x08pW/\xf3\xf2c\xe7\x7f\xbb\xa8\xe6\x87C\xad\
-NMs87N\xe3s!\xc6a\x8d\x84\x8a2P\
-Qz\xf9e\x95\xcc%2q\xe3\x10n\x0c\xc6X\xe3\
-!\xfbT\x1c\xee\xaf_|\xb8\xea\xcdV;dl\xee\
-\xd9\xbb+\xfe\xb6\x96h\x9dc\xda\x1cydU\x5cC\
-_\x0a\xc7\xcb\xe5\x9au\xe3\xf0<\x1f\xae\x8b\x07\xe7<\
-~\xc3Z\x07K\xdb\x84o\xf5\x91\x91\xd9\x97\xddX)\
-\xb8\x13\x83%B2\xd1m\x8f\xf2\xa2\xadGUUU\
-\xb5:\xb2\xbe<\xfd\xd4\xd3\xc3\xd4\x8fc\xb8I\xbd\xcf\
-\x18\xb7\x8e\x9b\x80pb\xab\xe5\xa8n\x8c\xc4\xca\x05\x1c\
-7\x09!|0K\x19\x1b\xd5_%\xd4\xa2\xc3\x9e\x7f\
-\xe0\xbc\x16\xcfo\xac\xa8b\xa5\xefo].7\x06\x00\
-%\xba\xa5\x9c\xbb\xc2\xedi\x89\xc2\x0e\xd9\x8ci\x1f\x06\
-\xa9\xb0\x04\xdb\x14\xff\x84\xea\x81\xb7`\x8b\xb2\xef\x90j\
-\x97M?\x8f\x16,GF2\x8c\xd9\xfdih\x19\xe2\
-\xae\x0f\x0e\x03y>8\xe52>\xado\x94a\xeb\xb4\
-\xec\xb0\xac\xfe\xf3 \x12/\x84a\x16\xeb\x22\xbf\x82\x06\
-\x04\x9a\xfd\xa8#\xad^\xb0a\xdd\x96Z\x86\x80q\x11\
-\x17r\xc1\xe9]?\xb6\xf3\x9a\xbb\xb9\x0d\xb2\xbb\x1c\xf2\
-\xb2}\xff\xe5'\x83 \xeb\xa3\xd1#\xc52\x0e\xa1\xb9\
-\xed^\xea\xfdi\xad;\xb0\x12\xda\xaa\xcf\x82\xa0\xee\x05\
-\x15\xa6`A\xe0\x8e\x83DiI\x8b\x81\xd0\xc8q^\
-\x08\xa2\xfa\xadt\x14\x80\x94\x80\x17O,\xed\xba\xdd\x8e\
-\xfa\xadf\x1356\x8f\xc8\xbe\x7f\x7f`v9H\x8b\
-b\xc7\xca4\x144\x88\x9c\x16\xf3\xcc\xae\xce\x9c\xbf\x9c\
-z\xe6\x88S\xef\xb8\xf1?\x8b\xd3\x174\xd8\x92^I\
-7\xdc\xc3\x8f\x17Uh\xdd\xe8}B\x1a\x82\x0c\xb2\xc1\
-\xd2\xffd\xb3\xb1\x7f\xf1\xb0\xe6Er\xdc\xc50\xd1\xef\
-ld,H\x932&t\xb4n6\xd2\xe7\x97\x7f\xbd\
-f\xc1\x97\xc0\x98\xa1'\xdf1uI\x8393\x0d\x19\
-w\x91\x1d\xe0\xfa\xa5\xc4\xac\x03P.\x8e*\x0c\x03#\
-\x17F/\x04Y\xf1J\x18d3V\xa7&\x95\xd8\xf7\
-\xe7\xcc\x9c9\xb3\xedM]c\xbeL\x87\xd9\x17\xac\x05\
-`4`\x120T\xf4\x9f6\xcb\xb5AX\x9a$\x13\
-\x8a\xdal\xb6\xf6\x05h\x05r<Da\xf6\xab\x9e\x95\
-5\xf7\xacK\xbd\x0f>xhz\xcf!\xd7\xdf\xe8\xba\
-\x99(\xf7\xbe\x00\x91\xccR\xc2\xf3w\xfexq2\x0e\
-\xa0\xc5MN\x02,f\xfe\xfe\xc1\xe3\x8e\xab\x9a]\xe7\
-%\x0f\xcc(3\xdeFA\xc2\xb2\xa8\xaf\xe3\x95A\x99\
-F\x13&)D\xb2v\x19\xa7\xa2wU\xb6\xf6?\xae\
-\x1b\xff\xd3\xdcG&\xfc\x90\xaf\x8c\x92\xc2\xbf\xda\xb0n\
-+-\xd71g\x8b\x12\x90*\xaa\x0d\xb4]E\xb7/\
-\xd7\xaf\xfb\x1duw\x11b\xe1\x02\xce\x9d\xaeF\xaf?\
-sH:\x8ca\x9b\xb2%\xa8:t\x12z\x95~\x8d\
-L\x07\xcd\xf4\xd7\xc4\x82\x13\x87\xe7(<\xf8\xfe\xbe\x98\
-\xfc\xdeP\xb8\xc2\x87`\xb9\x1c\xaf\xeb\x0b.<H\x15\
-~\xf4\xe6\xf4\xd3\x9b\x8dVY\xe0\xe7\xcb\x11\xa3\xae\xd9\
-K\xf2\xe2>)\x09\x00\x0c`\x061.Q\xaa\xb2\xaf\
->\xfa\xc8\x85\xcb\x03-\xf6\x1f6,\xe9\xd6z6*\
-\x0d\xa9+ffg\xce\xcc\xdf\x95w\xff\xa3\xff8\xc8\
-:]6c\xdcC\xces\xc7\x00\x1a\xf0\xfc$\x5c\xf9\
-\xc3\x8f/L\xbf\xf0\xb1\xce\xe8\xdb\xff:\xfdG\x5c1\
-\x8c9\xa5\x95\x99\x00\xe0\x9c\xc1a!\x90Z\xfc\xc1\xbc\
-\xa7\xae\xca{\x22\xb0>YE\xf1S,\x5c\xc0\xd6\x93\
-\xe2'X\xd4G\x09lW\xbe\x08\x97\x0f\xbc\x15=K\
-\x7f@*\xf4\xf3\xdf\xae^\x0b,\x18\x04\x11</\xc0\
-\x03\xef\xfe\x0aS\xe6\x1f\x03O\xc4\xc0\xd7m\x02\xde.\
-\xb8\xf0\x10\xe9\xbaO\xdez\xe4\xdc\x9d\xb0\xb1\xc4\x94(\
-P\xa0\xc0\xcf\x8a\xe5z\xd6\xf1\x8a\xd7C\xfe\xee\x15\xa4\
-\xc2$\xb6)[\x88\xab\x06\xde\x89-J\x7f@\xa6\x93\
-\x95>\x90\xf3\x1a\xd2\xd6 \x1b\xf88q\xcfWpz\
-\x9f'\xa0\xd2\x06\xca\xb6o\x83n]0\xc6\x80Y\xd6\
-\xfd\xb0\xe1\x17\xf6Yo\x8d\x16(P\xa0\xc0J,\xd7\
-\xb51\xf3\xc5VD6\xd6\xe9\xca\x9f\x80\x06\x99\xc4\xf6\
-\xa5\xff\xc6\xb5\x07\xde\x88\xcd\x8a\xbfAC\xb0>\xcf\x1e\
-YX(\xa4\xc3\x04\x8e\xdb\xf3e\x8c\xdf\xe3\x01\xe80\
-\x05i\xd7O~\x05k5\x5c\xe1\x95y\xf1\xe4\x9e\xeb\
-\xa5\xc1\x02\x05\x0a\x14X\x8d\xe5\x9b\xbb\x16\xac\xdcZ\xeb\
-\xe4\x13Ja\xed!4\x84>z\x17}\x85\xcb\x06\xde\
-\x83M\xca\x17\xe7\xfc\xf4\xd7\xbb\x83\x0d\xc1X\x85L\xe4\
-a\xf4~\xaf\xc3q\x08w}0\x14\xdaq;}\xd5\
-\x01ka\x88P'\xdd\x8d\xee\xa4m\x81\x02\x05~\x1e\
-\xac\xa4\xe7:\xec\xa0]\xb3\x10\x01\x99\xc0\xc5v\xb1\xef\
-p\xd9\xc0I\xe8Y\xfeo\xa4\xa2\x0d\xab\xfb\x8c!d\
-\xa4\x83Q{\xbe\x86!;\xfd\x0dA\xe4w\xfe6/\
-\x01\x0c\x02q8\xeb\xcf\xbeT\xa0@\x81\x02+\xb1\x5c\
-\xf1\x072\x95B'\x06\xfa\x0a\x95\x8b\xad\xca\xbf\xc5\x15\
-\xbf\x9e\x88\xcd+\x7fZ\xab\x13\xb9\x9d\x811\x1c \xa0\
-\x22\xb6\x08J\x9b\xf5\xe0\xdfO\xb0&\xb4\x8e\x08\x97u\
-rC\x05\x0a\x14(\xd0,\xcb\x15\xff2\x1d~\x09b\
-\x19\xea$\xbbK ]\xec\xd4\xf3K\xf4\xdct\x09R\
-\xd1\xc6\x95z\xd6\x1a@\x19g\xb5$\x9b\x9d\x03c\x1c\
-R\xd9\xa5aX\xd7j4\xc2\x02\x05\x0a\x14\xe8,\x96\
-+\xfe\xf2\xf8\xee\x12\x9d\xe8\xd0Nd\x11i\x01\xa96\
-t\x8c\xcc\x0d\x0b\x11\x03\xc8\xfe\xf8\xfc#Wwht\
-\xce\x02\x05\x0a\x14\xc8\x97\xe5\x8a_\x86\xf5?g}\xbc\
-\x1e\xb1\x00\xc9\xc2\xb3.P\xa0\xc0\x06cU'\x96\xce\
-\xb2\xf3\x14X\x09\x82\xb5\x1d\x96A\xad@\x81\x02\x05\xda\
-\xcdJ\x8a\x7f)\xa0\xb4\xb7A\xc3\xd5\xffL`:\x5c\
-#\xa8V\x81\x02\x05\x0a\xac/\x96+\xfe7\x16\xbc\x17\
-\x062\xf5\x0cH\xe0\xe7m\x85\xefl,\x94\xaa\xfdf\
-CKQ\xa0@\x81\x9f/+f\xfc\x1f\xcf\x8c\xb8_\
-v\x8fm&nz\x81\x8e\x81\x88`\x8c\x86\xcb\x9d\xeb\
-6\xb4,\x05\x0a\x14\xf8\xf9\xb2\x8a\x8d\xdf\x81JrX\
-\xd8\x82\xbd\xa7S\xb00\xb0\xd0\x90\xd4}\x8d\xfc\x9c\x05\
-\x0a\x14(\xb0\xbeXE\xf1\x97\xaa\xa5\x8b k\x96\xb5\
-7\xab\xd0\xff\x02\xca\xf0\xdca\xae\xce\x1c\xf4\x88\x01\xb2\
-\xc1\xb85\x9fu\xee1\xe9\x02\x05\x0a\x14h\x85U\x14\
-\xff\x9e;\x99w\x15\xf9\xcf\x0a\xf7\xe7\xe5ub@(\
-r\x22\xc0H\xd4dKP\x17&\x90\x8ab\x90\xc6\x81\
-\xb1\x0c\xc60\x18KX\xd7\xbd\x0f\xee\xc4\x111w\xd2\
-\x92\x85_}\xd4\xf6\xdd\x05\x0a\x14(\xd09\xac2\xf3\
-\xac\xae\xae6\x07\x9dxW\xca\xac\xcf\xf8\xcc\x1b\x01i\
-\xe9`\xef\xad>\xc1%\xde\xdd\xc8f\xcb \x04\xc7\x7f\
-\x82J\xbc\xf9\xd5\x96X\x1a\xf6\x80\x22\x09\xa18\x22\xc3\
-\x00#@\x00\x183\xe0,\xff\xe7d\x01\x08&\x10g\
-\x89\x1f\xdf\xfd8\x8f\xacF\x05\x0a\x14(\xd0I\xaca\
-r\x08\xa3%\xd7\xc1\x94\x1d\xcb\xb8X\xaf\x99\xb8:\x0a\
-\x02\x00\xb2\xb9\xac\xf6\xb61\xd6(\xb3`\xc6\x82CC\
-0\x02s\x0c\x18\x99\x9c\x02\xb7\x00\x0cPT\xb2\x04#\
-+\x96,_\x03E\x12\xf8\xf1\x17=\x90\xd6\x02\xca\xf5\
-\xf1]\xfd\x96x\xe9\x1f;\xe2\xa7lWhfQ\x13\
-$Q\xd7\xe0\x81(\xbf0\x0f\x9c;\x90A\xdd\xf7\xa5\
-\xa8\x7f\xbc#\xfb{\xe4\x98\xc9\x9b+\xbf\xa4[]\xdd\
-R\x00\x02\x8e\x03P\xed7\xd9y\xcf\x5c\xfd\xaf\xb6\xca\
-\x0e\x1b6\x83\x7f\xcd\x17\xee\x12\xe7\xbe\xe0\x0d\xb5\xf5/\
-\xcf\xbe\xe0\xb3|\xda\xdcg\xe8\x0d\xe5\xe4%\xb7\x8e\x03\
-p\xc2%\xdf<?\xeb\xe2\xc5-\xdd\xdbw\xe8-]\
-X\xb2\xdb\x96\x0b?}\xfb\x87/\xde\xba)\xeft|\
-\xfd\xc7V\xf9\xe9l\xd9\xceF\x86zk\xd1\xeb\xc3\x99\
-3\x87\xb7\x18G\xaa\x7f\xff\xb1\xbe-\xea\xb1s&\xde\
-\x13\xc0\xea\xd9C\x1dT\xc6c\xa8\x90?|?m\xda\
-%\xeb\xbc\xb7\xd2\x0d\xdd\x12[\x0d\xbeh\x07'\x1e\x83\
-\x94+\xbe\x8f\xb8\x13\xc3.\xe1?\xffu\xd3\xac\x9b\xb2\
-\xeb\xdaF\x13\x87\x8f\xb9\xe9\x175\xc6MB\x0a\x00\xb9\
-\xb6\xe2\xf1b\x94\xc9e\xe9Y\xd3\xce\xfa\xb8\xbd\xf5\xf5\
-\x197\xd9qk\xb3\xdb;\xf1\xe2X\x9c\x05\xaa\xa8\xa1\
-\xf2\x1f\xad=\xd7\xd68\xe4\xc8\x8bz\x07\xf1-\x8b$\
-\xb2(\xaf\xc8.x\xe6\x8e\x8bj\xf2)7j\xdc\xb9\
-\x95?E;\xf5\xcad$\x00\x05\xc7\x012\x99%X\
-\xf6\xe1\xec\xcf\xbf\xfaj~\xdd\xda\xc8R\xa0\xfd\xac\xa1\
-\xf8_{\xe8\xa2\xaf\x0e\x1c=)R\xd8\xb8\xed\xfc\x8c\
-\x0c\x04\xcb)p\xc0\x82@\xb0\x04\x18K\xb0\x86\xc1Z\
-\x0b\xe2.`\x0d\x8c6\xe0\xa2\x0bRR`\xe1R\x8e\
-\x7f-*FV\x97C\xe9\x22pr@D\xc8\x1a\x03\
-\xae\x15 \x18$i\x18+\xe0\xba>`]\xc0\x14!\
-\xd0\x1e\xbc8\xc7\xa6~=RL\x22\xacsP[\xef\
-\xe5\x1dR\x9a\x98\x801\xea\xc7\xa7VJ\xa1\xb7.l\
-\xb6\xcf\xd0\xd8&\xdd\xf7\xf8C\x83\x96c\xb92\xbd\x5c\
-?\x99k\x07\x80\x8cU\x06{\x1eu\xe3\xbdE\x8e\x9a\
-\xfc\xd2\xa3\x7fh14D\x0dj\x92\x9e\xf4^u\x9d\
-\x92d\xc6O\xbf\x02`@>m;H\x0ctP\xf2\
-\x08c!2L\x9d\x01`R\xcbw\xfb\xc3\x5c\xeb\xdc\
-^\xd6\xa3\xc7\xa7;\x1fz\xfe1\xff|\xe1\xba\xbc\x06\
-\x17\xdb\xd0\xbdg\xdc\x11\xefh!\x82\x1a\xa0;\x80\x16\
-\x95\x82SV\xdaK;\x95\xef$(\x01\xc0\x80\xb1\xc6\
-c\x12d\x010(i\xf1\xbdI~\xd4w\xf4C\x8f\
-%\xd4\xbf\xbf{a\xc6\x05w\xe7#\xc3\xea\xec3\xf8\
-\xea\x09\x96\xb9G\x09\xc7=\x98\x98\x8f\xa6\xc0\xda\xd6Z\
-(\xab1_l\xfd\xc2~C'\xbeS\xac>\x9f\xfa\
-\xfc\x13\x13\xbf\x5c\x9b6\x00`\xd0\x89w\x0cl0\xb1\
-~)Ys\xa6\xc3c%\xe4\x0b\xe4\xd6\x8c9\xaf\xb0\
-e\xc6\xa6\xf6\x1b~\xc7mQ\xcd\x82i\xef\xcd\xb9\xa1\
-\xcd\x01\xbe\x89\x92e\x8b\xbb\x1a]\xfe\x18\xd7\xf1m\xa3\
-@\x87YQ\xb3\x19\x80%\xed\x95o\xd80\xf0\x85T\
-\xf2\xb4pb[{\x92\x80:=\x1c\xc0\xcc\xb6\xca\xed\
-{x\xf5y?d\xba\x8e$\xce\xfa\xb8~\x0c\xb9\x9c\
-x\x80\xefit\xfd\xe5\xc8\xd7\xb6\xde\xf7\xf8\xc7\xe7L\
-;\xe7\xc6\xf6\xcaS\xa0\xfd\xac\xb9\xc9hAr\xb4\xac\
-\x06\x8f\xdf\x05\xbd\x01r\xaf7B\x8d\xc2\x009%\xef\
-9\x12\x02\x00Y\x02\x83E-\xe2X\xb4\xac\x04a6\
-\x0e\x08@B\x81t1\xbe\x08\xba\xe0\xbd/7\xc7\x0f\
-\xe98\x08\x1e\x04\x8b\xc3\x18\x00<\x86\xd0\x08\xd4\x07\xc0\
-\xd2z\x1f\xd2$\xa1\xad\x00\x18\x03\x88@\xc6\xc2\x92m\
-\xfc\xbc\x00K\xb9\x0fZX\x0b@\x83\xc8\x82\x11\x03`\
-`\x99\x81\xcb4\x04\xd3\xc8\xc7\xeeO (\xa3\xc1H\
-\xdd\xde\x11\xcf\xa6G\x8f\xaa\xf8\x16\x9bV\xfcE\x14\x95\
-\x0ea\x04\x84\x99\x9a\x85\x06j\x19\x98\x01\xd3N\x22V\
-\xdccK\xd7\x88\xd3\x8d\xaa\x19\xd9\x7f\xe4uW\xcc{\
-\xe4\xfc\x9bZ\xaa\x8b1+\x0d3\xb0,\x9e\xf7\xf2\xce\
-\x10\xb3\x96)(pX[\xde\xea\x92\x87\xc8\x1ac\x03\
-\xf8\xc9\xca\xde\x8c\xf1gv;\xe4\x9c\xc3>\xf8\xebM\
-\x0b\xdaj#b\xda:\x96\x819$\x91l}2\xe9\
-\xc7\xba\xda\xb4u\xad\x85&c\xb2i%\xe5\xb7D\xd6\
-\x824` 4\xa7\xed\xbd\xe2\x1e;\x1a-v\x8cd\
-%\xf6\x1b9i\xd37\x1e9\xbd:\xdf\xfe\x1e4\xf8\
-\xba#\xa4\x17\xbf\xc2p\xb1\xab\xe3\x14\xc3\xa8\x14d\x94\
-Zh--\x03\x00A\xa6\x88\xfb\x89\xcd\xe1T\x1e\xca\
-\xb4<4\x15\xf5>~\xc0\xd8\xbb\x86\xbd<\xf5\x94\xf9\
-\xf9\xb6\xd1\xc4^C&\xddP/\xdd\xf1\xc2\xf7\xe3\xc4\
-\xba l\xa85\x96\xb3Or\xbf%\x80To\xd7\xef\
-\x92t\x80\x0b9\xdf\xf6\xa4\xfe\xc3o}&\xf5\xe5\xbf\
-\xc6\xcf\x9f?\xa5\xcd\x8f5)\xa4\xad\xa7H)\x13\x00\
-Lx\xb5r\xe9\x15\x00\xc6\xb7W\xc6\x1f\xed\xf5\x17\x92\
-_\xd1K\xeb\x08d5RY\xd1\xaa\xcds\xe0\xf1\xbf\
-O\xa4\xb2e7x\xb1MN\x85\xe3!L/\x05@\
-\x1f\x81+\xc00\x08rwL\x94V\xf6\x85\xa5\xbe\xfd\
-F\xdcU\xfc\xb7\xe9\xa7\x5c\xda^\x99\x0a\xb4\x8f5\x15\
-?\xc1f\x07/{\xcbq\xa9\x813\xa7\xc8\x9a\xce\xb7\
-\xf7\x13,\x5c\xd2\x00\xd7\xe0Z\xc00\x03\x0d\x0dPn\
-\xd5\x91V\xc5\xf8\xdbW[ba\xed\xa6\xe0\xca@\xb9\
-\x16\x8b\x83\xcd\xf1\xe1weX\x5c\xdb\x15\x86\xc7\xa0\xb8\
-B,r\x10\x11!\xc3u.\xbf\xae\xceu\xcf\x12\x01\
-\xd6\x80\x08\xe0\x04\x08\xd7\xc0\x81\x04a]M\xedyN\
-\xf7\x19\x83\x0e\xeb\x90\x8a~xe\x1d\x1bD\xffaU\
-\xc9L\x14\x9b\xc2\xfc\x92!P\x11\x84\x0df\xf6\xec*\
-.\xfa\xcb\xc43\xbe\x04\x80\xa1'\xdd\xd2%\xb44>\
-C\xa9\xd1\xc6q{\xcb\x94\xfe\xb4\xb5\xfa\x0c\x19c\xa0\
-\x01Ky\xff\xa1\x89Yk\xa0@\xe0\x80u[-g\
-HY\x03\x0d-C\xf8\x89\xca\xad\xad\x8c\xae\x040\x22\
-\x9fv\x0c4@&/[\x9a\x851p\x047\xa1\xfc\
-\xdb\xc0\x1d\x7fwDuu.\x9fq\x9f>}\x9c\xca\
-\x1d\x8e\x18\xe9X\xef\x17K\x1a\xb2G\xf8\xb1\xe2]\xb8\
-\xe3\x5c\xba\xcf\xb0;\xe5[3\xc7_\xd5V\xbd{\x8e\
-\x9at\xa8\x84;\x9d9~\x82\xa0\x11\xd6\xd7\xbe-\xb3\
-K_\xe8\xd9=5\xf5\xb1\xfb\xae\xf9\x0a\x00\x06\x9fr\
-E\x8f\x86zuzDAw\xee\xc5~\xcb\xfc\xa2^\
-d\xecs\x03F\xdc~\xcc\xcb\xd3\xcfx#\x1f\xf9\x01\
-`\xaf\xe1\x13'\xf9n\xf24\xce9\xa2\xec\xb2E\xcc\
-\x98\x87\xa2\xec\xe2\xd7\xdf{\xb6zy\x02\xf4\x03\x87_\
-y\x8c\x09\xfc\x03-\xc9\x09p\x93\xdd\xc8\x89\xffF\xf4\
-\xda9\xb9M\x97[NX\xf0\xfcYa[m\x18\xa6\
-\x8d\x85\x84\x85\x05\xb9\xe5C\x0e\x1ay\xcb\xe4\x17\x1f9\
-\xeb\x83|e<\xf67woQ\x13\xe28e,\xb3\
-V\xc1\x921\x82Z\xdf\xec\xaa\xc9\x16\xff*\x16\xef~\
-\xaa\xb2\x1c\xaa\xae\xeeE\xbb\xb4\xf6\xc1\xb7\xe7\xfd\xf9\xfe\
-\xa6\xdf\xefq\xe8\x95g0`D\xbcl\x93~n\xf0\
-\xd3\x16\xf9\xcaR`\xedi\xd6\xadp\xf7.\x0b?\xfb\
-,]\xf2,9\xe5#d\xb6\xbe\x13\x9a\xb5`\xa4\x11\
-w5\x04,\x22\x00\xcb\x96uAm\xe4\x83\x0b\x83\x9f\
-\xc2M\xf1\xcag[\xe0\xeb\xf4\xa6`\x8c\xa0T\x02\xdf\
--\xed\x8aeQ9\x00\x03X\x80\x93\x82\xe7hpW\
-\x03\xd6\x82Y\x07\x81kA\xb0HX\x02\x91\x81e\x1b\
-\xc3\x1e\xaa\x05w\x13P\x99\xba)u\xffX\xb2\xce6\
-f+\xe2=<\x91\x18\xc59A\x05\xc1s\xd1\x8c\xdf\
-\x8d\xfeK\x93\x01\x18\xc0\xac\xfb\xceZ\x0c\xe0\xf2\xc1\x13\
-\x1e\xb8/\xd4^\xe5\xcb\xf7]\xf8\xf7um\xb3C\xb0\
-\x16*\x8a\xe0\x15w9\xbc\xdf\xb0\x89c\xff6s\xc2\
-\xd4\x8eo\x84 \x00\x5c\x0a\xa0i:?\x7f\xfe|\x89\
-\xf9\xf3\x1f\x00\x80\xdd\x8e\xba\xf66\xc1\xf0\xae\xf0\x92\x9b\
-\x18nN\xef?\xb6j\xd2\xbc\xa9\xd5\xb5-\xd5\xf6\xab\
-\xa1\x13w\xb6\xe4<\x0a\xce\x12Q\xd8P\x13\x8b\xb1K\
-\xca\x8c\x9a\xfe\xc4s\x97,]9\xa6\xf6\xe3w]\xb2\
-\x10\xc0\x9f\x00`\xe0\x09\xf7\xbe\xa7\xc2\xe0\x0e\xed\xfa]\
-\x94e\x8f\x0e\x18=\xe9\xc8\x97\x1f:\xbd\xd5\x99\xff\xc0\
-\x81\xd7%\xb2\xe5\xc5Wp7v\x1a1\x82Q\xe1\xdc\
-$\xd7g<\xf7\xd0\x84\xcfW\xbf\xf7\xa5\x19\x17?\x01\
-\xe0\x89\x03\x86\x5c7-R8\xd7\xf7\xfd\xe1^\xb2l\
-x\x17\xd4\xd4-\x00\xc6\xe5\xf5\x98ln\xb2\xc5\xb9\xa8\
-\xacO\xa7\xee\x02\xb0\x1f\x90\xdf,hY6s*\xf7\
-\xca\x7f\x81(\x93[\x16\xb7\xc1\x91GV\xc5kE\xec\
-<\xc6<\xc8 |\xeb\xcb\xa5\xe6\x98\xc5\xf3\xfe\x9cZ\
-\xf9\x9e\xf7^\xb8\xf8\xf6\x83\x87M~\xd0-\xe2;\xf2\
-\xd4\xb2\xef\xf3\xeaC\x81u\xa2Y\xc5?e\xca\x14y\
-\xd0qW<\x10\xc9\xcc\x91\xc4x\xc2\x9au\xcf\xcfB\
-\x00\xc0\x14<\x01\xf8\xcc\xe2'*\xc5K\x9fm\x8eT\
-&\x81\xb4\xe9\x8e\xf7\xfe\xbd5\xbe\x5c\xda\x13\x86\xe7\xcc\
-9\xd2\x08D\x9a\x81\x00p\x18\xb8\x5c\xa3\xc4ka\x10\
-\x22`\x15\xff{\xeaTo\xfcv\xc1\xb9\x0bn\xf5O\
-\xae\x83\xfb\xbf\xfdvj\xb0\xae\xf5eM\x9c\x047 \
-]g\x04\xd2O\xbe\xb2\x92\xd2_\x99\xc7'\x8e\xf9\x1e\
-\xc0F\xf2\x11\x11H!kl\x18c\x22\x9ed\x8e\x7f\
-\xffa\xa3nT\xcf?|\xee\xb4\x0eo\xca\x12MY\
-\x08\x0e`\x8d\x95\xc2\x07\xb3/\xf8\xa1\xdf\xb0+'\x1a\
-\xe5^-\x1cwS\x95\xa2\x09\x00.o\xa9\xaa\x88\xb2\
-\xe3]Q\x94\xe0 \x90I\xdf\xf4\xe2\xfd\xe7\xb5\xb2\x97\
-\x91c\xce_~3y\xffa\x13\x03\x1b\xf1)^<\
-\xde]\x06\x0d\x13\x91S\xac-\xa2\xcab\xfdE\xcc?\
-[+\x85(\x93\x9e\x97qR\xc3\xff\xf9@\xeb\x9b\xa5\
-\xaf<z\xfe\xdb\xc3\x86U\x8d\xf9!\xac\xdcA\x80v\
-\xf2c\xfe\xf0!\xa7\xdcy\xcf\xa3w\x8d\x7f\xbbU\x01\
--\xc0\x1c\x17$\xeb^1\x81\xed\x93,\xde\xb4\xcf\xd1\
-'\xdfu\xc2\x93\xf7\x9c\xd2\xe6\xbe\xc7\xafG\x5c\xf3\xeb\
-4\x8b\x9f\xa5\x82z\xc9\xc8\xfc\xcd\x90\x7f 5\xff\xfa\
--\xe7G\xe1\xc5\x98\xf6\xf6s\xc8B\x98\x86%\x8b\xe7\
-\x9d\x93j\xee\xbe\xb93O\xad\x03\x90\xf7\xea\xa8\xc0\xba\
-\xd1b\x8a\xd9\x17\xa7]\xf2\x8c\x09\xeb\xdf'\xea\x98M\
-^\xc1\x14\x16\xa7\xbb\xe1\xba\x97\x87\xe3\xec\xe7\xce\xc2\xa5\
-\xcf\x9f\x82\xeb\xe7\x8d\xc5\xf5o\x8e\xc1\xe4\xb7\x07\xe1\xe3\
-\x9f~\x01M\x0c\xd6p\x18\xcb \x98F\xc2\x89\x10w\
-\x22x\x8eB\x1b\xab\xc9\x8d\x16\xc68t\x94~\xf9\xd5\
-Y\x7fx\xb3c\xea\xd3\xd6B\x83\x08\xc4\x95\xfa/x\
-(\x1cD\x04\x06\xa5\x9d(s\xbe\x092\x9f\x91\xeb!\
-c\xec\x1d\xfd\x0f9\xb7\xf7\xfa\x96&\xf27{\xd2\x12\
-\x07\xe7\x1e\x88%\xca[\xba\xef\xe01U\x9b\x83\xc7\x7f\
-\xc3\x0c\x83\x91\x99\xcf}\xf5}\xde\x1b\xc2\xaf\xcf\x9c0\
-\x15\xaa\xe6\x1d\xa5\x0d\xc0\xe2\xbb\xec}\xf4\xad-\x9a\xb6\
-\x0e\x9bPUL\x5c\xfd\xd9H\x0d@\x06\xb0\x99\x1b\xff\
-\xf9P~\x1e23gVG\x5c\xeb\xab\x8dQ\x16\x22\
-^R\x1bF'VUU\xb5r80\x0eK\x96\xac\
-\xe0\xb0n\xd7IE\x1e\xdec\x9c\xa3.P\xe7\xee2\
-\xf0\xbaDkm\x0d\x1dzC,\x8b\x8a\xf3\x1c\x91\x8c\
-\x83\xd1\x82\x0c\xbc\x9b-chk\xda_\x5c\xb4)\x84\
-\xe3jc,\xc2 \xfc/x_\x7f\x1e\xb4\x9a[\xbc\
-4\xe9^\xec\xbb\x0el\x1eK\xba\xb6\xf0\x9d\x10\x9f\xfc\
-g[<\xf9\xf1!xs\xe1\x0e\xf8\xfb\x0f[\x83\x0b\
-\x1f\xe51\x85\x92X\x03\x5c'\x0dF\x16\x8c\x9a\x5c-\
-\xff\x07\xde\x11b\xd0F\x22c3\x7f\xee\xa8*\xb9L\
-2n\x93\x00\x92\xa4\xe2]O8\xe6\x8c\x89\x15\x1dU\
-w\xe7\xa0s\x7fIN\x89D\xc2y\x86ig\x8c\x89\
-BMne\x11UnUUUe;=\xbf\xfd\xca\
-\xf8\xe1\xe2\xed9cPQZ\x0bS\xffuK\xf7\xc9\
-\xa8\xe82\xcf\xf3=k\x03#d\xcd\xe4\x17\x1e\xbf\xb9\
-]f:\xee\x17_I\xc4\xc1]/\x01\x97\xfd\xb2\xa5\
-\xfb\xb2\x8b\xba\x98\xd0\xb0\xdd\x18waBz}sz\
-\xef\x99\xf6\xb4\xd3\x8d\x7f>[\xc9\xf0U\x1d\x19D!\
-\xc6\xbd\xfduy\xab6r\x02\xc0\xc0!\xa30jH\
-\xd7\x9d\x1af3K\xc1\x13\xbd\x93\x09{jk\xe5\x16\
-\xbb\xfc \xee\xc7\x0eP:\x03\x13\xd5\x5c\x18\x09\xf7{\
-\xc6\x19\xda\xda\xe7rL\xadtl\xb6\x81\xac\xf9\xff\xf6\
-\xee<>\x8a\x22\xed\x03\xf8\xaf\x8e\xee\x9e3\xe1\x0a\xe0\
-\xba*(\x1e\x8b\xa8\xbc\xe2\xab\x0b\xa2\x88\x88\xb2\x1ex\
-@\x88\xb2\xac\x8a\x0a\x0a\x8ax\x8b'\x1b\x15\xbceA\
-Q\x89\x8b\xae\xca\x15\x12\x05Y\x82\xc1\x88\x0aDD\xc5\
-W\xf1\xc0]E.\x15!\x90k\xae>\xab\xea\xfd\x03\
-}_\xdd\xcd1\x93\x0c\x87l\x7f\xffMuU\xf5g\
-25\xddUO=\x05\x16j{\xe8I\x05S\xbad\
-r\x7f\xbe\xdd\xa3\xc9/]\xf7\xbc\xd0'\xcaI,\xd0\
-\xf4`V\x1aS\x00\x0c\xee\x22\xa2[\x08j\x0e(\xf9\
-qP\xd8\x0f\xb3\x81*\x05\x18z\x10\xf0\x9c\xe7\xda\xd7\
-k\x9b\xb3Uo8\xa0\x7f\xc7\x89\xbb\x9c0\x0eB\xf8\
-\xc9\xf1x\xf8\xcd\x01\x05O\xdc\xd3\xef\x92\x19\x1d\xb2\xd5\
-\xc6\xeeA\x94C\xf5\x8e+\x16\x5c\xbdFy;\x8b\x19\
-\xe3\xa0Z\xee\xc5+\xd6O/\x1a4h\xdc\x1e9\x8b\
-\xb3\xd7\xe8\xd1\x1a\xd5Bw0\xca =g\xdb\x0f?\
-\xac}\xa1\xb1\xb2\xb6\x0a\xe9\x84pb9\x96\xa8\xb3z\
-\xbc\x94i[A/\xb6\x15N\xacF:6\xc2\xcc\xf9\
-\xe3y#\xee\xef\xdaP9Fk\x86RJ\x09\x94\x80\
-NS\xb5%%%\x19\xcd\xab\x96\x94<\x9d\x00\xa1_\
-Q\x0e\x08pZ\x9bH\xef\x87T\x0a\x11^\xf1\xea\xed\
-_\x0b\xaf~.!\x80K\xe8\xb8c\xce\xba\xfb\xc8\x86\
-\xca\x8e\x1b7\xd5\x90R\xbbS\x10P\xd7\xac\xaf\xd4v\
-|\xfcV@\xda\x91t\xda)\x9f=>\x9e\xb4\xad\x07\
-\x85T\xd0t\xe3\xe8\x90\x91[1\xa0\xe0\xc9\xc7\xfa]\
-2\xbbC\x9f\xc1\xb7F3\xb9W_\xf64\xf9O\xf2\
-\xe8\xa3W\xc5S\xd5_O\x91\x22\xe1P\xaa\xb5\xba1\
-\x02\xb5\x7f<\xc9\xa7\x812\x0d\x0c\xa2\xee\x90\x0edf\
-y\x1a\xd1\x16\xe9\xaa\x98ui2Q\xfb\xc3$\xe2\x99\
-)\xa5(\x04hO\x97G\xee\x13\x9e\xf7M\xdf\xfc\xc7\
-\x9e=e\xe8\xb4\x82s\xce\x19\xde6[\xede\x95t\
-9\x00\xd5\xe9@\xfd*\x22\xe3e\x8a\x00\x92E\xaf\xac\
-\x0f\xe4e\x1cR\xd8\x18E\x94{u\xd1\xbf\xed\xe2\xc2\
-\xb9\xe7N\x0cEc=\xe7\x83GN\xf4\xa4B\xc8 \
-\x8b\xff\xb9jQ\xbc\xb1z\x18@\xa1\x184N\x90\x93\
-S\xd5\xe44HC^\x9f{\xdbg\x02\xb4\x841\x0d\
-\xe0\xe1\x83\xebT\xb8\xc1\xcf\xc4Ul\x08\xd7\xc3\x9ak\
-'\x5c%\xaa\x9f\xca\xb4\x1d\x00\xd0\x88M\xa0$(e\
-0xj`Z\x17\xd1];P\xeaI\xf2\x0e\xd7\xae\
-\xab\x89\xe4\x1e\xd8\xa5Mn\xf4/\x0d\x15\xfd\xb8\x8a\x0e\
-&Z\xa0\xb7\xb4\x93\x80po[\xbe\xbc$!\x95\x97\
-\xee\x8f\xb5\x0a\xd5\xd8E\xc4K\xbc(\xa5\x84\x22\xb4\x9b\
-\xab\x05o\xf6\xbc\xd47T\xeb\xb4\xea\x94\xe1/\x16\xf4\
-\xfd\xc3\x0d'\xa7Y\x97/K\x9a}:X\xb5\xf4/\
-+\x85\x92\xd7ec\xe0\xff\x8fA\x08\x18=\xb2\xd2=\
-\x00\x00\x10\xe4IDAT#Pn\xfc\xd6YO_\
-\xd7\xf4b[\x0b|\xf4\xfa\xfd\x15\x01\x9a:\x8b\xba\xd6\
-\xd3pdR\x81\x81\x85\xa29,\xd8\xe9j\x1a\x8c\xce\
-K\xe4\x9c\xbe\xf4\x8c?=y\xc3\xa0q{\xe6I:\
-]\xe4\xc7\x85\x9a\xd2)7\x9b\xed\x22\xed.\x16^j\
-5(\x83\x8b\x9c\xf1\xdd\x06\xdduXk\xeb\x97\xc2\x06\
-a\xb4\xd7\x80\x8b\x1e\x9cs\xcay\xf7\xcf>m\xf0\xe4\
-\xd9g]\xf2\xc4\xbc\xdeC\xff:oG\xf8\xe0\xb7I\
-\xa8\xcd\x05\x8e\x95\xf0\xe0T\xbf\xf4\xc6\xba\xcf\xc65V\
-\xcf\xf9\xe7_\xd6\x86\xc0\xe9\xaa\xa4\x00\x116\x80\xb4\xa6\
-\xdc\x7f\x81\x10(\x02\xc3\x22\x84\xc1v%\xec\x14o\xf0\
-I\x9e  \x14!\x00!V\xb5~T\x8b\xcea\xe6\
-J\xee\x84\xe7\x82R\x0eC\x0bd4\x88\xae+)L\
-P\xe5>\x0a\xe5\x82\xf0\x8e'\xf7\x1d2\xf9\xdc\x9f\xff\
-\xbd\xef\xa0;\xf2\xa4\xc2\xc3\x9a\x9e\x03\xa9\xec\xa9\xab\x16\
-\xde\xb6z\xd7\xfd\xa5\xbf\xe8\xb6|y\xa1\xd5Ql\x1c\
-\x93\xac\xff~\xa2\xb2Rq%\x04\xb4P0\x87G:\
-\xf7\xa0\x8c\xcc\x13\xa1\xaeK\xcf\x189c\xde\x85#\x1f\
-ltJ\xcc\x97]i\xbd\x16\xfe\xa6&\xf8\x8a\x9b\xaa\
-\xddL\xb5}j\x1c\xd9g1\xc3\x80c\xd7\xaf\xe9\xbc\
-s\xcb\xdc\xdd\xd5F\xf9\xcb7T\xbe]|\xcd\xb5\x11\
-\xc1\xba;\xf1\xefg\xc4\x92\xdb\x17\xbb\xd6\x8ej\x80\x01\
-\xdc\xf8oW\x85\xa6X\xd5G\xae\xe8\x7f\xd1]\xfbd\
-\x5ct\xc9\xd3\xc3\x12A\xfb\xdb)\xd4K\x22\x92\xd3\xae\
-k\xc7\xb6\x07/\xecW\xf0L\x97\xd6\xd4\xa9\x84\x00!\
-\xb9\x07\xa0m\xb7Kx\xe7C\x87\xeby]\x86K\xbd\
-C\x81\x112\x0a\x88\x8a\x1f\x96H\xd5\xbe\x02\xd8\x03\xdf\
-)\xbe\xe9r4\xb1\xe1\xc9\xfeb\xbb\xa9\x14\xad%d\
-Wn&\xb40\x16\x8b\x09O)f\x03\xca\x83\xd6H\
-\xb0\xa4\x92QBE\x00R)\x08Wk\xd1\x8eI\x05\
-\x15\x22\x84\x02P\x90\xc2\xce8eDGQ=\xcbI\
-U}G\x8dp\x94\xf0\xf0\x95\xe7\x8e\x9e\x11\x02\x80\xfc\
-\xfc|\x9d\xb5\xe94A\x0f\xb4\xef\xea\x98u\xdb\xe2\xb1\
-\xea\xbf\xa1\x85\x01s\xa5\xa5S\xcc\xffY|\xcf}\xba\
-\x83n\x06\xb5\x0a\x5c\xc7Z,e\xddG\xba\xee@\x0b\
-\xe6\x86\x85\x0a\x17\xd4\x98\x1d^;q\xf0\xd4\xee-\xa9\
-\xdf\x97\x99\xb4\x06\xfe\xd27F\xd5P\x15>Sz\xce\
-w\x943\xec\x8fs\xf2\xd9\xc2\xb8\x0e\xe59\x1br\xf4\
-.\x83gU<\x9e\xdc\xdd\xed-.\xb9l\xcb\xfb\x8b\
-\xee\xbd\xe6\xe3\xd2[\xcf\xe3\x88\xff\xc1\xb6\xac1\xae\x15\
-\xab\x96\x8a\x82jmO\xf4h\xf4\x8a\xe6kQh$\
-*\xb4\x11\xad\x0f\xef\x05\x80\xa5%\x0f\xcc\x87+o\x95\
-\xd2C@\x0f\xf7p\xdc\xd8\x9c\xee\xdd\xbb\xa75w\xdc\
-\x10\xcau\xb8^\xfc\x0b\xdb\xdcq\xb5i\xc6\xaeJ$\
-k\xaf\x8f%k\xe3R\xba\xe0R\xec<\xec\xa0\xaa\xeb\
-\xdf-\xbe\xf1\x9d\xe6\xa2}\xcb\xd7\x97\xdb\x8a\xb0*B\
-($\x18\xe2Z(\xbd\x84L?3q\xe2D*\xa9\
-\x9d'\x05\x05\x94\x0bGmi\xf8K\xa3j\xa4T.\
-8\xd3\x02\x9d\xd9?/\xcb\xb4\x1d\x000]\x9a\xa3\x18\
-\x87\x14\x9e\xf2$\x9b\x97\xe9\xf5\xa5\xa5\x93\xbf\xd7\x14\xbb\
-E910#\xf7\x82T\xdc>\x13\x00R\xe1c\x0e\
-QT\xbf\x09D\x82\x89\xda%k\x97\x14\xb6zOH\
-\xc5\x82\xb1Uo\xce\x1e?\xff\xdd\xb9W\x9d\xd7)\xf8\
-\xe9\x00\xc6\xc9U\x1a\x92\xdfP%\xa18?\x84\x12\xeb\
-\x95\xfeg\x8f\xdd'\x1fV\xf6'iGTT.\x1c\
-\xfd\x950\xabg\x81\xf8\xc7\xc56L\x81\x10\xb2+?\
-\x90\x15\xfb\xdb\xd2\xd9C\xf6\xf8a++\xe6O\xfcp\
-u\xc9\xe8gu\xd7\x1bB\xa4\xbb\xc5\x93\x1e\x84\xe2\x7f\
-:\xe9\xac\xf1]\x1a\xbfJ\x91]\xa9\x00\xd2O\xc9*\
-\x95L\xee\xba_\x06(\xd5\xaa\xb3\x05\xde.\x1e\xf3\x98\
-\xb2\xacIB\xb8\xe0\xc1\x0e\xbd\xa3G\x8c\xba\x04\x00(\
-k:\x0d@C\x08\xd5\xa0)oC\xe5\x9c\xb1E\xab\
-g\x8d\x99\xb9j\xde\xb5O\x068\xae \x0a\xae\x1e\xed\
-t\xe4\xe6o\xdb\xdf\x9dv]\x84\x04\x15!\x90\x8c\x91\
-0\xd72\xee\xcb\xda\x9d\x87\x9e\xa4\x87#C\xa4+\xa0\
-\x11\xf9A^8\xb5\xad\xa1r\x0a\xc9\xa7\x1c\xaf\xd6\xd1\
-\x8c\xb0\xc6\x02\x9d.\xcc\xb4\x1d\x00H\x02\xa6$\x04J\
-)\xe2\xf0v_\xb7\xa4\x8e\xb7\x8f\xbe\xb1Dz\x89\x85\
-\x90\x04\xa6%&\xe5\xe7C\xaf\xa9\x0d\xddM\xb4\x1c\x98\
-\xf1\xaamV\xe2\x9b\xacE\xa6\xfd\xa4\xa4\xa8\xa8\xbe|\
-\xc6\x953\x0f\x89$\xcea\x22\xf1\xa9\x14\x02FN\xa7\
-\xa3\xbc\xd0\xd1=\xb2\xdd\x96\xef\x972\x0a\xa5[mG\
-\xff,\x1d\xab8\x10\xcc\xd9]\xfd\xf9\xf5\x22\x14\x9c\x07\
-\xe1Z\xf5\xd3V\xber[\xa3\x9b\x82\xf6\x84w\x16\x8e\
-_\xee\x09w\x0e!\x0cF\xb0M\xd7H\x87\xaey\x8d\
-\x16VR\x03\x08\x88\xe4i\xbd\xc6\x8d\x1b7\xd5\x08\x19\
-\xe2\x22\xa5\x00\xe1\xc4\x5c\x8ex\xebw#\x9b\x9f=.\
-\x9c\xea\xcdT3\xa0\x85\xc2O\xf6\x1f:ep\xaa\xbe\
-:\x86\x8c\xa7\x15v%\x22\x981\x1a\xff\xb7 \xf5\xe7\
-\xab_]\xc8\x90X\x0aP0\x1a\x1a\xd3w\xe8\xd4\xfb\
-\xd2\xa9)\x1a\x10\x9f\x09a\x821\x9d9\xc9\xba1\x99\
-\xf5\x03\xf8a{,b;4\xa0\x19:\x5c\xa2/X\
-R\xf2t\x83\x03\xbft#\x1f\x10\xa9l!%\xea\x93\
-n\xa4W/d\xb4\x98v\xc1\xa5\x8f\x1c\xd6>\x12\xed\
-'\x84\x07J,+W\xd4\xb4\xe8\x87\x98\x14BJO\
-\xde-\x85\x05\x16\x0ct\xaffS\x17(\x1e\xe8O!\
-\x11\xd6\x8d)\xab\xcbf\xa4\x9dY5S\xcf?{\xfb\
-?\x93\xae\xf9\x1c\xd75(P\xd8\xdc\x9fR\xde\xdd2\
-\x8b\xa1.\x1foW\x16_\xf3G\xcf\xb2\xe60-\xe3\
-@\x87\xfd\x17!\xd0\xf5 \x98pg\xae\x9a?n\xfc\
-\xde\xee\x0e\x00Hh.!\x0c\xc2\xb3\xe1\xa4j\x1b\x9c\
-\x9b\xd9\xfa\xc5V3\xe58oJ!\x10\xd0\xb4\x93\xfb\
-_<yps\xf5.\xdbV\xa3,\x17\xc3\x19\xd5\xe0\
-\x09\xe7=#\xb9%\xa3\xb8\xf3\x86T\x96=S+\x88\
-9\xdc\xb1b\xd5\x5c\x0b\x19\xb6DIPw\x06\x10\x90\
-\x06wyf\xa2\x7f\xff\xe5^\x80[\xa3\x1c3\xbe\x9a\
-\xd3\x00\x1c\x85{z\x9eyO\xb3\x91/\x01\xf9\xfdt\
-\xcf\xac\xb34n\x10\x1ej\x97\xdfm\xd0\xd4\xb4\x9fv\
-\xce\xbbxR'\xce\xe4\xe3J\xb9p\xcc\xb8K\xec\xba\
-F3h\x1ehtM\xc1\x13\xf3\x08\x00\xdd\xd0z\x05\
-\xbb=qk\xba\xed\x00@\x9d\x13\x1d\xc2X\xb8\xbb\xce\
-5PE\xa7\x1d\x9c\xbb~K&\xd7\xff\x5c4\xb9q\
-\xbd\x94\xe6_5-\x17.\xcf9;\x98\xd3\xf6 \xe9\
-$\xde?\xe5\xc8\xaa\x06\xa3}\xb2\x89H\xa6\x11\x05H\
-\xe9\xc2\xb3wG\x9a\x18\xdf\xcfe\xbcy\x86\x10\x22j\
-\xab\xd7\x8d\x16v\xfd\x87T\xfb\xcf:\xa9\xab1\x84j\
-\xf0Ru\xebc\xf5\x1f\xa7=\x95\xd0R\xc7\x0e\xbc\xa6\
-c\x8fs\xaf\xed\xddT\x99\x0b\xafy\xb4\xa3\xce\xbd\xb3\
-\x08\x01<\xe9\x96+\xc7np\xa3\xd2\xbau\x85\x8e\x16\
-\xd4g\x12\xa2 (\x0dyN\xf4\xfa\xc1}\x9a\x8e\xad\
-\xee`\x1cp9A\x88\xef\xca^\x8a\x1d\xe5\xe5Of\
-%T\xf5\xbd\xe2{V9\xf1\xd8\xd9\xae\x19\xdb\xc9\x83\
-\xb9:\x0b\xe6\xdd\x05\xaa\x82\xc8\xc2\x82\xc2\x92\x17o\xdb\
-\x16\xd6\x93WA&R\xc1p;\x84\xdbv.\xec\xd5\
-\xcc\xbe\x87\x85/?T\x03G<+\x95\x04%\xec\xf0\
-\x03\xdb\x87\xfe>\xf4\xc6\xe2Fw\xfa\xfeD)\x90\x18\
-\x22\x938\x8f\x1eC\x19\x07\xa3\xdeK\x95\x0b\xef]\xdc\
-X\xf9\x92\x92a\x82\x04\x02\x0f\xb9^j=G\x80S\
-\x12\x984p\xf8#\xf9\xe9\xdcW\x9f\xf3\xa7]\xee\x11\
-2\xc9u-\x08\xd7\xda\xc4<5\xbb\xa8\xa8\xf9,\x9d\
-\x8d)/\x7f\xd2\x96f\xd5\x0c\xe1\x9a;93 l\
-\xd3\xd58&\x16\x16\x16\xb68\xe9U\xfe\xfc|v\xe6\
-\xf0\x09\xbd\xd0\xcc\xc2\xa0'\x0dH\xc5\xc1\x19A$\xc8\
-3^S\xf1e\xa6E\xbb&?\xadx<\x19\x22\xb5\
-72\x95\xaccZ \xdb}\xfaUaZ\x10\xca\x89\
-\x9bVb\xc35\x1f.i\xf8u>\x8bH\xbb\x8e\xc7\
-\xccl\xdb\xa6\xe7\x92\xbe\xc3\x9e\x19\xdbw\xe8\xd4\x7f\x9b\
-\xc2\x99??\x9fU\xc7\xc2\x170-z\xa2\x92\xae\x1b\
-\xd0\xdb\x15W\x96=\xd4h<\x22\x0f\x99+\xa4\x97|\
-\x93R\x0e\x16\xca\x19`\x1dv\xc8\x8b\xc7\x0e|\xa9\xc1\
-\xd7\xb9\xc1\xa3\x9f\xbdV\xd7\x02\xcfrM\xd7\x1c'\xbe\
-E@eu\xde\xf7\xa3\xb2\x09\x1f\x10\x12\x9f\xc58\x01\
-a\x81\x1e\x842\xfecR\xfdV+\xefz\xd3\x97\x8e\
-L>\xce(\xa0\x07\xa2\xbd\x99\x95,=#\x7ftn\
-\x13\x97\xa8\xf7\x16\xdd~\xa3\xeb\xa4\x9e'\x8c\x83\xe9\xe1\
-Skv\xd4\xcd\xef?bf\xa3!\x87\xfd\x86L<\
-\xa1\xdf\xb0\xc7\xde\xf6\x94q9(\x83k\xd5\xd6h\xd8\
-\xfeps}\xab\x9c3vC\x0e\xb7\xe7\x18:\x03\xa0\
-\xc1S\xb9/\x9c6\xfc\x89\xdb\xce/\xb8\xe9\xa0\x86\xca\
-\x9fs\xe93\x07\xf6\x1f\xf1\xdc\x18\x1e\x0a\xccdZ\x88\
-S\x08(\x11\xbb\xf2\xadWnhQ8\xe8\xcf\xadZ\
-4y\x8d\xa1\x99\xf7\x0b\x89\xb5Vjg\xc5\x9b/\x8f\
-]\xda\x9a\xfa6\xbc|\xd2\xe9\x09q\xd0\xeb\xfdGL\
-_3p\xf8#=\x1b*s\xde\xd5\xcf\x9d\x1c\x0c\xe3\
-VJ\x15\x1c\xb3ni'\xb7zek\xda\xf45\xaf\
-\xc5\x0bs\x15\xf3'\xbe;t\xd4\x03#\xb6\xa5\xbc\x99\
-\x5c\x8bv\x12\xae\xf5\x1f\xb25\xeb\xff1\x1e\x02G2\
-\x11\x09\xbb\xf9KJ\xa7-\xdb\x13m:\x02G\x04\x83\
-\xd16\x1eu\xa7{VlT\x9f\x82\xe9\xa5?\xff\xfb\
-\xf4W\xc5\x7f\x09\xc2\x87\x10\xa2\xe0YU\x1fW\xce\xbb\
-\xe5E2\xab\xf1\xfaV=\x7f{\xbc\xcf9\x13\x9e$\
-\xd1\x03\xfa)=\xa29\xaa\xcd\x85\x91\xdc\xfa\xd7\xfa\x14\
-L\x7f\xfb\xe7\xe5\x08D\xa7\x9a\xb8\x1c\xc7(\xc0\x98\x85\
-\xb6\xb4\xfe\xe6\xb2\xd2\x09\x19\x9f\x02\xd5\x9c\x03rk\xfe\
-\xbc\xad>\xd4\x83\xeam\xcf\x90^2\xed\x002\xd2L\
-AR\x08\x09\xdc|o\x9faO\xe5p-8>\x1c\
-i\xdf\xcfN\x1d5\x0a\xc0cM]G\x13\x9f\xdeb\
-\xca\xc3\xb9\xa1\xe7\x5c\xcaHp\x80\x12\xf6''\x0f{\
-\xaaH\x11\xf2\x8b)\x15\xa6\xccC<hW\xeaF;\
-J5@\x97\xeeV\xc6\xf8\x85o\xce} \xad\xc5\xd6\
-\x91\xe7\xae\xbc\xef\xf9E\xa7\x1e\xc0\x8c\xe8()I\x98\
- \xf0p\x9d\xf0\xc6\xf6)\x98\xfe\xdc\xbf\x96\x8d[r\
-$\x09\x18\x87\x11\xa2`\x99\xb1\xfa\xbc\xb0{\xdf\xe2\xd9\
-7\xbd\x95N;\xe9\xa8x\xf1\xbai\x00\xa6e\xa3.\
-\x9dy\xc3\x83\x91\xf6yR\x8a<3%\x97\xf6\x1d6\
-}\x86$\xf8\xc5[b<.\xc6s#\x9agY1\
-[\xc6wN/)\x9f\xdc\xea)>_\xd3Z\x15\x91\
-Q\xfa\xdc\xdde\xa7\x0d\x99p>B\x81\xbf\xf0`\xf8\
-\xf7\x9e\x99\x82\xda\xef\x87\x7f\x05\x02\x06\xc2\x02\xf0\xac\x1d\
-\xdb8j\xafX\xf2\xca\xe4\xf2=\xd58\x93\xb1Q\x9e\
-I\x9ep%\xe9\x15\x8et\xee)\x88\xd7Sx.\x88\
-R`\x8c\x03T\x83H\xd4\xc3\x8am[\x1d6\xea\xc6\
-\x934\xb6J\xaf*{h\xd1\x80\x0b\xee\xbeH\x80\x14\
-\x0a\xa6\x8e\x0f\xe4v\x18\xa0\xa47@J\x09\xf2c\xd0\
-\x0f\xe5\x06\x88p\xe1:\xd5\xdf2a\x8e?\xf4\xfd\xbf\
-.I\xa7\xc3\x92\xa8\x003\x22`\xd2\xa1\x14\xc9f\x17\
-.K\x8a\x1e\xae?v\xe0\xd2\x0br\xf3\xbe]\x10\x88\
-\xe4\x0dL\xa6\xb6\xb6wm\xbd\xc9Q\xddu\x04#A\
-\x83q#\x02\xc7\xacn\xea)\x1e\xe1o7NNt\
-\xecp\xb1\xde\xe1\x88N\xae\xeb=|Z\xc1\xb4o\xdf\
-)\xbe\xbe\xb8\xb1\xf2\x95e\xcf\xd4\x02\x18yj\xc13\
-5\xd0\xd90b\xe8\xbf\x09\xf0\xf6\xa3!l\x08!\xa0\
-\x08\xc0\x08\x05\xd3~\x03!L\x08\xab\xbe\x0a\x9e\xf7\xb7\
-\x90&\x8b\x16\xce\x1d\x9f\xf6)\x5c\xc3\x86\x95\x08\xa0d\
-\xf4\xe9\x97>;\x17BN\x12`'i\xe1\xae\x87p\
-\xe0\x01!\x1c((P\x100M\x07@\xe0$\xab \
-\x1c\xf2\x89m\xc7F/.\xb9\xf3\xc3f\x1b\x00\xc0\x98\
-\xa2\xc2Sm\xf5@\x14\xd2rZ\xb7\x82*\x98\xc6\x83\
-\x91]\xc1]2\xdeh]m\xb5\x9dw\xc4\x92\xb9\x9f\
-R\xa6\xdd\xa5\x07\xdbw\xa4z\xe0\x1e\xcf1\x01)A\
-\x09\x05\xd7\x83\xb0\xcd$\xacd\xdd&\xaa\xc4\xed\xab\xcb\
-'\xff\xbdU\xfd\xf2\xa5\xa5\xd5\xa977}Y\xf9}\
-\x8f\xa3O{-\x05\xad\x0bc\xfa\xd1\xd9H\xe1\xbc/\
-#\x84@\xd3tH'\xf9\xaa\x97\xfa\xfc\xb2\xcaE\xd3\
-\xb2\x92u3][\xbeX\xb6y\xf3\xe7eE\x07v\
-\xfd\xfd\xb6\xa0\xde\xf1k3\xb9IQj\x1e\xa4+\x17\
-^j\xe7z\xcb\x93/2G\x9b\xbdj\xc1uWo\
-\xfc|e\xda\x91\x18\x1b\xff\xb1\xe2\xabM\x9f\xbf^\xf4\
-\xdbC{\xbbR\xa7\xeba%~\xc7\xa0\xebDR(\
-/\x01\xdb\xae-\xd6\xa5\xa8 \xb5\xff\xb8i\xd9\x82I\
-+?\xa8\xa9I\xeb\x83\xee|\xd4\x00\xe6\x09\xc4 b\
-\xef\x05\xa3V\xc5\xd7\x1f\xbdY\xd3\xdc5\xdb7\xccr\
-{\x9c2\xa2\xc2\xb6\x92,e\xa5\xde\xd9\xaa\x05\x96\xd5\
-\xaf}\xad\xd1\x8d\x06\xe1\xdf\x1eO\x1c\xa5\x98\xa0l\xb5\
-c%\x97\xd5\xce\xa9\xf8h]#\x11A\x1b\xbe{/\
-y\xdc\xf1\xe7\xad\x13<T\x95t\x13\x9f0\xea\x18\x9b\
-?+_YX\xd8\xe4\x81\x5cj\xf3\x17eK\x8f\xfb\
-\xdd\x09%\x8e\xc7a\xba\xa9\x8f\xa8\xb5\xa3\x1d\xa1N;\
- \x05a\xd6n%\x92\xbe\xa0\xa4U\xa9\x9b\x9b\xaf\x7f\
-\xab\xe4\xcey\xffX[\x9e\xf9v_\x00\x1b\xd7.\xde\
-\xb4\xf9\xb3\xb2\x99G\xf6:\xfbK\xe1\x91\xef\xbc\xf8\xf6\
-zBc\xdd(\xb1\xa1\xcc\x1a%\xbdd\x19\xe7\xb9e\
-9\x5c=]1g\xd4\xb5\xdb\xbeZ\xb65\xdd\xba\x8f\
-\xe9\xdd\x8bT\x9b\x01A`|&\xa9\xa8\xf8~\xed\xc2\
-\x16Gd\x1dt\xc4\x85\xc4\xf3l\xcf\x135\xab#9\
-\xda\x1b\xeb?^\xb2\xbd\xa1r_\xaf[\x95\xd8\xf2y\
-\xd9\xea\x8e\x9d\xbb\xbe!D(\xa5Hb\xa3pvt\
-\xd3\xb9\xd4dj\xa7+\xe1\x95R\x8f\x95\x1e\xc8\xaa\xaf\
-X\x5c|K\xc6'\x96\xf9Z&{;\xb1z\x8d\xd6\
-~\xdf\xa5{Q0\xd2\xfer\xd7\xb5\xa0\x84\x93\xd5\xea\
-\xf7\x09\x94C\xe3:<\xab\xfe\xf1\x01\xdd_\x9dPX\
-\xb8|\xaf\x9fF\x7f\xce9c\xda\xda\xc16\xc7\xd2P\
-\x84\xdavl\xe3\xf2\xe2\x877e\xa3\xde\xd3/|\xe2\
-x\xae\xb5\xcb\xb5\xe0\x81:\xf5\xf2\x9d\x857/\xcfF\
-\xbd\xfb\x8b~\x05\xb7waJ\xef\x0a\x0e(\xc7\xda\xfa\
-vizg\x09g\xea\xb2\xcb\xfa\x05\xbeO\xf5=\x81\
-jT\xb3=ab\xfb\xe45\xcb\x97g\xb4\xdbn\x9f\
-\xd3?\x7fB/-\x18\xcd\xb1\xacxb\xc5\xfc\x87\xd2\
-z[\xf1eW\xd6G\xe6\x01#\xa6>f\xbb\xc6(\
-\xaa\xe99\xc2m\xf5\xb9#\xfb\x08\x02\xa2\xe9 Jx\
-\x9a\xb0\x1f|k\xde\xb8\xacof\xf1\xf9|\xbe=e\
-\xb7<\x92\xf7\xcd\x7f\xb0\x97\xc6\x0fx\x01\x1a;\xc6u\
-\x13PR\xee\xae\xa6v3\x05\xcat0]\x874S\
-+\x0cf\xdeY1\xe7\xa6w\xf7v\xaf|>\x9f\xaf\
-5\xb2s\xbc\xd6\xbf\xd8\xb2n\xd9\x0f\xffu\xdc\x09\x0b\
-]A\x02\x8a\xf1\x9e\x94\x05\x98R\xbf\xae\xb7S\x02\x0a\
-\xaeE\xe0\xb9V\x9d\xb0jg\xdb5\xdbF\xad\x5ct\
-\xcfny\x9d\xf7\xf9|\xbe=i\xb7?\x86\x0f\x1a9\
-\xb3\x9fc\x89\xd1\x92\xd2\xe1\x02\x14\xd2\xdb\xb7\xa7\x7f\x94\
-\x92\xe0F\x18D\x0aP)J\xe3\xf1\xd8#k\x16\xdf\
-\xea\xcfC\xfa|\xbe\xfd\xc6\x1e\x99\x7fQ\x00\x19X\xf0\
-\xc4\x08\x8f\x06n\xa6\xdc8\xce\x15\x12JJ(\xb5\xef\
-D\x00\x11BA\x18G(\xa8\xc31\xad5R\x9a3\
-:z\xe3_()\xc9R*J\x9f\xcf\xe7\xdbG\xec\
-\xd1\x89\xf7q#\xef\xc8\xfb<\xde\xe1\x5cS\xd0\xabh\
-0p\x02g\x9a\x0eI =g\xaf\xc5\xff\x13j\x80\
-\x10@\x10\xe9\x04\x88\xb96'\xd2a\xba&\xd7.,\
-)z\xb8~\xaft\xc8\xe7\xf3\xf9v\xb3\xbd\xb2\xe2\xda\
-\xaf\xdf\xd8\x88\xf8m\xd7\x83\xa5\xc5\x1f\x90R;.\x10\
-\x8e\x1e*\xa1 =\x13\x00\x81R\x0a-<\xef\xa1Y\
-\x84\xd0]'d\xf1\x00\x18\xa3\x88\xd5Wo\xd6AV\
-\x05\xdaD\x1e\xe8Bv~\xfb\xfc\xf3\xb77z\x1c\x9f\
-\xcf\xe7\xf3\xed\x0f\xf6z\xa8\xcd\xe1}G\x1e\xda\xa1\xd3\
-\xf1\x7f0\x0cz\xb2\xa70LJ\x0a\xcatF)\x01\
-@ \x85\x07%\x7f\xca;E\x90\xe9\x0f\x02e\x1a\x08\
-\xe5 \x00\xa4\x92\x10\xc2\x11\xca\xb3 ,\xfb\xe5PN\
-\xce\x1a\xa9v\xbe\xb1b\xee\xbd-\xcaa\xee\xf3\xf9|\
-\xbfF{}\xe0\xff\x89\x9a\x08z\xc6\xd73\xbb\xd8\x00\
-\x88]{\xb72r\x0e\x97\xc2\x03Q\xce1F\xa8}\
-\xaeP\xc0\xaeD\x8d\xbb\xbaL\x84\x82\x14\x1ev\xad \
-\x10\x10\xc6\x01J\x00P@Q\x10\xa5@\x94\x80c\xd5\
-\xd6(\xa6\xaf\xe3<\x00\x0a\xf7\xcb\x84\xe2\x0f\x05\xac*\
-T\xbez\xc7\x86\xbdv\xb3>\x9f\xcf\xb7\x17\xed3\x03\
-\x7fcN\x19<\xfeT\xd6\xe6w\xbdM\x1b\x00\x8d\x03\
-\xd0!\x01\x84\x1c\xf7p\xce\xc5\x09\x8a\xc8v\x90\xb4\xca\
-U\xec}\x87j[\x00\x03\x90:\xa8\xf4\xa0yIx\
-\xd6\xa6\x15\xab\x96N\xdd\xa3i\x15|>\x9fo_\xb6\
-\xcf\x0f\xfcM\x194rd\x9eT\x81\x80\x10\x89\xd4\xb2\
-\x97_\xae\xde\xdb\xfd\xf1\xf9|>\x9f\xcf\xe7\xf3\xf9|\
->\x9f\xcf\xe7\xf3\xf9|>\x9f\xcf\xe7\xf3\xf9|>\x9f\
-\xcf\xe7\xf3\xf9\xb2\xe2\x7f\x01\x89h\xbcJQ:\xbc\xc2\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x1a5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01h\x00\x00\x00\xd8\x08\x02\x00\x00\x00I:\xeeC\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x19\xeaIDATx\x9c\xed\xdd\x7fX\
-\x13\xf7\x1d\x07\xf0\xef\x11\x94\x88\xf2K\x0aZ~g\xb1\
-\x88\x8f\xbf\x88Q~4?`V\xda\x0d\xecf\xa5j\
-q\x1d\xe3\xe9\xe6\x1c\xae\x88Z\xc5\xc7\xa9\xd3\xa7b\x87\
-RQ\x11\xab\x82\xb8\xe2\xacL\x1c\xad\x1be*E\x8d\
-\x17\xa7v\xb5h1\xe5A\xe9J\x88N\x05g\x09\x90\
-!\x02z\xfb\xe3\xd6<)\xbf\xccU\x92\xbb\xe0\xfb\xf5\
-G\x9f\xdc\xf7\xbew\xf9$\xf2}\xf7\xee\xf2\xbd\x84b\
-\x18\x86\x00\x00p\xe1\xc4w\x01\x00\xe0x\x10\x1cB\x97\
-\x97\x97GQTmm\xade\xe3\xcd\x9b7)\x8a\xca\
-\xca\xca\xe2\xab*K\xc5\xc5\xc5\x14E\xd14mni\
-ll\xa4(j\xcc\x981\x96\xddv\xef\xdeMQ\x94\
-N\xa7\x1b`W\x99\x99\x99\xa3F\x8d\xeao\x11\x84\x03\
-\xc1\x01OJ\xadV\x13B,\x83\x83\xa6iWW\xd7\
-\xa6\xa6&\xcb\xbc\xa3i\xda\xdb\xdb{\xe2\xc4\x89<\x94\
-\x08\x83\x0d\xc1\x01O\xca\xdf\xdf_*\x95\xf6\x08\x8e\x99\
-3g\xf6h\xd4j\xb5J\xa5\x92\xa2(>j\x84A\
-\x86\xe0\x18\x22***\x9e\x7f\xfe\xf9\x11#Fxx\
-x\xbc\xfc\xf2\xcb555l\xfb\xeb\xaf\xbf>}\xfa\
-t\xcb\x9e\xb1\xb1\xb1s\xe6\xcca\x1f744\xbc\xf6\
-\xdakc\xc7\x8euqq\xf1\xf7\xf7\x9f3gN[\
-[\x9b\xb9guu\xf5O~\xf2\x13OO\xcf\x11#\
-F(\x14\x0a\xadV\xdb\xdf\xb3\xab\xd5\xea\x0b\x17.t\
-ww\xb3\x8b4M\xabT*\xa5Ri\x0e\x8e\xba\xba\
-\xba\xdb\xb7o\xc7\xc4\xc4\x10Bt:]RRRp\
-p\xb0X,\x96J\xa5iii---\x83\xf7N\
-\x80= 8\x1cC[[\x9b\xd1Bkk\xab\xe5\xda\
-O>\xf9$>>\xde\xd5\xd5\xf5\xc8\x91#{\xf7\xee\
-\xbdv\xed\x9aB\xa1hhhx\xecn_}\xf5\xd5\
-\x9a\x9a\x9a\xdd\xbbw\x9f9s&77\xd7\xd7\xd7\xb7\
-\xb3\xb3\x93]\xf5\xc5\x17_<\xff\xfc\xf3\x8d\x8d\x8d\xf9\
-\xf9\xf9\x1f~\xf8\xa1\xaf\xaf\xef\xacY\xb3>\xff\xfc\xf3\
->\xf7\xa3V\xabM&SUU\x15!\xc4h4\xea\
-t:\x95J\xa5R\xa9\xccY\xc3&\x08{R\xd3\xd0\
-\xd0 \x91H\xb6o\xdf~\xf2\xe4\xc9\xf5\xeb\xd7WT\
-T$$$<\xc1{\x03|`@\xd8v\xed\xda\xd5\
-\xdf\xbf\xdd\x1f\xfe\xf0\x07\xb6Odd\xe4\x0f~\xf0\x83\
-\xae\xae.v\xb1\xa1\xa1a\xd8\xb0a\xa9\xa9\xa9\x0c\xc3\
-\xfc\xecg?\x93\xcb\xe5\x96;\x8c\x89\x89\xf9\xe9O\x7f\
-\xca0Lgg'EQ\x85\x85\x85}>\xef\x8b/\
-\xbe\x18\x1c\x1cl2\x99\xd8\xc5\x87\x0f\x1fN\x992e\
-\xce\x9c9}v\xfe\xfa\xeb\xaf\x09!\xd9\xd9\xd9\x0c\xc3\
-\xfc\xedo\x7f\x1b1b\xc4\x83\x07\x0f\xae]\xbbF\x08\
-\xa9\xaf\xafg\x18&99\xd9\xdd\xdd\xbd\xbb\xbb\xbb\xf7\
-\xb6\x97/_&\x84TWW3\x0c\xb3i\xd3\xa6\x91\
-#G\x9aW\xf5X\x04\xe1\xc0\x11\x87c(**:\
-c\xa1\xa4\xa4\xc4\xbc\xaa\xa3\xa3\xe3\xb3\xcf>\x9b?\x7f\
-\xbe\xb3\xb33\xdb\x12\x14\x14\xa4V\xab\xcf\x9e=;\xf0\
->\x87\x0d\x1b6u\xea\xd4\xb7\xdf~;77\xb7\xc7\
-\x87\x1d\x9d\x9d\x9dg\xce\x9cILL\x1c9r$\xdb\
-\xe2\xe4\xe44{\xf6\xecs\xe7\xce\xf5\xb9+\x89D\x12\
-\x10\x10\xc0\x1eV\xd04\x1d\x19\x199|\xf8\xf0\xd0\xd0\
-P___s\xa3B\xa1\x10\x89D\x84\x90\xae\xae\xae\
-\x9c\x9c\x1c\xb9\x5c\xee\xe3\xe3#\x16\x8b\xa3\xa2\xa2\x08!\
-l\xca\x80\xa3@p8\x86\x88\x88\x88X\x0b\xd1\xd1\xd1\
-\xe6UF\xa3\xf1\xd1\xa3Gc\xc7\x8e\xb5\xec?v\xec\
-\xd8o\xbe\xf9\xe6\xb1\xbb\xfd\xf8\xe3\x8f\xe3\xe2\xe2\xdey\
-\xe7\x9d\xc9\x93'\x07\x06\x06\xe6\xe4\xe4\xb0\xed\xcd\xcd\xcd\
-]]]\xb9\xb9\xb9b\x0b[\xb7n\xbdw\xef^\x7f\
-\xbbR\xab\xd5\xe7\xce\x9dc\x18\x86\xbd\xc0\xc16\xb2\x97\
-9n\xde\xbc\xa9\xd7\xeb\xd9\xf3\x14BHFF\xc6\xba\
-u\xeb\x92\x93\x93\xcb\xcb\xcb/_\xbe\x5cYYI\x08\
-\xe9\xe8\xe8\xe0\xf8\x96\x00\x9f\x9c\xf9.\x00\x9e\x94\xa7\xa7\
-\xa7\x93\x93\xd3\x9d;w,\x1b\xef\xdc\xb93z\xf4h\
-B\x88X,6_\xb3d\xb5\xb6\xb6zzz\xb2\x8f\
-\xfd\xfd\xfd\x0b\x0a\x0a\x08!:\x9d\xee\xc0\x81\x03o\xbd\
-\xf5V``\xe0\xbcy\xf3<<<D\x22Qjj\
-\xea\x92%K\xac,#&&\xe6\xf0\xe1\xc3\x17/^\
-\xac\xaa\xaa\xca\xcc\xccd\x1bU*\xd5{\xef\xbd\xc7\x1e\
-\xfb\x98\x83\xe3\xd0\xa1CK\x97.MOOg\x17/\
-]\xba\xf4\xfd^8\xf0\x08G\x1c\x0eO,\x16GD\
-D\x1c=z\xd4\x1c\x10\x06\x83\x81\xa6\xe9\xd8\xd8XB\
-Hpp\xb0\xc1`0\xaf\xba{\xf7n\x8f\xb9d\xac\
-I\x93&m\xdb\xb6\xcd\xc5\xc5\x85=g\x11\x8b\xc5\xb1\
-\xb1\xb1\x1a\x8dF\x22\x91\x84}W\x7fe\xb0\xb9\x90\x95\
-\x95\xc50\x8c\xf9\x80H\xa9T\xd6\xd5\xd5\x95\x94\x94\xb8\
-\xba\xba\xce\x981\x83\x10\xc20L{{\xbb9\xb9\x08\
-!\x96\xa7]\xe0(\x10\x1cC\xc1\xdbo\xbf]__\
-\xff\xd2K/}\xf4\xd1G\x87\x0e\x1dz\xe1\x85\x17F\
-\x8e\x1c\x99\x91\x91A\x08\x99?\x7f~KK\xcb\xda\xb5\
-k\x9b\x9a\x9a\xaa\xab\xab\x17,X0l\xd80v\xab\
-\x86\x86\x06\x85B\x91\x97\x97WQQQYY\xb9x\
-\xf1\xe2\xae\xae\xaeY\xb3f\xb1k\xb7m\xdbV__\
-\xafT*\xdf\x7f\xff\xfdS\xa7N\x95\x94\x94ddd\
-\xb0\xfb\xecSXX\x98\xaf\xafoYY\x99L&3\
-O\xf7d\x1f\x97\x95\x95EEE\xb1\xcfKQT\x5c\
-\x5c\x5cAAAMM\x8d\xc9d*,,<x\xf0\
-\xa0m\xdf\x1d\xb0\x01\x04\xc7P\x10\x17\x17w\xfc\xf8\xf1\
-\xfb\xf7\xef/\x5c\xb8p\xc9\x92%aaa\xff\xf8\xc7\
-?\x82\x83\x83\x09!\xe3\xc7\x8f/))\xf9\xf8\xe3\x8f\
-\x83\x82\x82^{\xed\xb5E\x8b\x16\xc9d2v+O\
-O\xcf\xb0\xb0\xb0\xbc\xbc\xbcW^y\xe5\xd5W_\xfd\
-\xf2\xcb/?\xfa\xe8#\xf3\xe5\x89\xa9S\xa7~\xf6\xd9\
-gR\xa94###>>~\xc5\x8a\x15\xd7\xaf_\
-7\xc7J\x9f\xd4j5\xc30\xe6=\x10BD\x22Q\
-tt4\xc30\xe6\xf3\x14B\xc8\xbe}\xfb\xe4r\xb9\
-B\xa1\xf0\xf3\xf3+-----\x1d\xfcw\x04l\
-\x8cbpw,\x00p$\x88\x8b\xa3\x1a\x8dF\xa3\xd1\
-\xf0]\x05\x80\xe3a?e\xb3\xff\xf3\x0a%8**\
-*\x5c\x5c\x5c\xf8.\x04\xc0\x91\x18\x8dFB\xc8\xd3\x1b\
-\x1c\x84\x90)S\xa6\xec\xdb\xb7\x8f\xef*\x00\x1c\xc9\xc0\
-\x97\x9cl\x0a\x17G\x01\x803\x04\x07\x00p\x86\xe0\x00\
-\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\x008Cp\x00\x00g\
-\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!8\x00\x803\x04\x07\
-\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\xc0\x99Pnr\xfb\
-\xf2\xcb/\x17.\x5c\xc8w\x15\x00\x8e\xe4_\xff\xfa\x17\
-_O-\x88\xe0x\x92\xfb\x82\xd9/\xf2\xe8o\x0f\x03\
-\xaf\x05\xb0\x03\xdb\xfd\x89>\xf7\xdcs|\xfdm;\xfc\
-7\x80m\xdc\xb8\xd1\xfc_\xaek\x01\xec`H\xfe\x89\
-\xe2\x1a\x07\x00p&\xdc\xe00\x18\x0c\xe5\xe5\xe5\x06\x83\
-\x81\xefB\x00x&\xc0\xb1 \x88k\x1c\xbd\xe5\xe6\xe6\
-^\xb9rE\xa9T\xfe\xe5/\x7f\x996mZZZ\
-\x1a\xdf\x15\x01\xf0C\x98cA\x88\xc1a0\x18\xae\x5c\
-\xb9r\xe0\xc0\x01B\xc8\x1bo\xbc\x91\x92\x92b0\x18\
-\x82\x82\x82\xf8\xae\x0b\xc0\xde\x04;\x16\x84x\xaa\xa2\xd3\
-\xe9\x14\x0a\x85yQ\xa5R\xf5\xf8Id\x80\xa7\x84`\
-\xc7\x82\x10\x83c\xd2\xa4I\x96\xbf\x8a\xae\xd5j'O\
-\x9e\xccc=\x00|\x11\xecX\x10\xe2\xa9JPP\xd0\
-\xb4i\xd3RRRT*\x95V\xab\x9d>}z`\
-` \xdfE\x01\xf0@\xb0cA\x88\xc1A\x08IK\
-K[\xbdz5M\xd3\x9b7o\x0e\x08\x08\xe0\xbb\x1c\
-\x00\xde\xa4\xa5\xa5\xdd\xb8qc\xed\xda\xb5\xcf>\xfb\xec\
-\x9bo\xbe\xc9w9\xff'\xd0\xe0 \x84xxxx\
-xx 5\x00\x02\x03\x03\xc7\x8f\x1f\xcfw\x15\xdf!\
-\xc4k\x1c\x00 p\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!\
-8\x00\x803\x04\x07\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\
-\xc0\x19\x82\x03\x008Cp\x00\x00g\x08\x0e\x00\xe0\x0c\
-\xc1\x01\x00\x9c!8\x00\x803\x04\x07\x00p\x86\xe0\x00\
-\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\x008Cp\x00\x00g\
-\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!8\x00\x803\x04\x07\
-\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\x008\
-Cp\x00\x00g\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!8\
-\x00\x803\x04\x07\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\xc0\
-\x19\x82\x03\x008Cp\x00\x00g\x08\x0e\x00\xe0\x0c\xc1\
-\x01\x00\x9c!8\x00\x803\x04\x07\x00p\x86\xe0\x00\x00\
-\xce\x10\x1c\x00\xc0\x19\x82\x03\x008Cp\x00\x00g\x08\
-\x0e\x00\xe0\x0c\xc1!DyyyT/'N\x9c0\
-\xaf\xaa\xad\xad\xedo\xdb3g\xce\xcc\x9e=\xfb\x99g\
-\x9eqqq\x91J\xa5\xcb\x96-kjj\xe2\xda\xc7\
-\xb2\x80\xe1\xc3\x87\x8f\x1b7n\xfd\xfa\xf5\x0f\x1e<\xb0\
-\xa6`777\x99L\xb6w\xef\xde\x87\x0f\x1fZ\xae\
-\x1d\xa0fB\xc8\xa2E\x8b(\x8aZ\xbe|y\x9f{\
-\x1e3f\xcc\x7f\xff\xfb_s\xa3^\xaf\xa7(j\xef\
-\xde\xbd\x03\xec\x10l\xca\x99\xef\x02\xa0_;w\xee\xf4\
-\xf3\xf33/\xcad\xb2\xc7n\x92\x93\x93\xf3\xd6[o\
-EFFfff\xfa\xf8\xf8TWW\xef\xda\xb5\xeb\
-\xe8\xd1\xa3\xa7O\x9f\x1e?~\xbc\xf5}X{\xf6\xec\
-\x09\x08\x08hmm---\xcd\xcc\xcc4\x99L\xdb\
-\xb7o\x1f\xe0\xd9\xd9\xfe---\xc5\xc5\xc5\xa9\xa9\xa9\
-z\xbd>++\xcb\x9aWz\xff\xfe\xfd\x92\x92\x12B\
-\xc8\xe1\xc3\x87\xb3\xb3\xb3\x9d\x9d{\xfeY655\xe5\
-\xe6\xe6\xaeY\xb3\xc6\x9a\xbd\x81\x1d 8\x84\xeb\xc5\x17\
-_\x0c\x0b\x0b\xb3\xbe\xff\xf9\xf3\xe7W\xadZ5o\xde\
-\xbc?\xff\xf9\xcfNNN\x84\x90\xc4\xc4\xc4\xe4\xe4d\
-\xb9\x5c>\x7f\xfe\xfc\xcb\x97/;99Y\xd3\xc7\xbc\
-\xc3\xd8\xd8X\xb6\x80\xa4\xa4$\xb9\x5c^XX8p\
-pX\xf6\x0f\x0f\x0f\xdf\xbd{\xf7\xe6\xcd\x9bE\x22\xd1\
-c+?v\xecXkkk||\xfc\xdf\xff\xfe\xf7\
-\x13'N\xcc\x9e=\xbbG\x87\xb8\xb8\xb8w\xdf}w\
-\xc9\x92%\x1e\x1e\x1e\xd6\xbf!`;8U\x19:\xb2\
-\xb3\xb3\x87\x0f\x1f\xbeg\xcf\x1e\xcb\xc1/\x95J\x97/\
-_^]]}\xfc\xf8q+\xfb\xf4FQ\xd4\x8c\x19\
-3\xda\xda\xda\xbe\xf9\xe6\x1bk*qrr\x8a\x8a\x8a\
-2\x99L\xf7\xee\xdd\xb3\xa6\x7fQQ\x91\x97\x97\xd7\xfb\
-\xef\xbf?b\xc4\x88\xa2\xa2\xa2\xde\x1d~\xff\xfb\xdf\x9b\
-L\xa6\x9c\x9c\x1ck\xf6\x06v\x80\xe0\x10\xae\xb6\xb66\
-\xe3\xb7L&\xd3\xc0\x9d\x19\x869}\xfatLL\x8c\
-\xb7\xb7w\x8fU\xf3\xe7\xcf'\x84\x9c>}\xda\x9a>\
-\xfd\xed\xbf\xa1\xa1a\xf4\xe8\xd1^^^V\x16__\
-_\xef\xec\xec\xec\xee\xee\xfe\xd8\x9e\xb7n\xdd\xaa\xac\xac\
-\x5c\xb0`\x81\x8f\x8f\xcf\x9c9s\xca\xca\xca\x9a\x9b\x9b\
-{\xf4\x09\x09\x09\xf9\xe5/\x7f\xb9c\xc7\x0e+\x93\x0b\
-l\x0d\xc1!\x5c\x11\x11\x11^\xdf\x9a5k\xd6\xc0\x9d\
-[[[[[[%\x12I\xefU!!!\x84\x90\
-\x1b7nX\xd3\xc7\xb2\xb1\xbd\xbd\xddd2\xdd\xbe}\
-;77\xb7\xa2\xa2b\xf3\xe6\xcd\x14E\x0dP\x03\xdb\
-\xff\xd6\xad[[\xb7n\xad\xac\xac\x9c={\xb6X,\
-~\xcc\x8b$\xe4\xd0\xa1C\x0f\x1f>LNN&\x84\
-\xfc\xe2\x17\xbfx\xf0\xe0\xc1\x91#Gzw[\xb7n\
-]gg\xe7\x96-[\x1e\xbbC\xb0\x03\xe1^\xe3\xf8\
-\xdd\xef~\xc7w\x09<+**\x0a\x0a\x0ab\x1f[\
-\xf3\xbf\xeeA'\x97\xcb\xcd\x8f\xd3\xd3\xd3\x7f\xf3\x9b\xdf\
-X\xd9\x9f\xa2\xa8\x05\x0b\x16\xe4\xe5\xe5Y\xf3,EE\
-E\xcf=\xf7\x5ctt4!d\xd6\xacY~~~\
-EEE\xbd\x9f\xcb\xcf\xcf/555//o\xc5\
-\x8a\x15\x1c^\x03\xd8\x86p\x83\x03\x22\x22\x22\xac\xbf8\
-\xea\xee\xee\xee\xe6\xe6V__\xdf{\x95^\xaf'\x84\
-\x04\x06\x06Z\xd3\xc7\xb2\xf1\x83\x0f>\x08\x0a\x0a\xba{\
-\xf7nNN\xce\xce\x9d;#\x22\x22\x16.\x5c8@\
-\x0dl\x7f777\x89Dbe\xd2]\xbat\xa9\xa6\
-\xa6f\xf5\xea\xd5F\xa3\x91m\x99;wn^^\xde\
-\xf5\xeb\xd7CCC{t^\xb3fM~~\xfe;\
-\xef\xbc\xd3\xfbS\xdb!o\xed\xda\xb5|\x97\xf0\x1d8\
-U\x19\x22(\x8a\x9a9s&M\xd3\xbd\xaf\x02\x1c=\
-z\x94\x102s\xe6Lk\xfaX6N\x9b6M\xa9\
-T\xbe\xf2\xca+'O\x9e\x94H$+W\xaelo\
-o\x1f\xa0\x06\xb6\xff\xd4\xa9S\xad?>b/\x85n\
-\xd9\xb2\xc5|R\xc6\x1e\xa7\x1c<x\xb0wg\x1f\x1f\
-\x9f\xa5K\x97\xee\xdb\xb7\xef\xe6\xcd\x9bV\xee\x1fl\x04\
-\xc11t\xac\x5c\xb9\xb2\xa3\xa3\xe3\xb7\xbf\xfd\xed\xa3G\
-\x8f\xcc\x8d_\x7f\xfd\xf5\xf6\xed\xdb'O\x9e\xfc\xe3\x1f\
-\xff\xd8\xca>\xbd\xb9\xba\xban\xdd\xba\xf5\xf6\xed\xdb\xf9\
-\xf9\xf9\x83Xpgggqqqdd\xe4\x99\xef\
-\x0a\x0f\x0f\xff\xd3\x9f\xfe\xc40L\xefMV\xadZ%\
-\x16\x8b7m\xda4\x88e\xc0\xf7 \x94S\x95E\x8b\
-\x16\xed\xdf\xbf\x7f\xd9\xb2e\x03\xcf\x14\x00VEE\x85\
-N\xa73/zxx\xc4\xc5\xc5)\x95\xca\xac\xac\xac\
-\xd5\xabW744\xa4\xa4\xa4<\xf3\xcc3\xec\xe4.\
-\xb1X|\xe4\xc8\x11\xf6\xf3Wk\xfa\xf4)11Q\
-&\x93egg\xa7\xa6\xa6\xba\xb8\xb8\x0cJ\xcd\xec\xe7\
-\xb5\xdb\xb6m\x8b\x8d\x8d\xb5\xec\xb9x\xf1\xe2\xd4\xd4T\
-\x8dF\xf3\xc3\x1f\xfe\xb0\xc7N\xbc\xbc\xbcV\xacX\xb1\
-a\xc3\x86\xefQ\xc0\xd0\xf3\xe9\xa7\x9f\xe6\xe4\xe4h\xb5\
-\xda\xff\xfc\xe7?\xee\xee\xee3f\xcc\xf8\xd5\xaf~\x95\
-\x98\x98h\x87\xa7\x16Dp<v\xe2 \xf4\x90\x9e\x9e\
-n\xb98q\xe2DvLfdd\xc8\xe5\xf2m\xdb\
-\xb6\xadY\xb3\xc6d2\xf9\xfb\xfb\xbf\xfe\xfa\xebk\xd6\
-\xac\x19;v\xac\xb9\xb35}z\xa3(*333\
-!!\xe1\xc0\x81\x03\xa9\xa9\xa9\x83R\xf3\xb8q\xe3\xdc\
-\xdc\xdc\xe6\xcd\x9b\xd7\xa3gRR\xd2\x8a\x15+\x8a\x8a\
-\x8az\x07\x07!d\xf9\xf2\xe5\xb9\xb9\xb9V\xce\x10\x19\
-\xc2\xf2\xf2\xf2\xd2\xd3\xd3'L\x98\xb0l\xd9\xb2\x90\x90\
-\x90\x96\x96\x96S\xa7N-X\xb0\xe0\xd8\xb1c\xbdg\
-\xd0\x0d>F\x00\x0e\x1f>L\x08\x89\x8f\x8f'\x84\x94\
-\x95\x95q\xdav\xc3\x86\x0d\x1b6l\xf8~k\x01\xec\
-\xc0\x16\x7f\xa2\xe7\xcf\x9fwrrJLL\xec\xea\xea\
-\xb2l\xff\xe2\x8b/.]\xba\xc4\xbdF\xce\x04q\x8d\
-\xe3\xb1\x13\x07\x01\xc0\xd2\xd6\xad[]\x5c\x5c\xf2\xf3\xf3\
-{\x1c\x9eO\x992\xc5\xf2Ct\xdb\xe1?8\xac\x99\
-8\x08\x00\x96N\x9f>\xadV\xabG\x8f\x1e\xcdW\x01\
-\xfc\x07\x87\x95\x13\x07\x01\x80\xd5\xd2\xd2\xd2\xdf\x0c`\xbb\
-\xe1?8\xfa\x9c8\xc8wQ\x000\x10\x9e\x83\x83\x9d\
-88w\xee\x5c\xf6V\xae\xb6\xb6\xb6\xb9s\xe7^\xbc\
-x\xf1\xfa\xf5\xeb\xfc\x16\x06 X\x1e\x1e\x1e\xee\xee\xee\
-}\xce\x00\xb6\x1b\x9e\x83\x83\xd3\xc4A\x00`\xf57\x03\
-\xd8n\xf8\x0c\x8e\xef1q\x10\x00\x08!\x19\x19\x19\x0f\
-\x1e<\xf8\xf5\xaf\x7f\xdd\xdd\xddm\xd9^]]\xfd\xf9\
-\xe7\x9f\xdb\xa1\x00>\xa7Z\x95\x97\x97s\x9d8\x08\x00\
-\x84\x90\xe8\xe8\xe8\x1d;v\xa4\xa7\xa7\xcbd\xb2\xe4\xe4\
-\xe4\x90\x90\x10\xa3\xd1x\xfa\xf4\xe9\xa3G\x8f\xfe\xf5\xaf\
-\x7f\xb5C\x01|\x1eq\x14\x15\x15\xf57q\x10\x13:\
-\x00\x06\x96\x96\x96v\xfe\xfc\xf9\x09\x13&\xe4\xe4\xe4,\
-\x5c\xb8p\xcd\x9a5---\xa5\xa5\xa5\x09\x09\x09v\
-xv>\x8f8\x8e\x1d;\xd6g\xbb\x87\x87\xc7\xc0w\
-a\x02\x00!$**\x8a\xbdW\xc3\xfe\xf8\xff8\x16\
-\x00\x1c\x0e\x82\x03\x008Cp\x00\x00g\x08\x0e\x00\xe0\
-\x0c\xc1\x01\x00\x9c!8\x00\x803\x04\x07\x00pf\xc3\
-\xe0(..\xa6(\x8a\xa6isKcc#\xfb\xcb\
-\xe3\x96\xddv\xef\xdeMQ\x94\xe5\xb7Q\xf6\x96\x99\x99\
-9j\xd4\xa8\xfe\x16\x01\x86\x92A\x1c8\xe4\xbb\x83e\
-\x10\x07\x8e\x0d\x83C\xadV\x13B,_?M\xd3\xae\
-\xae\xaeMMM\xb5\xb5\xb5\x96\x8d\xde\xde\xde\x13'N\
-\xb4]%\x00\x0e\xc4!\x06\x8e\x0d\x83\xc3\xdf\xdf_*\
-\x95\xf6x\xfd3g\xce\xec\xd1\xa8\xd5j\x95J\xe5\xc0\
-\xbf-\x08\xf0\xf4p\x88\x81c\xdbk\x1cj\xb5\xfa\xc2\
-\x85\x0b\xe6\x1b\xf8h\x9aV\xa9TJ\xa5\xd2\xfc\xfa\xeb\
-\xea\xean\xdf\xbe\x1d\x13\x13\xa3\xd3\xe9\x92\x92\x92\x82\x83\
-\x83\xc5b\xb1T*MKKkii\xb1im\x00\
-\x82e\xfd\xc0!\x84\xf02vl\x1e\x1c&\x93\xa9\xaa\
-\xaa\x8a\x10b4\x1au:\x9dJ\xa5R\xa9TZ\xad\
-\x96\xed\xc0\xbe\x11j\xb5\xba\xa1\xa1A\x22\x91l\xdf\xbe\
-\xfd\xe4\xc9\x93\xeb\xd7\xaf\xaf\xa8\xa8\xb0\xcf\xbd:\x00\x02\
-d\xfd\xc0!\x84\xf02vl{\x93\x1b\x9b\x884M\
-GDDh\xb5Z\x17\x17\x17\xb9\x5c\xee\xed\xedm0\
-\x18\xf4z}HH\x08M\xd3\xee\xee\xee\xe1\xe1\xe1\x22\
-\x91\xc8\xfcjcbb\xc2\xc3\xc3e2\xd9\xd5\xabW\
-'O\x9el\xd3\x0a\x01\x04\xc8\xfa\x81C\x08IHH\
-\xb0\xff\xd8\xb1\xed\x11\x87D\x22\x09\x08\x08`\xd3\x91\xa6\
-\xe9\xc8\xc8\xc8\xe1\xc3\x87\x87\x86\x86\xfa\xfa\xfa\x9a\x1b\x15\
-\x0a\x85H$\xea\xea\xea\xca\xc9\xc9\x91\xcb\xe5>>>\
-b\xb18**\x8a\x10r\xed\xda5\x9b\x96\x07 L\
-\xd6\x0f\x1cB\x08/c\xc7\xe6\xf38\xd4j\xf5\xb9s\
-\xe7\x18\x86a\xcf\xd3\xd8F\xf6l\xed\xe6\xcd\x9bz\xbd\
-\x9e=\xdc\xca\xc8\xc8X\xb7n]rrryy\xf9\
-\xe5\xcb\x97+++\x09!\x1d\x1d\x1d\xb6.\x0f@\x98\
-\xac\x1c8\x84\xa7\xb1c\xf3\xe0\x88\x89\x89inn\xbe\
-x\xf1bUU\x95\xf9\xf5\xabT*\x9a\xa6\xcf\x9e=\
-K\xbe=O;t\xe8\xd0\xd2\xa5K\xd3\xd3\xd3#\x22\
-\x22&L\x98 \x16\x8bm]\x18\x80\x90Y9p\x08\
-Oc\xc7\x1eG\x1c\x84\x90\xac\xac,\x86a\xd8\xdf@\
- \x84(\x95\xca\xba\xba\xba\x92\x92\x12WW\xd7\x193\
-f0\x0c\xd3\xde\xde\xee\xe9\xe9i\xde\x8a\xaf\xaf'\x01\
-\x10\x08k\x06\x0e!\x84\xaf\xb1c\xf3\xe0\x08\x0b\x0b\xf3\
-\xf5\xf5-++\x93\xc9d\xe6Yk\xec\xe3\xb2\xb2\xb2\
-\xa8\xa8\xa8a\xc3\x86Q\x14\x15\x17\x17WPPPS\
-Sc2\x99\x0a\x0b\x0b\xf1-\xe7\xf0\x94\xb3f\xe0\x10\
-B\xf8\x1a;\xf6\xb8WE\xadV3\x0cc>\xdc\x22\
-\x84\x88D\xa2\xe8\xe8h\x86a\xcc\x87[\xfb\xf6\xed\x93\
-\xcb\xe5\x0a\x85\xc2\xcf\xcf\xaf\xb4\xb4\xb4\xb4\xb4\xd4\x0e\x85\
-\x01\x08\x995\x03\x87\xf04v(G\xff\x15\x82\x8d\x1b\
-7\x9a\xff\xcbu-\x80\x1d\x0c\xc9?Q\xdc\x1d\x0b\x00\
-\x9c!8\x00\x803\x04\x07\x00p\x86\xe0\x00\x00\xce\x84\
-\x1b\x1c[\xb6l\xd9\xb2e\x0b\xdfU\x00\x08\x82\xd0\x86\
-\x83p\x83\x03\x00\x04\x0b\xc1\x01\x00\x9c!8\x00\x803\
-\x04\x07\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\
-\x008Cp\x00\x00g\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c\
-!8\x00\x803\x04\x07\x00p\x86\xe0\x00\x00\xce\x10\x1c\
-\x00\xc0\x19\x82\x03\x008Cp\x00\x00g\x08\x0e\x00\xe0\
-\x0c\xc1\x01\x00\x9c!8\x00\x803\x04\x07\x00p\x86\xe0\
-\x00\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\x008Cp\x00\x00\
-g\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!8\x00\x803\x04\
-\x07\x00p\x86\xe0\x00\x00\xce\x10\x1c\x00\xc0\x19\x82\x03\x00\
-8Cp\x00\x00g\x08\x0e\x00\xe0\xcc\x99\xef\x02\x06\x81\
-F\xa3\xd9\xb8qc\x9f\xab\x8e\x1d;\xe6\xe9\xe9\xd9\xdf\
-Z\x00;\xd0h4F\xa3q\x80\xb5\xb1\xb1\xb1v,\
-gp8|p\xe8\xf5\xfa\xce\xceN\x83\xc1\xd0\xe7\xda\
-{\xf7\xee\xdd\xb9s\xc7\x11\xffa`\xc80\x1a\x8d\xee\
-\xee\xee\xfd\xfd\x89vww\xeb\xf5z\xfbV4\x08\x1c\
->8BBB\x9a\x9b\x9b\xff\xf8\xc7?\xf6\xb9V*\
-\x95J\xa5R\x1cq\x00\xbf\x9a\x9a\x9a\xf6\xec\xd9\xd3\xe7\
-\xaa\x05\x0b\x16\x84\x84\x84\xd8\xb7\x9cA\x80k\x1c\x00\xc0\
-\x99p\x83\xc3h4\xd6\xd6\xd6\xf6w\x80\x07\xf0\xf40\
-\x18\x0c\xb5\xb5\xb5\x03\x5c(\xb1?\x81\x06Gnnn\
-cc\xa3J\xa5\xda\xb0a\xc3\xae]\xbb\xf8.\x07\x80\
-7\xb9\xb9\xb9\x1b7nT\xa9Tw\xee\xdc\x11\xceX\
-\x10\xe25\x0e\x83\xc1p\xe5\xca\x95\x03\x07\x0e\x10B\xde\
-x\xe3\x8d\x94\x94\x14\x83\xc1\x10\x14\x14\xc4w]\x00\xf6\
-&\xd8\xb1 \xc4#\x0e\x9dN\xa7P(\xcc\x8b*\x95\
-J\xa7\xd3\xf1X\x0f\x00_\x04;\x16\x84\x18\x1c\x93&\
-M:w\xee\x9cyQ\xab\xd5N\x9e<\x99\xc7z\x00\
-\xf8\x22\xd8\xb1 \xc4S\x95\xa0\xa0\xa0i\xd3\xa6\xa5\xa4\
-\xa4\xa8T*\xadV;}\xfa\xf4\xc0\xc0@\xbe\x8b\x02\
-\xe0\x81`\xc7\x02\xc50\x0c\xdf5\xf4\xed\xc6\x8d\x1b\xd5\
-\xd5\xd5S\xa7N\x0d\x08\x08\x18\xa0\xdb\xc6\x8d\x1b+*\
-*BCC\xfb\x5c{\xea\xd4)\x91H\x94\x92\x92b\
-\x93\x12\x01\xac\xa0\xd1h\x1e>|(\x95J\xfb\x5c[\
-WW\x17\x17\x177\xf0T#+\xc7\x82=\x0978\
-\xac\xa4\xd1h4\x1aM\x7fk\xd99y\x8e8\xc1\x06\
-\x9e\x1e\xb1\xb1\xb1\x0e7\xb9\xd9\xe1\x83\x03\x00\xecO\x88\
-\x17G\x01@\xe0\x10\x1c`\x95\xbc\xbc<\xea[\x22\x91\
-(   ))\xe9\xab\xaf\xbe\xe2\xbb.\xe0\x87\x10\
-?U\x01\xc1\xda\xb3gO@@\xc0\xc3\x87\x0f\xaf_\
-\xbf\x9e\x9d\x9d}\xe1\xc2\x85\xabW\xaf\xba\xb9\xb9\xf1]\
-\x17\xd8\x1b\x82\x038\x88\x8d\x8d\x0d\x0b\x0bc\x1f?\xfb\
-\xec\xb3?\xff\xf9\xcf/^\xbc\x18\x17\x17\xc7oU`\
-\x7f8U\x81\xefi\xf4\xe8\xd1\x84\x90\xae\xae.\xbe\x0b\
-\x01\x1e\xe0\x88\x038hoo7\x99L\xec\xa9\xca\x86\
-\x0d\x1b\xfc\xfd\xfdcbb\xf8.\x0ax\x80\xe0\x00\x0e\
-\xe4r\xb9\xf9\xb1D\x229~\xfc\xf8\xc8\x91#y\xac\
-\x07\xf8\x82\xe0\x00\x0e>\xf8\xe0\x83\xa0\xa0 \x86a\xfe\
-\xfd\xef\x7f\xef\xdc\xb9\xf3\xa5\x97^\xa2iz\xdc\xb8q\
-|\xd7\x05\xf6\x86\xe0\x00\x0e\xa6M\x9bf\xbe8\xfa\xa3\
-\x1f\xfd\xc8\xcf\xcfo\xd3\xa6MEEE\xfcV\x05\xf6\
-\x87\x8b\xa3\xf0=yzz\x06\x04\x04TWW\xf3]\
-\x08\xf0\x00\xc1\x01\xdf\xd3\xdd\xbbw\x0d\x06\x83\x8f\x8f\x0f\
-\xdf\x85\x00\x0f\x86\xc8\xa9\x0a\xc30\x1d\x1d\x1d#F\x8c\
-\xe0\xbb\x90!N\xa3\xd1|\xf5\xd5W\x0c\xc3\xdc\xbau\
-\xeb\xbd\xf7\xde\xeb\xec\xec|\xf3\xcd7\xf9.\xca14\
-77\xff\xf3\x9f\xff\x1c;v\xec\xd4\xa9S\xf9\xaee\
-\x10\x0c\x85\xe0\xd8\xb3gOyy\xb9\x97\x97\xd7\xfd\xfb\
-\xf7w\xec\xd8!\x9c[\x8f\x87\x9e\xd4\xd4T\xf6\x81\xaf\
-\xaf\xef\x94)S>\xf9\xe4\x93\x17^x\x81\xdf\x92\x1c\
-\x82V\xab}\xf7\xddw\x13\x12\x12\xce\x9e=\xbbs\xe7\
-\xce\xfd\xfb\xf7;99\xf6\xc1\xbe\xc3\xdf\x1dK\xd3t\
-YYYvv6!\xa4\xa1\xa1a\xe5\xca\x95G\x8f\
-\x1e\xe5\xbb\xa8\xc7kiiy\xf4\xe8\x91e\xcb\xfd\xfb\
-\xf7;::,[\xba\xbb\xbb\xdb\xda\xda\x06w\xc3\xd5\
-\xabW?i\xe9\x83\x81\xfd\xf7zzh4\x9a\x0f?\
-\xfc\xd0\xc5\xc5\x85\x10\xb2\x7f\xff\xfe\x91#G&%%\
-\xf1]\xd4\x13q\xf8#\x8e\x13'N,Z\xb4\x88}\
-\x1c\x1c\x1c\xec\xe2\xe2\x92\x99\x999l\xd80\xb6\xc5>\
-\xa3\xb1\xbf\x0d\xdd\xdc\xdc\x9c\x9d\x9d-7\x14\x8b\xc5=\
-\xce\xa7\x9c\x9c\x9c<<<z\xec\x96\xdd\xd0\xb2e\x10\
-7\x04;\xeb\xea\xea\xf2\xf6\xf6fS\x83\x10\x12\x1b\x1b\
-[PP\x80\xe0\xe0\xd9\x981c\xea\xeb\xeb\xcd\xdf\x00\
-f4\x1a\x9d\x9d\x9d\xcd\x83\xca\xcb\xcb\xcb\xdc\xd3\xa6\xa3\
-\xb1\xcf\x0d\xa1?\xabV\xad\xe2\xbb\x04\xbb\x8a\x8f\x8f\xef\
-\xe8\xe8\x10\x8b\xc5\x84\x903g\xce\xc8d2\xbe+z\
-R\x0e\x7f\xaa\xd2\xda\xda:\x7f\xfe\xfce\xcb\x96I$\
-\x92\xfc\xfc\xfc\xd0\xd0\xd0\xc5\x8b\x17\xf3]\x14\xc0wh\
-\xb5\xda\xad[\xb7\xbe\xfc\xf2\xcb\xf5\xf5\xf5MMM\x05\
-\x05\x05\xb8\xc6\xc1\xbf\xb6\xb6\xb6\x03\x07\x0e466\xc6\
-\xc7\xc7+\x95J\xbe\xcb\x01\xe8\x83\xd1h\xfc\xf4\xd3O\
-\xfd\xfc\xfc\x04\xf25\xe5Oh(\x04\x07\x00\xd8\x99c\
-\x1f/\x01\x00/\x10\x1c\x00\xc0\x19\x82\xe3iW\x5c\x5c\
-LQ\x14M\xd3\xe6\x96\xc6\xc6F\x8a\xa2\xc6\x8c\x19c\
-\xd9m\xf7\xee\xdd\x14E=\xf6\xf7\x07333G\x8d\
-\x1a\xd5\xdf\x22\x0c\x19\x08\x8e\xa7\x9dZ\xad&\x84X\x06\
-\x07M\xd3\xae\xae\xaeMMM\xb5\xb5\xb5\x96\x8d\xde\xde\
-\xde\x13'N\xe4\xa1D\x10\x1e\x04\xc7\xd3\xce\xdf\xdf_\
-*\x95\xf6\x08\x8e\x993g\xf6h\xd4j\xb5J\xa5\x92\
-\xa2(>j\x04\xc1Ap\x00Q\xab\xd5\x17.\x5c\xe8\
-\xee\xeef\x17i\x9aV\xa9TJ\xa5\xd2\x1c\x1cuu\
-u\xb7o\xdff\xbf%P\xa7\xd3%%%\x05\x07\x07\
-\x8b\xc5b\xa9T\x9a\x96\x96\xd6\xd2\xd2\xc2[\xe9\xc0\x13\
-\x04\x07\x10\xb5Zm2\x99\xaa\xaa\xaa\x08!F\xa3Q\
-\xa7\xd3\xa9T*\xf6W\x8e\xd9\x0el\x82\xb0'5\x0d\
-\x0d\x0d\x12\x89d\xfb\xf6\xed'O\x9e\x5c\xbf~}E\
-EEBB\x02\x8f\xc5\x03/\x1c~\xca9<9\xf6\
-P\x82\xa6\xe9\x88\x88\x08\xadV\xeb\xe2\xe2\x22\x97\xcb\xbd\
-\xbd\xbd\x0d\x06\x83^\xaf\x0f\x09\x09\xa1i\xda\xdd\xdd=\
-<<\x9c\x10\x92\x90\x90`N\x8a\x98\x98\x98\xf0\xf0p\
-\x99Lv\xf5\xea\xd5\xa11\xaf\x09\xac\x84#\x0e \x12\
-\x89$  \x80=\xac\xa0i:22r\xf8\xf0\xe1\
-\xa1\xa1\xa1\xbe\xbe\xbe\xe6F\x85B!\x12\x89\x08!]\
-]]999r\xb9\xdc\xc7\xc7G,\x16GEE\
-\x11B\xae]\xbb\xc6\xefK\x00;Cp\x00!\x84\xa8\
-\xd5\xeas\xe7\xce1\x0c\xc3^\xe0`\x1b\xd9\xcb\x1c7\
-o\xde\xd4\xeb\xf5\xecy\x0a!$##c\xdd\xbau\
-\xc9\xc9\xc9\xe5\xe5\xe5\x97/_\xae\xac\xac$\x84\xf4\xb8\
-\x93\x18\x86<\x04\x07\x10BHLLLss\xf3\xc5\
-\x8b\x17\xab\xaa\xaa\xcc\xc1\xa1R\xa9h\x9a>{\xf6,\
-\xf9\xf6\x02\x07!\xe4\xd0\xa1CK\x97.MOO\x8f\
-\x88\x88\x980a\x02{\xc7'<m\x10\x1c@\xc8\xb7\
-\xb9\x90\x95\x95\xc50Ltt4\xdb\xa8T*\xeb\xea\
-\xeaJJJ\x5c]]g\xcc\x98A\x08a\x18\xa6\xbd\
-\xbd\xdd\xd3\xd3\xd3\xbcaII\x09/\x05\x03\xbf\x10\x1c\
-@\x08!aaa\xbe\xbe\xbeeee2\x99\xcc<\
-\xd7\x93}\x5cVV\x16\x15\x15\xc5~7\x12EQq\
-qq\x05\x05\x05555&\x93\xa9\xb0\xb0\xf0\xe0\xc1\
-\x83\xbc\x16\x0e\xfc@p\xc0\xff\xa9\xd5j\x86a\xcc\xe7\
-)\x84\x10\x91H\x14\x1d\x1d\xcd0\x8c\xf9<\x85\x10\xb2\
-o\xdf>\xb9\x5c\xaeP(\xfc\xfc\xfcJKKKK\
-K\xf9(\x16x\x86\xdb\xea\x01\x803\x1cq\x00\x00g\
-\x08\x0e\x00\xe0\x0c\xc1\x01\x00\x9c!8\x00\x80\xb3\xff\x01\
-\xfd\xdd\xef\xac&,\xe53\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x1ea\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01h\x00\x00\x00\xd8\x08\x02\x00\x00\x00I:\xeeC\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x1e\x16IDATx\x9c\xed\xdd{X\
-T\xd5\xde\x07\xf05\x0c\xc8\xa0r\x17D\x1ca\x08*\
-\x14T\x90\x1c\x06\x98\x1bxA\x05\xd1\xf2\x11\xc5S\x1e\
-\xa5\x82P\x115\x1fLM\xd1D\xc14\xf3t\xbc\xa4\
-\x9es\x14\xb1P\x14\x8f\xa6i^\x02\x1c8A\x92\xfa\
-\xa4\x80\x17\xec\xe1\x92I\x98\xe4\xa0\x88\xc0\x00\xfb\xfdc\
-\xbfg\xbf\xf3\xa2\x22[\x86\xb9~?\x7f\xf40\x8b5\
-\xb3\x7f\xbbY|\xdd\x975k8\x14E\x11\x00\x006\
-\xcct]\x00\x00\x18\x1e\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\
-\x10\x1c\x00\xc0\x1a\x82\x03\x00XCp\x00\x00k\x08\x0e\
-\x00`\x0d\xc1\x01\x00\xac!8\x00\x805\x04\x07\x00\xb0\
-\x86\xe0\x00\x00\xd6\x10\x1c\x00\xc0\x9a\xb9\xae\x0b\x00\xd0/\
----\xe9\xe9\xe9UUU\x1c\x0eg\xe1\xc2\x85~\
-~~\xba\xaeH\x1fq\xf0\xe9X\x00u\x89\x89\x891\
-11\xc1\xc1\xc1MMMqqq\x1b6lps\
-s\xd3uQz\x07G\x1c\x00\xe4\xc9\x93'\xe7\xce\x9d\
-\x8b\x8a\x8aR\xa9T---\xc1\xc1\xc1\x84\x90\xbe}\
-\xfb.[\xb6\xec\xfd\xf7\xdf\x17\x89D\xda,F.\x97\
-\x87\x86\x86js\x8b/\x01\xd78\xc0tQ\x14u\xe1\
-\xc2\x85w\xdf}w\xf0\xe0\xc1\x1f~\xf8\xe1\x8a\x15+\
-8\x1cN[[\x1b\xd3\xa1\xb5\xb5\x95\xc3\xe1h\xb3\xa4\
-\x0b\x17.\xe4\xe7\xe7ks\x8b/\x07G\x1c`\x8a\xaa\
-\xab\xab\x0f\x1e<\xb8g\xcf\x1eKK\xcb\xd9\xb3g\x97\
-\x95\x95\xed\xda\xb5\x8b\x10bnn>`\xc0\x80S\xa7\
-NM\x9a4\xe9\xc1\x83\x07\xe9\xe9\xe9\xfb\xf6\xedsq\
-q\xd1Za)))Z\xdbVO 8\xc0\x84(\
-\x95\xcao\xbe\xf9&33\xb3\xac\xacl\xd0\xa0Ac\
-\xc6\x8c\xa1\xf3B]ZZ\xda\xf6\xed\xdb\xe7\xce\x9d\xcb\
-\xe3\xf1\xd2\xd3\xd3\xb5\x99\x1a\x06\x04\xc1\x01\xc6\xaf\xbd\xbd\
-=//o\xff\xfe\xfd'O\x9e\x1c=z\xf4\xf0\xe1\
-\xc3\x85Bauu\xb5\xab\xab\xeb\xd3\x9d\xb9\x5c\xee\xc2\
-\x85\x0b\xb5_\xa4aAp\x801+++\xcb\xcc\xcc\
-\xdc\xb7o\x9f\x9b\x9b\xdb\xa8Q\xa3\xe2\xe3\xe3\x9d\x9c\x9c\
-\xfa\xf7\xefO\x08\xa9\xa9\xa9\xd1uu\x06\x0c\xc1\x01F\
-\xe8\xce\x9d;999\xff\xfa\xd7\xbf\x9e<y\x22\x12\
-\x89\xe8\xf3\x8eA\x83\x06\xe9\xba.\xe3\x81\xe0\x00\xe3\xf1\
-\xe4\xc9\x93\x93'O\xee\xdf\xbf\xff\x87\x1f~\x90\xc9d\
-\xe3\xc7\x8f777www73\xc3\xddC\x0dC\
-p\x80\xc1\xeb\xe8\xe8\xf8\xe1\x87\x1f233\x8f\x1c9\
-2r\xe4H_____\xdfA\x83\x06\xf1x<\
-]\x97f\xb4\x10\x1c`\xc0\xca\xcb\xcb\xb3\xb3\xb3\xf7\xed\
-\xdbgoo/\x14\x0accc\x1d\x1d\x1d\x1d\x1c\x1c\
-t]\x97\xf1Cp\x80\xe1\xa9\xaf\xaf\xcf\xc9\xc9\xd9\xbf\
-\x7f\x7fee\xa5T*\x9d5k\x16\x97\xcb\x1d2d\
-\x88\xae\xeb2!\x08\x0e0\x18\xcd\xcd\xcd\xe7\xce\x9d\xcb\
-\xcc\xcc\xcc\xcd\xcd\x15\x89D\x81\x81\x81b\xb1\xd8\xdd\xdd\
-\x9d\xcb\xe5\xea\xba4\x93\x83\xe0\x00\x03p\xe9\xd2\xa5\xfd\
-\xfb\xf7geey{{\xfb\xfa\xfa\xc6\xc6\xc6\xba\xb8\
-\xb8\xd0wUA'\x10\x1c\xa0\xbf\x98\x89\xe1\x16\x16\x16\
-\x22\x91(66\xd6\xce\xce\x0e\x970\xf4\x01\x82\x03\xf4\
-\x8e\xfa\xc4p\xb1X<m\xda4.\x97\xeb\xee\xee\xae\
-\xe5\xcf\x9bA\x17\x10\x1c\xa0/\xd4'\x86\x0b\x85B_\
-__\x7f\x7f\x7f77\xb7>}\xfa\xe8\xba4\xe8\x0c\
-\xc1\x01\xba\xc7L\x0c\x1f2d\xc8\xa8Q\xa3\xe2\xe2\xe2\
-\x9c\x9d\x9dq\x09C\x9f!8@g\xd4'\x86\x07\x05\
-\x05\xcd\x9d;\xd7\xca\xca\x0a\x9fF5\x08\x08\x0e\xd06\
-L\x0c7\x02\x08\x0e\xd0\x12\xf5\x89\xe1~~~>>\
->>>>\x83\x07\x0f\xb6\xb4\xb4\xd4ui\xc0\x1a\x82\
-\x03z\x9d\xfa\xc4\xf0\xc0\xc0\xc0\xd8\xd8\xd8\x01\x03\x06\xd8\
-\xdb\xdb\xeb\xba.xy\x08\x0e\xe8-\xea\x13\xc3e2\
-\x19&\x86\x1b\x13\x04\x07h\x98\xfa\xc4\xf0\xa0\xa0\xa0\xc0\
-\xc0\xc0\x90\x90\x10\x81@\x80\x89\xe1\xc6\x04\xc1\x01\x1a\xc3\
-L\x0c\x1f:t\xa8\x8f\x8f\xcf\xdc\xb9s]]]\xfb\
-\xf5\xeb\xa7\xeb\xba@\xf3\x10\x1c\xd0S\xcc\xc4pss\
-\xf3\xe0\xe0\xe0\xb9s\xe7\xda\xdb\xdbcb\xb8qCp\
-\xc0K\xc2\xc4pS\x86\xe0\x00v\xd4'\x86\x8bD\x22\
-___???\x81@`aa\xa1\xeb\xd2@{\
-\x10\x1c\xd0]\x9d&\x86\xbf\xf7\xde{\xf8l\xbb\xc9B\
-p\xc0\x0b`b8<\x0d\xc1\x01\xcf\xa6>1<,\
-,,\x22\x22\x82\xcb\xe5\xf2\xf9|\x5c\xc2\x00\x82\xe0\x80\
-N\x9e\xb9b8\x9f\xcf\xc7%\x0cP\x87\xe0\x80\xff\xd5\
-ibx||\xfc\xf2\xe5\xcbu]TOeee\
-\xe9\xba\x04\xe3\x84\xcf#\x9a\xba\xfa\xfa\xfa\xdd\xbbw\x8b\
-\xc5\xe2q\xe3\xc6\xdd\xbauk\xd6\xacY\x91\x91\x91\xa3\
-F\x8d\x12\x08\x04t\x87w\xdeyg\xe4\xc8\x91\xeaO\
-\xd9\xbau\xab\x8d\x8dM\x5c\x5c\x9cz\xe3\xb4i\xd3\xe4\
-r9!\x84\xcf\xe7o\xd9\xb2E#\xb5\xc5\xc4\xc4\xd8\
-<\xcb\xe3\xc7\x8f;m\xc8\xc9\xc9i\xc7\x8e\x1d\xea?\
-@\xaf\xc2\x11\x87\x89\xea\xfe\xc4p\x89Dr\xfc\xf8\xf1\
-\xfb\xf7\xef\x0f\x180\x80n\xc9\xcb\xcb\xb3\xb7\xb7\xcf\xcf\
-\xcfg\xfattt\x5c\xbcx\xf1\xddw\xdf%\x84\x84\
-\x86\x862\xa1\xd3s\x03\x07\x0e\x5c\xbcxq\xa7Fz\
-M0\xcdn\x08XAp\x98\x1c\xb6+\x86K\xa5R\
-BHII\xc9\xc4\x89\x13\x09!\xcd\xcd\xcdEEE\
-K\x96,\xd9\xb0aCyy\xf9\xb0a\xc3\x08!\xd7\
-\xaf_ohh\x90\xc9d\x84\x90\xcc\xccL\x0dV\xeb\
-\xe0\xe00o\xde\xbcg\xfeJ\xb3\x1b\x02Vp\xaab\
-*\xaa\xab\xab7n\xdc\xe8\xe5\xe5\xf5\xf6\xdbo?|\
-\xf8066v\xe2\xc4\x89~~~^^^]\xcf\
-\xc5\xf0\xf6\xf6vrr\xbax\xf1\x22\xfd\xb0\xa8\xa8H\
-\xa5R\xc5\xc7\xc7;88\xe4\xe5\xe51\x8d\x96\x96\x96\
-\x22\x91\x88\xa8\x9dA\xf0\xf9\xfc]\xbbv\xbd\xfd\xf6\xdb\
-\x83\x06\x0drss[\xbcxqKK\x0b\xdd\xbf\xa5\
-\xa5e\xd9\xb2e\x9e\x9e\x9e\xae\xae\xae\xf3\xe7\xcfOM\
-M\x0d\x0c\x0cd\xbbG\x1a<'\x02\xb6p\xc4a\xe4\
-\xd4'\x86\x87\x84\x84L\x9b6\xcd\xdc\xdc\xdc\xcd\xcd\x8d\
-\xd5]U\x89D\xc2\x04G~~\xbe\xbf\xbf\xbf\xbd\xbd\
-\xbdL&\xcb\xcd\xcd\x9d?\x7f>!\xa4\xb8\xb880\
-0\xd0\xca\xca\xaa\xd3\x13W\xadZ\xb5l\xd9\xb2O>\
-\xf9\xe4\xca\x95+\xf1\xf1\xf1\x02\x81 ))\x89\x10\x92\
-\x98\x98x\xfc\xf8\xf1\xd5\xabW\x0b\x04\x82m\xdb\xb6\x1d\
->|\xd8\xc3\xc3\xe3\x99\x9bV\xa9T555\xea-\
-...X\xbeX\xe7\x10\x1c\xc6I}bxPP\
-\x90\xaf\xaf\xef\xa8Q\xa3\xf8|\xfe\xcb-\xb7%\x91H\
-V\xae\x5c\xd9\xde\xde\xce\xe5rsss\xc7\x8f\x1fO\
-\x08\x91\xcb\xe5\xcb\x97/omm\xed\xd3\xa7OQQ\
-\xd1\x9c9s\x9e~\xe2\x981c>\xfc\xf0CB\xc8\
-+\xaf\xbcr\xf0\xe0\xc1\xb3g\xcf&%%UUU\
-\x1d:th\xeb\xd6\xads\xe7\xce%\x84\x84\x85\x85\x8d\
-\x181\xe2y\x9b\xbe}\xfb\xb6\xaf\xaf\xafz\xcb\x85\x0b\
-\x17\xfc\xfd\xfd_b/@\x83\x10\x1c\xc6\x86\x99\x18.\
-\x10\x08\xdex\xe3\x8d\x84\x84\x04\x07\x07\x07kk\xeb\x9e\
-\xbc\xa6D\x22ijj*--\x1d2d\xc8\xb5k\
-\xd7\xd2\xd2\xd2\x08!\xa1\xa1\xa1MMM%%%\x1e\
-\x1e\x1e\xbf\xfe\xfa+}K\xa5\x13\xf5Dpvv.\
-++#\x84\x14\x16\x16R\x14\x15\x15\x15E\xb7[Y\
-YM\x9c8\xf1\xc7\x1f\x7f|\xe6\xa6\xf9|\xfe\xa7\x9f\
-~\xaa\xde\xf2\xca+\xaf\xf4d_@#\x10\x1cF\xa2\
-\xd3\xc4\xf0\xd8\xd8X\x0d.\xb7\xf5\xdak\xaf\x0d\x1c8\
-\xf0\xe2\xc5\x8b\xbf\xfc\xf2\x0b\x8f\xc7\x13\x0a\x85\x84\x10\x81\
-@\xe0\xee\xee\xfe\x9f\xff\xfc\xe7\xf7\xdf\x7f\xb7\xb6\xb6\x1e\
-5j\xd4\xd3OT?\xc0\xe1p8\x1d\x1d\x1d\x84\x90\
-\xfa\xfaz333\xf5\xcf\xdd;;;?o\xd3\xd6\
-\xd6\xd6\x91\x91\x91\x1a\xd9\x0b\xd0 \x04\x87ac&\x86\
-\x17\x15\x15\xc9d\xb2\xf0\xf0p\x0e\x87\xd3\x1b\xcbmI\
-$\x92\xcb\x97/\xf3x\xbc\xe0\xe0`\xe6\x12Chh\
-\xe8\x8f?\xfex\xef\xde=\xb1X\xdc\xfd-\xba\xba\xba\
-vtt\xd4\xd7\xd73\xf7w\xff\xf8\xe3\x0f\xcdV\x0b\
-\xbd\x0dwU\x0cRGGGaaa||<}\
-\xe7\xc2\xc3\xc3#666$$\xc4\xcb\xcb\xcb\xd3\xd3\
-\xb37\x16\xe9\x93H$?\xff\xfcsQQQXX\
-\x18\xd3(\x97\xcb\xcb\xcb\xcbKJJ\x9ey\x9e\xf2<\
-B\xa1\x90\xcb\xe5\x9e:u\x8a~\xa8R\xa9\xce\x9d;\
-\xa7\xd9j\xa1\xb7\xe1\x88\xc3\xc00\x13\xc3\xed\xec\xecF\
-\x8f\x1e\x1d\x17\x17gcc\xe3\xe8\xe8\xd8\xdb\xdb\x95J\
-\xa5K\x96,\xe9\xe8\xe8P\xcf\x08\xb9\x5c^[[[\
-WW\xb7s\xe7\xce\xee\xbf\x94\xbb\xbb{LL\xccG\
-\x1f}\xd4\xd4\xd4\xe4\xee\xee\xbek\xd7\xae\xbbw\xef\x0e\
-\x1d:T\xf3EC\xafAp\x18\x06f\xc5\xf0\xaa\xaa\
-*\xb9\x5c\xfe\x97\xbf\xfc\x85\x10\xc2\xf6\xaejOxz\
-z\x0e\x1c8P\xa5R\xf9\xf8\xf80\x8d\x0e\x0e\x0e\xc3\
-\x87\x0f\xaf\xad\xad\xa5\xa7\x81u\xdfg\x9f}\xc6\xe3\xf1\
-\xd2\xd2\xd2Z[[\xa7O\x9f>m\xda\xb4\xaa\xaa*\
-\x0dW\x0c\xbd\x09\xc1\xa1\xd7\xd4'\x86K$\x12\x91H\
-$\x16\x8bu\xf5%F7n\xdcx\xba\xb1\xa0\xa0\xa0\
-S\xcb\x9d;w:\xfd@\xdb\xb6m\x1b\xfd\x83R\xa9\
-<u\xea\xd4\xea\xd5\xab\x99\xe9[\xe1\xe1\xe1\xcf\xbcW\
-\xd2\xf5G\xd4\xd4_\x9f\xb9J\x82\xcb%\xda\x81\xe0\xd0\
-S\xcc\xc4\xf0a\xc3\x86\x8d\x1c9\xf2\x83\x0f>\xb0\xb7\
-\xb7\xef\xe1]U=aii\xb9l\xd9\xb2#G\x8e\
-\xc4\xc5\xc5YXX\x9c<y\xf2\xc7\x1f\x7f\x5c\xb3f\
-\x8d\xae\xeb\x02\x16\x10\x1c\xfaE}\xc5p\xb1X\x1c\x1f\
-\x1fO\x08\xd1\xd5\x97\x18\xf5\xdeg\xd2\x13\x12\x12\x8e\x1d\
-;6g\xce\x9c\xf6\xf6v>\x9f\x9f\x98\x98XUU\
-\x85\xb3\x15\x03\x82\xe0\xd0\x0b\xcc\xc4\xf0\xf2\xf2\xf2\xc8\xc8\
-\xc8\xe9\xd3\xa7\x9b\x99\x99\x0d\x192\xc4X\xbf\x87\xd9\xc3\
-\xc3\xe3\xe9\xcf\xbc\x82\x01Ap\xe8\x92\xfa\xc4\xf0\xd0\xd0\
-\xd0)S\xa6DGG\xb7\xb5\xb5\xe1K\xcf@\xcf!\
-8t\x83\x99\x18\xee\xe5\xe55y\xf2\xe4\xc8\xc8\xc8\xfb\
-\xf7\xef\x9b\x9b\x9bS\x14\x85\xd4\x00\xfd\x87\xe0\xd0*f\
-bxKK\xcb\x94)S>\xff\xfc\xf3\xfb\xf7\xef[\
-ZZ*\x95Jss\xbc\x17`00X\xb5A}\
-b\xf8\xd4\xa9S\x17-Zdnn\xfe\xe8\xd1\xa3G\
-\x8f\x1e\xe9\xe4\xc6*@\x0f!8z\x91\xfa\x8a\xe1\xc1\
-\xc1\xc1\x93'O\x9e3gNmm\xadJ\xa5R\xa9\
-T8\xc4\x00\xc3\x85\xb1\xfb2\xee\xdf\xbf\x9f\x9a\x9a\xfa\
-\xe8\xd1#\x1b\x1b\x9b\x15+V899u\xea\xc0L\
-\x0c\x1f0`\xc0\xb4i\xd3\xfe\xf1\x8f\x7f\xd4\xd5\xd5Q\
-\x14U__\x8fEh\xc0\x08 8XkkkK\
-HH\xd8\xb4i\x93@ \xa8\xa9\xa9\x997o\xde\xd7\
-_\x7fM\x7f\xed\x0831\xfc\xda\xb5k\xbe\xbe\xbe\xcb\
-\x96-{\xf2\xe4I[[[uu\xb5\x99\x99\x19\x8f\
-\xc7\xd3u\xed\x00\x9aar\xc1\xf1\xd1G\x1f\xf5\xf0\x15\
-jkk\xe5r9\xbd\xbe\xb6\x9b\x9b\xdb\x981c.\
-]\xba\xe4\xeb\xeb\x1b\x1d\x1d]\x5c\x5c\xfc\xe6\x9bo\xae\
-_\xbf>777//\xaf\xac\xac\xac\xbd\xbd\x9d\x10\
-\xc2\xac\xb5\xd9\xd6\xd6\xa6R\xa9\x08!\xccgLx<\
-\x1e\xbdP\x05\xd3\x87\x99\xbbA\xff\xea\x995477\
-S\x14\xf5\x12\xc5s8\x9c\xe7\xe5\x17EQ\xcd\xcd\xcd\
-]?\xf7%\xb6\xa8\xb7*++\xbd\xbc\xbct]\x85\
-\xa12\xad\xe0\xd8\xb0aCQQQPPPO^\
-\x84Y\x90\x86\xd6\xd1\xd1\xc1\xe1p6o\xdelkk\
-\xfb\xdbo\xbf\xd1\xebn\xe6\xe6\xe6r\xb9\xdc.\xd6\xa7\
-\x01\x9d\xfb\xed\xb7\xdft]\x82\x013\xad\xe0 \x84\x84\
-\x87\x87\xafX\xb1\xa2'\xaf\xd0\xde\xde>s\xe6\xcc\x89\
-\x13'zyy\xfd\xf2\xcb/yyyqqq\xa7\
-O\x9f~\xfd\xf5\xd7\xd5W\xeb\x95J\xa5\xabW\xaf\xee\
-q\xbd\xd0[^\xee\x90\x0dh&\x17\x1c=\xc7\xe5r\
-w\xef\xde\xbda\xc3\x86{\xf7\xee9;;\xef\xde\xbd\
-\x1b\xf7G\xc0\xd4`\xc4\xbf\x0c{{\xfbM\x9b6\xe9\
-\xba\x0a\x00\x9d1\xce\xcfP\x01@\xafBp\x00\x00k\
-\x08\x0e\x00`\x0d\xc1\x01\x00\xac!8\x00\x805\x04\x07\
-\x00\xb0\x86\xe0\x00\x00\xd6\x10\x1c\x00\xc0\x1a\x82\x03\x00X\
-Cp\x00\x00k\x08\x0e\x00`\x0d\xc1\x01\x00\xac!8\
-\x00\x805\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\x10\x1c\x00\xc0\
-\x1a\x82\x03\x00XCp\x00\x00k\x08\x0e\x00`\x0d\xc1\
-\x01\x00\xac!8\x00\x805\xd3Z\xe5\xbc\x87\xdf\xa8\x02\
-\xd0\xdb\xd6\xae]\xab\xeb\x12\xba\x05G\x1c\x00\xc0\x1a\x82\
-\x03\x00X\xd3\xdf\xe0\xd8\xb6m\x1b\xe7\xbf\xb8\x5c.\x9f\
-\xcf\x8f\x89\x89\xb9}\xfb\xf6\xf3\xfageeq8\x1c\
-\x85B\xc1\xb4\xd4\xd5\xd5q8\x9c\x81\x03\x07\xaaw\xdb\
-\xbe};\x87\xc3)--\xedb\xd3\xa9\xa9\xa9\xfd\xfb\
-\xf7\x7f\xdeC\x00\xf5\xc1imm\xed\xef\xef\xff\xe5\x97\
-_\xd2_0\xde\x13K\x97.uqq\xd1H\x85\xbd\
-M\xdf\xafq\xec\xdc\xb9\x93\xcf\xe7\xb7\xb7\xb7\xdf\xbau\
-k\xd3\xa6MEEE\xd7\xae]\xb3\xb6\xb6~\xba\xa7\
-T*%\x84(\x14\x0a\xfa\x07\xfa\xe7\xbe}\xfb\xde\xbb\
-w\xef\xc6\x8d\x1b\xde\xde\xdeL\xa3\xa3\xa3\xa3\x8f\x8f\x8f\
-\xd6v\x01\x8c\x15=8\x1b\x1a\x1a\xb2\xb2\xb2\x12\x12\x12\
-\xaa\xaa\xaa\xd2\xd3\xd3u]\x94\x96\xe8{p\xc8\xe5r\
-\xe6o~\xd0\xa0A\xef\xbc\xf3Nqq\xf1\xb8q\xe3\
-\x9e\xee9x\xf0`OOO\xf5#\x0e\x85B\x11\x16\
-\x16v\xfd\xfau\x85B\xc1\xbcHAA\x81X,\xe6\
-p8Z(\x1e\x8c\x1b38cbb\xfc\xfc\xfc\xb6\
-o\xdf\xbe~\xfdz.\x97\xab\xeb\xba\xb4A\x7fOU\
-\x9e\xe6\xe0\xe0@\x08Q\xa9T\xcf\xeb \x95J\x8b\x8a\
-\x8a\xda\xda\xda\xe8\x87\x0a\x85B\x22\x91\x88\xc5b&M\
-***jkke2YiiiLL\x8c\xbb\
-\xbb;\x8f\xc7\xf3\xf4\xf4LLLlhh\xd0\xc2.\
-\x80Q233\x13\x89D\x8d\x8d\x8d\xf5\xf5\xf5\x84\x90\
-\xabW\xafFEE\xd9\xd9\xd9YYY\x85\x84\x84\x14\
-\x14\x140=Y\x0d\xbc\xbd{\xf7ZXX\xac_\xbf\
-^\x1b\xfb\xc0\x92\xbe\x07GSSScccCC\
-CIIIJJ\xca\xe0\xc1\x83e2\xd9\xf3:K\
-\xa5\xd2\xc6\xc6\xc6\xcb\x97/\x13B\x94Jeii\xa9\
-D\x22\x91H$\xcc;G'\x88T*\xad\xae\xae\xf6\
-\xf0\xf0\xf8\xfc\xf3\xcf\xcf\x9c9\xb3j\xd5\xaa\xb3g\xcf\
-FDDhg\x8f\xc0(UVV\x9a\x9b\x9b\xdb\xd8\
-\xd8\xfc\xfc\xf3\xcf\xc1\xc1\xc1uuu\xbbw\xef>z\
-\xf4\xa8\xb3\xb3\xf3\xd8\xb1c/]\xbaDw\xeb\xfe\xc0\
-KKK\x8b\x8b\x8b\xfb\xf2\xcb/W\xae\x5c\xa9\xc5\xfd\
-\xe8.}?U\x09\x08\x08`~\xf6\xf0\xf08}\xfa\
-t\xbf~\xfd\x9e\xd7\x99\xce\x14\x85B!\x14\x0a\x0b\x0a\
-\x0a,--\x03\x02\x02\x1c\x1d\x1dkjj\xaa\xaa\xaa\
-\x04\x02\x81B\xa1\xb0\xb1\xb1\xf1\xf3\xf3\xe3r\xb9\xcc\x1b\
-&\x93\xc9\xfc\xfc\xfc\xfc\xfd\xfd\xaf]\xbb6|\xf8\xf0\
-\xde\xde#0\x1a\xf4\xbfj\x0f\x1f><p\xe0\xc0\xf9\
-\xf3\xe7\xa7N\x9d\xca\xe3\xf1\x92\x93\x93\x07\x0c\x18\x90\x9b\
-\x9bK\x0f\xd4\xf0\xf0p\x7f\x7f\xff\xd4\xd4\xd4\x7f\xff\xfb\
-\xdf\x84\x90\x88\x88\x88\x17\x0e<\x8a\xa2\x16-Z\xb4g\
-\xcf\x9e\x9c\x9c\x9c\xa8\xa8(\x9d\xec\xda\x0b\xe9\xfb\x11\xc7\
-W_}UPP\xa0P(\xb2\xb2\xb2\x06\x0e\x1c\x18\
-\x1e\x1e\xde\xc5\x8d\x15\x0f\x0f\x0f>\x9fO\x1fV(\x14\
-\x8a\xc0\xc0\xc0>}\xfa\xbc\xf6\xdak\xce\xce\xceLc\
-HH\x08\x97\xcbU\xa9T[\xb6l\x09\x08\x08pr\
-r\xe2\xf1x\x22\x91\x88\x10r\xf3\xe6M\xad\xed\x17\x18\
-\x81\x80\x80\x00kk\xeb\xc1\x83\x07\x7f\xf4\xd1G3f\
-\xcc\xd8\xb3gOkkk^^\xde\xb4i\xd3\x98\x7f\
-\xde\xcc\xcc\xcc\x22##\x0b\x0b\x0b\xe9\x87/\x1cx\xed\
-\xed\xed\xb3f\xcd\xca\xcc\xcc<{\xf6\xac\xde\xa6\x06\xd1\
-\xff#\x8eQ\xa3F1\xd75'L\x98\xe0\xea\xea\xba\
-n\xdd\xba\x8c\x8c\x8c\xe7\xf5\x97J\xa5\xa7O\x9f\xa6(\
-J\xa1P\x84\x87\x87\xd3\x8d\xf4e\x8e\xb0\xb0\xb0\xaa\xaa\
-\xaa\xf8\xf8xBHrr\xf2\xae]\xbb\xd2\xd2\xd2\x82\
-\x82\x82\xac\xad\xad\xeb\xeb\xeb%\x12Iss\xb3\x16\xf6\
-\x08\x8c\xc6W_}\xe5\xe6\xe6fmm\xed\xe1\xe1a\
-ccC\x08\xa9\xab\xabS\xa9T_|\xf1\xc5\xf6\xed\
-\xdb\x99n\xed\xed\xed\xcc\x9d\xda\x17\x0e\xbc\xc6\xc6\xc6\x13\
-'NH\xa5R:S\xf4\x96\xbe\x07\x87:;;;\
->\x9f\x7f\xf5\xea\xd5.\xfa\xc8d\xb2\xaf\xbf\xfe\xba\xb8\
-\xb8\xf8\xf2\xe5\xcb\xa9\xa9\xa9t\xa3D\x22\xd9\xb1c\xc7\
-\x85\x0b\x17\xc8\x7f\xef\xda\x1e8p`\xe1\xc2\x85II\
-It\x87\x9f~\xfa\xa9\x97k\x07#\xa4\xfe\xaf\x1a\xcd\
-\xd6\xd6\x96\xcb\xe5&$$\xcc\x9b7\xef\x99Oy\xe1\
-\xc0\xb3\xb5\xb5\xcd\xce\xce\x8e\x88\x88\x989s\xe6\xc1\x83\
-\x07\xcd\xcd\xf5\xf4/T\xdfOU\xd4\xfd\xf1\xc7\x1f5\
-55NNN]\xf4\xa1s!==\x9d\xa2\xa8\xa0\
-\xa0 \xbaQ,\x16WTTdgg\xf7\xed\xdbw\
-\xf4\xe8\xd1\x14E555\xd9\xd9\xd91\xcf\xca\xce\xce\
-\xee\xd5\xca\xc1D\xf0x<\xb9\x5c\x9e\x9f\x9f\xef\xe1\xe1\
-\xe1\xfd\xff\x11B\xba9\xf0\xe8\xa3\xe63g\xce\xcc\x98\
-1\xa3\x8b{\x88\xba\xa5\xa7y\xc6\xc8\xcf\xcf\xbf}\xfb\
-6EQw\xef\xde\xdd\xb1cGkk\xeb\x82\x05\x0b\
-\xba\xe8\xef\xed\xed\xed\xec\xec|\xe2\xc4\x89\x80\x80\x00f\
-\xba\xa7\xbf\xbf\x7f\xff\xfe\xfdO\x9c8\x11\x1a\x1aja\
-aA\x08\x197n\xdc\x9e={\xa2\xa2\xa2\xdc\xdc\xdc\
-\x0e\x1d:\xb4\x7f\xff~m\xec\x0c\x98\x80\xcf>\xfbL\
-,\x16\x8b\xc5\xe2\xf9\xf3\xe7\x0f\x192\xa4\xbe\xbe\x9e>\
-\xac\xf8\xf4\xd3O9\x1cN7\x07\x9eX,>s\xe6\
-\xcc\x84\x09\x13\xa2\xa3\xa3\xb3\xb3\xb3\xe9A\xabW\xf4\xfd\
-\x88#!!a\xf2\xe4\xc9QQQ\xabW\xafvv\
-v>w\xee\xdc\x0b\xaf\x18I\xa5R\x8a\xa2$\x12\x09\
-\xd3\xc2\xe5r\x83\x82\x82(\x8ab&\x95\xee\xda\xb5+\
-   $$\xc4\xd5\xd55'''''\xa7\x17\
-\xf7\x01L\xc9\xc8\x91#KJJ<==\x93\x93\x93\
-'M\x9a\xb4d\xc9\x92[\xb7n\x8d\x1d;\x96\xfem\
-\xf7\x07^pp\xf0\xd9\xb3gsss\xa7O\x9f\xde\
-\xda\xda\xaa\xad\xf2\xbb\x8bCQ\x94\xaek0\x06k\xd6\
-\xaca\xfeK\x08III!\x86\xf3\x11i\xd3D\xbf\
-;\xf4;E\x9ez\x07\xa1k\xfa~\xc4\x01\x00z\x08\
-\xc1\x01\x00\xac!8\x00\x805\x04\x07\x00\xb0\x86\xe0\x00\
-\x00\xd6\x10\x1c\x00\xc0\x1a\x82\x03\x00X\xd3\xdf\xe0\xa0\x97\
-u\xbcq\xe3\x86z\xe3\x9d;w8\x1cN7\x17h\
-c\xb5Vh\xd7\xcb=\xe6\xe6\xe6\x9a\xce\xaap\xf0B\
-\xda\x1c\x9c\xfa92\xf578z\xce\xd9\xd9y\xd8\xb0\
-a\x1ay)\x04\x07h\x96\xa6\x06'\x82C\xf3\xe2\xe2\
-\xe2.^\xbc\xa8\xeb*\x00\x9e\xc1\xd0\x07\xa71\x04\xc7\
-\xf3\x96x|\xfah0;;{\xe8\xd0\xa1<\x1e\xcf\
-\xd7\xd7\xf7\xe8\xd1\xa3c\xc7\x8e\x8d\x8c\x8cT\xefPV\
-V\x16\x16\x16\xd6\xaf_?//\xaf/\xbe\xf8\x82n\
-\x5c\xb4h\xd1\xfa\xf5\xeb\x1b\x1a\x1a\xe8\xe5\xf0\xf9|\xbe\
-v\xf6\x0b\x0c]\x17\x8b\x8fv\x1a\x9c\x0672\xf5=\
-8\x1e=z\xa4T\xf3\xf0\xe1\xc3N\x1d\xba^\xe2Q\
-]^^\xde\xcc\x993}}}\xbf\xf9\xe6\x9b\x15+\
-V$''\x97\x97\x97\xabwx\xfc\xf8\xf1[o\xbd\
-\x15\x11\x11q\xe8\xd0!\x89D\x92\x94\x94t\xfa\xf4i\
-B\xc8\xea\xd5\xab\x17,X`mm]YYYY\
-YY\x5c\x5c\xdc{\xfb\x0b\x06\xa4\xeb\xc1i\xdc#S\
-\xdf?V/\x14\x0a\xbb\xee\xd0\xf5\x12\x8f\xeaRRR\
-F\x8e\x1cy\xf8\xf0a\xfa\xa1\xaf\xaf\xef\xc8\x91#\xd5\
-;466~\xfe\xf9\xe7\x93&M\x22\x84DDD\
-\x14\x14\x14deeM\x9c8\xd1\xc1\xc1\xc1\xd6\xd6\xd6\
-\xcc\xccL \x10hj\xbf\xc0\x08t=8\x8d{d\
-\xea{pddd\xb8\xb9\xb91\x0f\xff\xf8\xe3\x8f\xe8\
-\xe8h\xe6!\xbd\xc4cbbb\xa7%\x1ew\xef\xde\
-\xdd\xe9u(\x8a\xbax\xf1\xa2\xfa\x82\xd1#F\x8cx\
-\xf5\xd5W\xd5\xfbXZZN\x980\x81\xfe\x99\xc3\xe1\
-\x0c\x1f>\xbc\xa6\xa6F\xb3\xbb\x03\xc6\xa4\x8b\xc1i\xf4\
-#S\xdf\x83C(\x14\xaa\xaf\xcev\xe7\xce\x1d\xf5\xdf\
->x\xf0\xa0\xeb%\x1e\x19\x7f\xfe\xf9gKK\x8b\xb3\
-\xb3\xb3zc\xa7o\x87\xb4\xb3\xb333\xfb\xbfs7\
-KKK\xacB\x0a]\xe8bp\x1a\xfd\xc8\xd4\xf7\xe0\
-\xe8\xda\x0b\x97xd\xd8\xdb\xdb[ZZ\xde\xbbwO\
-\xbd\xb1\xae\xae\xce\xd6\xd6\xb67\x0b\x04\x13e\xf4#S\
-\xdf/\x8ev\xad\xeb%\x1e\xd5\x99\x99\x99\x09\x85\xc2\xa3\
-G\x8f2-\xd7\xae]\xab\xa8\xa8\xe8\xe6\x86\xf4!\xe3\
-\xc1\x80\x18\xfd\xc84\xec#\x0e\xd2\xe5\x12\x8f\x9dz\xae\
-]\xbbv\xcc\x981\xd1\xd1\xd1\xef\xbd\xf7^}}\xfd\
-\xaaU\xab\x5c\x5c\x5c\xd4\x8f\x00\xbb\xe0\xe3\xe3\xd3\xd2\xd2\
-\xf2\xb7\xbf\xfd-((\x88\xc7\xe3\x8d\x181B\xf3{\
-\x02\xc6\xc5\xb8G\xa6a\x1fq\x90\x17-\xf1\xa8.4\
-44++\xeb\xea\xd5\xab\x93'O^\xb7n]z\
-z:\x9f\xcf\xef\xe6\x01\xe1\x94)S\xe2\xe2\xe2\xd6\xad\
-['\x12\x89\xe8\x8b\xdb\x00]3\xee\x91i\xbak\x8e\
-\xd6\xd6\xd6zyy\xa5\xa6\xa6.^\xbc\xb8\xe7\xaf\x86\
-5G\x0d\x8e\xde\xae9\xaa\xd9\x91\xd9K\x0c\xfeT\xa5\
-\xfb\x1a\x1b\x1b\x97/_>v\xec\xd8\x01\x03\x06TV\
-Vn\xdc\xb8\xb1\x7f\xff\xfe\xb3g\xcf\xd6u]`\xea\
-\x0cqd\x9aPp\x98\x9b\x9b\xff\xfa\xeb\xaf\x1f|\xf0\
-A}}}\xff\xfe\xfd\xe5r\xf9\x91#G\x1c\x1d\x1d\
-u]\x17\x98:C\x1c\x99&\x14\x1c<\x1e\xef\xd8\xb1\
-c\xba\xae\x02\xa03C\x1c\x99\x06\x7fq\x14\x00\xb4\xcf\
-\xb4\x82c\xdd\xbau\xeb\xd6\xad\xd3u\x15\x00\xcfe(\
-C\xd4\xb4\x82\x03\x004\x02\xc1\x01\x00\xac!8\x00\x80\
-5\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\x10\x1c\x00\xc0\x1a\x82\
-\x03\x00XCp\x00\x00k\x08\x0e\x00`\x0d\xc1\x01\x00\
-\xac!8\x00\x805\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\x10\
-\x1c\x00\xc0\x1a\x82\x03\x00XCp\x00\x00k\x08\x0e\x00\
-`\x0d\xc1\x01\x00\xac!8\x00\x805\x04\x07\x00\xb0\x86\
-\xe0\x00\x00\xd6\x10\x1c\x00\xc0\x1a\x82\x03\x00XCp\x00\
-\x00k\x08\x0e\x00`\x0d\xc1\x01\x00\xac!8\x00\x805\
-\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\x10\x1c\x00\xc0\x1a\x82\x03\
-\x00X3\xd7u\x01\x06\xa9\xa2\xa2b\xf3\xe6\xcd\xad\xad\
-\xad\xde\xde\xdeK\x96,\xb1\xb0\xb0\xd0uE\xa01\xad\
-\xad\xad\x9b6m\xba}\xfb6\x87\xc3\x997o\xde\x1b\
-o\xbc\xa1\xeb\x8a\xf4\x11\x8e8X\xab\xab\xab[\xb9r\
-\xe5\xc6\x8d\x1b\xf7\xee\xdd\x1b\x18\x18\xb8t\xe9R]W\
-\x04\x9a\xb4|\xf9\xf2\x90\x90\x90\xbd{\xf7\xee\xd8\xb1\xe3\
-\xef\x7f\xff\xfb/\xbf\xfc\xa2\xeb\x8a\xf4\x91i\x1dqP\
-\x14\xf5\xfd\xf7\xdf?y\xf2\xa4'/r\xf9\xf2\xe5\xb5\
-k\xd7\xda\xd9\xd9\x11B\xe4ryVVVKK\x0b\
-!$???%%\x85\xees\xe1\xc2\x05B\xc8\x9a\
-5kzZ1\xf4\x9a\x0b\x17.p8\x9c\xb5k\xd7\
-2\x0fe2YGG\x87R\xa9\x94\xcb\xe5\x84\x10\x1e\
-\x8f\xb7r\xe5\xca\xf9\xf3\xe7\x87\x86\x86j\xad\xaa\xc2\xc2\
-B\xb1X\xac\xb5\xcd\xbd4\xd3\x0a\x8e\x8f?\xfe\xb8\xb9\
-\xb9\xb9\x87/BQ\x94\x99\x99Y\xa7\x965k\xd60\
-\xa9A\x08\x91\xc9d\xd5\xd5\xd5=\xdc\x10\xf4*\x81@\
- \x10\x08\x98\x87r\xb9<%%\x85\xa2\xa8\xf6\xf6v\
-\xa6Q\xa5Ruz\xaf{[XX\x98D\x22\xd1\xe6\
-\x16_\x12\x05,\xdd\xbd{w\xc6\x8c\x19\x0d\x0d\x0d\x14\
-E\x15\x16\x16\xce\x9f?_\xd7\x15\x81&\xadX\xb1\xe2\
-\xd8\xb1c\x14E)\x95\xca\x193f\xd4\xd4\xd4\xe8\xba\
-\x22}\xc4\xa1(J\xd7\xd9ex\xae_\xbf\xbee\xcb\
-\x96\xb6\xb66//\xaf\xa5K\x97ZZZ\xea\xba\x22\
-\xd0\x98\x8e\x8e\x8e\x9d;w\x96\x94\x94\xf0x\xbc\xc5\x8b\
-\x17\xbf\xfe\xfa\xeb\xba\xaeH/\xe9:\xb9\x8cDJJ\
-\x0a}\xa0k(\xde{\xef=B\xc8\xa2E\x8b\xb4\xb0\
-\xad\xe2\xe2\xe2\xe8\xe8\xe8A\x83\x06YXX8::\
-N\x980\xe1\xc8\x91#Z\xd8.+\x06\xf7\x0e\xea\x16\
-\xee\xaa\x98\xa2'O\x9edgg\x13B\xbe\xfe\xfa\xeb\
-\xb6\xb6\xb6^\xdd\xd6\xb6m\xdb\x82\x83\x83\xcb\xca\xca\x16\
--Zt\xe0\xc0\x81\xb4\xb44[[\xdb\x193f\x9c\
-<y\xb2W\xb7\x0b\xbd\xca\xb4.\x8e\x02\xed\xd8\xb1c\
-\x0f\x1f>\x9c4i\xd2\xa9S\xa7\xbe\xfb\xee\xbb\xc8\xc8\
-H\x8d\xbclKKK\xa7\xb3\xb6\xa2\xa2\xa2\xa4\xa4\xa4\
-7\xdf|\xf3\xe0\xc1\x83\xe6\xe6\xff;\xd8\xde\x7f\xff\xfd\
-\xabW\xaf\xaaT*\x8dl\x14t\x02G\x1c\xa6(#\
-#\xc3\xde\xde~\xdf\xbe}VVV\x19\x19\x19]w\
->{\xf6lpp\xb0\x95\x95\x95\xad\xad\xed\xe4\xc9\x93\
-\xcb\xcb\xcb\x99_-]\xba\xd4\xc5\xc5\xe5\xfb\xef\xbf\x0f\
-\x0c\x0c\xb4\xb2\xb2\xfa\xf0\xc3\x0f;=\xf7\xd3O?\xb5\
-\xb4\xb4\xdc\xbd{7\x93\x1a\xb4\x11#F\x04\x04\x04h\
-jw@\xfb\x10\x1c&\xe7\xee\xdd\xbb\xe7\xcf\x9f\x9f1\
-c\x86\x93\x93\xd3\xd4\xa9SO\x9c8\xf1\xe0\xc1\x83\xe7\
-u>w\xee\xdc\xa4I\x93\xfa\xf6\xed{\xe8\xd0\xa1/\
-\xbf\xfc\xf2\xe6\xcd\x9b!!!\xeaw\x9a\x95J\xe5\xfc\
-\xf9\xf3SRR***\x16/^\xdc\xe9\xe9\xb9\xb9\
-\xb9R\xa9\xd4\xc1\xc1\xa1\xb7v\x06t\x04\xc1ar\x0e\
-\x1c8\xd0\xde\xde>{\xf6lB\xc8_\xff\xfa\xd7\x96\
-\x96\x96C\x87\x0e=\xaf\xf3\xaaU\xab\xdc\xdd\xdd\xbf\xfb\
-\xee\xbb\xa8\xa8\xa8\x98\x98\x98\xf3\xe7\xcf?~\xfcx\xe3\
-\xc6\x8dL\x87\x96\x96\x96\x1d;vL\x9a4\x89\xcf\xe7\
-{zz\xaa?\xb7\xa1\xa1\xe1\xe1\xc3\x87\x1e\x1e\x1e\xbd\
-\xb7/\xa0+\x08\x0e\x93\x93\x91\x91\xf1\xea\xab\xaf\x06\x05\
-\x05\x11B\xc6\x8e\x1d\xeb\xea\xea\xfa\xbc\xb3\x95\xe6\xe6\xe6\
-\x92\x92\x92\xe8\xe8h\xe6D\xc3\xcd\xcdM*\x95\xd2\xf3\
-bi\xe6\xe6\xe6\xf4<K0)\x08\x0e\xd3\xf2\xd3O\
-?\x95\x97\x97\xbf\xf5\xd6[J\xa5R\xa9T>z\xf4\
-\xe8\xad\xb7\xde*..\xbeu\xeb\xd6\xd3\x9d\x95Je\
-GG\x87\x8b\x8b\x8bz\xa3\x8b\x8b\xcb\x9f\x7f\xfe\xc9<\
-ttt|\xde\xdcJ[[[\x1b\x1b\x9b\xca\xcaJ\
-\xcd\xee\x02\xe8\x03\x04\x87i\xa1\x0f.6n\xdch\xff\
-_\xdb\xb6m#\x84\xec\xdf\xbf\xff\xe9\xcevvvf\
-ff\xbf\xff\xfe\xbbz\xe3\xef\xbf\xff\xde\xfdk\x16a\
-aa\x0a\x85B=h\xc08 8LHkkk\
-VVV```\xde\xff\xe7\xe7\xe7\x97\x99\x99I=\
-5\x87\x98\xc7\xe3\x09\x85\xc2\xc3\x87\x0f3s=jj\
-j\x14\x0aE\xf7\xcfM\x92\x93\x93[ZZ\xe2\xe2\xe2\
-:\xcd\x16\xb9z\xf5\xea\xa5K\x97z\xbcC\xa03\x98\
-\xc7aB\xbe\xfd\xf6\xdb\xfa\xfa\xfa\xcf>\xfb\xac\xd3_\
-~|||BBB~~\xfe\xd3\x1f\x03\xfd\xe4\x93\
-O&L\x98\x10\x1e\x1e\xbe`\xc1\x82\xc7\x8f\x1f\xaf]\
-\xbb\xb6_\xbf~\xc9\xc9\xc9\xdd\xdcbPP\xd0\xd6\xad\
-[\x93\x92\x92\xfc\xfd\xfdg\xcf\x9e-\x10\x08\x94Je\
-nn\xee\xe1\xc3\x87\x8f\x1f?\xae\x91\x9d\x02\x9d@p\
-hL~~\xbe\xfe|\x8e\xfe\x99\x95dddX[\
-[O\x9f>\xbdS{LL\xcc\x92%K222\
-\x9e\x0e\x8eq\xe3\xc6\x9d>}z\xcd\x9a5\xb3f\xcd\
-\xb2\xb0\xb0\x90\xc9d\x1b7ntww\xef~%\x89\
-\x89\x89\xa3G\x8f\xde\xb2e\xcb\x96-[\xee\xdf\xbfo\
-kk+\x14\x0asrr\x22\x22\x22\xbaS\xb3\xd6\xe4\
-\xe7\xe7\xe3*o\xf7!8L\xc8\xb1c\xc7\x9e\xd9n\
-kk\xdb\xd4\xd4\xf4\xbcg\x8d\x1f?~\xfc\xf8\xf1\xcf\
-\xfc\xd5\xe6\xcd\x9b7o\xde\xfc\xc2\xed\x8aD\x22z\x86\
-;\x18\x0d\x04\x87\xc6\xc8\xe5r\xfd9\xe20D\xba\xfd\
-\xbf\x87\xf7\x8e\x15\x5c\x1c\x05\x00\xd6\x10\x1c\x00\xc0\x1a\x82\
-\x03\x00XCp\x00\x00k\x08\x0e\x00`\x0d\xc1\x01\x00\
-\xac!8LHVV\x16\x87\xc3Q(\x14LK]\
-]\x1d\x87\xc3\x198p\xa0z\xb7\xed\xdb\xb7s8\x9c\
-\xd2\xd2\xd2.^*55\xb5\x7f\xff\xfe\xcf{\x08F\
-\x0f\xc1aB\xa4R)!D=8\x14\x0aE\xdf\xbe\
-}\xef\xdd\xbbw\xe3\xc6\x0d\xf5FGGG\x1f\x1f\x1f\
-\x1d\x94\x08\x06\x02\xc1aB\x06\x0f\x1e\xec\xe9\xe9\xd9)\
-8\xc2\xc2\xc2:5\x16\x14\x14\x88\xc5b\x0e\x87\xa3\x8b\
-\x1a\xc10 8L\x8bT*-**b>\xab\xaa\
-P($\x12\x89X,f\x82\xa3\xa2\xa2\xa2\xb6\xb6V\
-&\x93\x11BJKKcbb\xdc\xdd\xddy<\x9e\
-\xa7\xa7gbbbCC\x83\xceJ\x07}\x82)\xe7\
-\x9aa(\x13\x96\xa5R\xe9\xde\xbd{/_\xbe,\x14\
-\x0a\x95Jeii\xa9D\x22qtt\xfc\xe4\x93O\
-\xe8\x0et\x82\xd0'5\xd5\xd5\xd5\x1e\x1e\x1e\xd3\xa7O\
-wtt\xac\xac\xacLKK\xbbr\xe5Jaa\xa1\
-.w\x00\xf4\x03\x82\xc3\xb4\xd0\x87\x12\x0a\x85B(\x14\
-\x16\x14\x14XZZ\x06\x04\x048::\xd6\xd4\xd4T\
-UU\x09\x04\x02\x85Bacc\xe3\xe7\xe7G\x08\x89\
-\x88\x88`>\xc3*\x93\xc9\xfc\xfc\xfc\xfc\xfd\xfd\xaf]\
-\xbb6|\xf8p]\xeeC\xef0\x94\xe8\xd7\x138U\
-1-\x1e\x1e\x1e|>\x9f>\xacP(\x14\x81\x81\x81\
-}\xfa\xf4y\xed\xb5\xd7\x9c\x9d\x9d\x99\xc6\x90\x90\x10.\
-\x97K\x08Q\xa9T[\xb6l\x09\x08\x08prr\xe2\
-\xf1x\x22\x91\x88\x10r\xf3\xe6M\xdd\xee\x02\xe8\x03\x04\
-\x87\xc9\x91J\xa5\x85\x85\x85\x14E\xd1\x178\xe8F\xfa\
-2\xc7\x9d;w\xaa\xaa\xaa\xe8\xf3\x14BHrr\xf2\
-\xc7\x1f\x7f<{\xf6\xeco\xbf\xfd\xf6\xca\x95+\xe7\xcf\
-\x9f'\x84477\xeb\xact\xd0\x1b\x08\x0e\x93#\x93\
-\xc9\x1e<xP\x5c\x5c|\xf9\xf2e&8$\x12\x89\
-B\xa1\xa0\x97/g\x82\xe3\xc0\x81\x03\x0b\x17.LJ\
-J\x12\x0a\x85C\x87\x0e\xe5\xf1x:+\x1a\xf4\x0c\x82\
-\xc3\xe4\xd0\xb9\x90\x9e\x9eNQ\x14\xfd%\x09\x84\x10\xb1\
-X\x5cQQ\x91\x9d\x9d\xdd\xb7o\xdf\xd1\xa3G\x13B\
-(\x8ajjj\xb2\xb3\xb3c\x9e\x88\xc5x\x80\x81\xe0\
-09\xde\xde\xde\xce\xce\xce'N\x9c\xf0\xf7\xf7g\xa6\
-{\xd2?\x9f8qB$\x12YXX\x10B8\x1c\
-\xce\xb8q\xe3\xf6\xec\xd9S^^\xde\xd8\xd8\xf8\xcf\x7f\
-\xfe\xf3\x99+\xa1\x83iBp\x98\x22\xa9TJQ\x14\
-s\x9eB\x08\xe1r\xb9AAA\x14E1\xe7)\x84\
-\x90]\xbbv\x05\x04\x04\x84\x84\x84\xb8\xba\xba\xe6\xe4\xe4\
-\xe4\xe4\xe4\xe8\xa2X\xd0G\x9c\xa7\x17\xc5\x07\x00\xe8\x1a\
-\x8e8\x00\x805\x04\x07\x00\xb0\x86\xe0\x00\x00\xd6\x10\x1c\
-\x00\xc0\x1a\x82\x03\x00XCp\x00\x00k\x08\x0e\x00`\
-\x0d\xc1\x01\x00\xac!8\x00\x80\xb5\xff\x01\x12\xa7\xd7\x94\
-\xae\xf8\x942\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00%\xf8\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01h\x00\x00\x00\xd8\x08\x02\x00\x00\x00I:\xeeC\
-\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00 \x00IDATx\x9c\xed\xddi@\
-\x13\xd7\xda\x07\xf0\x13@6!\xac\x02\x02\xe2\x82pA\
-\x04A\x16E\x92 (*J\xd5\xd6\x05W\xa8\xbd\x0a\
-\xa8e\xa9P\x04)[\xa1\x80V**\xd6\x82m\x15\
-\xb5*n\xd5\xbaP-\xd5\x1ax\x0bn\xa8\x80+*\
-\x0a\x8a\xec$\x91=\x84\xbc\x1f\xe6\xde\xb9)\xb2dB\
-\x16H\x9e\xdf\xa7dr2s&\x0e\x7f\xcf\xcc<9\
-!q\xb9\x5c\x04\x00\x00D\xc8I\xba\x03\x00\x80\xe1\x07\
-\x82\x03\x00@\x18\x04\x07\x00\x800\x08\x0e\x00\x00a\x10\
-\x1c\x00\x00\xc2 8\x00\x00\x84Ap\x00\x00\x08\x83\xe0\
-\x00\x00\x10\x06\xc1\x01\x00 \x0c\x82\x03\x00@\x18\x04\x07\
-\x00\x800\x08\x0e\x00\x00a\x10\x1c\x00\x00\xc2 8\x00\
-\x00\x84Ap\x00\x00\x08\x83\xe0\x00\x00\x10\x06\xc1\x01\x00\
- LA\xd2\x1d\x00\xd2\xac\xbc\xbc<..NNN\
-\xae\xab\xab+$$\xc4\xde\xde^\xd2=\x02\xc2A\x82\
-\xa9\x03\x81\x88p8\x1coo\xef\x03\x07\x0ehii\
-\xb5\xb7\xb7\x7f\xf6\xd9g\xfb\xf6\xed\xd3\xd2\xd2\x92t\xbf\
-\x80\x10\x08m\xc4\xb1e\xcb\x96C\x87\x0e\x09km@\
-\x0a\xa8\xa9\xa9\x05\x05\x05aI\xa1\xac\xac\xec\xed\xed}\
-\xe3\xc6\x8d\xc5\x8b\x17\xf3\xb69z\xf4hEE\x85\x8f\
-\x8f\x8f\xb1\xb1\xb1\x84\xba\x09\x04!\xb4\xe0hmm\xd5\
-\xd6\xd6\x0e\x0f\x0f\x17\xd6\x0a\xc1p\xd7\xd6\xd6\xf6\xf6\xed\
-[\xfciMM\x8d\xb9\xb99\xfe\xb4\xa2\xa2\x22  \
-\xe0\xdd\xbbwT*u\xea\xd4\xa9\x09\x09\x09~~~\
-$\x12I\x12=\x05\xc4q\x85\xc4\xdf\xdf\xdf\xc5\xc5E\
-Xk\x03\xd2a\xf3\xe6\xcdg\xcf\x9emkk\xbbq\
-\xe3\xc6\x8a\x15+8\x1c\x0e\x97\xcb\xed\xee\xee\xce\xc8\xc8\
-\xd0\xd1\xd1\xd9\xbaukGG\x07\x97\xcb-++s\
-uuuqqy\xfc\xf8\xb1\xa4\xbb\x0c\xf8\x02wU\
-\x80\x08\xed\xd9\xb3\x87\xc9d\x86\x84\x84\xdc\xbf\x7f\xff\xd0\
-\xa1Crrr\xf7\xef\xdfwrr\xca\xca\xca\xca\xcb\
-\xcbKIIQTTD\x08M\x9c8\xf1\xfa\xf5\xeb\
->>>T*\xd5\xdf\xdf\x9f\xcdfK\xba\xe3`\x00\
-B\xbb8\x1a\x10\x10PZZ\x9a\x9f\x9f/\x94\xb5\x01\
-\xe9\xd3\xd5\xd5\x95\x9a\x9a\x9a\x94\x94\xa4\xa5\xa5\xf5\xf2\xe5\
-K9\xb9^\xfe\xd3:y\xf2\xa4\xbf\xbf\xff\xd8\xb1c\
-\x7f\xfc\xf1G\x07\x07\x07\xf1w\x12\xf0\x09F\x1c@\x1c\
-\x1e<x\xe0\xec\xec\x5cPP\xf0\xed\xb7\xdf\x1a\x1b\x1b\
-\xf7\x9a\x1a\x08!\x03\x03\x03++\xab\x80\x80\x80E\x8b\
-\x16EDD\xb4\xb7\xb7\x8b\xb9\x9f\x80O\x10\x1c@\xb4\
-\xda\xdb\xdb\xe3\xe2\xe2\xe6\xcc\x99\xb3z\xf5\xea\xe9\xd3\xa7\
-www\x0f\xf8\x96\x9a\x9a\x9am\xdb\xb6544X\
-[[_\xbf~]\x0c\x9d\x04DAp\x00\x11\xca\xcf\
-\xcf\xb7\xb3\xb3{\xfe\xfcybb\x22\x93\xc9\xc4.\x85\
-\xf2\xf3\xc6\xfa\xfaz\x13\x13\x93-[\xb6l\xd8\xb0\xc1\
-\xdf\xdf\xff\xfd\xfb\xf7\xa2\xee* \x04\x82\x03\x88\x04\x8b\
-\xc5\x0a\x0e\x0e^\xb5jUHH\x88\xa5\xa5eUU\
-\x15\xd15tww\xd7\xd6\xd6~\xfe\xf9\xe7\xea\xea\xea\
-\x96\x96\x96\xe7\xce\x9d\x13E?\x81` 8\x80\xf0]\
-\xbe|\xd9\xc6\xc6\xa6\xa5\xa5%\x22\x22\xa2\xba\xba\xba\xab\
-\xab\x0b\x7f\x89\xe8\xc5x&\x93\xa9\xae\xae\x1e\x1d\x1d\x1d\
-\x13\x13\xb3|\xf9\xf2\xba\xba:aw\x16\x08\x02\x82\x03\
-\x08SSS\x93\xbf\xbf\xff\x96-[\xa2\xa3\xa3ML\
-L>\xfc;\x17\xac\xc4\xab\xba\xba\xda\xc7\xc7\xc7\xcc\xcc\
-\xcc\xca\xca*33S\x18=\x05\x83\x02\xc1\x01\x84\xe6\
-\xd4\xa9S\x93&MRWW\xdf\xb4i\xd3\x9b7o\
-z\x1d\x5c\x08|\xfb\xbf\xa5\xa5EQQ\xf1\x9bo\xbe\
-9t\xe8\xd0\x82\x05\x0b*++\x07\xd7Y0(\x10\
-\x1c@\x08\xaa\xaa\xaa>\xfe\xf8\xe3\xed\xdb\xb7'%%\
-\xa9\xab\xab755\x89nC\x8b\x16-rqqq\
-pp\xd8\xbd{7?\xf7h\x80(@p\x80A\xe1\
-r\xb9\x99\x99\x99666\x93&MZ\xb5jUE\
-E\xc5\x80\xed\x07\xb9\xc5\xf6\xf6v6\x9b\x9d\x98\x98\x98\
-\x93\x93C\xa3\xd1\x9e<y2\xc8\x15\x02\x01\xc0|\x1c\
-@p/^\xbc\xd8\xb0a\x03Bh\xe7\xce\x9d\xaf_\
-\xbf\x16\xe7M\xd3\xaa\xaa*\x1a\x8d\xa6\xa2\xa22s\xe6\
-\xcc\x80\x80\x80\xa8\xa8\xa8\x11#F\x88m\xeb\x00F\x1c\
-@\x10]]]\xdb\xb7owrr\xf2\xf0\xf0\x987\
-o\xde\xeb\xd7\xaf\xf9|\xa3\x10\xbf\xff\xcaf\xb3Y,\
-Vlllqq\xb1\xa3\xa3\xe3\x9d;w\x84\xb5f\
-0 \x08\x0e@\x18V?^XX\x98\x92\x92\xd2\xd9\
-\xd9\xd9\xd6\xd6\xc6\xff{\x85\xf5\xdd(\x5cmm\xad\x9d\
-\x9d\xdd\xfa\xf5\xeb\xa1J]\x9c 8\x00\x01X\xfd\xf8\
-\xdc\xb9sW\xaf^\xed\xe4\xe4$@Y\x97(tw\
-w744DDD466B\x95\xbax@p\
-\x00~a\xf5\xe3/_\xbe\x8c\x8d\x8de2\x99\x9d\x9d\
-\x9d\x02\xacD\xe8#\x0e\x5ccc\xe3\x981c\xa0J\
-]< 8\xc0\xc0x\xeb\xc7\xcd\xcd\xcdkkk\x05\
-^\x95H\xe7\xf8\x82*u\xb1\x81\xe0\x00\x03\xc0\xea\xc7\
-\xdb\xda\xda\xbe\xfc\xf2\xcb\xea\xeaj\x0e\x873\x98\xb5\x89\
-n\xc4\x81\x83*u1\x80\xe0\x00}\xe2\xad\x1f76\
-6nll\x94t\x8f\x08\x80*u\x91\x82\xe0\x00\xbd\
-\xc3\xeb\xc7\xfd\xfd\xfd\xfb\xaa\x1f\x17\x80\x18F\x1c8\xac\
-J=!!!++\x0b\xaa\xd4\x85\x0b\x82\x03\xf4\x84\
-\xd5\x8f\xef\xd8\xb1\x03\xab\x1fg\xb1X\x92\xee\xd1\xa0T\
-WW/\x5c\xb8\x10\xaa\xd4\x85\x0b\x82\x03\xfc\x0fo\xfd\
-\xf8\xf2\xe5\xcb\x07\xac\x1f\x1f.\xa0J]\xe8\xa0\xe4\x1c\
-\xfc\x07^?\x9e\x92\x92\xf2\xf6\xed\xdb\xd6\xd6VI\xf7\
-H\xc8\xa0J]\x88`\xc4\x01\xfeW?>{\xf6\xec\
-9s\xe6\xf0\xfe\x8a\x92\x94\xc1\xab\xd4\x1f<x\x00U\
-\xea\x83\x01\xc1!\xeb\xf0\xfa\xf1\xa4\xa4$6\x9b\xdd\xd1\
-\xd1!\xd2\xcd\x89\xf3\xe2h_jkk\xa7N\x9d\x0a\
-U\xea\x83\x01\xc1!\xbb\xb0\xfa\xf1y\xf3\xe6\xadZ\xb5\
-\xca\xc1\xc1\xa1\xba\xbaZ\xd2=\x12\x1f\xbcJ\x1d\xe6R\
-\x17\x0c\x04\x87\x8c\xc2\xeb\xc7\xa3\xa3\xa3Y,\x16\xef\xb4\
-\xa0\xb2\x03\xabR\xff\xe2\x8b/\xa0J\x9d(\xb88*\
-sX,Vtt\xf4\xf9\xf3\xe7\xb7n\xddZ__\
-?\xc8\xc2J===eee\xfe\xdb\xab\xa9\xa9\xd9\
-\xda\xda\xf6U~\xaa\xae\xaenkkkbbB\xb4\
-\x1b555\x82\x9ddq\xb9\xdc\xba\xba\xba\xc0\xc0\xc0\
-\xca\xcaJKK\xcb\xf4\xf4\xf4\xc5\x8b\x17\x0b\xb0\x1eY\
-\x03?\x01)[._\xbe\xbci\xd3\xa69s\xe6L\
-\x9e<Y(\x13\xfc-]\xbaT\x80\xbfs\xa1;}\
-\xfa\xf4\xe0o\x1e\x1b\x18\x18\xec\xdb\xb7\xcf\xc2\xc2b\xdf\
-\xbe}\xa3F\x8d\x12J\xc7\xa4\x15\x9c\xaa\xc8\x0a\xac~\
-<,,,22\xd2\xc8\xc8H\xb8\xd3\x82\x06\x04\x04\
-\x90\xfb\xb0g\xcf\x1e!nH\xa4\xaa\xab\xab}}}\
-\xa1J\x9d\x1fp\xaa\x22\x13N\x9d:\x15\x14\x14\xb4z\
-\xf5\xea\xf5\xeb\xd7\x8b\xe2\x22\xe8\xf2\xe5\xcbmll\xb0\
-\xc7\xa9\xa9\xa9\x06\x06\x06\xabW\xaf\xc6\x9e\xba\xb8\xb8\x08\
-}s\xa2\xd3\xdc\xdc\x8cW\xa9\x9f?\x7f\xfe\x87\x1f~\
-\x183f\x8c\xa4;5\x14ApH\xb9\xaa\xaa\xaa\xcd\
-\x9b7\xbfy\xf3&))\xa9\xa2\xa2BD\xd7\xff\xdc\
-\xdd\xdd\xdd\xdd\xdd\xb1\xc7?\xfd\xf4\xd3\x84\x09\x136m\
-\xda$\x8a\x0d\x89\x07V\xa5\xce\xe1p\x1c\x1c\x1c\xb6m\
-\xdb\x16\x18\x18\xd8\xd7\xafd\xcb,\xf88\xa4\xd6\xd0\xa9\
-\x1f700\xd8\xbbw\xaf\x83\x83\x83\x81\x81\xc1\xe9\xd3\
-\xa7\x11B,\x16+,,l\xd2\xa4I:::\xa6\
-\xa6\xa6\x81\x81\x81---\x08!cc\xe3\xd4\xd4\xd4\
-E\x8b\x16\xe9\xeb\xebO\x9a4)--\x0d_\xc9\xcd\
-\x9b7\xe7\xce\x9dk```bb\xe2\xe3\xe3\xf3\xe6\
-\xcd\x1b\x91\xf6\x19\xaa\xd4\xfb\x07#\x0e\xe94\xd4\xea\xc7\
-\x13\x13\x137m\xda\xa4\xad\xad=}\xfat\x84\xd0\xa7\
-\x9f~\xfa\xe4\xc9\x93\xe8\xe8h\x03\x03\x83\xdb\xb7o'\
-''\x8f\x1e=z\xdb\xb6mX\xcb\x84\x84\x84\x13'\
-N\xe4\xe7\xe7\xfb\xfa\xfa\x92H\xa4\xe0\xe0\xe0\xe6\xe6\xe6\
-\xa5K\x97\xce\x993g\xeb\xd6\xad\x0c\x06#>>\xfe\
-\xd3O?\xcd\xcd\xcd\x15u\xb7\xa1J\xbd/\x10\x1c\xd2\
-\xa6\xab\xab+55u\xc7\x8e\x1d\xa1\xa1\xa1$\x12i\
-\x88\xd4\x8f;99\xc5\xc6\xc6b\x8f\x9b\x9b\x9b[Z\
-Zv\xee\xdc9\x7f\xfe|\x84\x90\x9b\x9b\xdb\xcd\x9b7\
-\xf1\xfbq\xee\xee\xee\x9f\x7f\xfe9B\xc8\xc3\xc3c\xf3\
-\xe6\xcd\xbbv\xed\x0a\x0c\x0c|\xf4\xe8\x11\x93\xc9\x0c\x0a\
-\x0a\x9a2e\x0aB\xc8\xc0\xc0\xe0\xda\xb5k\x1c\x0eG\
-^^^\xd4=g\xb3\xd9l6;&&\xe6\x8f?\
-\xfeptt\xfc\xf1\xc7\x1f\x1d\x1c\x1cD\xbd\xd1\xa1\x0f\
-\x82C\xaa<x\xf0`\xfd\xfa\xf5\xc6\xc6\xc6III\
-C\xaa\x12\xd4\xda\xda\x1a\x7f\xac\xa6\xa6v\xe5\xca\x15\x84\
-\xd0\x9b7o\x9e?\x7f\xfe\xe8\xd1\xa3\xe7\xcf\x9f\xeb\xea\
-\xeab\xaf\xce\x9e=\x1bo9c\xc6\x8c\xed\xdb\xb7?\
-y\xf2\xc4\xc2\xc2BKKk\xc9\x92%\xcb\x96-\x9b\
-3g\x8e\x8b\x8b\xcb\x8c\x193\xc4\xd9\xff\xba\xba\xba\xa9\
-S\xa7\xce\x9a5k\xd1\xa2Ek\xd7\xae\x8d\x8b\x8b#\
-T\xbd\x22}\xe0\x1a\x87\x94\x18\xe2\xf5\xe3\xfa\xfa\xfa\xbc\
-O\x7f\xfb\xed7kkk\xec\xc7\xdf._\xbe\xac\xa4\
-\xa4\x84\xd7\x13\xe9\xe8\xe8\xe0\xcd455\x11B\x0c\x06\
-\x83L&\xff\xfe\xfb\xef4\x1a\xed\xf0\xe1\xc3\x8b\x16-\
-\x9a8q\xe2\xae]\xbb\xc4\xd9\x7f\x04U\xea\xff\x04\xc1\
-!\x0d\xf0\xfa\xf1\x98\x98\x98\xa1Y?\xce;G\xf1\xa3\
-G\x8f\xd6\xad[\xe7\xe2\xe2r\xef\xde\xbd\xb7o\xdf^\
-\xbcx\xd1\xdc\xdc\x1c\x7f\x95\xb7\x92\x15\x8b?\xac\x16\xcb\
-\xd2\xd2\xf2\xe7\x9f\x7f~\xfd\xfa\xf5\xa5K\x97(\x14J\
-ll\xec\xcd\x9b7\xc5\xb8\x07\xff\xd1\xd8\xd8hbb\
-\x02s\xa9Cp\x0co\xd8\xfc\xe3\xabW\xaf\x0e\x0a\x0a\
-233\x1b\xcc\xfc\xe3bs\xf7\xee]6\x9b\x1d\x11\
-\x11ajjJ\x22\x91\xda\xda\xdan\xdd\xba\x85\x8f8\
-.^\xbc\x88\xb7<s\xe6\x8c\x91\x91\xd1\xc4\x89\x13/\
-]\xbadjj\xca`0\x14\x14\x14\xa8T\xea\xf6\xed\
-\xdb\x11B\x92\x9a\x0a\x10\xe6RG\x10\x1c\xc3\x1a>\xff\
-xhhhmm\xedp\x99\x14o\xca\x94)$\x12\
-)))\xe9\xee\xdd\xbbW\xaf^]\xbcxqMM\
-\x0d\xfesp\x05\x05\x05\x01\x01\x01W\xae\x5c\xd9\xbau\
-\xeb\xc9\x93'\xbf\xfa\xea+\x12\x89\xe4\xe8\xe8\xc8f\xb3\
-W\xacXq\xe9\xd2\xa5+W\xae\x04\x06\x06jhh\
-\xb8\xb9\xb9Ip/d|.u\x08\x8ea\x09\xab\x1f\
-\x0f\x0d\x0d\x8d\x8a\x8a266\x16n\xfd\xb8\xa8\xd9\xd8\
-\xd8\xa4\xa7\xa7\xdf\xbcy\xd3\xd3\xd3344t\xca\x94\
-)\xdb\xb7o/++c0\x18\x08\xa1\xa0\xa0 &\
-\x93\xb9v\xed\xda\xdc\xdc\xdc\xcc\xccL\xac\x02UOO\
-\xef\xec\xd9\xb3\x0a\x0a\x0a\x01\x01\x01>>>\x1c\x0e\xe7\
-\xe2\xc5\x8b\xbcWC$Ef\xe7R\x87/\xb9\x0d?\
-x\xfd\xb8\xa1\xa1\xa1\xc4\xcf\xb1\x85\xfb%7cc\xe3\
--[\xb6l\xd9\xb2\x85\xe8\x1b\x85\xf2%\xb7\xc100\
-08|\xf8\xb0\xa6\xa6\xa6\x8cT\xa9\xc3\x88c8\xe9\
-1\xff\xb8\xc4S\x03\xe0dm.u\x08\x8e\xe1a\xe8\
-\xd4\x8f\x83\xbe\xc8T\x95:\x14\x80\x0d\x03C\xad~\x5c\
-tD\xfd\x0d\x141\x90\x91*u\x18q\x0ci\xbc\xf3\
-\x8f{xx\x0c\x91\xfaq\xd0?|.\xf5\xe2\xe2b\
-i\x9dK\x1d\x82c\xe8\xea1\xffxgg\xa7\xa4{\
-\x04\x08\xa8\xad\xad\xb5\xb3\xb3\x93\xd6\xb9\xd4\xe1Te(\
-jooOII\xc9\xc8\xc8\x08\x0f\x0fomm\x1d\
-j\xf5\xe3\xbc\xea\xea\xeax\xabB\x07\xa4\xa0\xa0\x80\xfd\
-:A\xaf\xaf2\x18\x8c\x97/_jkk\x13\xed\x06\
-^\x062\xa4\xe0U\xea%%%\xd6\xd6\xd6\x99\x99\x99\
-\x92\xad=\x11\x22\xb8\x1d;\xe4\xe4\xe7\xe7o\xd8\xb0\xc1\
-\xd1\xd1\xd1\xd9\xd9yXT\x82\x12\xa2\xa9\xa9y\xea\xd4\
-\xa9\xbe\x8e\x13:\x9d\xbem\xdb6\x0f\x0f\x0f1\xf7J\
-\xd4\xe4\xe4\xe4tuuSSSg\xcd\x9a\xb5s\xe7\
-NuuuI\xf7h\xb0\xe0Te\x08a\xb1X\x1b\
-7n\x5c\xb6lY``\xe0p\xa9\x1f\x07\xfc\xc0\xaa\
-\xd4\x03\x03\x03\x95\x94\x94&N\x9c(\x05U\xea\x10\x1c\
-b\xf2\xf0\xe1\xc3\x0d\x1b6\xac[\xb7.%%\xa5\xd7\
-\xab\x15X\xfdxyy\xb9\x95\x95U]]\x9d\xd4\x17\
-\x02\xc8 \x06\x83aeee``\x10\x11\x11\xd1W\
-\x95:\x87\xc3\x89\x8e\x8e\xf6\xf5\xf5]\xb7n]LL\
-\xcc\x90=\x0c 8\xc4\xe1\xcd\x9b7\x89\x89\x89\xbbv\
-\xed:x\xf0\xe0\x8c\x193\xc2\xc3\xc3y_\xc5\xea\xc7\
-\x83\x82\x82~\xfa\xe9\xa7\xaf\xbe\xfaJA\x01.<I\
--.\x97\xab\xa1\xa1q\xef\xde\xbd\x09\x13&\xf4Z\xa5\
-\xbew\xef^''\xa7\xac\xac\xac\x83\x07\x0f:88\
-\xa4\xa7\xa7K\xa4\x9f\x03\x82c\xb4?\x0f\x1f>|\xf4\
-\xe8\xd1\xe0\xd7s\xf7\xee\xdd\xad[\xb7\xaa\xa9\xa9!\x84\
-h4\xda\x91#G\xd8l6v{\x9f\xc9d\xba\xbb\
-\xbb\xcf\x993\xa7\xa4\xa4DEE%??\x1f\xe6\xc5\
-\x95b\xd8\x08BEE%%%e\xc9\x92%\x9f~\
-\xfaiKK\xcb\x17_|\x817x\xf0\xe0AHH\
-\x08\xf6x\xe1\xc2\x85\x16\x16\x16\x87\x0f\x1f\x1e\xe4F9\
-\x1cNXX\x18>\xef\xbcP@p\xf4g\xe9\xd2\xa5\
-\xc6\xc6\xc6\x83_\x8f\xbe\xbe>\xef\x98\x93\xf7\x82tq\
-q\xb1\xaa\xaa*\xf6=q\x0c\xa1\x9b\x14`\xf8rt\
-tLOO\x8f\x89\x89\xe1\x0d\x0e99\xb9\xb6\xb66\
-\x15\x15\x15\x84Pkk\xab\x85\x85\x056\x91\xe2`<\
-y\xf2$##\x03\x82C|\xde\xbd{\xf7\xf8\xf1\xe3\
-\xc1\xaf\xa7\xaa\xaa\xea\x8b/\xbe\xc8\xcc\xcc\xd4\xd0\xd0\xf8\
-\xf3\xcf?\xc9d2o5a\x8f!\x06\x8c8\xa4X\
-\x8f\x9b\x98\x1f\x9e\x96n\xde\xbc\xd9\xdf\xdf?>>\x9e\
-D\x22\xc5\xc4\xc4\xc4\xc6\xc6\xda\xd9\xd9\x0dr\xa3\xea\xea\
-\xea\xbf\xfe\xfa\xeb W\xd2\x03\x04\x878\x18\x1a\x1a\xc6\
-\xc7\xc7\x7f\xf9\xe5\x97l6{\xd2\xa4I;v\xec\xe8\
-\xa71\x8c8\xa4\xd8\x80\x17;\xa7N\x9d\x1a\x1d\x1d\x9d\
-\x95\x95\x85\x10\x8a\x8e\x8e633\x13K\xbf\x08\x83\xe0\
-\x10\x13\x0b\x0b\x0b>\xe7k\x80\xe0\x90b\xfc\x94M\x99\
-\x99\x99\xc5\xc5\xc5\x89\xbe/\x83\x02\xc11\xe4\x94\x94\x94\
-\xf4\xf5c\xeeR\xa0\xa9\xa9\x09\xfb\xed\xa5\xbe\x94\x97\x97\
-\xdf\xbe}[l\xfd\x113&\x93\xd9\xff\xee\x0f\x17\x10\
-\x1cC\x8e\x96\x96V\x8f\xfb\xb5\xd2\xe4\xc1\x83\x07\xbf\xfc\
-\xf2K?\x0d\xf4\xf5\xf5\xa5x\xf7KJJ\xfa\xdf\xfd\
-\xe1\x02\x82c\xc8\x199r$\x8dF\x93t/D(\
-;;\xbb\x9fWUUU\xa5x\xf7\xe5\xe4\xe4\xfa\xdf\
-\xfd\xe1\x02.\xe0\x03\x00\x08\x83\xe0\x00\x00\x10\x06\xa7*\
-C\xce\xcb\x97/\xa5x\xac\xced2\xfb\xbfmT^\
-^.\xc5\xbb\xcfb\xb1\xa4\xa3N\x07\x82c\xc8\xd1\xd7\
-\xd7OLL\x94t/D\x85\x9f\x8b\xa3R\xbc\xfbp\
-q\x14\x88\x0a\x5c\x1c\x95\xe2\xdd\x87\x8b\xa3\x00\x00\xd9\x05\
-\xc1\x01\x00 \x0c\x82\x03\x00@\x18\x04\x07\x00\x800\x08\
-\x0e\x00\x00a\x10\x1c\x00\x00\xc2 8\x00\x00\x84Ap\
-\x00\x00\x08\x83\xe0\xe8\x0f\x83\xc1\x90t\x17\x00\x18\xaci\
-\xd3\xa6\xfd\xf9\xe7\x9f\xc2]'\x04\x07\x00\x800\x08\x0e\
-\x00\x00a\x10\x1c\x00\x00\xc2\x84\xf6%7\x0b\x0b\x0be\
-eea\xad\x0d\x000\x94\xfdc\xc4q\xe2\xc4\x09\xd2\
-\x7f)((\x18\x1a\x1a\xaeY\xb3\xe6\xd5\xabW\xfc\xac\
-($$$--\xad\xafWSRRH$Rs\
-s\xf3 \xbb\x0b\x00\x18\x0az9U\x89\x8a\x8a\xbap\
-\xe1Bvv\xf6\x9a5kN\x9f>\xed\xe2\xe22\xac\
-o.l\xd8\xb0\x81D\x22\xf1\xfeX\xd6\x87\x8e\x1f?\
-N\x22\x91\xe8t:\xbe\xa4\xa6\xa6\x86D\x22\xe9\xeb\xeb\
-\xf36\xdb\xb7o\x1f\x89D*--\xedgU\x89\x89\
-\x89\xd8O=\xf6\xfa\x14\x00Bn\xde\xbc\xe9\xed\xedm\
-hh\xa8\xa8\xa8\xa8\xab\xab\xeb\xe9\xe9y\xe6\xcc\x99^\
-[\x8a\xf9\x18\xee%8\x1c\x1c\x1c\xbc\xbc\xbc\x96,Y\
-\xb2c\xc7\x8e\xb8\xb8\xb8\xaa\xaa\xaa\xe3\xc7\x8f\x0f\xb8\x87\
-CS[[\xdb\xc9\x93'\x11B\xc7\x8e\x1d\xeb\xea\xea\
-\xea\xab\x196\x01\x04\xef\x87N\xa7\xd3UUUkk\
-k\x9f<y\xc2\xbbPGG\xc7\xca\xcaJ\x94]\x06\
-\xe0?\xd2\xd3\xd3g\xcc\x98\xf1\xf0\xe1\xc3\x90\x90\x90\xa3\
-G\x8f&''khhx{{_\xbcx\xf1\xc3\
-\xc6b>\x86\x07\xb88J\xa5R\x11B\xe5\xe5\xe5\x08\
-\xa1W\xaf^\xf9\xfa\xfa\x1a\x18\x18(**N\x9c8\
-1))\x89\xf7g\xa9^\xbe|\xf9\xd9g\x9f\x99\x99\
-\x99\xa9\xaa\xaa\x92\xc9dww\xf7\x1b7n\xf4\xb5\xda\
-\xc7\x8f\x1fO\x980\xc1\xde\xde\xfe\xdd\xbbw\x83\xdc\x81\
-\xfe\x9d;w\x8e\xc5b\xcd\x9f?\xbf\xb6\xb6\xf6\xf7\xdf\
-\x7f\xef\xab\x99\x91\x91\x91\xa9\xa9i\x8f\x0f\xdd\xdd\xdd\xbd\
-\xc7\xc2\xbc\xbc<\x0a\x85\x02?\x98\x04\xc4\xa0\xa0\xa0 \
-88\xf8\xe3\x8f?\xbe\x7f\xff~xx\xf8\xf2\xe5\xcb\
-7l\xd8p\xe2\xc4\x89\xa2\xa2\xa2\xd1\xa3G\x7f\xd8^\
-\xcc\xc7\xf0\x00\xc1\xf1\xe2\xc5\x0b\x84\x90\xae\xae\xee\xcb\x97\
-/\x1d\x1d\x1d\xf3\xf2\xf2\x12\x12\x12rrr\xd6\xacY\
-\x13\x1f\x1f\xcf\xfbs\xb8o\xdf\xbe%\x93\xc9\xdf|\xf3\
-MNNNVV\x16\x99L\x9e3g\xce\x83\x07\x0f\
->\x5c\xe7\xb5k\xd7f\xcc\x98aeeE\xa7\xd3{\
-\xfd\x08\x84(++KKK\xeb\xd0\xa1C***\
-\xd8\xcf\xea\xf5\x85F\xa3\x15\x14\x14\xe0\xa3\x12:\x9dN\
-\xa5R)\x14\x0a\xfe\xa1\x97\x95\x95\xbd{\xf7\xce\xd5\xd5\
-\xb5\xb4\xb4t\xe5\xca\x95c\xc7\x8eUVV655\
-\x0d\x0c\x0cd2\x99\x22\xdd\x0b \x83v\xec\xd8\xa1\xa4\
-\xa4\x94\x99\x99\xd9\xe3\xf7emll\xec\xed\xed{}\
-\x8b8\x8f\xe1^\xee\xaa\xb4\xb7\xb7777wtt\
-\xdc\xbcys\xdb\xb6m#F\x8c\xf8\xf8\xe3\x8f\xc3\xc3\
-\xc3;::\xee\xdd\xbb\x87\xfdz\xfb\xacY\xb3\x94\x95\
-\x95\xa3\xa2\xa2\xbe\xfc\xf2\xcb\xf1\xe3\xc7#\x84\xa8T*\
-6<\xc1,^\xbc\xd8\xd2\xd2\xf2\x87\x1f~\xd8\xbf\x7f\
-?\xef\xca\x0f\x1d:\xe4\xe7\xe7\x17\x10\x10\xb0k\xd7.\
-yyyB}%\xaa\xaa\xaa*77w\xc3\x86\x0d\
-\xa3F\x8dZ\xbcx\xf1\xd9\xb3g\x9b\x9a\x9a\xb4\xb4\xb4\
-zmL\xa3\xd1\x0e\x1e<XTT\xe4\xe4\xe4\xc4`\
-0JKK\xa9T\xaa\x8e\x8e\xce\xd7_\x7f\x8d5\xc0\
->}\x1a\x8d\xf6\xfa\xf5\xeb\xf1\xe3\xc7/[\xb6LG\
-G\xa7\xbc\xbc<99\xf9\xde\xbd{\xf9\xf9\xf9\x22\xdd\
-\x17 k\xae]\xbbF\xa3\xd1\xb4\xb5\xb5\xf9\x7f\x8b8\
-\x8f\xe1^\x82c\xe5\xca\x95\xf8\xe3\xb1c\xc7\x9e={\
-\xd6\xd4\xd44''g\xfe\xfc\xf9Xj`>\xf9\xe4\
-\x93\xc8\xc8\xc8\xbc\xbc<,8\xba\xbb\xbb\x7f\xfe\xf9\xe7\
-\x83\x07\x0f\x96\x97\x97755q\xb9\x5c6\x9b\xddc\
-@\x11\x13\x13\xb3g\xcf\x9e\xd4\xd4\xd4\xe0\xe0`\xfe\xbb\
-(\xb0\xa3G\x8fr8\x1c\x1f\x1f\x1f\x84\x90\xaf\xaf\xef\
-\xf1\xe3\xc7\xb3\xb3\xb3\x03\x02\x02zm\xec\xea\xea\x8a\x10\
-\xa2\xd3\xe9NNNyyyJJJ\xf6\xf6\xf6:\
-::\x15\x15\x15\xaf^\xbd\x1a7n\x1c\x9dN'\x93\
-\xc9\xb6\xb6\xb6\xf2\xf2\xf2\x0b\x16,\xc0\xdfekkk\
-ggWRRbmm-\x86\x9d\x02\xb2\x80\xc9d\
-\xb2X,\xec/\x8b\x7f\xe2<\x86{9UIJJ\
-\xca\xcb\xcb\xfb\xfb\xef\xbf\xcb\xca\xca\xca\xcb\xcb\xbd\xbc\xbc\
-\xde\xbf\x7f\xdf\xda\xda\xfa\xeb\xaf\xbf*\xf3\xb0\xb1\xb1A\
-\x08\xd5\xd7\xd7c\xef\x8a\x8c\x8c\xf4\xf7\xf7\x9f5kV\
-vv\xf6\x9d;w\xee\xdf\xbfooo\xdf\xd6\xd6\xc6\
-\xbb\xe6#G\x8e\x8c\x193\xc6\xdb\xdb\x9b\xd0\xc7!\xb0\
-\xac\xac,333ggg\x84\xd0\xec\xd9\xb3\x0d\x0d\
-\x0d\xfb9[\x19?~\xbc\xb1\xb11\x16\xc9t:}\
-\xda\xb4i\x8a\x8a\x8a\xe6\xe6\xe6zzz\xf8B\x17\x17\
-\x17yyy6\x9b\xfd\xddw\xdf\xd9\xdb\xdb\x8f\x1a5\
-JYYy\xfa\xf4\xe9\x08\xa1\xa7O\x9f\x8ag\xa7\x00\
-\xe8\x8b8\x8f\xe1^F\x1c\x96\x96\x96\x14\x0a\x85w\x89\
-\x9a\x9a\x9a\x92\x92\xd2G\x1f}\x94\x90\x90\xd0\xa3\xb1\x9e\
-\x9e\x1e\xf6\xe0\xd0\xa1C\xde\xde\xde\xf8\xa0\x08!T_\
-_\x8f\xbf\x8a\xc9\xcd\xcd]\xbcx1\x95J\xfd\xf3\xcf\
-?MLL\xf8\xef\xa5\x00\xee\xdc\xb9\xf3\xe8\xd1\xa3\xad\
-[\xb7\xe2\xf7\x92?\xf9\xe4\x93\xf4\xf4\xf4g\xcf\x9e\x99\
-\x9b\x9b\xf7\xfa\x16\x1a\x8d\x96\x93\x93\xc3\xe5r\xe9t\xfa\
-\xdc\xb9s\xb1\x85\xd8)\xa2\xbb\xbb\xfb\xabW\xaf\xfc\xfd\
-\xfd\x11B\xe1\xe1\xe1\x19\x19\x19\xc9\xc9\xc9\xce\xce\xce\xea\
-\xea\xea\x0d\x0d\x0dT*\xb5\xbd\xbd]\xa4\xbb\x03d\x8a\
-\x86\x86\x06\x99L\xc6nJ\x10\x22\xb6c\x98\xaf\x92s\
-yy\xf9y\xf3\xe6\xe5\xe7\xe7\xeb\xe8\xe8X\xfc\x13~\
-\x0e\xc6\xe5ry/\x1f\xdc\xbau\xeb\xc3\xdd655\
-\xcd\xcf\xcf\x1f1b\x04\x85By\xf6\xec\x19\xff\xbd\x14\
-\x006\xb8\xd8\xbe}\xbb\xd6\x7f\xa5\xa7\xa7#\x84\x0e\x1f\
->\xdc\xd7[\x5c]]\x9b\x9a\x9a\x0a\x0b\x0b\x8b\x8a\x8a\
-\xf0\xeb5T*\x95N\xa7cw\x88\xb0;^G\x8f\
-\x1e\x0d\x0a\x0a\x0a\x0e\x0evrr\xb2\xb4\xb4\x84zY\
- \x0a\xee\xee\xeet:\xbd\xb1\xb1\x91\xd0\xbb\xc4v\x0c\
-\xf3\xfb]\x95\xd4\xd4T\x0e\x873}\xfa\xf4={\xf6\
-\x5c\xbdz\xf5\xb7\xdf~KKKsww\xaf\xad\xad\
-\xc5\x1axyy\x1d;v,??\xbf\xa3\xa3#/\
-/o\xd5\xaaU\x9a\x9a\x9a\x1f\xae\xc7\xc8\xc8\x88N\xa7\
-\xeb\xe9\xe9Q\xa9\xd4^\xef\xb9\x08Egg\xe7\xf1\xe3\
-\xc7\xa7M\x9bv\xfd\x9flmm\x8f\x1c9\xc2\xe5r\
-{}\x17\xf6\x99\xa6\xa4\xa4p\xb9\x5c\xec\x04\x07!D\
-\xa1P\xca\xca\xcaN\x9e<\xa9\xaa\xaa\xea\xe8\xe8\xc8\xe5\
-r[[[yw\x0d\xab\x13\x01@\xb8\xb0\xdb\x11~\
-~~=\xea\x8f\x8a\x8b\x8b\xef\xde\xbd\xdb\xd7\xbb\xc4v\
-\x0c\xf3\xfb]\x15SS\xd3{\xf7\xee%&&\xa6\xa6\
-\xa6\xbe{\xf7\x8eL&\x9b\x9a\x9a\xce\x9f?_CC\
-\x03k\x90\x96\x96&//\xbfd\xc9\x12\x16\x8bei\
-i\x99\x9c\x9c\x9c\x91\x91\xd1k\x8d\xb9\xae\xae\xee\xb5k\
-\xd7\xbc\xbc\xbc\xdc\xdc\xdc._\xbe\x8c\x9d_\x09\xd7\xa5\
-K\x97\x1a\x1a\x1aRSSg\xce\x9c\xc9\xbb\xdc\xdf\xdf\
-\x7f\xe3\xc6\x8d\x7f\xfd\xf5\x97\x9b\x9b\xdb\x87\xef\xb2\xb0\xb0\
-\xd0\xd3\xd3\xbbp\xe1\x82\xbd\xbd=^*ggg\xa7\
-\xa6\xa6v\xe1\xc2\x0577\xb7\x11#F \x84<<\
-<\x0e\x1c8\xb0p\xe1B\x13\x13\x93\xec\xec\xec~\x86\
-0\x00\x08\xcc\xd9\xd99---88\xd8\xce\xce\xce\
-\xc7\xc7g\xdc\xb8q\x0c\x06\xe3\xda\xb5k\xa7N\x9d:\
-\x7f\xfe|_\xef\x12\xdb1\xfc\x8f\x11\xc7\x8a\x15+\xb8\
-\x5c\xee\xe2\xc5\x8b{mjdd\xb4\x7f\xff\xfe\xd7\xaf\
-_wvv\xd6\xd7\xd7\xdf\xbcy366VII\
-\x09{\x95L&\x1f8p\xa0\xa6\xa6\xa6\xad\xad\xad\xa8\
-\xa8h\xd9\xb2e\xb9\xb9\xb9\x85\x85\x85\xd8\xab\x11\x11\x11\
-\x5c.\x17\xdf\x132\x99\x8c\x0d\xc3D\x91\x1a\x08\xa1\xac\
-\xac,uu\xf5e\xcb\x96\xf5X\xber\xe5\xca\xfe\x0b\
-:h4\x1a\x97\xcb\xe5\xbd\xaf,//\xef\xec\xec\xcc\
-\xe5r\xf1\x9f\x17\xcb\xc8\xc8\xb0\xb7\xb7wqq14\
-4<s\xe6L_%\xc0\x00\x0cR``\xe0\xdf\x7f\
-\xffmii\xf9\xddw\xdf\xadZ\xb5*22\x92\xc9\
-d\x9e9s\x06\xbf!\xd2+1\x1d\xc3\x5c Qt\
-:\x9dB\xa1\xe0O\xf3\xf2\xf2\xa8T\xaa\x04\xfb#j\
-7n\xdcpqq\x11\xecU)\xd0\xe3\xdf\xb7\xc7\xbf\
-\xfe0\x02\xf3q\x00\x00\x08\x83\xe0\x00\x00\x10\x06\xc1\x01\
-\x00 \x0c\x82\x03\x00@\x18\x04\x07\x00\x800\x08\x0e\x00\
-\x00a\xbd\xcc9z\xee\xdc\xb9\x1e\x8d\x96.]\xdac\
-R\x80~\xa4\xa7\xa7\x93H\xa4\xea\xeaj~\x1a\x0f8\
-\x17iaaa\x5c\x5c\x5ckk+\x9f[\x07\x00\x88\
-\x81\xf0G\x1c\xd8\xc4dX\x81\xda\xe0\x15\x16\x16\xc6\xc7\
-\xc7\x0b\x10\x1cX~\xf1N\x9a\x86\x10z\xf3\xe6\x0d\x89\
-DJII\xe1g\x0d\xfcO\x17\x1a\x16\x16f``\
-\xd0\xd7\xab\xd7\xae]\xe3s\x8b\x00\xe0\xc4y\x00#\xe2\
-\xc7\xb0\xf0\x83c\xe5\xca\x95\xa5\xa5\xa5:::B_\
-\xb3\x98\xe9\xe9\xe9M\x9a4i\xf0\xeb\x81\xe0\x00\x12!\
-\xac\x03\x18\x0918\xfa\x99\x7f\xf4\xc3S\x95\xdc\xdc\x5c\
-GGGeee##\xa3\xc8\xc8\xc8\x9f\x7f\xfe\x99\
-D\x22=\x7f\xfe\x1coP[[\xbbf\xcd\x1aMM\
-M==\xbd\x15+V\xe0_\x9c\x0b\x0b\x0b\xc3f'\
-\x1f5j\x14\xf6\xa3\x0d\xf7\xef\xdf\x17\xac\xc3\x02\xf0\xf3\
-\xf3\xbbu\xeb\x96\xd86\x07\x80p\x89\xf4\x00\xee%8\
-ZZZ\x18\xff\xc4f\xb3y\x1b\x0c8\xff(\xaf\xfc\
-\xfc|OOOEE\xc5\xe3\xc7\x8f\x1f8p\xa0\xb4\
-\xb44>>\xbeG\x9b\x8f>\xfa\xc8\xc8\xc8\xe8\xe8\xd1\
-\xa3\x11\x11\x11\x17/^\xc4\xe6\xecB\x08EEEE\
-GG#\x84\x8a\x8a\x8a\xca\xcb\xcb\xcb\xcb\xcb\x85\x95\xa0\
-\xb8\xe2\xe2\xe2\x85\x0b\x17jjj\xaa\xa8\xa8\xb8\xb8\xb8\
-\xe4\xe5\xe5\xe1/\xf5\x18\xe9\x9d<y\x12\xfb\x02\xf2\xe4\
-\xc9\x93\xcf\x9e=;{\xf6l///\xdeU=|\
-\xf8\xd0\xdd\xdd}\xe4\xc8\x91\x13'N\xdc\xb3g\x0f\xb6\
-0$$\xe4\x9bo\xbea2\x99X\xf0\xf1N\xa1\x06\
-\xc0\xe0\xf1\x7f\x00#\xa1\x1e\xc3\xbd\x5c\xf2\x5c\xb3f\xcd\
-\x87\x0by\xe7\x07\x1dp\xfeQ^\xb1\xb1\xb1:::\
-\xb9\xb9\xb9***\x08!OOOl\xea0^\x9f\
-}\xf6Yhh(\xf6\x98\xc9d~\xfd\xf5\xd7\xf5\xf5\
-\xf5\xba\xba\xbaZZZ\xd8|\x1fc\xc6\x8c\xd1\xd5\xd5\
-\xed\xfb\xd3\xeb\xd3\xfb\xf7\xefy\x7f\x14\x86\xc5b\xf1\xbe\
-\xfa\xe0\xc1\x03\x17\x17\x17++\xab\xcc\xccLuu\xf5\
-\xcc\xcc\xcc\xd9\xb3g\xff\xfd\xf7\xdf\x1fN\x06{\xfd\xfa\
-\xf5\x15+V,Y\xb2d\xf7\xee\xdd\xf5\xf5\xf5\xe1\xe1\
-\xe1\xad\xad\xadS\xa7N\xc5\x1b\xb4\xb4\xb4|\xf2\xc9'\
-~~~[\xb6l9s\xe6Lpp\xb0\x99\x99\x99\
-\xa7\xa7gLL\x0c\x87\xc3\xc9\xca\xca*..F\x08\
-\xf1\x7f\x8d\x19\x00$\xbc\x03\x18\x09\xfb\x18\xee\xe58N\
-HH\xe81\x03Xll\xec\xff\xfd\xdf\xffa\x8f\xbb\
-\xbb\xbb\x07\x9c\x7f\x14\xc7\xe1p\xf2\xf3\xf3}||\xb0\
-\xd4@\x08\x91H$oo\xef\x1e\xbf\x07\xb3t\xe9R\
-\xfc\xb1\x9d\x9d\x1dB\xe8\xd5\xabW\x82%E\x0fNN\
-N\xfd\xbc\x1a\x1e\x1e\x8e}\xc7\x7f\xe4\xc8\x91\x08\xa1\xb9\
-s\xe7\xda\xd9\xd9%&&\xfe\xfa\xeb\xaf=Z\xc6\xc6\
-\xc6N\x992\xe5\xd4\xa9S\xd8\xd3\xc9\x93'O\x992\
-\x85\xb7Ass\xf3\xae]\xbb\xe6\xcf\x9f\x8f\x10Z\xb0\
-`A^^\xde\xf1\xe3\xc7===\xb5\xb5\xb554\
-4\xe4\xe4\xe4\xc6\x8d\x1b7\xf8\xdd\x01\xb2FX\x070\
-\x12\xf61\xdcKpL\x9e<\xb9\xc74\x16\xa3F\x8d\
-\xc2\x1f\xf3\xce?\xda\xe3\x8d\xf8\xfc\xa3\xbc\x8d;;;\
-{\x5c\xad\xfd\xf0\xe2-\xef\x95Tl\xb5\xc2\x9a\x89/\
-++\x8bw\x8e\xc2\xba\xba\xba\xe5\xcb\x97c\x8f;;\
-;\xaf_\xbf\x1e\x18\x18\x88}\xe8\x08!999/\
-/\xaf\xcc\xcc\xcc\x1e+\xe1r\xb9\xb7n\xdd\x8a\x8a\x8a\
-\xc2\x97\xd8\xd8\xd8\x98\x99\x99\xf1\xb6QRR\x9a7o\
-\x1e\xf6\x98D\x22Y[[WTT\x08e\x17\x80,\
-\x13\xca\x01\x8cDp\x0c\x13\x1e9\xf33\xff(N]\
-]}\xc4\x88\x11=j:\xf8,\xf1\x10\x0a'''\
-\x0b\x0b\x0b\xfc\xe9\x9b7o\xf0\xc7MMMl6{\
-\xcf\x9e=\xfb\xf6\xed\xc3\x17r8\x1c\x0e\x87\xd3c%\
-\x8d\x8d\x8d\x1d\x1d\x1d=\xf6\xae\xc7/\xebijj\xca\
-\xc9\xfd\xef\x82\x91\x92\x92\x12\xccB\x0a\x06O(\x070\
-\x12\xc11L88x\xe7\x1f\xe5\x1d\x89\xf4\xd5\x98J\
-\xa5^\xb8p\xa1\xad\xad\x0d;[\xe1r\xb9\xd9\xd9\xd9\
-\xfco\x0e\x9b(\xa8\xc7l\xe9B\xa1\xa1\xa1!//\
-\xbfq\xe3\xc6M\x9b6\xf5\xdfRKKKII\x09\
-\xbf\xd7\x83\xa9\xa9\xa9\xc1g?\x03@\xfc\xf8?\x80\x91\
-\x08\x8eaAn\xc7\x0e8\xff(\xaf\xf8\xf8\xf8\x86\x86\
-\x86\xd9\xb3g\x9f;w\xee\xf2\xe5\xcb\x0b\x17.\xc4.\
-\xf0\xf0f[?\xb0\x1fzHKK+((\xb8s\
-\xe7\x8e\x10\x13DYYy\xe6\xcc\x99\x7f\xfd\xf5\xd7\xf8\
-\xf1\xe3{\xcc\xc0\xdc\xa3\xa5\x9c\x9c\x9c\x93\x93\xd3\xd9\xb3\
-g\xf1%%%%eee|n\x08F\x1f@\x14\
-\xf8?\x80\x91\x08\x8eaA.\xf2\x0f8\xff(/\x0a\
-\x85\x92\x93\x93\x13\x19\x19\xe9\xed\xed\xad\xad\xad\xbdf\xcd\
-\x1a77\xb7\xd0\xd0\xd0^\xa72\xee\xf5\xedQQQ\
-\x07\x0f\x1eLKK\xeb\xee\xee\xbew\xef\x9e\xad\xad\xad\
-\x00}\xeeUjj*\x85B\xa1P(\x9b7o\x1e\
-3fLCC\xc3\x9d;w\x10B;v\xec\xe8\xd1\
-2>>~\xd6\xacY\xcb\x97/_\xbf~}CC\
-Ctt\xb4\x81\x81\x01\x9f\xd9gee\xd5\xd1\xd1\xb1\
-{\xf7nggg\xfc\xf7h\x00\x18<\xfe\x0f`$\
-\xf4cX\xfc\x93\x8e-X\xb0`\xc2\x84\x09\xa2\xde\xca\
-\xde\xbd{\x11B\x8f\x1f?\xe6]XYY\x89\x10J\
-NN\xc6\x97<~\xfc\xd8\xdb\xdb{\xd4\xa8Q\x8a\x8a\
-\x8aFFF\x8b\x16-\xbar\xe5\x0a\xf6RBB\xc2\
-\xc8\x91#\xf1\x96'N\x9c\xf8\xd7\xbf\xfe\xa5\xa8\xa8h\
-iiy\xea\xd4)\x07\x07\x875k\xd6`/\x85\x86\
-\x86\xea\xeb\xeb\xf3n\xc8\xdb\xdb{\xda\xb4i\xd8\xe3\xae\
-\xae.???\x1d\x1d\x1d\x12\x89ddd\xd4\xa3\x9f\
-0u \xff\xafJ\x01\xfe\xa7\x0e\x14\xfa\x01\xcc\x15\xea\
-1,\x8e\xe0\x08\x08\x08\xc8\xce\xce\xce\xcf\xcf?\x7f\xfe\
-\xfc\x8a\x15+\x10B?\xfe\xf8\xa3\x18\xb6+:UU\
-U\xaa\xaa\xaa\xdf}\xf7\xdd\xe0W\x05\xc1\xc1\xff\xabR\
-`\xe8\xcc9:\xc8cX\x1c\xf5H\xcd\xcd\xcdaa\
-a\xb5\xb5\xb5rrr\x93'O>z\xf4\xe8\xea\xd5\
-\xab\xc5\xb0]!jnn\x8e\x8c\x8c\x9c={\xb6\xae\
-\xaenyy\xf9\xf6\xed\xdb\xd5\xd4\xd4\xf0\x0aW\x00\x86\
->\xe1\x1e\xc3\xe2\x08\x8e#G\x8e\x88a+\x22\xa5\xa0\
-\xa0PYY\x19\x10\x10\xd0\xd0\xd0\xa0\xa6\xa66s\xe6\
-\xcc\xd3\xa7OK\xc1\x17\xf9\x80\xec\x10\xee1\x0c\x15\xd0\
-|QVV\xfep\x9a\x12\x00\x86\x11\xe1\x1e\xc30\x03\
-\x18\x00\x800\x08\x0e\x00\x00aB\x0b\x8e\xe4\xe4\xe4\xf5\
-\xeb\xd7\x0bkm\x00\x80\xa1Lh\xc1QYY\xf9\xec\
-\xd93a\xadm\x88PQQ\x11\xe77k\x00\x10\x85\
-\xdb\xb7o\xf7ZN:\x18p\xaa\x02\x00 \x0c\x82\x03\
-\x00@\x18\x04\x07\x00\x800\x08\x0e\x00\x00a\x10\x1c\x00\
-\x00\xc2 8\x00\x00\x84Ap\x00\x00\x08\x83\xe0\x00\x00\
-\x10\x06\xc1\x01\x00 \x0c\x82\x03\x00@\x18\x04\x07\x00\x80\
-0\x08\x0e\x00\x00a\x10\x1c\x00\x00\xc2 8\x00\x00\x84\
-Ap\x00\x00\x08\x83\xe0\x00\x00\x10\x06\xc1\x01\x00 \x0c\
-\x82\x03\x00@\x18\x04\x07\x00\x800\x08\x0e\x00\x00a\x10\
-\x1c\x00\x00\xc2 8\x00\x00\x84Ap\x00\x00\x08\x83\xe0\
-\x00\x00\x10\x06\xc1\x01\x00 \x0c\x82\x03\x00@\x18\x04\x07\
-\x00\x800\x08\x0e\x00\x00a\x10\x1c\x00\x00\xc2 8\x00\
-\x00\x84Ap\x000\xb4twws\xb9\x5cI\xf7b\
-\x00\x0a\x92\xee\x80l\xa9\xae\xae\x8e\x8b\x8bkooG\
-\x08\x85\x85\x85M\x9e<Y\xd2=\x02C\x08\x9b\xcd\x8e\
-\x88\x88hll\xe4r\xb9\xc6\xc6\xc6_\x7f\xfd\xb5\x9c\
-\xdc\x10\xfd\xaf\x1d\x82C|\xb8\x5cnPPPZZ\
-\x9a\xa1\xa1aKK\xcb\xbf\xff\xfd\xef\xfd\xfb\xf7K\xba\
-S`\x08\xd9\xb9s\xa7\x97\x97\x97\x9b\x9b\x1bB\xe8\xfc\
-\xf9\xf3\xfb\xf7\xef\xdf\xbcy\xb3\xa4;\xd5;\x92\xb0\x06\
-E\x9b6m:p\xe0\x80\xba\xba\xbaP\xd66D0\
-\x18\x0c2\x99,\xac\xd4\xef\xee\xeevuu=\x7f\xfe\
-<\xf6\xf4\xd2\xa5K\xed\xed\xed\xe6\xe6\xe6\xbe\xbe\xbe\xf8\
-\xe7\xc6b\xb1\xea\xea\xea&L\x98 \x94-\x0eA-\
------zzz\x02\xbc*\x05X,\xd6\x8b\
-\x17/\xa6N\x9d\x8a=mii177?v\xec\
-\x18\xf6t\xdd\xbau\x07\x0f\x1e\xc4\x1b[ZZ\x8e\x1c\
-9r\xf0\x1bmiia0\x18\xef\xde\xbd\x1b\xfc\xaa\
-pB\x1bq\xacX\xb1B\xfa\x06\xde\x95\x95\x95\x86\x86\
-\x86\xf2\xf2\xf2BY\x1b\x8b\xc5z\xf2\xe4\x09\xfe\x94\xc1\
-`hkk[[[gee1\x18\x0c|ym\
-m\xed\xa8Q\xa3\x84\xb2\xc5\xa1IAA\xa1\xab\xabK\
-\xb0W\x87\xbb\x96\x96\x16\x84\x90\x9a\x9a\x1a\xbe\xc4\xc6\xc6\
-\x86\xb7A[[\x9b\x8a\x8a\x0aB\x88\xc5bYZZ\
-\xfa\xf9\xf9\x09e\xbb\xe6\xe6\xe6BY\xcf\xffp\x81\x18\
-\xf9\xfb\xfb_\xb9r\xa5\xbb\xbb\xbb\xb8\xb8x\xc9\x92%\
-\x1d\x1d\x1d\x92\xee\x11\x18Bn\xdf\xbe\xbdv\xed\xda\xa7\
-O\x9f>z\xf4\xc8\xdb\xdb\xfb\xd1\xa3G\x92\xeeQ\x9f\
-\x84v\xaa\x02\xf8\xd1\xd5\xd5\x95\x91\x91q\xf7\xee\xddq\
-\xe3\xc6\x85\x84\x84\x90\xc9\xe4\xfc\xfc\xfc\xb8\xb8\xb8\xdc\xdc\
-\x5cIw\x0dH@AA\xc1\xb6\xeb$:/\x00\x00\
-\x05\xa1IDATm\xdb\xae_\xbf\x8e/y\xf1\xe2\
-\xc5\x89\x13'\xe4\xe5\xe5W\xaf^=f\xcc\x18\x09\xf6\
-\xad\x7fpqT\xac\x14\x14\x14z\x5c\xee\xea\xea\xea\x1a\
-1b\x84\xa4\xfa\x03$KNN\xae\xc7\xff\xdc\xa6\xa6\
-\xa6QQQ\x92\xea\x0f\xff\x86\xe8\xcd\x1e\xd9\xc1f\xb3\
-!8d\x16\x894\x5c\x87\xfc\x10\x1c\x12\xc6f\xb3\x15\
-\x14`\xdc'\xa3 8\x80\x80\xe0TE\x96Ap\x00\
-\x01\xc1\xa9\x8a,\x83\xe0\x00\x02\x82S\x15Y\x06\xc1\x01\
-\x04\x04\xa7*\xb2\x0c\x82\x03\x08\x08NUd\x19\x04\x07\
-\x10PWW\x17\x9c\xaa\xc8,\x08\x0e  \x18q\xc8\
-2\x08\x0e  \x08\x0eY&''\xd7\xdd\xdd-\xe9\
-^\x08\x02\x82C\xc2\x86\xfb\xa9Jzz:\xe9\xbf\xe4\
-\xe5\xe5\x8d\x8d\x8dW\xae\x5c\xf9\xfc\xf9\xf3^\x1b\x1f?\
-~\x9cD\x22\xd1\xe9t|IMM\x0d\x89D\xd2\xd7\
-\xd7\xe7m\xb6o\xdf>\x12\x89TZZ\xda\xff\xa6\x13\
-\x13\x13\xf1\xaf\x99\xf2>\x1eF\x86\xef\x88c\x18\x1f\xb2\
-\xd2A:F\x1c\xfb\xf7\xef766\xe6p8\xcf\x9e\
-=\xfb\xf6\xdbo\x0b\x0a\x0aJJJ>\x9c\x9c\x85F\
-\xa3!\x84\xe8t:\xf6\x00{\xac\xaa\xaaZ[[\xfb\
-\xe4\xc9\x13\x0b\x0b\x0b|\xa1\x8e\x8e\x8e\x95\x95\x958w\
-A\x22 8\x80\x80\xa4\xa3\x8ec\xe6\xcc\x99\xf8\x9f\xfd\
-\xe8\xd1\xa3\xd7\xae][XX\xe8\xe1\xe1\xd1\xa3\x99\x91\
-\x91\x91\xa9\xa9)\xef\x88\x83N\xa7\xbb\xbb\xbb?~\xfc\
-\x98N\xa7\xe3k\xc8\xcb\xcb\xa3P($\x12I<\x9d\
-\x97\xa0\xe1\x1b\x1cp\xaa\x22a\xd2W\xc7\xa1\xad\xad\x8d\
-\x10b\xb3\xd9\xbd\xbeJ\xa3\xd1\x0a\x0a\x0a\xf0\xa9z\xe8\
-t:\x95J\xa5P(x\x9a\x94\x95\x95\xbd{\xf7\xce\
-\xd5\xd5\x15!TZZ\xbar\xe5\xca\xb1c\xc7*+\
-+\x9b\x9a\x9a\x06\x06\x062\x99L\xb1\xec\x84\x98@p\
-\x00\x01I\xc7\xa9Jkkkss3\x93\xc9\xbc}\
-\xfbvll\xac\x91\x91\x11\xf6\x97\xff!\x1a\x8d\xd6\xdc\
-\xdc\x5cTT\x84\x10b0\x18\xa5\xa5\xa5T*\x95J\
-\xa5\xe6\xe5\xe5a\x0d\xb0\x04\xc1\xcee^\xbf~=~\
-\xfc\xf8]\xbbv]\xb9r%::\xfa\xea\xd5\xab\x0b\
-\x16,\x10\xd7>\x89\xc3\xf0\x0d\x8ea?H\x1e\xee\xba\
-\xba\xbaJJJN\x9d:\xd5c\xb9\x9a\x9aZ?\x81\
-\xa2\xac\xac\x8cM0\xd7+\x05\x05\x85~&\x7f%\x91\
-H\x9a\x9a\x9a\xfdt\x89L&\x13\x9d-\xd1\xde\xde\x1e\
-\x7f<~\xfc\xf8\x9c\x9c\x9c\xbe&\xcb\xc4\x02\x85N\xa7\
-;99\xe5\xe5\xe5)))\xd9\xdb\xdb\xeb\xe8\xe8T\
-TT\xbcz\xf5j\xdc\xb8qt:\x9dL&\xdb\xda\
-\xda\x22\x84\x16,X\x80'\x85\xab\xab\xab\xad\xad\xad\x9d\
-\x9d]II\x89\xb5\xb5\xf5\x80]\xca\xc9\xc9\xb9z\xf5\
-*\xa1\xbd\x10\xbf\xa6\xa6\xa6\xf7\xef\xdfK\xba\x17\x82\x80\
-\xe0\x9006\x9b]PPPYY\x89\x10b2\x99\
-\xfd\xdc\x9ckii\xe9\xec\xec\xec\xeb\xd5\x8e\x8e\x8e\xd6\
-\xd6\xd6\xbe^\xe5p8,\x16K\xe0N&$$|\
-\xf5\xd5W\xfd4\xf8\xe5\x97_LLL\xb8\x5c\xee\xdb\
-\xb7ow\xef\xde=w\xee\x5c:\x9d>q\xe2\xc4\x0f\
-[\x8e\x1f?\xde\xd8\xd8\x98N\xa7\x87\x85\x85\xd1\xe9\xf4\
-i\xd3\xa6)**\x9a\x9b\x9b\xeb\xe9\xe9\xd1\xe9t,\
-8\x5c\x5c\x5c\xb0\xe4b\xb3\xd9{\xf7\xee\xfd\xe5\x97_\
-***\xf0?\xb0\xa7O\x9f\xf2\x13\x1c\xc3\x02\x8c8\
-\x80\x80\xd8lvXX\xd8\xbf\xff\xfdo\xc9v\xa3\xa9\
-\xa9\xa9\x9fW\x07<\x99\x9a:u*~is\xde\xbc\
-y\x86\x86\x86\x09\x09\x09YYY\xbd6\xa6\xd1h9\
-99\x5c.\x97N\xa7\xcf\x9d;\x17[\x88]\xe6p\
-ww\x7f\xf5\xea\x95\xbf\xbf?\xb60<<<##\
-#99\xd9\xd9\xd9Y]]\xbd\xa1\xa1\x81J\xa5b\
-\xbfJ3 OOOOOO~ZJ\xd0\xf3\xe7\
-\xcf\xef\xdc\xb9#\xe9^\x08\x02\x82C\xc2\x86H\x1d\x87\
-\x96\x96\x96\xb0V\xa5\xa9\xa9ill\x5c\x5c\x5c\xdcW\
-\x03WW\xd7c\xc7\x8e\x15\x16\x16\x16\x15\x15%&&\
-b\x0b\xa9T\xea\xf7\xdf\x7f\x7f\xe3\xc6\x0d\xf4\xdf\x0b\x1c\
-\x08\xa1\xa3G\x8f\x06\x05\x05\x05\x07\x07cO\x87\xe9\xdf\
-X?\x86\xef\x88\x03.\x8eJ\x98t\x5c\x1c\xe5UW\
-WWQQ\xd1\xcf/<`\xb9\x90\x92\x92\xc2\xe5r\
-\x9d\x9d\x9d\xb1\x85\x14\x0a\xa5\xac\xac\xec\xe4\xc9\x93\xaa\xaa\
-\xaa\x8e\x8e\x8e\x08!.\x97\xdb\xda\xda\xca{9\xe6\xe4\
-\xc9\x93\x22\xee\xbb\xb8\x0d\xdf\xcaQ\xc9\xff_'\xe3\xa4\
-#8\xfe\xfa\xeb\xaf\xe7\xcf\x9fs\xb9\xdc\xaa\xaa\xaa\xef\
-\xbf\xff\xbe\xb3\xb3\xf3\xf3\xcf?\xef\xab\xb1\x85\x85\x85\x9e\
-\x9e\xde\x85\x0b\x17\xec\xed\xed\xf1rO;;;55\
-\xb5\x0b\x17.\xb8\xb9\xb9a\x1f\x08\x89D\xf2\xf0\xf08\
-p\xe0\xc0\xc2\x85\x0bMLL\xb2\xb3\xb3\x0f\x1f>,\
-\xa6\xfd\x11\x97\xe1;\xe2\x80\xe0\x90\xb0!r\xaa2H\
-\x1b7n\xc4\x1e\xe8\xe9\xe9\xd9\xd8\xd8\xfc\xf1\xc7\x1f\xb3\
-f\xcd\xea\xa7=\x8dF;}\xfa4\x95J\xc5\x97\xc8\
-\xcb\xcb;;;\xff\xf1\xc7\x1f\xf8y\x0aB(##\
-#00\xd0\xc5\xc5\x85\xc3\xe1P(\x943g\xceP\
-(\x14\x11\xed\x82D\x0c\xdf\xe0\x18\xae\xfd\x96\x1a\xcb\x96\
--\xf3\xf5\xf5\xf5\xf2\xf2\x92tG\x80\x04TTTx\
-xx<}\xfaT\xd2\x1d!\x0c\xaeqH\x98t\x9c\
-\xaa\x00\xc1\x0c\xdf\x11\x07\x04\x87\x84I\xc7\xa9\x0a\x10\x0c\
-\x04\x07\x10\x10\x8c8d\x19\x04\x07\x10\x10\x04\x87,\x83\
-\xe0\x00\x02\x82S\x15Y\x06\xc1\x01\x04\x04#\x0eY\x06\
-\xc1\x01\x04\x04\xc1!\xcb 8\x80\x80\xe0TE\x96\x0d\
-\xdf\x92s\x08\x0e\x09\x83\x11\x87,STT\x1c\xa6\xb5\
-\xb0\xc3u\xa4$5*++G\x8f\x1e\x0d\x83\x0e0\
-\xbc@p\x00\x00\x08\x83S\x15\x00\x00a\x10\x1c\x00\x00\
-\xc2\xfe\x1f\xf2L\x8f\xd4\xd0T\x0d#\x00\x00\x00\x00I\
-END\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x0b\
-\x04l}\x95\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\
-\x00\x10\
-\x09>y\xfe\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\x00_\x00I\x00c\x00o\x00n\
-\x00\x10\
-\x09A\xba\x7f\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\x00_\x00L\x00o\x00g\x00o\
-\x00\x15\
-\x01@\xb9\xde\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\x00_\x00F\x00l\x00o\x00o\x00r\
-\x00P\x00l\x00a\x00n\
-\x00\x12\
-\x09$\x08\x9f\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\x00_\x00S\x00t\x00u\x00d\x00i\
-\x00o\
-\x00\x15\
-\x01\xccz\x9c\
-\x00L\
-\x00i\x00v\x00i\x00n\x00g\x00S\x00p\x00a\x00c\x00e\x00_\x00C\x00a\x00t\x00h\x00e\
-\x00d\x00r\x00a\x00l\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x05\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00h\x00\x00\x00\x00\x00\x01\x00\x00wi\
-\x00\x00\x01\x9a\xfb\xff\xed!\
-\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\xb0\x07\
-\x00\x00\x01\x9a\xfb\xff\xed!\
-\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x91\xa2\
-\x00\x00\x01\x9a\xfb\xff\xed!\
-\x00\x00\x00\x1c\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\xfb\xff\xed!\
-\x00\x00\x00B\x00\x00\x00\x00\x00\x01\x00\x00\x13(\
-\x00\x00\x01\x9a\xfb\xff\xed!\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -0,0 +1,296 @@
+"""Solves sunrooms from a file without the GUI. Each row of a CSV or JSON Lines file is a room, given the same way it is
+typed into the toolkit, and each gets a row of results. Nothing here imports PySide6.
+
+    livingspacetoolkit-batch rooms.csv -o results.jsonl --workers 4
+"""
+import argparse
+import csv
+import json
+import logging
+import sys
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import fields
+from itertools import islice
+from math import degrees, tan
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Mapping, TextIO
+
+from livingspacetoolkit.config.log_config import logger, configure_logging
+from livingspacetoolkit.lib import ScenarioInputs, ScenarioOutputs, ToolkitLength, ToolkitPitch, UnknownScenarioError
+from livingspacetoolkit.lib.material_takeoff import ProjectRoom
+from livingspacetoolkit.lib.root_finding import ConvergenceError
+from livingspacetoolkit.lib.scenario_requirements import get_requirements
+from livingspacetoolkit.lib.solve_cache import SolveCache, solve_cached
+from livingspacetoolkit.lib.toolkit_enums import (EndCutType, LengthType, MaterialType, PitchType, RoofingType,
+                                                  Scenario, SunroomSide, SunroomType)
+from livingspacetoolkit.models import BillOfMaterials, BomLineItem
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "jsonl"}
+SIDES = {"a": SunroomSide.A_SIDE, "b": SunroomSide.B_SIDE, "c": SunroomSide.C_SIDE}
+ENUM_COLUMNS = {"scenario": Scenario, "sunroom_type": SunroomType, "end_cuts": EndCutType}
+LENGTH_COLUMNS = tuple(input_field.name for input_field in fields(ScenarioInputs)
+                       if input_field.name not in ENUM_COLUMNS and not input_field.name.startswith("pitch"))
+PITCH_COLUMNS = ("pitch_a", "pitch_b", "pitch_c")
+OUTPUT_COLUMNS = (("name", "error") + tuple(output_field.name for output_field in fields(ScenarioOutputs))
+                  + ("roof_area", "armstrong_boxes", "items", "warnings"))
+# Every scenario needs these. get_requirements adds the pitches and heights the scenario solves from.
+REQUIRED_COLUMNS = ("overhang", "thickness", "wall_width_a", "wall_width_b", "wall_width_c")
+TRUE_TEXT = ("true", "yes", "y", "1")
+# Rows go to the workers in chunks so a worker isn't waiting on a pipe for every row. Only a few chunks per worker are
+# read ahead of the one being written, which keeps memory flat on big files.
+CHUNK_SIZE = 64
+CHUNKS_IN_FLIGHT = 4
+
+_cache: SolveCache | None = None
+
+
+def _side(name: str) -> tuple[str, SunroomSide | None]:
+    """Splits a column like wall_width_a into wall_width and the A side."""
+    prefix, _, suffix = name.rpartition("_")
+    if prefix and suffix in SIDES:
+        return prefix, SIDES[suffix]
+    return name, None
+
+
+def _blank(value: object) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _column(name: str, side: SunroomSide | None) -> str:
+    """The column for a length or pitch, e.g. wall_height and the B side give wall_height_b."""
+    return name if side is None else f"{name}_{side.name[0].lower()}"
+
+
+def _required_columns(scenario: Scenario, sunroom_type: SunroomType) -> tuple[str, ...]:
+    try:
+        requirements = get_requirements(scenario, sunroom_type)
+    except KeyError:
+        raise UnknownScenarioError(scenario, sunroom_type) from None
+    return (REQUIRED_COLUMNS + tuple(_column("pitch", side) for side in requirements.pitch_sides)
+            + tuple(_column(length_type.name.lower(), side) for side, length_type in requirements.wall_heights))
+
+
+def _enum(enum_type, value: object):
+    try:
+        return enum_type[str(value).strip().upper()]
+    except KeyError:
+        raise ValueError(f"Unknown {enum_type.__name__}: {value}") from None
+
+
+def parse_room(record: Mapping[str, object]) -> tuple[ProjectRoom, PitchType]:
+    """
+    Reads a room from a row. Enums are given by name, e.g. WALL_HEIGHT_PITCH, and are not case sensitive. Lengths
+    accept anything the toolkit does, like 120 or 10' 6". Pitches are a ratio over 12 unless pitch_type is ANGLE.
+    Blank cells are left out, but every column the scenario needs must be filled in.
+    :param record: Mapping[str, object]: A CSV row or JSON object
+    :return: tuple[ProjectRoom, PitchType]: The room and how its pitches are written
+    """
+    values: dict[str, object] = {}
+    for column, enum_type in ENUM_COLUMNS.items():
+        if _blank(record.get(column)):
+            raise ValueError(f"{column} is required")
+        values[column] = _enum(enum_type, record[column])
+    missing = [column for column in _required_columns(values["scenario"], values["sunroom_type"])
+               if _blank(record.get(column))]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    for column in LENGTH_COLUMNS:
+        if _blank(record.get(column)):
+            continue
+        name, side = _side(column)
+        length = ToolkitLength(LengthType[name.upper()], side)
+        length.length = record[column]
+        values[column] = length.length
+    pitch_type = PitchType.RATIO if _blank(record.get("pitch_type")) else _enum(PitchType, record["pitch_type"])
+    for column in PITCH_COLUMNS:
+        if _blank(record.get(column)):
+            continue
+        pitch = ToolkitPitch(pitch_type, _side(column)[1])
+        pitch.pitch_value = record[column]
+        values[column] = pitch.radians
+    roofing_type = None if _blank(record.get("roofing_type")) else _enum(RoofingType, record["roofing_type"])
+    fascia = record.get("fascia")
+    if isinstance(fascia, str):
+        fascia = fascia.strip().lower() in TRUE_TEXT
+    name = "" if _blank(record.get("name")) else str(record["name"])
+    return ProjectRoom(ScenarioInputs(**values), roofing_type, bool(fascia), name), pitch_type
+
+
+def _item_record(item: BomLineItem) -> dict:
+    return {"material": item.material.name, "side": item.side.name if item.side else None, "quantity": item.quantity,
+            "cut_length": item.cut_length.inches if item.cut_length is not None else None, "halved": item.halved,
+            "ripped": item.ripped}
+
+
+def result_record(name: str, outputs: ScenarioOutputs, bill: BillOfMaterials, pitch_type: PitchType) -> dict:
+    """One row of results. Lengths are in inches and pitches are written the way the room gave them."""
+    record: dict = {"name": name, "error": None}
+    for output_field in fields(ScenarioOutputs):
+        value = getattr(outputs, output_field.name)
+        if value is not None and output_field.name in PITCH_COLUMNS:
+            value = degrees(value) if pitch_type == PitchType.ANGLE else tan(value) * 12
+        record[output_field.name] = value
+    record["roof_area"] = bill.roof_area
+    record["armstrong_boxes"] = bill.quantity(MaterialType.ARMSTRONG_BOX)
+    record["items"] = [_item_record(item) for item in bill.items if item.material != MaterialType.ARMSTRONG_BOX]
+    record["warnings"] = [str(warning) for warning in bill.warnings]
+    return record
+
+
+def solve_record(record: Mapping[str, object]) -> dict:
+    """
+    Solves one row. A row that can't be solved gets its error message instead of results, and a row that couldn't be
+    read is passed through. Rows are solved through a SolveCache kept for the life of the process, so repeated rooms
+    are only solved once.
+    :param record: Mapping[str, object]
+    :return: dict
+    """
+    global _cache
+    if record.get("error") is not None:
+        return dict(record)
+    if _cache is None:
+        _cache = SolveCache()
+    name = "" if _blank(record.get("name")) else str(record["name"])
+    try:
+        room, pitch_type = parse_room(record)
+        result = solve_cached(room.inputs, room.roofing_type, room.fascia, _cache)
+    except (ValueError, TypeError, ZeroDivisionError, UnknownScenarioError, ConvergenceError) as err:
+        logger.warning(f"Couldn't solve room {name!r}: {err}")
+        return {"name": name, "error": str(err)}
+    return result_record(room.name, result.outputs, result.bill_of_materials, pitch_type)
+
+
+def read_records(file: TextIO, file_format: str) -> Iterator[dict]:
+    """Yields the rows of a CSV or JSON Lines file one at a time. Blank lines are skipped."""
+    if file_format == "csv":
+        yield from csv.DictReader(file)
+        return
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as err:
+            record = {"name": f"line {line_number}", "error": f"Invalid JSON: {err}"}
+        if not isinstance(record, dict):
+            record = {"name": f"line {line_number}", "error": "Each line must be a JSON object"}
+        yield record
+
+
+def _format_item(item: dict) -> str:
+    side = item["side"][0] if item["side"] else ""
+    flags = "".join(f" {flag}" for flag in ("halved", "ripped") if item[flag])
+    return f"{item['material']} {side} {item['quantity']} x {item['cut_length']:g}{flags}"
+
+
+class RecordWriter:
+    """Writes result rows to a CSV or JSON Lines file as they come."""
+
+    def __init__(self, file: TextIO, file_format: str) -> None:
+        self.file = file
+        self.file_format = file_format
+        self._csv = None
+        if file_format == "csv":
+            self._csv = csv.DictWriter(file, OUTPUT_COLUMNS, extrasaction="ignore", lineterminator="\n")
+            self._csv.writeheader()
+
+    def write(self, record: dict) -> None:
+        if self._csv is None:
+            self.file.write(json.dumps(record) + "\n")
+            return
+        row = dict(record)
+        row["items"] = "; ".join(_format_item(item) for item in record.get("items", ()))
+        row["warnings"] = "; ".join(record.get("warnings", ()))
+        self._csv.writerow(row)
+
+
+def solve_records(records: list[dict]) -> list[dict]:
+    return [solve_record(record) for record in records]
+
+
+def imap_ordered(executor: Executor, function: Callable[[list[dict]], list[dict]], records: Iterable[dict],
+                 window: int, chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Like executor.map with a chunksize, but only window chunks are read ahead, so a huge file is never all in
+    memory."""
+    pending = deque()
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        pending.append(executor.submit(function, chunk))
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def _init_worker(log_level: int) -> None:
+    configure_logging(log_level, log_file=False)
+
+
+def solve_file(input_file: TextIO, input_format: str, output_file: TextIO, output_format: str,
+               workers: int = 1) -> tuple[int, int]:
+    """
+    Solves every row of input_file into output_file, in order.
+    :return: tuple[int, int]: The number of rows and how many of them failed
+    """
+    writer = RecordWriter(output_file, output_format)
+    records = read_records(input_file, input_format)
+    rows = failed = 0
+
+    def write_all(results: Iterable[dict]) -> None:
+        nonlocal rows, failed
+        for result in results:
+            writer.write(result)
+            rows += 1
+            failed += result.get("error") is not None
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(logger.level,)) as executor:
+            write_all(imap_ordered(executor, solve_records, records, workers * CHUNKS_IN_FLIGHT))
+    else:
+        write_all(solve_record(record) for record in records)
+    return rows, failed
+
+
+def _file_format(path: str, given: str | None, parser: argparse.ArgumentParser) -> str:
+    if given:
+        return given
+    file_format = FORMATS.get(Path(path).suffix.lower())
+    if file_format is None:
+        parser.error(f"Can't tell the format of {path}. Use --input-format/--output-format.")
+    return file_format
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="livingspacetoolkit-batch", description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="CSV or JSON Lines file of rooms, - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="Where to write the results, stdout by default")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"))
+    parser.add_argument("--output-format", choices=("csv", "jsonl"))
+    parser.add_argument("--workers", type=int, default=1, help="Processes to solve rows in, 1 by default")
+    parser.add_argument("--log-level", default="WARNING", choices=("DEBUG", "INFO", "WARNING", "ERROR"))
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error(f"--workers must be at least 1: {args.workers}")
+    configure_logging(getattr(logging, args.log_level), log_file=False)
+    input_format = _file_format(args.input, args.input_format, parser) if args.input != "-" else (
+        args.input_format or "jsonl")
+    output_format = args.output_format or (
+        input_format if args.output == "-" else _file_format(args.output, None, parser))
+
+    input_file = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf8")
+    output_file = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf8")
+    try:
+        rows, failed = solve_file(input_file, input_format, output_file, output_format, args.workers)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    logger.info(f"Solved {rows - failed} of {rows} rooms.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
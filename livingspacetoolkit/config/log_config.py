@@ -1,28 +1,39 @@
-import logging.config
+import logging
 from logging import StreamHandler
-from logging.handlers import RotatingFileHandler
-from .config import log_dir
-
-log_dir.mkdir(parents=True, exist_ok=True)
-
-log_path = log_dir / "livingspace-toolkit.log"
 
+# Importing this module only creates the logger. Nothing is written until an entry point calls configure_logging, so
+# the calculation code can be imported without touching the log directory.
 logger = logging.getLogger(name="livingspace_toolkit")
-logger.setLevel(logging.DEBUG)
 
 formatter = logging.Formatter(fmt="[%(levelname)s | %(filename)s | %(lineno)s] %(asctime)s: %(message)s",
                               datefmt="%Y-%m-%dT%H:%M:%S%z")
-rotating_file_handler = RotatingFileHandler(
-    log_path,
-    maxBytes=2_000_000,   # 2MB
-    backupCount=5,         # keep 5 old logs
-    mode="a+",
-    encoding="utf8"
-)
-stream_handler = StreamHandler()
 
-rotating_file_handler.setFormatter(formatter)
-stream_handler.setFormatter(formatter)
 
-logger.addHandler(rotating_file_handler)
-logger.addHandler(stream_handler)
+def configure_logging(level: int = logging.DEBUG, log_file: bool = True) -> None:
+    """
+    Sends the toolkit's logs to stderr and, for the application, to a rotating file in the user log directory.
+    Calling it again only changes the level.
+    :param level: int: e.g. logging.DEBUG
+    :param log_file: bool: Also write the rotating log file
+    :return:
+    """
+    logger.setLevel(level)
+    if logger.handlers:
+        return
+    if log_file:
+        from logging.handlers import RotatingFileHandler
+        from .config import log_dir
+
+        log_dir.mkdir(parents=True, exist_ok=True)
+        rotating_file_handler = RotatingFileHandler(
+            log_dir / "livingspace-toolkit.log",
+            maxBytes=2_000_000,   # 2MB
+            backupCount=5,         # keep 5 old logs
+            mode="a+",
+            encoding="utf8"
+        )
+        rotating_file_handler.setFormatter(formatter)
+        logger.addHandler(rotating_file_handler)
+    stream_handler = StreamHandler()
+    stream_handler.setFormatter(formatter)
+    logger.addHandler(stream_handler)
@@ -5,6 +5,7 @@ from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.models import ToolkitStateModel, RoofModel
 from livingspacetoolkit.lib.toolkit_enums import (PitchType, SunroomType, RoofingType, EndCutType,
                                                   LengthType, SunroomSide)
+from livingspacetoolkit.lib.scenario_requirements import get_requirements
 from livingspacetoolkit.utils.helpers import set_strikethrough
 
 
@@ -29,6 +30,19 @@ class BaseSunroomController(ABC, BaseSunroomProtocol):
         self.sunroom_wall.default_state()
         self.sunroom_floor.default_state()
 
+    def enable_scenario_inputs(self) -> None:
+        """Enables the pitch and wall height inputs the selected scenario needs, from the scenario requirements table."""
+        if self.toolkit_state.scenario is None:
+            return
+        requirements = get_requirements(self.toolkit_state.scenario, self.toolkit_state.sunroom_type)
+        for sunroom_side in requirements.pitch_sides:
+            self.sunroom_roof.pitch_view_dict[sunroom_side].enabled_state(self.toolkit_state.sunroom_type)
+        for key in requirements.wall_heights:
+            # A height can share its input with another side, like the single cathedral drip edge.
+            if key in self.sunroom_wall.wall_height_dict:
+                set_strikethrough(self.sunroom_wall.wall_height_label_dict[key], False)
+                self.sunroom_wall.wall_height_dict[key].setEnabled(True)
+
     def set_end_cuts_by_roof_type(self, roof_type: RoofingType) -> None:
         logger.debug(f"Enabling/Disabling end cuts for roofing type {roof_type.name}")
         match roof_type:
@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from livingspacetoolkit.config.log_config import logger
+from livingspacetoolkit.lib import ScenarioInputs, ScenarioOutputs, ToolkitPitch
+from livingspacetoolkit.lib.solve_cache import SolveCache, fill_toolkit_state, solve_key
+from livingspacetoolkit.lib.sunroom_calculator import SunroomCalculator
+from livingspacetoolkit.lib.toolkit_enums import PitchType, RoofingType, SunroomSide
+from livingspacetoolkit.models import ToolkitStateModel, SunroomResult
+
+
+@dataclass(frozen=True, slots=True)
+class CalculationRequest:
+    """Everything a calculation reads, copied from the toolkit state when it was asked for. The worker only sees this,
+    so the toolkit state can keep changing on the GUI thread while it runs."""
+    generation: int
+    inputs: ScenarioInputs
+    roofing_type: RoofingType | None
+    fascia: bool
+    # In the order of SunroomSide. A solved pitch is checked against the limit of how its side is written.
+    pitch_types: tuple[PitchType, ...]
+
+    @classmethod
+    def snapshot(cls, toolkit_state: ToolkitStateModel, generation: int) -> "CalculationRequest":
+        return cls(generation, ScenarioInputs.from_toolkit_state(toolkit_state), toolkit_state.roofing_type,
+                   toolkit_state.fascia, tuple(toolkit_state.pitch[side].pitch_type for side in SunroomSide))
+
+    def matches(self, toolkit_state: ToolkitStateModel) -> bool:
+        """Whether toolkit_state still has the inputs this request was made from."""
+        return self == self.snapshot(toolkit_state, self.generation)
+
+
+def _check_pitch_limits(outputs: ScenarioOutputs, pitch_types: tuple[PitchType, ...]) -> None:
+    """Raises ValueError, like apply_outputs, if a solved pitch is too steep for the pitch type of its side."""
+    for side, pitch_type, pitch in zip(SunroomSide, pitch_types, (outputs.pitch_a, outputs.pitch_b, outputs.pitch_c)):
+        if pitch is not None:
+            ToolkitPitch.from_radians(pitch, side, pitch_type)
+
+
+class _WorkerSignals(QObject):
+    # request, SunroomResult or None, Exception or None
+    done = Signal(object, object, object)
+
+
+class CalculationWorker(QRunnable):
+    """Solves one CalculationRequest on a pool thread and always emits done when it's finished. A room that isn't in
+    the cache is calculated with the runner's SunroomCalculator, which only reruns the stages whose inputs changed
+    since the last calculation."""
+
+    def __init__(self, request: CalculationRequest, cache: SolveCache, calculator: SunroomCalculator,
+                 signals: _WorkerSignals) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.request = request
+        self.cache = cache
+        self.calculator = calculator
+        self.signals = signals
+        self.cancelled = False
+
+    def run(self) -> None:
+        result = error = None
+        if not self.cancelled:
+            try:
+                result = self.calculate()
+            except Exception as err:
+                error = err
+        self.signals.done.emit(self.request, result, error)
+
+    def calculate(self) -> SunroomResult:
+        # Solved from the canonical inputs, like solve_cached, so the result is the same as a cached one.
+        key = solve_key(self.request.inputs, self.request.roofing_type, self.request.fascia)
+        result = self.cache.get(key)
+        if result is not None:
+            # The cache isn't keyed on the pitch types, so the limits of this request are checked here.
+            _check_pitch_limits(result.outputs, self.request.pitch_types)
+            return result
+        inputs, roofing_type, fascia = key
+        toolkit_state = self.calculator.toolkit_state_model
+        if (toolkit_state.sunroom_type, toolkit_state.scenario) != (inputs.sunroom_type, inputs.scenario):
+            # Every stage reruns for another scenario, so nothing solved for the last one is kept.
+            toolkit_state.default_state()
+        fill_toolkit_state(toolkit_state, inputs, roofing_type, fascia, self.request.pitch_types)
+        self.calculator.calculate()
+        result = self.calculator.result()
+        self.cache.put(key, result)
+        return result
+
+
+class CalculationRunner(QObject):
+    """Runs calculations off the GUI thread, one at a time. Submitting a calculation cancels the ones before it, as
+    does cancel_stale once an input they were made from is edited: a queued one never starts and the result of a
+    running one is dropped. Only the latest calculation emits finished or failed, always on the GUI thread."""
+    finished = Signal(object, object)  # CalculationRequest, SunroomResult
+    failed = Signal(object, object)  # CalculationRequest, Exception
+
+    def __init__(self, cache: SolveCache | None = None, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self.cache = cache if cache is not None else SolveCache()
+        # Works on its own models, filled in from each request. Only one worker runs at a time, so only one thread
+        # ever uses it.
+        self.calculator = SunroomCalculator(ToolkitStateModel())
+        # The solve holds the GIL, so a second thread would only slow the current calculation down.
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.generation = 0
+        # Kept until their done signal arrives so a worker isn't deleted while a pool thread runs it.
+        self._workers: dict[int, CalculationWorker] = {}
+        self._signals = _WorkerSignals(self)
+        self._signals.done.connect(self._handle_done)
+
+    @property
+    def busy(self) -> bool:
+        return any(not worker.cancelled for worker in self._workers.values())
+
+    def submit(self, toolkit_state: ToolkitStateModel) -> CalculationRequest:
+        """
+        Snapshots toolkit_state and calculates it in the background.
+        :param toolkit_state: ToolkitStateModel
+        :return: CalculationRequest: The snapshot being calculated
+        """
+        self.cancel()
+        self.generation += 1
+        request = CalculationRequest.snapshot(toolkit_state, self.generation)
+        worker = CalculationWorker(request, self.cache, self.calculator, self._signals)
+        self._workers[request.generation] = worker
+        self.thread_pool.start(worker)
+        logger.debug(f"Started calculation {request.generation}.")
+        return request
+
+    def cancel(self) -> None:
+        """Cancels every calculation that hasn't reported back yet."""
+        for generation, worker in list(self._workers.items()):
+            if not worker.cancelled:
+                self._cancel(generation, worker)
+
+    def cancel_stale(self, toolkit_state: ToolkitStateModel) -> bool:
+        """
+        Cancels the calculations that haven't reported back and whose inputs toolkit_state no longer has.
+        :param toolkit_state: ToolkitStateModel
+        :return: bool: Whether any calculation was cancelled
+        """
+        cancelled = False
+        for generation, worker in list(self._workers.items()):
+            if not worker.cancelled and not worker.request.matches(toolkit_state):
+                self._cancel(generation, worker)
+                cancelled = True
+        return cancelled
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Blocks until the pool is idle. For shutting down and tests, never the GUI."""
+        return self.thread_pool.waitForDone(msecs)
+
+    def _cancel(self, generation: int, worker: CalculationWorker) -> None:
+        worker.cancelled = True
+        if self.thread_pool.tryTake(worker):
+            del self._workers[generation]
+        logger.debug(f"Cancelled calculation {generation}.")
+
+    def _handle_done(self, request: CalculationRequest, result: SunroomResult | None,
+                     error: Exception | None) -> None:
+        worker = self._workers.pop(request.generation, None)
+        if worker is None or worker.cancelled:
+            return
+        if error is not None:
+            self.failed.emit(request, error)
+        else:
+            self.finished.emit(request, result)
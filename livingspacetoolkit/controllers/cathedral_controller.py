@@ -1,9 +1,8 @@
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.views import CathedralView
 from livingspacetoolkit.models import ToolkitStateModel, RoofModel
-from livingspacetoolkit.lib.toolkit_enums import (PitchType, SunroomType, RoofingType, EndCutType, Scenario,
-                                                  SunroomSide, LengthType)
-from livingspacetoolkit.utils.helpers import set_strikethrough
+from livingspacetoolkit.lib.toolkit_enums import (PitchType, SunroomType, RoofingType, EndCutType, SunroomSide,
+                                                  LengthType)
 from .base_sunroom_controller import BaseSunroomController
 
 
@@ -74,48 +73,5 @@ class CathedralController(BaseSunroomController):
         self.set_to_default()
         self.sunroom_roof.enable_except_pitch()
         self.sunroom_floor.enable_floor_input()
-        match self.toolkit_state.scenario:
-            case Scenario.WALL_HEIGHT_PITCH:
-                self.sunroom_roof.pitch_a.enabled_state(self.toolkit_state.sunroom_type)
-                self.sunroom_roof.pitch_c.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.a_wall_height_label, False)
-                self.sunroom_wall.a_wall_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.c_wall_height_label, False)
-                self.sunroom_wall.c_wall_height_edit.setEnabled(True)
-            case Scenario.WALL_HEIGHT_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.a_wall_height_label, False)
-                self.sunroom_wall.a_wall_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.c_wall_height_label, False)
-                self.sunroom_wall.c_wall_height_edit.setEnabled(True)
-            case Scenario.MAX_HEIGHT_PITCH:
-                self.sunroom_roof.pitch_a.enabled_state(self.toolkit_state.sunroom_type)
-                self.sunroom_roof.pitch_c.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.max_height_label, False)
-                self.sunroom_wall.max_height_edit.setEnabled(True)
-            case Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.soffit_height_a_label, False)
-                self.sunroom_wall.soffit_height_a_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.soffit_height_c_label, False)
-                self.sunroom_wall.soffit_height_c_edit.setEnabled(True)
-            case Scenario.SOFFIT_HEIGHT_PITCH:
-                self.sunroom_roof.pitch_a.enabled_state(self.toolkit_state.sunroom_type)
-                self.sunroom_roof.pitch_c.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.soffit_height_a_label, False)
-                self.sunroom_wall.soffit_height_a_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.soffit_height_c_label, False)
-                self.sunroom_wall.soffit_height_c_edit.setEnabled(True)
-            case Scenario.DRIP_EDGE_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.drip_edge_height_label, False)
-                self.sunroom_wall.drip_edge_height_edit.setEnabled(True)
-            case Scenario.DRIP_EDGE_PITCH:
-                self.sunroom_roof.pitch_a.enabled_state(self.toolkit_state.sunroom_type)
-                self.sunroom_roof.pitch_c.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.drip_edge_height_label, False)
-                self.sunroom_wall.drip_edge_height_edit.setEnabled(True)
+        self.enable_scenario_inputs()
         self.toolkit_state.default_state(sunroom= SunroomType.CATHEDRAL, scenario=self.toolkit_state.scenario)
@@ -1,11 +1,22 @@
+from PySide6.QtWidgets import QAbstractButton, QComboBox, QLineEdit
+
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.views import ScenariosView, ResultsView, TabsView
-from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, SunroomResult
 from livingspacetoolkit.models.results_model import generate_results
 from .studio_controller import StudioController
 from .cathedral_controller import CathedralController
+from .base_sunroom_controller import BaseSunroomController
+from .calculation_worker import CalculationRequest, CalculationRunner
 from livingspacetoolkit.lib.toolkit_enums import SunroomType
-from livingspacetoolkit.lib import SunroomBuilder, ScenarioSelector
+from livingspacetoolkit.lib import ScenarioSelector, UnknownScenarioError
+from livingspacetoolkit.lib.root_finding import ConvergenceError
+
+
+SUNROOM_CONTROLLERS: dict[SunroomType, type[BaseSunroomController]] = {
+    SunroomType.STUDIO: StudioController,
+    SunroomType.CATHEDRAL: CathedralController,
+}
 
 
 class MainWindowController:
@@ -19,17 +30,58 @@ class MainWindowController:
         self.scenarios_view = scenarios_view
         self.results_view = results_view
         self.toolkit_state = toolkit_state
+        # The results of the last calculation. Calculations run on a pool thread over a snapshot of toolkit_state and
+        # come back through handle_calculation_finished, so the window never waits on them.
+        self.sunroom_model = SunroomModel()
+        self.calculation_runner = CalculationRunner()
 
-        # Controller for each tab
-        self.studio_controller = StudioController(self.tabs_view.studio_view, self.toolkit_state)
-        self.cathedral_controller = CathedralController(self.tabs_view.cathedral_view, self.toolkit_state)
+        # Controller for each tab. Each is made along with its tab's view, the first time the tab is opened.
+        self.sunroom_controllers: dict[SunroomType, BaseSunroomController] = {}
 
         # Connect signals
+        self.tabs_view.sunroom_view_created.connect(self.handle_sunroom_view_created)
         self.tabs_view.currentChanged.connect(self.handle_tab_change)
         self.scenarios_view.radio_group.buttonToggled.connect(self.handle_scenario_selected)
         self.results_view.calculate_button.clicked.connect(self.handle_results_button_click)
+        self.calculation_runner.finished.connect(self.handle_calculation_finished)
+        self.calculation_runner.failed.connect(self.handle_calculation_failed)
+        # Make the tab that is open at startup.
+        self.sunroom_controller(SunroomType(self.tabs_view.currentIndex()))
+
+    @property
+    def studio_controller(self) -> StudioController:
+        return self.sunroom_controller(SunroomType.STUDIO)
+
+    @property
+    def cathedral_controller(self) -> CathedralController:
+        return self.sunroom_controller(SunroomType.CATHEDRAL)
+
+    def sunroom_controller(self, sunroom_type: SunroomType) -> BaseSunroomController:
+        """Returns the controller for a tab, making the tab's view and controller if they haven't been made yet."""
+        self.tabs_view.sunroom_view(sunroom_type)
+        return self.sunroom_controllers[sunroom_type]
+
+    def handle_sunroom_view_created(self, sunroom_type: SunroomType) -> None:
+        view = self.tabs_view.sunroom_view(sunroom_type)
+        controller = SUNROOM_CONTROLLERS[sunroom_type](view, self.toolkit_state)
+        self.sunroom_controllers[sunroom_type] = controller
+        # Connected after the controller, so toolkit_state already has the edit when handle_input_edited runs.
+        for line_edit in view.findChildren(QLineEdit):
+            line_edit.editingFinished.connect(self.handle_input_edited)
+        for button in view.findChildren(QAbstractButton):
+            button.clicked.connect(self.handle_input_edited)
+        for combo_box in view.findChildren(QComboBox):
+            combo_box.currentIndexChanged.connect(self.handle_input_edited)
+        controller.set_to_default()
+
+    def handle_input_edited(self) -> None:
+        # A line edit also finishes editing when it only loses focus, so only a calculation whose inputs really
+        # changed is cancelled.
+        if self.calculation_runner.cancel_stale(self.toolkit_state):
+            self.results_view.results_view.clear()
 
     def handle_tab_change(self) -> None:
+        self.calculation_runner.cancel()
         self.toolkit_state.default_state()
         self.toolkit_state.sunroom_type = SunroomType(self.tabs_view.currentIndex())
         self.results_view.results_view.clear()
@@ -38,6 +90,7 @@ class MainWindowController:
         logger.debug(f'The sunroom type, {SunroomType(self.tabs_view.currentIndex()).name}, has been selected.')
 
     def handle_scenario_selected(self) -> None:
+        self.calculation_runner.cancel()
         for button in self.scenarios_view.scenario_dict.keys():
             if button.isChecked():
                 self.toolkit_state.scenario = self.scenarios_view.scenario_dict[button]
@@ -49,26 +102,54 @@ class MainWindowController:
         try:
             logger.debug("Checking if all fields are filled for selected scenario.")
             self.toolkit_state.check_calculation_ready()
-            logger.info(f"Calculating properties of {self.toolkit_state.sunroom_type.name} sunroom using scenario: {self.toolkit_state.scenario.name}")
-            sunroom_model = SunroomModel()
-            scenario = ScenarioSelector(self.toolkit_state).identify_scenario(sunroom_model)
-            scenario.calculate_sunroom_properties()
-            builder = SunroomBuilder(self.toolkit_state, sunroom_model)
-            builder.build_roof_components()
-            self.results_view.update_text(generate_results(self.toolkit_state, sunroom_model))
         except TypeError as err:
             self.tabs_view.show_warning(str(err))
             logger.warning(err)
+            return
+        logger.info(f"Calculating properties of {self.toolkit_state.sunroom_type.name} sunroom using scenario: {self.toolkit_state.scenario.name}")
+        self.calculation_runner.submit(self.toolkit_state)
+        self.results_view.update_text("Calculating...")
+
+    def handle_calculation_finished(self, request: CalculationRequest, result: SunroomResult) -> None:
+        if not request.matches(self.toolkit_state):
+            # An input was changed while it ran, so these results are for a sunroom that's no longer on screen.
+            logger.debug(f"Dropped calculation {request.generation}, the inputs changed while it ran.")
+            self.results_view.results_view.clear()
+            return
+        self.sunroom_model = result.to_sunroom_model()
+        try:
+            # The solved pitches and heights go back into the toolkit state for generate_results.
+            ScenarioSelector(self.toolkit_state).identify_scenario(self.sunroom_model).apply_outputs(result.outputs)
+            self.results_view.update_text(generate_results(self.toolkit_state, self.sunroom_model))
+        except Exception as err:
+            # Shown like a failed calculation, rather than left to the Qt event loop with "Calculating..." on screen.
+            self.handle_calculation_failed(request, err)
+
+    def handle_calculation_failed(self, request: CalculationRequest, err: Exception) -> None:
+        self.results_view.results_view.clear()
+        if not request.matches(self.toolkit_state):
+            logger.debug(f"Dropped calculation {request.generation}, the inputs changed while it ran.")
+            return
+        match err:
+            case ConvergenceError():
+                self.tabs_view.show_warning(f"Could not find a pitch for these inputs. {err}")
+                logger.error(err)
+            case TypeError():
+                self.tabs_view.show_warning(str(err))
+                logger.warning(err)
+            case UnknownScenarioError():
+                self.tabs_view.show_warning(str(err))
+                logger.error(err)
+            case _:
+                self.tabs_view.show_warning(str(err))
+                logger.error(err, exc_info=err)
 
     def set_to_default_state(self) -> None:
-        self.studio_controller.set_to_default()
-        self.cathedral_controller.set_to_default()
+        # Tabs that haven't been made yet are set to default when they are made.
+        for controller in self.sunroom_controllers.values():
+            controller.set_to_default()
         self.results_view.default_state()
 
     def update_to_scenario(self) -> None:
         self.results_view.results_view.clear()
-        match self.toolkit_state.sunroom_type:
-            case SunroomType.STUDIO:
-                self.studio_controller.update_to_scenario()
-            case SunroomType.CATHEDRAL:
-                self.cathedral_controller.update_to_scenario()
+        self.sunroom_controller(self.toolkit_state.sunroom_type).update_to_scenario()
@@ -1,9 +1,8 @@
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.views import StudioView
 from livingspacetoolkit.models import ToolkitStateModel, RoofModel
-from livingspacetoolkit.lib.toolkit_enums import (PitchType, SunroomType, RoofingType, EndCutType, Scenario,
-                                                  LengthType, SunroomSide)
-from livingspacetoolkit.utils.helpers import set_strikethrough
+from livingspacetoolkit.lib.toolkit_enums import (PitchType, SunroomType, RoofingType, EndCutType, LengthType,
+                                                  SunroomSide)
 from .base_sunroom_controller import BaseSunroomController
 
 
@@ -64,36 +63,5 @@ class StudioController(BaseSunroomController):
         self.set_to_default()
         self.sunroom_roof.enable_except_pitch()
         self.sunroom_floor.enable_floor_input()
-        match self.toolkit_state.scenario:
-            case Scenario.WALL_HEIGHT_PITCH:
-                self.sunroom_roof.pitch.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.b_wall_height_label, False)
-                self.sunroom_wall.b_wall_height_edit.setEnabled(True)
-            case Scenario.WALL_HEIGHT_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.b_wall_height_label, False)
-                self.sunroom_wall.b_wall_height_edit.setEnabled(True)
-            case Scenario.MAX_HEIGHT_PITCH:
-                self.sunroom_roof.pitch.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.max_height_label, False)
-                self.sunroom_wall.max_height_edit.setEnabled(True)
-            case Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.soffit_height_label, False)
-                self.sunroom_wall.soffit_height_edit.setEnabled(True)
-            case Scenario.SOFFIT_HEIGHT_PITCH:
-                self.sunroom_roof.pitch.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.soffit_height_label, False)
-                self.sunroom_wall.soffit_height_edit.setEnabled(True)
-            case Scenario.DRIP_EDGE_PEAK_HEIGHT:
-                set_strikethrough(self.sunroom_wall.peak_height_label, False)
-                self.sunroom_wall.peak_height_edit.setEnabled(True)
-                set_strikethrough(self.sunroom_wall.drip_edge_height_label, False)
-                self.sunroom_wall.drip_edge_height_edit.setEnabled(True)
-            case Scenario.DRIP_EDGE_PITCH:
-                self.sunroom_roof.pitch.enabled_state(self.toolkit_state.sunroom_type)
-                set_strikethrough(self.sunroom_wall.drip_edge_height_label, False)
-                self.sunroom_wall.drip_edge_height_edit.setEnabled(True)
+        self.enable_scenario_inputs()
         self.toolkit_state.default_state(sunroom= SunroomType.STUDIO, scenario=self.toolkit_state.scenario)
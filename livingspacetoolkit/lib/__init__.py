@@ -1,16 +1,34 @@
-from .toolkit_length import ToolkitLength
-from .toolkit_pitch import ToolkitPitch
-from .base_scenario_class import ScenarioSelector
-from .scenario_wall_height_pitch import WallHeightPitch
-from .scenario_wall_height_peak_height import WallHeightPeakHeight
-from .scenario_soffit_height_pitch import SoffitHeightPitch
-from .scenario_soffit_height_peak_height import SoffitHeightPeakHeight
-from .scenario_max_height_pitch import MaxHeightPitch
-from .scenario_drip_edge_pitch import DripEdgePitch
-from .scenario_drip_edge_peak_height import DripEdgePeakHeight
-from .sunroom_builder import SunroomBuilder
+from importlib import import_module
+
+# Where each name lives. Modules are only imported when one of their names is first used, so importing the package,
+# or one module in it, doesn't load the rest of the calculation code.
+_EXPORTS = {
+    "ToolkitLength": "toolkit_length", "FrozenToolkitLength": "toolkit_length", "ToolkitPitch": "toolkit_pitch",
+    "FrozenToolkitPitch": "toolkit_pitch", "ScenarioInputs": "scenario_core", "ScenarioOutputs": "scenario_core",
+    "ScenarioSelector": "base_scenario_class", "UnknownScenarioError": "base_scenario_class",
+    "register_solver": "base_scenario_class", "get_solver": "base_scenario_class", "solve": "base_scenario_class",
+    "WallHeightPitch": "scenario_wall_height_pitch", "WallHeightPeakHeight": "scenario_wall_height_peak_height",
+    "SoffitHeightPitch": "scenario_soffit_height_pitch", "SoffitHeightPeakHeight": "scenario_soffit_height_peak_height",
+    "MaxHeightPitch": "scenario_max_height_pitch", "DripEdgePitch": "scenario_drip_edge_pitch",
+    "DripEdgePeakHeight": "scenario_drip_edge_peak_height", "SunroomBuilder": "sunroom_builder",
+    "SunroomCalculator": "sunroom_calculator",
+}
 
 __all__ = [
-    "ToolkitLength", "ToolkitPitch", "ScenarioSelector", "WallHeightPitch", "WallHeightPeakHeight", "SoffitHeightPitch",
-    "SoffitHeightPeakHeight", "MaxHeightPitch", "DripEdgePitch", "DripEdgePeakHeight", "SunroomBuilder"
-]
\ No newline at end of file
+    "ToolkitLength", "FrozenToolkitLength", "ToolkitPitch", "FrozenToolkitPitch", "ScenarioInputs", "ScenarioOutputs",
+    "ScenarioSelector", "UnknownScenarioError", "register_solver", "get_solver", "solve", "WallHeightPitch",
+    "WallHeightPeakHeight", "SoffitHeightPitch", "SoffitHeightPeakHeight", "MaxHeightPitch", "DripEdgePitch",
+    "DripEdgePeakHeight", "SunroomBuilder", "SunroomCalculator"
+]
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,114 +1,182 @@
-from math import sin, cos, tan, pi
 from abc import ABC, abstractmethod
+from typing import Callable, Dict
 
 from livingspacetoolkit.config.log_config import logger
-from .toolkit_enums import Scenario, EndCutType
+from . import scenario_core
+from .scenario_core import ScenarioInputs, ScenarioOutputs
+from .toolkit_enums import Scenario, SunroomType, SunroomSide, LengthType
 from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
 
+ScenarioSolver = Callable[[ScenarioInputs], ScenarioOutputs]
+
+# Filled in as the scenario modules are imported. Looking up a solver is a single dictionary access.
+_SCENARIO_SOLVERS: Dict[tuple[Scenario, SunroomType], ScenarioSolver] = {}
+_SCENARIO_CLASSES: Dict[Scenario, type["BaseScenarioClass"]] = {}
+
+
+class UnknownScenarioError(LookupError):
+    """Raised when there is no solver registered for a scenario and sunroom type."""
+    def __init__(self, scenario: Scenario | None, sunroom_type: SunroomType | None) -> None:
+        scenario_name = scenario.name if isinstance(scenario, Scenario) else scenario
+        sunroom_name = sunroom_type.name if isinstance(sunroom_type, SunroomType) else sunroom_type
+        super().__init__(f"There is no solver for scenario {scenario_name} on a {sunroom_name} sunroom.")
+        self.scenario = scenario
+        self.sunroom_type = sunroom_type
+
+
+def register_solver(scenario: Scenario, sunroom_type: SunroomType, solver: ScenarioSolver | None = None):
+    """
+    Registers a function that solves a scenario for a sunroom type. Registering the same pair again replaces the
+    solver. Can be used as a decorator:
+
+        @register_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)
+        def my_solver(inputs: ScenarioInputs) -> ScenarioOutputs: ...
+
+    :param scenario: Scenario
+    :param sunroom_type: SunroomType
+    :param solver: Callable[[ScenarioInputs], ScenarioOutputs]
+    :return: The solver, or a decorator if no solver was given.
+    """
+    def decorator(func: ScenarioSolver) -> ScenarioSolver:
+        _SCENARIO_SOLVERS[(scenario, sunroom_type)] = func
+        return func
+
+    if solver is None:
+        return decorator
+    return decorator(solver)
+
+
+def get_solver(scenario: Scenario, sunroom_type: SunroomType) -> ScenarioSolver:
+    """
+    Returns the solver registered for a scenario and sunroom type. Raises UnknownScenarioError if there isn't one.
+    :param scenario: Scenario
+    :param sunroom_type: SunroomType
+    :return: Callable[[ScenarioInputs], ScenarioOutputs]
+    """
+    try:
+        return _SCENARIO_SOLVERS[(scenario, sunroom_type)]
+    except KeyError:
+        raise UnknownScenarioError(scenario, sunroom_type) from None
 
 
 class BaseScenarioClass(ABC):
-    """This is the base class for all scenario calculations. All scenarios must inherit this class."""
-    post_width = 3.25  # Business logic. The width of the center post. Used in cathedral calculations.
+    """This is the base class for all scenario calculations. All scenarios must inherit this class and name the
+    scenario they handle, e.g. class WallHeightPitch(BaseScenarioClass, scenario=Scenario.WALL_HEIGHT_PITCH). That
+    registers solve_studio and solve_cathedral with register_solver. The math lives in those two methods which only
+    read a ScenarioInputs record and return a ScenarioOutputs record. The class itself only moves values between
+    those records and the models. A solver registered on its own with register_solver needs no class, see
+    RegisteredSolverScenario."""
+    post_width = scenario_core.POST_WIDTH  # Business logic. The width of the center post. Used in cathedral calculations.
+    calculate_hypotenuse = staticmethod(scenario_core.calculate_hypotenuse)
+    calculate_triangle_height = staticmethod(scenario_core.calculate_triangle_height)
 
     @abstractmethod
     def __init__(self, toolkit_state_model: ToolkitStateModel, sunroom_model: SunroomModel) -> None:
         self.toolkit_state_model = toolkit_state_model
         self.sunroom_model = sunroom_model
 
-    @staticmethod
+    def __init_subclass__(cls, scenario: Scenario | None = None, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if scenario is None:
+            return
+        cls.scenario = scenario
+        _SCENARIO_CLASSES[scenario] = cls
+        register_solver(scenario, SunroomType.STUDIO, cls.solve_studio)
+        register_solver(scenario, SunroomType.CATHEDRAL, cls.solve_cathedral)
+
+    @classmethod
     @abstractmethod
-    def scenario_condition(scenario: Scenario) -> bool:
-        return False
+    def solve_studio(cls, inputs: ScenarioInputs) -> ScenarioOutputs:
+        pass
 
+    @classmethod
     @abstractmethod
-    def calculate_sunroom_properties(self) -> None:
+    def solve_cathedral(cls, inputs: ScenarioInputs) -> ScenarioOutputs:
         pass
 
-    @staticmethod
-    def calculate_hypotenuse(opposite: float, pitch: float) -> float:
-        """
-        Calculates the hypotenuse given pitch and the opposite (panel thickness). Pitch has to be in radians.
-        :param opposite: float
-        :param pitch: float
-        :return: float
-        """
-        if pitch == pi/2:
-            raise ZeroDivisionError("The pitch is 90 degrees?")
-        return opposite * (sin(pi / 2) / sin(pi / 2 - pitch))
+    def calculate_sunroom_properties(self) -> None:
+        # Through the registry, so a solver registered in place of solve_studio or solve_cathedral is the one used.
+        self.apply_outputs(solve(ScenarioInputs.from_toolkit_state(self.toolkit_state_model)))
 
-    def calculate_drip_edge(self, thickness: float, soffit: float, pitch: float) -> float:
+    def apply_outputs(self, outputs: ScenarioOutputs) -> None:
         """
-        Returns the drip edge height given the soffit and angled thickness. Returns in units of inches.
-
-        :param thickness: float: Panel thickness in inches
-        :param soffit: float: Soffit height in inches
-        :param pitch: float: Pitch in radians
+        Writes the solved values into toolkit_state_model and sunroom_model. Values that are None are left alone.
+        :param outputs: ScenarioOutputs
         :return:
         """
-        angled_thickness = self.calculate_hypotenuse(opposite=thickness, pitch=pitch)
-        if self.toolkit_state_model.end_cuts == EndCutType.PLUMB_CUT_TOP_BOTTOM:
-            drip_edge = soffit + angled_thickness
-        else:
-            drip_edge = soffit + thickness * cos(pitch)
-        return drip_edge
-
-    def estimate_drip_from_peak(self, peak: float, overhang: float, thickness: float, estimate_pitch: float,
-                                pitched_wall_length: float) -> float:
-        """
-        This method is used to help estimate the pitch. Since I forgot how to do numerical methods this will have to do.
-        All lengths must be in inches, the estimated pitch in radians, and this assumes you are cycling through a list
-        of pitches.
-        :param thickness: float: Panel thickness in inches
-        :param overhang: float: Overhang in inches
-        :param peak: float: Sunroom peak in inches
-        :param estimate_pitch: float: The estimated pitch of the room in radians
-        :param pitched_wall_length: float: The length of the pitched-side wall in inches
-        :return: float: Returns the drip edge height in inches
-        """
-        wall_height = peak - pitched_wall_length * tan(estimate_pitch)
-        soffit = wall_height - overhang * tan(estimate_pitch)
-
-        return self.calculate_drip_edge(thickness, soffit, estimate_pitch)
-
-    @staticmethod
-    def calculate_triangle_height(angle_1: float, angle_2: float, base_length: float) -> float:
-        """
-        This is business logic used to figure out the height of a triangle when only given the two base angles and base
-        width. Use the Sine Rule to figure out the missing angle, that same rule to get the hypotenuse of one side, and
-        finally the right angle rule to figure out the height of the triangle. This is used primarily to find the
-        difference between the calculated peak height and the peak height used in Fenevision which is at the base of the
-        post sitting at the center of a cathedral sunroom.
-        :param angle_1:
-        :param angle_2:
-        :param base_length:
-        :return: float: Returns the height of the triangle.
-        """
-        return base_length * sin(angle_1) * sin(angle_2) / sin(pi - angle_1 - angle_2)
-
+        pitches = {SunroomSide.A_SIDE: outputs.pitch_a, SunroomSide.B_SIDE: outputs.pitch_b,
+                   SunroomSide.C_SIDE: outputs.pitch_c}
+        heights = {
+            (None, LengthType.PEAK_HEIGHT): outputs.peak_height,
+            (None, LengthType.MAX_HEIGHT): outputs.max_height,
+            (SunroomSide.A_SIDE, LengthType.WALL_HEIGHT): outputs.wall_height_a,
+            (SunroomSide.B_SIDE, LengthType.WALL_HEIGHT): outputs.wall_height_b,
+            (SunroomSide.C_SIDE, LengthType.WALL_HEIGHT): outputs.wall_height_c,
+            (SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT): outputs.soffit_height_a,
+            (SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT): outputs.soffit_height_b,
+            (SunroomSide.C_SIDE, LengthType.SOFFIT_HEIGHT): outputs.soffit_height_c,
+            (SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT): outputs.drip_edge_height_a,
+            (SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT): outputs.drip_edge_height_b,
+            (SunroomSide.C_SIDE, LengthType.DRIP_EDGE_HEIGHT): outputs.drip_edge_height_c,
+        }
+        gable_walls = {SunroomSide.A_SIDE: outputs.gable_wall_a, SunroomSide.B_SIDE: outputs.gable_wall_b,
+                       SunroomSide.C_SIDE: outputs.gable_wall_c}
+        for sunroom_side, pitch in pitches.items():
+            if pitch is not None:
+                self.toolkit_state_model.pitch[sunroom_side].radians = pitch
+        for key, height in heights.items():
+            if height is not None:
+                self.toolkit_state_model.wall_heights[key].length = height
+        for sunroom_side, gable_wall in gable_walls.items():
+            if gable_wall is not None:
+                self.sunroom_model.gable_wall[sunroom_side].length = gable_wall
+
+
+def solve(inputs: ScenarioInputs) -> ScenarioOutputs:
+    """
+    Solves a sunroom without touching any models. The same inputs always give the same outputs so it is safe to call
+    from any thread and the results can be cached by their inputs. Raises UnknownScenarioError if nothing is
+    registered for the scenario and sunroom type.
+    :param inputs: ScenarioInputs
+    :return: ScenarioOutputs
+    """
+    return get_solver(inputs.scenario, inputs.sunroom_type)(inputs)
+
+
+class RegisteredSolverScenario(BaseScenarioClass):
+    """Moves values between the models and a solver that was registered with register_solver without a scenario
+    class of its own."""
 
-class UnknownScenario(BaseScenarioClass):
-    """A scenario that cannot be identified from the list of scenarios"""
-    def __init__(self):
-        pass
+    def __init__(self, toolkit_state_model: ToolkitStateModel, sunroom_model: SunroomModel) -> None:
+        self.toolkit_state_model = toolkit_state_model
+        self.sunroom_model = sunroom_model
+        self.scenario = toolkit_state_model.scenario
 
-    @staticmethod
-    def scenario_condition(scenario: Scenario) -> bool:
-        return False
+    @classmethod
+    def solve_studio(cls, inputs: ScenarioInputs) -> ScenarioOutputs:
+        return get_solver(inputs.scenario, SunroomType.STUDIO)(inputs)
 
-    def calculate_sunroom_properties(self) -> None:
-        raise NotImplementedError
+    @classmethod
+    def solve_cathedral(cls, inputs: ScenarioInputs) -> ScenarioOutputs:
+        return get_solver(inputs.scenario, SunroomType.CATHEDRAL)(inputs)
 
 
 class ScenarioSelector:
     def __init__(self, toolkit_state_model: ToolkitStateModel) -> None:
         self.toolkit_state_model = toolkit_state_model
 
-    def identify_scenario(self, sunroom_model: SunroomModel):
-        for scenario_cls in BaseScenarioClass.__subclasses__():
-            try:
-                if scenario_cls.scenario_condition(self.toolkit_state_model.scenario):
-                    return scenario_cls(self.toolkit_state_model, sunroom_model)
-            except KeyError:
-                pass
-        return UnknownScenario
\ No newline at end of file
+    def identify_scenario(self, sunroom_model: SunroomModel) -> BaseScenarioClass:
+        scenario = self.toolkit_state_model.scenario
+        sunroom_type = self.toolkit_state_model.sunroom_type
+        if (scenario, sunroom_type) not in _SCENARIO_SOLVERS:
+            raise UnknownScenarioError(scenario, sunroom_type)
+        scenario_cls = _SCENARIO_CLASSES.get(scenario, RegisteredSolverScenario)
+        logger.debug(f"Selecting {scenario_cls.__name__} class for calculations.")
+        return scenario_cls(self.toolkit_state_model, sunroom_model)
+
+
+# Each scenario module registers its solvers and class when it is imported, so importing this module is enough to
+# solve any scenario. They import this module, which is fully defined by now.
+from . import (scenario_wall_height_pitch, scenario_wall_height_peak_height, scenario_soffit_height_pitch,  # noqa: E402, F401
+               scenario_soffit_height_peak_height, scenario_max_height_pitch, scenario_drip_edge_pitch,
+               scenario_drip_edge_peak_height)
@@ -0,0 +1,347 @@
+from math import pi
+from typing import Callable, Dict, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from livingspacetoolkit.config.log_config import logger
+from .scenario_core import MAX_PITCH, POST_WIDTH
+from .toolkit_enums import Scenario, SunroomType, EndCutType
+
+# The solvers registered with register_solver, i.e. solve_studio and solve_cathedral of each scenario class, are the
+# one source of truth for the geometry. The functions here are the same formulas written over NumPy columns. A change
+# to a scenario has to be made here too: tests/core/test_batch_solver.py checks every output of every scenario and
+# sunroom type against solve.
+BATCH_INPUT_COLUMNS = (
+    "wall_width_a", "wall_width_b", "wall_width_c", "overhang", "thickness", "end_cuts",
+    "pitch_a", "pitch_b", "pitch_c", "peak_height", "max_height",
+    "wall_height_a", "wall_height_b", "wall_height_c",
+    "soffit_height_a", "soffit_height_b", "soffit_height_c",
+    "drip_edge_height_a", "drip_edge_height_b", "drip_edge_height_c",
+)
+BATCH_OUTPUT_COLUMNS = (
+    "pitch_a", "pitch_b", "pitch_c", "peak_height", "max_height",
+    "wall_height_a", "wall_height_b", "wall_height_c",
+    "soffit_height_a", "soffit_height_b", "soffit_height_c",
+    "drip_edge_height_a", "drip_edge_height_b", "drip_edge_height_c",
+    "gable_wall_a", "gable_wall_b", "gable_wall_c",
+)
+# The columns every scenario needs no matter which heights and pitch are given.
+_COMMON_COLUMNS = ("wall_width_a", "wall_width_b", "wall_width_c", "overhang", "thickness", "end_cuts")
+
+
+def _hypotenuse(thickness: np.ndarray, pitch: np.ndarray) -> np.ndarray:
+    return thickness * (np.sin(pi / 2) / np.sin(pi / 2 - pitch))
+
+
+def _drip_edge(thickness: np.ndarray, soffit: np.ndarray, pitch: np.ndarray, plumb_cut: np.ndarray) -> np.ndarray:
+    return np.where(plumb_cut, soffit + _hypotenuse(thickness, pitch), soffit + thickness * np.cos(pitch))
+
+
+def _triangle_height(angle_1: np.ndarray, angle_2: np.ndarray, base_length: np.ndarray | float) -> np.ndarray:
+    return base_length * np.sin(angle_1) * np.sin(angle_2) / np.sin(pi - angle_1 - angle_2)
+
+
+def _pitch_from_drip_edge(peak: np.ndarray, overhang: np.ndarray, thickness: np.ndarray, drip_edge: np.ndarray,
+                          pitched_wall_length: np.ndarray, plumb_cut: np.ndarray, iterations: int = 64) -> np.ndarray:
+    """Vectorized bisection on [0, MAX_PITCH]. The drip edge drops as the pitch rises so every row with a solution is
+    bracketed. Rows without a solution are NaN."""
+    def residual(pitch: np.ndarray) -> np.ndarray:
+        soffit = peak - (pitched_wall_length + overhang) * np.tan(pitch)
+        return _drip_edge(thickness, soffit, pitch, plumb_cut) - drip_edge
+
+    lower = np.zeros_like(peak)
+    upper = np.full_like(peak, MAX_PITCH)
+    bracketed = (residual(lower) >= 0) & (residual(upper) <= 0)
+    for _ in range(iterations):
+        middle = (lower + upper) / 2
+        above = residual(middle) > 0
+        lower = np.where(above, middle, lower)
+        upper = np.where(above, upper, middle)
+    pitch = (lower + upper) / 2
+    if not bracketed.all():
+        logger.warning(f"Could not find a pitch for {np.count_nonzero(~bracketed)} rows.")
+    return np.where(bracketed, pitch, np.nan)
+
+
+def _studio_gable_wall(c: Dict[str, np.ndarray]) -> np.ndarray:
+    # Same as ScenarioInputs.studio_gable_wall.
+    return c["wall_width_a"]
+
+
+def _studio_wall_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    pitch = c["pitch_b"]
+    wall_height = c["wall_height_b"]
+    soffit = wall_height - c["overhang"] * np.tan(pitch)
+    peak = wall_height + gable_wall * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak,
+               max_height=peak + _hypotenuse(c["thickness"], pitch),
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_wall_height_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    peak = c["peak_height"]
+    wall_height = c["wall_height_b"]
+    pitch = np.arctan((peak - wall_height) / gable_wall)
+    soffit = wall_height - c["overhang"] * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak,
+               max_height=peak + _hypotenuse(c["thickness"], pitch),
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_max_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    pitch = c["pitch_b"]
+    max_height = c["max_height"]
+    hypotenuse = _hypotenuse(c["thickness"], pitch)
+    wall_height = max_height - gable_wall * np.tan(pitch) - hypotenuse
+    # Matches MaxHeightPitch, which measures the soffit from the gable wall length.
+    soffit = gable_wall - c["overhang"] * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=max_height - hypotenuse, max_height=max_height,
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_soffit_height_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    peak = c["peak_height"]
+    soffit = c["soffit_height_b"]
+    pitch = np.arctan((peak - soffit) / (gable_wall + c["overhang"]))
+    wall_height = soffit + c["overhang"] * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak,
+               max_height=peak + _hypotenuse(c["thickness"], pitch),
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_soffit_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    pitch = c["pitch_b"]
+    soffit = c["soffit_height_b"]
+    wall_height = soffit + c["overhang"] * np.tan(pitch)
+    peak = wall_height + gable_wall * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak,
+               max_height=peak + _hypotenuse(c["thickness"], pitch),
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_drip_edge_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    peak = c["peak_height"]
+    pitch = _pitch_from_drip_edge(peak, c["overhang"], c["thickness"], c["drip_edge_height_b"], gable_wall,
+                                  c["plumb_cut"])
+    wall_height = peak - gable_wall * np.tan(pitch)
+    soffit = wall_height - c["overhang"] * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak,
+               max_height=peak + _hypotenuse(c["thickness"], pitch),
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _studio_drip_edge_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = _studio_gable_wall(c)
+    pitch = c["pitch_b"]
+    hypotenuse = _hypotenuse(c["thickness"], pitch)
+    soffit = c["drip_edge_height_b"] - hypotenuse
+    wall_height = soffit + c["overhang"] * np.tan(pitch)
+    peak = wall_height + gable_wall * np.tan(pitch)
+    out.update(pitch_b=pitch, soffit_height_b=soffit, peak_height=peak, max_height=peak + hypotenuse,
+               drip_edge_height_b=_drip_edge(c["thickness"], soffit, pitch, c["plumb_cut"]),
+               wall_height_a=wall_height, wall_height_b=wall_height, wall_height_c=wall_height, gable_wall_b=gable_wall)
+
+
+def _cathedral_max_height(c: Dict[str, np.ndarray], fenevision_peak: np.ndarray, pitch_a: np.ndarray,
+                          pitch_c: np.ndarray) -> np.ndarray:
+    return (fenevision_peak + np.maximum(_hypotenuse(c["thickness"], pitch_a), _hypotenuse(c["thickness"], pitch_c))
+            + _triangle_height(pitch_a, pitch_c, POST_WIDTH))
+
+
+def _cathedral_drip_edges(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray], soffit_a: np.ndarray,
+                          soffit_c: np.ndarray, pitch_a: np.ndarray, pitch_c: np.ndarray) -> None:
+    out.update(drip_edge_height_a=_drip_edge(c["thickness"], soffit_a, pitch_a, c["plumb_cut"]),
+               drip_edge_height_c=_drip_edge(c["thickness"], soffit_c, pitch_c, c["plumb_cut"]))
+
+
+def _cathedral_wall_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    pitch_a, pitch_c = c["pitch_a"], c["pitch_c"]
+    wall_height_a, wall_height_c = c["wall_height_a"], c["wall_height_c"]
+    soffit_a = wall_height_a - c["overhang"] * np.tan(pitch_a)
+    soffit_c = wall_height_c - c["overhang"] * np.tan(pitch_c)
+    peak = _triangle_height(pitch_a, pitch_c, gable_wall) + np.maximum(wall_height_a, wall_height_c)
+    fenevision_peak = peak - _triangle_height(pitch_a, pitch_c, POST_WIDTH)
+    out.update(pitch_a=pitch_a, pitch_c=pitch_c, wall_height_a=wall_height_a, wall_height_c=wall_height_c,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=_cathedral_max_height(c, fenevision_peak, pitch_a, pitch_c),
+               gable_wall_a=gable_wall / 2, gable_wall_c=gable_wall / 2)
+    _cathedral_drip_edges(c, out, soffit_a, soffit_c, pitch_a, pitch_c)
+
+
+def _cathedral_wall_height_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    fenevision_peak = c["peak_height"]
+    wall_height_a, wall_height_c = c["wall_height_a"], c["wall_height_c"]
+    pitch_a = np.arctan2(fenevision_peak - wall_height_a, gable_wall / 2 - POST_WIDTH / 2)
+    pitch_c = np.arctan2(fenevision_peak - wall_height_c, gable_wall / 2 - POST_WIDTH / 2)
+    soffit_a = wall_height_a - c["overhang"] * np.tan(pitch_a)
+    soffit_c = wall_height_c - c["overhang"] * np.tan(pitch_c)
+    out.update(pitch_a=pitch_a, pitch_c=pitch_c, wall_height_a=wall_height_a, wall_height_c=wall_height_c,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=_cathedral_max_height(c, fenevision_peak, pitch_a, pitch_c),
+               gable_wall_a=gable_wall / 2, gable_wall_c=gable_wall / 2)
+    _cathedral_drip_edges(c, out, soffit_a, soffit_c, pitch_a, pitch_c)
+
+
+def _cathedral_max_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    pitch_a, pitch_c = c["pitch_a"], c["pitch_c"]
+    max_height = c["max_height"]
+    peak = _triangle_height(pitch_a, pitch_c, gable_wall)
+    hypotenuse = np.maximum(_hypotenuse(c["thickness"], pitch_a), _hypotenuse(c["thickness"], pitch_c))
+    fenevision_peak = max_height - hypotenuse - _triangle_height(pitch_a, pitch_c, POST_WIDTH)
+    wall_height = max_height - hypotenuse - peak
+    soffit_a = wall_height - c["overhang"] * np.tan(pitch_a)
+    soffit_c = wall_height - c["overhang"] * np.tan(pitch_c)
+    out.update(pitch_a=pitch_a, pitch_c=pitch_c, wall_height_a=wall_height, wall_height_c=wall_height,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=max_height, gable_wall_a=peak / np.tan(pitch_a), gable_wall_c=peak / np.tan(pitch_c))
+    _cathedral_drip_edges(c, out, soffit_a, soffit_c, pitch_a, pitch_c)
+
+
+def _cathedral_soffit_height_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    fenevision_peak = c["peak_height"]
+    soffit_a, soffit_c = c["soffit_height_a"], c["soffit_height_c"]
+    soffit = np.maximum(soffit_a, soffit_c)
+    pitch = np.arctan((fenevision_peak - soffit) / (gable_wall / 2 + c["overhang"] - POST_WIDTH / 2))
+    # Matches SoffitHeightPeakHeight, which measures both walls from the A side soffit.
+    wall_height = soffit_a + c["overhang"] * np.tan(pitch)
+    out.update(pitch_a=pitch, pitch_c=pitch, wall_height_a=wall_height, wall_height_c=wall_height,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=_cathedral_max_height(c, fenevision_peak, pitch, pitch),
+               gable_wall_a=gable_wall / 2, gable_wall_c=gable_wall / 2)
+    _cathedral_drip_edges(c, out, soffit_a, soffit_c, pitch, pitch)
+
+
+def _cathedral_soffit_height_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    pitch_a, pitch_c = c["pitch_a"], c["pitch_c"]
+    soffit_a, soffit_c = c["soffit_height_a"], c["soffit_height_c"]
+    soffit = np.maximum(soffit_a, soffit_c)
+    # Matches SoffitHeightPitch, which measures both walls from the A side soffit.
+    wall_height_a = soffit_a + c["overhang"] * np.tan(pitch_a)
+    wall_height_c = soffit_a + c["overhang"] * np.tan(pitch_c)
+    tallest_wall = np.maximum(wall_height_a, wall_height_c)
+    peak = _triangle_height(pitch_a, pitch_c, gable_wall) + tallest_wall
+    fenevision_peak = peak - _triangle_height(pitch_a, pitch_c, POST_WIDTH)
+    out.update(pitch_a=pitch_a, pitch_c=pitch_c, wall_height_a=wall_height_a, wall_height_c=wall_height_c,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=_cathedral_max_height(c, fenevision_peak, pitch_a, pitch_c),
+               gable_wall_a=(peak - tallest_wall) / np.tan(pitch_a),
+               gable_wall_c=(peak - tallest_wall) / np.tan(pitch_c))
+    _cathedral_drip_edges(c, out, soffit, soffit, pitch_a, pitch_c)
+
+
+def _cathedral_drip_edge_peak_height(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    fenevision_peak = c["peak_height"]
+    half_gable = gable_wall / 2 - POST_WIDTH / 2
+    # There's only one input for drip edge.
+    pitch = _pitch_from_drip_edge(fenevision_peak, c["overhang"], c["thickness"], c["drip_edge_height_a"],
+                                  half_gable, c["plumb_cut"])
+    wall_height = fenevision_peak - half_gable * np.tan(pitch)
+    soffit = wall_height - c["overhang"] * np.tan(pitch)
+    out.update(pitch_a=pitch, pitch_c=pitch, wall_height_a=wall_height, wall_height_c=wall_height,
+               soffit_height_a=soffit, soffit_height_c=soffit, peak_height=fenevision_peak,
+               max_height=(fenevision_peak + _hypotenuse(c["thickness"], pitch)
+                           + _triangle_height(pitch, pitch, POST_WIDTH)),
+               drip_edge_height_a=c["drip_edge_height_a"], drip_edge_height_c=c["drip_edge_height_c"],
+               gable_wall_a=gable_wall / 2, gable_wall_c=gable_wall / 2)
+
+
+def _cathedral_drip_edge_pitch(c: Dict[str, np.ndarray], out: Dict[str, np.ndarray]) -> None:
+    gable_wall = c["wall_width_b"]
+    pitch_a, pitch_c = c["pitch_a"], c["pitch_c"]
+    soffit_a = c["drip_edge_height_a"] - _hypotenuse(c["thickness"], pitch_a)
+    soffit_c = c["drip_edge_height_c"] - _hypotenuse(c["thickness"], pitch_c)
+    soffit = np.maximum(soffit_a, soffit_c)
+    wall_height_a = soffit + c["overhang"] * np.tan(pitch_a)
+    wall_height_c = soffit + c["overhang"] * np.tan(pitch_c)
+    tallest_wall = np.maximum(wall_height_a, wall_height_c)
+    peak = _triangle_height(pitch_a, pitch_c, gable_wall) + tallest_wall
+    fenevision_peak = peak - _triangle_height(pitch_a, pitch_c, POST_WIDTH)
+    out.update(pitch_a=pitch_a, pitch_c=pitch_c, wall_height_a=wall_height_a, wall_height_c=wall_height_c,
+               soffit_height_a=soffit_a, soffit_height_c=soffit_c, peak_height=fenevision_peak,
+               max_height=_cathedral_max_height(c, fenevision_peak, pitch_a, pitch_c),
+               gable_wall_a=(peak - tallest_wall) / np.tan(pitch_a),
+               gable_wall_c=(peak - tallest_wall) / np.tan(pitch_c))
+    _cathedral_drip_edges(c, out, soffit_a, soffit_c, pitch_a, pitch_c)
+
+
+_BATCH_SOLVERS: Dict[tuple[Scenario, SunroomType],
+                     tuple[tuple[str, ...], Callable[[Dict[str, np.ndarray], Dict[str, np.ndarray]], None]]] = {
+    (Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO): (("pitch_b", "wall_height_b"), _studio_wall_height_pitch),
+    (Scenario.WALL_HEIGHT_PEAK_HEIGHT, SunroomType.STUDIO): (("peak_height", "wall_height_b"),
+                                                             _studio_wall_height_peak_height),
+    (Scenario.MAX_HEIGHT_PITCH, SunroomType.STUDIO): (("pitch_b", "max_height"), _studio_max_height_pitch),
+    (Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT, SunroomType.STUDIO): (("peak_height", "soffit_height_b"),
+                                                               _studio_soffit_height_peak_height),
+    (Scenario.SOFFIT_HEIGHT_PITCH, SunroomType.STUDIO): (("pitch_b", "soffit_height_b"), _studio_soffit_height_pitch),
+    (Scenario.DRIP_EDGE_PEAK_HEIGHT, SunroomType.STUDIO): (("peak_height", "drip_edge_height_b"),
+                                                           _studio_drip_edge_peak_height),
+    (Scenario.DRIP_EDGE_PITCH, SunroomType.STUDIO): (("pitch_b", "drip_edge_height_b"), _studio_drip_edge_pitch),
+    (Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL): (("pitch_a", "pitch_c", "wall_height_a", "wall_height_c"),
+                                                          _cathedral_wall_height_pitch),
+    (Scenario.WALL_HEIGHT_PEAK_HEIGHT, SunroomType.CATHEDRAL): (("peak_height", "wall_height_a", "wall_height_c"),
+                                                                _cathedral_wall_height_peak_height),
+    (Scenario.MAX_HEIGHT_PITCH, SunroomType.CATHEDRAL): (("pitch_a", "pitch_c", "max_height"),
+                                                         _cathedral_max_height_pitch),
+    (Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT, SunroomType.CATHEDRAL): (("peak_height", "soffit_height_a",
+                                                                   "soffit_height_c"),
+                                                                  _cathedral_soffit_height_peak_height),
+    (Scenario.SOFFIT_HEIGHT_PITCH, SunroomType.CATHEDRAL): (("pitch_a", "pitch_c", "soffit_height_a",
+                                                             "soffit_height_c"), _cathedral_soffit_height_pitch),
+    (Scenario.DRIP_EDGE_PEAK_HEIGHT, SunroomType.CATHEDRAL): (("peak_height", "drip_edge_height_a",
+                                                               "drip_edge_height_c"),
+                                                              _cathedral_drip_edge_peak_height),
+    (Scenario.DRIP_EDGE_PITCH, SunroomType.CATHEDRAL): (("pitch_a", "pitch_c", "drip_edge_height_a",
+                                                         "drip_edge_height_c"), _cathedral_drip_edge_pitch),
+}
+
+
+def solve_batch(scenario: Scenario, sunroom_type: SunroomType, columns: Mapping[str, ArrayLike]) -> Dict[str, np.ndarray]:
+    """
+    Solves many sunrooms of the same scenario and sunroom type at once. This gives the same numbers as solve but works
+    on whole columns with NumPy instead of one ScenarioInputs at a time.
+
+    The input columns are named in BATCH_INPUT_COLUMNS. Every scenario needs the wall widths, overhang, thickness and
+    end_cuts (the EndCutType value) plus the pitch and heights of the scenario. Pitches are in radians and lengths are in
+    inches. Columns the scenario doesn't use are ignored.
+
+    The output has every column in BATCH_OUTPUT_COLUMNS. Values that don't apply to the sunroom type, like the A side
+    pitch of a studio, are NaN. So are the rows of DRIP_EDGE_PEAK_HEIGHT where no pitch gives the drip edge. The
+    business limits of ToolkitLength and ToolkitPitch are not applied.
+    :param scenario: Scenario
+    :param sunroom_type: SunroomType
+    :param columns: Mapping[str, ArrayLike]: Input columns of equal length
+    :return: Dict[str, np.ndarray]: Output columns
+    """
+    try:
+        required, solver = _BATCH_SOLVERS[(scenario, sunroom_type)]
+    except KeyError:
+        raise ValueError(f"There is no batch solver for {scenario} and {sunroom_type}.") from None
+    missing = [name for name in _COMMON_COLUMNS + required if name not in columns]
+    if missing:
+        raise ValueError(f"Missing input columns for {scenario.name}: {', '.join(missing)}")
+    c = {name: np.asarray(columns[name], dtype=np.float64) for name in _COMMON_COLUMNS + required
+         if name != "end_cuts"}
+    c["plumb_cut"] = np.asarray(columns["end_cuts"]) == EndCutType.PLUMB_CUT_TOP_BOTTOM.value
+    size = np.broadcast_shapes(*(column.shape for column in c.values()))
+    out = {name: np.full(size, np.nan) for name in BATCH_OUTPUT_COLUMNS}
+    solver(c, out)
+    return {name: np.broadcast_to(np.asarray(value, dtype=np.float64), size).copy() for name, value in out.items()}
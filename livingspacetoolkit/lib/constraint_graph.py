@@ -0,0 +1,195 @@
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from math import atan, tan
+from typing import Callable, Dict, Iterable
+
+from livingspacetoolkit.config.log_config import logger
+from .root_finding import ConvergenceError, brent
+from .scenario_core import (MAX_PITCH, POST_WIDTH, ScenarioInputs, ScenarioOutputs, calculate_drip_edge,
+                            calculate_hypotenuse)
+from .toolkit_enums import EndCutType, SunroomType
+
+PITCH = "pitch"
+WALL_HEIGHT = "wall_height"
+SOFFIT_HEIGHT = "soffit_height"
+DRIP_EDGE_HEIGHT = "drip_edge_height"
+PEAK_HEIGHT = "peak_height"
+MAX_HEIGHT = "max_height"
+HEIGHTS = (WALL_HEIGHT, SOFFIT_HEIGHT, DRIP_EDGE_HEIGHT, PEAK_HEIGHT, MAX_HEIGHT)
+
+
+@dataclass(frozen=True, slots=True)
+class RoofPlane:
+    """One pitched side of a roof. Lengths are in inches.
+    run: The horizontal distance from the wall to the peak
+    ridge_offset: Extra rise at the peak that only counts toward the max height. On a cathedral it is half the post
+    width because the peak is measured at the base of the post."""
+    run: float
+    overhang: float
+    thickness: float
+    end_cuts: EndCutType
+    ridge_offset: float = 0.0
+
+    @classmethod
+    def from_inputs(cls, inputs: ScenarioInputs) -> "RoofPlane":
+        """The roof plane the scenario classes use. Cathedral sunrooms are treated as symmetric."""
+        match inputs.sunroom_type:
+            case SunroomType.STUDIO:
+                return cls(inputs.studio_gable_wall, inputs.overhang, inputs.thickness, inputs.end_cuts)
+            case SunroomType.CATHEDRAL:
+                return cls(inputs.wall_width_b / 2 - POST_WIDTH / 2, inputs.overhang, inputs.thickness,
+                           inputs.end_cuts, POST_WIDTH / 2)
+            case _:
+                raise NotImplementedError
+
+
+@dataclass(frozen=True, slots=True)
+class Relation:
+    """An edge of the graph: child = parent + delta(plane, pitch). slope is set when delta is slope(plane)*tan(pitch),
+    which lets a pitch be solved in closed form."""
+    parent: str
+    child: str
+    delta: Callable[[RoofPlane, float], float]
+    slope: Callable[[RoofPlane], float] | None = None
+
+
+# The wall height is the root. Every other height hangs off it by exactly one path.
+RELATIONS = (
+    Relation(WALL_HEIGHT, SOFFIT_HEIGHT, lambda plane, pitch: -plane.overhang * tan(pitch),
+             lambda plane: -plane.overhang),
+    Relation(SOFFIT_HEIGHT, DRIP_EDGE_HEIGHT,
+             lambda plane, pitch: calculate_drip_edge(plane.thickness, 0.0, pitch, plane.end_cuts)),
+    Relation(WALL_HEIGHT, PEAK_HEIGHT, lambda plane, pitch: plane.run * tan(pitch), lambda plane: plane.run),
+    Relation(PEAK_HEIGHT, MAX_HEIGHT,
+             lambda plane, pitch: calculate_hypotenuse(plane.thickness, pitch) + plane.ridge_offset * tan(pitch)),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Step:
+    """Sets target = source + sign * relation.delta(plane, pitch)."""
+    target: str
+    source: str
+    relation: Relation
+    sign: int
+
+
+@dataclass(frozen=True, slots=True)
+class SolvePlan:
+    """The precompiled order of evaluation for one pair of knowns. pitch_path is the signed chain of relations between
+    two known heights. It is empty when the pitch is one of the knowns."""
+    knowns: frozenset[str]
+    start: str
+    pitch_path: tuple[tuple[Relation, int], ...]
+    steps: tuple[Step, ...]
+
+    def run(self, plane: RoofPlane, knowns: Dict[str, float], max_pitch: float = MAX_PITCH,
+            tolerance: float = 1e-12, max_iterations: int = 100) -> Dict[str, float]:
+        values = dict(knowns)
+        if PITCH not in values:
+            values[PITCH] = self._solve_pitch(plane, values, max_pitch, tolerance, max_iterations)
+        pitch = values[PITCH]
+        for step in self.steps:
+            values[step.target] = values[step.source] + step.sign * step.relation.delta(plane, pitch)
+        return values
+
+    def _solve_pitch(self, plane: RoofPlane, values: Dict[str, float], max_pitch: float, tolerance: float,
+                     max_iterations: int) -> float:
+        end = self.pitch_path_end
+        rise = values[end] - values[self.start]
+        slopes = [relation.slope for relation, _ in self.pitch_path]
+        if all(slopes):
+            run = sum(sign * relation.slope(plane) for relation, sign in self.pitch_path)
+            pitch = atan(rise / run) if run else float("nan")
+            if not 0 <= pitch <= max_pitch:
+                raise ConvergenceError(f"No pitch between 0 and {max_pitch} radians gives a {self.start} and "
+                                       f"{end} of {values[self.start]} and {values[end]}.")
+            return pitch
+
+        def residual(pitch: float) -> float:
+            return sum(sign * relation.delta(plane, pitch) for relation, sign in self.pitch_path) - rise
+
+        result = brent(residual, 0.0, max_pitch, tolerance, max_iterations)
+        logger.debug(f"Solved the pitch from {self.start} and {end} in {result.iterations} iterations.")
+        return result.root
+
+    @property
+    def pitch_path_end(self) -> str:
+        (other,) = self.knowns - {self.start}
+        return other
+
+
+def _neighbours(name: str) -> Iterable[tuple[str, Relation, int]]:
+    for relation in RELATIONS:
+        if relation.parent == name:
+            yield relation.child, relation, 1
+        elif relation.child == name:
+            yield relation.parent, relation, -1
+
+
+@lru_cache(maxsize=None)
+def compile_plan(knowns: frozenset[str]) -> SolvePlan:
+    """
+    Builds the evaluation plan for a pair of knowns. The knowns are two of the heights, or the pitch and one height.
+    Plans are cached so each pair is only compiled once.
+    :param knowns: frozenset[str]: Names from HEIGHTS and PITCH
+    :return: SolvePlan
+    """
+    unknown_names = knowns - set(HEIGHTS) - {PITCH}
+    if unknown_names:
+        raise ValueError(f"Unknown values: {', '.join(sorted(unknown_names))}")
+    if len(knowns) != 2:
+        raise ValueError(f"Exactly two values must be known, got {len(knowns)}.")
+    start = next(name for name in HEIGHTS if name in knowns)
+    # Walk the tree out from the first known height. The order of the walk is the order of evaluation.
+    steps: list[Step] = []
+    parents: Dict[str, Step | None] = {start: None}
+    queue = deque([start])
+    while queue:
+        name = queue.popleft()
+        for neighbour, relation, sign in _neighbours(name):
+            if neighbour not in parents:
+                step = Step(neighbour, name, relation, sign)
+                parents[neighbour] = step
+                queue.append(neighbour)
+                if neighbour not in knowns:
+                    steps.append(step)
+    pitch_path: list[tuple[Relation, int]] = []
+    if PITCH not in knowns:
+        (end,) = knowns - {start}
+        while parents[end] is not None:
+            pitch_path.insert(0, (parents[end].relation, parents[end].sign))
+            end = parents[end].source
+    return SolvePlan(knowns, start, tuple(pitch_path), tuple(steps))
+
+
+def solve_roof(plane: RoofPlane, max_pitch: float = MAX_PITCH, **knowns: float) -> Dict[str, float]:
+    """
+    Solves every height and the pitch of a roof plane from any two of them, e.g.
+    solve_roof(plane, wall_height=100, drip_edge_height=92). Raises ConvergenceError if no pitch up to max_pitch fits
+    the knowns.
+    :param plane: RoofPlane
+    :param max_pitch: float: The steepest pitch allowed in radians
+    :param knowns: float: Two of pitch (radians), wall_height, soffit_height, drip_edge_height, peak_height and
+    max_height in inches
+    :return: Dict[str, float]: The pitch and all five heights
+    """
+    return compile_plan(frozenset(knowns)).run(plane, knowns, max_pitch)
+
+
+def solve_studio_roof(inputs: ScenarioInputs, **knowns: float) -> ScenarioOutputs:
+    """
+    Solves the B side of a studio from two of its values, e.g. solve_studio_roof(inputs, pitch=inputs.pitch_b,
+    wall_height=inputs.wall_height_b), for the scenarios whose geometry is exactly the graph's.
+    :param inputs: ScenarioInputs
+    :param knowns: float: Two of pitch, wall_height, soffit_height, drip_edge_height, peak_height and max_height
+    :return: ScenarioOutputs: Everything but the knowns. The A and C walls are as tall as the B wall.
+    """
+    values = solve_roof(RoofPlane.from_inputs(inputs), **knowns)
+    solved = {name: value for name, value in values.items() if name not in knowns}
+    return ScenarioOutputs(peak_height=solved.get(PEAK_HEIGHT), max_height=solved.get(MAX_HEIGHT),
+                           pitch_b=solved.get(PITCH), wall_height_a=values[WALL_HEIGHT],
+                           wall_height_b=solved.get(WALL_HEIGHT), wall_height_c=values[WALL_HEIGHT],
+                           soffit_height_b=solved.get(SOFFIT_HEIGHT), drip_edge_height_b=solved.get(DRIP_EDGE_HEIGHT),
+                           gable_wall_b=inputs.studio_gable_wall)
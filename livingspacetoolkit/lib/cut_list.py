@@ -0,0 +1,205 @@
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, Sequence
+
+from livingspacetoolkit.config.log_config import logger
+from .fixed_length import FixedLength
+from .toolkit_enums import LengthType, MaterialType
+from .toolkit_length import LENGTH_LIMITS
+from livingspacetoolkit.models import BillOfMaterials
+
+# Business logic. Hang rails and fascia come in the longest length they can be cut to, and a saw blade takes 1/8".
+DEFAULT_STOCK_LENGTHS = (FixedLength.from_fraction(LENGTH_LIMITS[LengthType.HANG_RAIL]),)
+DEFAULT_KERF = FixedLength.from_fraction(0, 1, 8)
+CUT_MATERIALS = (MaterialType.HANG_RAIL, MaterialType.FASCIA)
+# Orders with this many pieces or fewer are packed exactly. The search gives up after MAX_SEARCH_NODES and keeps the
+# best plan it found, so a hard order takes tens of milliseconds at most.
+EXACT_PIECE_LIMIT = 12
+MAX_SEARCH_NODES = 20_000
+
+
+@dataclass(frozen=True, slots=True)
+class StockBar:
+    """One stock length and the pieces cut from it, longest first."""
+    stock_length: FixedLength
+    cuts: tuple[FixedLength, ...]
+    kerf: FixedLength
+
+    @property
+    def offcut(self) -> FixedLength:
+        """What is left past the last piece, before the cut that frees it."""
+        return self.stock_length - sum(self.cuts, FixedLength(0)) - self.kerf * (len(self.cuts) - 1)
+
+    @property
+    def waste(self) -> FixedLength:
+        """Everything that isn't a piece, the offcut and the saw kerf."""
+        return self.stock_length - sum(self.cuts, FixedLength(0))
+
+
+@dataclass(frozen=True, slots=True)
+class CutPlan:
+    """How to cut a set of pieces from stock.
+    optimal: The plan was proven to use the least stock. Otherwise it is the first-fit-decreasing plan, or the best the
+    search found before it gave up."""
+    bars: tuple[StockBar, ...]
+    optimal: bool
+
+    @property
+    def stock_used(self) -> FixedLength:
+        return sum((bar.stock_length for bar in self.bars), FixedLength(0))
+
+    @property
+    def waste(self) -> FixedLength:
+        return sum((bar.waste for bar in self.bars), FixedLength(0))
+
+    def stock_count(self) -> Dict[FixedLength, int]:
+        """How many bars of each stock length to pull."""
+        return dict(Counter(bar.stock_length for bar in self.bars))
+
+
+def _first_fit_decreasing(weights: Sequence[int], capacities: Sequence[int]) -> list[tuple[int, list[int]]]:
+    """
+    Puts each piece, longest first, in the first bar with room, opening a bar of the longest stock when none has.
+    Each bar is then swapped for the shortest stock that still holds its pieces.
+    :param weights: Sequence[int]: Piece ticks plus kerf, longest first
+    :param capacities: Sequence[int]: Stock ticks plus kerf, shortest first
+    :return: list[tuple[int, list[int]]]: The capacity and piece indexes of each bar
+    """
+    bars: list[list[int]] = []
+    free: list[int] = []
+    for index, weight in enumerate(weights):
+        for bar, room in enumerate(free):
+            if weight <= room:
+                bars[bar].append(index)
+                free[bar] -= weight
+                break
+        else:
+            bars.append([index])
+            free.append(capacities[-1] - weight)
+    packed = []
+    for bar, room in zip(bars, free):
+        filled = capacities[-1] - room
+        packed.append((next(capacity for capacity in capacities if filled <= capacity), bar))
+    return packed
+
+
+def _branch_and_bound(weights: Sequence[int], capacities: Sequence[int], kerf: int,
+                      best: list[tuple[int, list[int]]]) -> tuple[list[tuple[int, list[int]]], bool]:
+    """
+    Searches every way of grouping the pieces into bars for the one using the least stock, starting from a known plan.
+    Bars are filled up to the longest stock and each costs the shortest stock that holds its pieces, so the search
+    never has to choose a stock length.
+    :return: The best plan found and whether the search finished
+    """
+    def fit(filled: int) -> int:
+        return capacities[bisect_left(capacities, filled)]
+
+    best_cost = sum(capacity - kerf for capacity, _ in best)
+    # Each tick of capacity a new bar adds costs at least this much stock. It is lowest for the shortest stock.
+    cost_per_tick = (capacities[0] - kerf) / capacities[0]
+    remaining = [sum(weights[index:]) for index in range(len(weights) + 1)]
+    bar_filled: list[int] = []
+    assignment = [0] * len(weights)
+    nodes = 0
+
+    def search(index: int, cost: int) -> bool:
+        nonlocal best, best_cost, nodes
+        nodes += 1
+        if nodes > MAX_SEARCH_NODES:
+            return False
+        if index == len(weights):
+            if cost < best_cost:
+                best_cost = cost
+                best = [(fit(filled), [piece for piece in range(len(weights)) if assignment[piece] == bar])
+                        for bar, filled in enumerate(bar_filled)]
+            return True
+        weight = weights[index]
+        # Pieces are longest first, so room for less than the last piece is wasted.
+        usable = sum(capacities[-1] - filled for filled in bar_filled if capacities[-1] - filled >= weights[-1])
+        if cost + max(0, remaining[index] - usable) * cost_per_tick >= best_cost:
+            return True
+        tried = set()
+        for bar, filled in enumerate(bar_filled):
+            # Bars filled the same amount are the same choice.
+            if filled + weight > capacities[-1] or filled in tried:
+                continue
+            tried.add(filled)
+            bar_filled[bar] += weight
+            assignment[index] = bar
+            finished = search(index + 1, cost - fit(filled) + fit(filled + weight))
+            bar_filled[bar] -= weight
+            if not finished:
+                return False
+        bar_filled.append(weight)
+        assignment[index] = len(bar_filled) - 1
+        finished = search(index + 1, cost + fit(weight) - kerf)
+        bar_filled.pop()
+        return finished
+
+    finished = search(0, 0)
+    return best, finished
+
+
+def optimize_cuts(pieces: Iterable[FixedLength], stock_lengths: Sequence[FixedLength] = DEFAULT_STOCK_LENGTHS,
+                  kerf: FixedLength = DEFAULT_KERF, exact_piece_limit: int = EXACT_PIECE_LIMIT) -> CutPlan:
+    """
+    Packs pieces into the stock lengths using the least stock. Every piece but the last on a bar takes a kerf.
+    Small orders are searched exactly, larger ones are packed first-fit-decreasing.
+    :param pieces: Iterable[FixedLength]
+    :param stock_lengths: Sequence[FixedLength]: The lengths that can be pulled, any number of each
+    :param kerf: FixedLength: The width of the saw cut
+    :param exact_piece_limit: int: The most pieces to search exactly
+    :return: CutPlan
+    """
+    pieces = sorted(pieces, reverse=True)
+    if not stock_lengths:
+        raise ValueError("At least one stock length is needed.")
+    if kerf.ticks < 0:
+        raise ValueError(f"Invalid kerf: {kerf}")
+    longest_stock = max(stock_lengths)
+    if pieces and pieces[0] > longest_stock:
+        raise ValueError(f"A {pieces[0]} piece is longer than the longest stock length, {longest_stock}.")
+    if pieces and pieces[-1].ticks <= 0:
+        raise ValueError(f"Invalid piece length: {pieces[-1]}")
+    # A bar holds pieces if their lengths plus a kerf each fit in the stock plus one kerf.
+    weights = [piece.ticks + kerf.ticks for piece in pieces]
+    capacities = sorted({stock.ticks + kerf.ticks for stock in stock_lengths})
+    packed = _first_fit_decreasing(weights, capacities)
+    optimal = False
+    if len(pieces) <= exact_piece_limit:
+        packed, optimal = _branch_and_bound(weights, capacities, kerf.ticks, packed)
+    bars = tuple(StockBar(FixedLength(capacity - kerf.ticks), tuple(pieces[index] for index in bar), kerf)
+                 for capacity, bar in sorted(packed, key=lambda bar: (-bar[0], bar[1])))
+    logger.debug(f"Cut {len(pieces)} pieces from {len(bars)} bars of stock.")
+    return CutPlan(bars, optimal)
+
+
+def cut_pieces(bills: Iterable[BillOfMaterials], material: MaterialType) -> list[FixedLength]:
+    """
+    Every piece of a material in one or many bills of materials, one entry per piece.
+    :param bills: Iterable[BillOfMaterials]
+    :param material: MaterialType
+    :return: list[FixedLength]
+    """
+    pieces = []
+    for bill in bills:
+        for item in bill.lines(material):
+            pieces.extend([item.cut_length] * item.quantity)
+    return pieces
+
+
+def cut_list(bills: Iterable[BillOfMaterials], stock_lengths: Sequence[FixedLength] = DEFAULT_STOCK_LENGTHS,
+             kerf: FixedLength = DEFAULT_KERF,
+             materials: Sequence[MaterialType] = CUT_MATERIALS) -> Dict[MaterialType, CutPlan]:
+    """
+    Plans the cuts for the hang rails and fascia of one or many rooms together, so offcuts from one room can be used
+    by another.
+    :param bills: Iterable[BillOfMaterials]
+    :param stock_lengths: Sequence[FixedLength]
+    :param kerf: FixedLength
+    :param materials: Sequence[MaterialType]: The materials to plan, each from its own stock
+    :return: Dict[MaterialType, CutPlan]
+    """
+    bills = list(bills)
+    return {material: optimize_cuts(cut_pieces(bills, material), stock_lengths, kerf) for material in materials}
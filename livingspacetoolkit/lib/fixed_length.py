@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from math import gcd, isfinite
+
+TICKS_PER_INCH = 64
+TICKS_PER_FOOT = 12 * TICKS_PER_INCH
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class FixedLength:
+    """An exact length stored as a whole number of 1/64" ticks. Sums, differences, multiples and rounding to a whole
+    unit are integer math, so comparisons like "within 1 inch of a foot" don't drift the way floats do."""
+    ticks: int
+
+    def __post_init__(self):
+        if not isinstance(self.ticks, int) or isinstance(self.ticks, bool):
+            raise TypeError(f"Ticks must be an int, got {type(self.ticks).__name__}")
+
+    @classmethod
+    def from_inches(cls, inches: float) -> "FixedLength":
+        """
+        Rounds a length in inches to the nearest 1/64".
+        :param inches: float
+        :return: FixedLength
+        """
+        if not isfinite(inches):
+            raise ValueError(f"Invalid length: {inches}")
+        return cls(round(inches * TICKS_PER_INCH))
+
+    @classmethod
+    def from_fraction(cls, whole: int, numerator: int = 0, denominator: int = 1) -> "FixedLength":
+        """The length of whole + numerator/denominator inches. The denominator must divide 64."""
+        if TICKS_PER_INCH % denominator:
+            raise ValueError(f"{denominator} does not divide {TICKS_PER_INCH}")
+        return cls(whole * TICKS_PER_INCH + numerator * (TICKS_PER_INCH // denominator))
+
+    @property
+    def inches(self) -> float:
+        # Exact for any tick count a sunroom will see. 64 is a power of two.
+        return self.ticks / TICKS_PER_INCH
+
+    def __add__(self, other):
+        if isinstance(other, FixedLength):
+            return FixedLength(self.ticks + other.ticks)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, FixedLength):
+            return FixedLength(self.ticks - other.ticks)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, int) and not isinstance(other, bool):
+            return FixedLength(self.ticks * other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, other):
+        if isinstance(other, FixedLength):
+            return self.ticks // other.ticks
+        if isinstance(other, int) and not isinstance(other, bool):
+            return FixedLength(self.ticks // other)
+        return NotImplemented
+
+    def __mod__(self, other):
+        if isinstance(other, FixedLength):
+            return FixedLength(self.ticks % other.ticks)
+        return NotImplemented
+
+    def __neg__(self):
+        return FixedLength(-self.ticks)
+
+    def __bool__(self) -> bool:
+        return bool(self.ticks)
+
+    def __float__(self) -> float:
+        return self.inches
+
+    def ceil_div(self, other: "FixedLength") -> int:
+        """How many whole others it takes to cover this length."""
+        return -(-self.ticks // other.ticks)
+
+    def floor_to(self, unit: "FixedLength") -> "FixedLength":
+        return FixedLength(self.ticks // unit.ticks * unit.ticks)
+
+    def ceil_to(self, unit: "FixedLength") -> "FixedLength":
+        return FixedLength(self.ceil_div(unit) * unit.ticks)
+
+    def round_to(self, denominator: int) -> "FixedLength":
+        """
+        Rounds to the nearest 1/denominator inch, halves away from zero. The denominator must divide 64.
+        :param denominator: int
+        :return: FixedLength
+        """
+        if TICKS_PER_INCH % denominator:
+            raise ValueError(f"{denominator} does not divide {TICKS_PER_INCH}")
+        step = TICKS_PER_INCH // denominator
+        sign = -1 if self.ticks < 0 else 1
+        return FixedLength(sign * ((abs(self.ticks) + step // 2) // step * step))
+
+    def format_inches(self, denominator: int = TICKS_PER_INCH) -> str:
+        """
+        Formats the length like 150 1/2" after rounding to 1/denominator inch.
+        :param denominator: int
+        :return: str
+        """
+        ticks = self.round_to(denominator).ticks
+        sign = "-" if ticks < 0 else ""
+        whole, remainder = divmod(abs(ticks), TICKS_PER_INCH)
+        if not remainder:
+            return f'{sign}{whole}"'
+        divisor = gcd(remainder, TICKS_PER_INCH)
+        fraction = f"{remainder // divisor}/{TICKS_PER_INCH // divisor}"
+        return f'{sign}{whole} {fraction}"' if whole else f'{sign}{fraction}"'
+
+    def format_feet_inches(self, denominator: int = TICKS_PER_INCH) -> str:
+        """
+        Formats the length like 12' 6 1/2" after rounding to 1/denominator inch.
+        :param denominator: int
+        :return: str
+        """
+        ticks = self.round_to(denominator).ticks
+        feet, remainder = divmod(abs(ticks), TICKS_PER_FOOT)
+        sign = "-" if ticks < 0 else ""
+        if not feet:
+            return FixedLength(ticks).format_inches()
+        return f"{sign}{feet}' {FixedLength(remainder).format_inches()}"
+
+    def __str__(self) -> str:
+        return self.format_inches()
+
+
+INCH = FixedLength(TICKS_PER_INCH)
+FOOT = FixedLength(TICKS_PER_FOOT)
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import isfinite
+from typing import Iterable
+
+import numpy as np
+
+from livingspacetoolkit.config.log_config import logger
+from .toolkit_enums import LengthError, LengthType
+from .toolkit_length import LENGTH_LIMITS, PARSE_CACHE_SIZE, ToolkitLength, scan_imperial_to_inches
+
+_NAN = float("nan")
+
+
+@dataclass(frozen=True, slots=True)
+class LengthColumn:
+    """A parsed column of measurements.
+    inches: float64 lengths in inches. Rows that are not valid are NaN.
+    valid: True where the row parsed and is within the limits of the LengthType
+    errors: int8 LengthError value of each row"""
+    inches: np.ndarray
+    valid: np.ndarray
+    errors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.inches)
+
+    def error_rows(self, error: LengthError) -> np.ndarray:
+        """The row indices with the given error."""
+        return np.flatnonzero(self.errors == error.value)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_text(text: str) -> tuple[float, int]:
+    if not text or text.isspace():
+        return _NAN, LengthError.EMPTY.value
+    if ToolkitLength.NEGATIVE_MEASUREMENT_REGEX.match(text):
+        return _NAN, LengthError.NEGATIVE.value
+    inches = scan_imperial_to_inches(text)
+    if inches != inches:
+        return _NAN, LengthError.INVALID.value
+    return inches, LengthError.OK.value
+
+
+def _parse_cell(cell: str | float | int | None) -> tuple[float, int]:
+    if isinstance(cell, str):
+        return _parse_text(cell)
+    if cell is None:
+        return _NAN, LengthError.EMPTY.value
+    if isinstance(cell, float | int) and not isinstance(cell, bool):
+        # Numbers skip the regex just like ToolkitLength.length does.
+        if not isfinite(cell):
+            return _NAN, LengthError.INVALID.value
+        if cell < 0:
+            return _NAN, LengthError.NEGATIVE.value
+        return float(cell), LengthError.OK.value
+    return _NAN, LengthError.INVALID.value
+
+
+def parse_length_column(cells: Iterable[str | float | int | None],
+                        length_type: LengthType | None = None) -> LengthColumn:
+    """
+    Parses a whole column of measurements like 12' 6 1/2" into inches. Accepts the same formats as ToolkitLength and
+    applies the same business limits for the length type, but reports problems per row in the errors array instead of
+    raising. Empty cells and None are LengthError.EMPTY.
+    :param cells: Iterable[str | float | int | None]: Measurement strings or numbers in inches
+    :param length_type: LengthType: Applies the length limits of this type. None skips them.
+    :return: LengthColumn
+    """
+    cells = cells if isinstance(cells, list | tuple) else list(cells)
+    parsed = np.fromiter((_parse_cell(cell) for cell in cells), dtype=np.dtype((np.float64, 2)), count=len(cells))
+    parsed = parsed.reshape(len(cells), 2)
+    inches = np.ascontiguousarray(parsed[:, 0])
+    errors = parsed[:, 1].astype(np.int8)
+    limit = LENGTH_LIMITS.get(length_type)
+    if limit is not None:
+        errors[inches > limit] = LengthError.TOO_LONG.value
+    valid = errors == LengthError.OK.value
+    inches[~valid] = np.nan
+    if not valid.all():
+        logger.warning(f"{np.count_nonzero(~valid)} of {len(cells)} {getattr(length_type, 'name', 'length')} "
+                       f"cells could not be used.")
+    return LengthColumn(inches, valid, errors)
@@ -0,0 +1,156 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from livingspacetoolkit.config.log_config import logger
+from .base_scenario_class import UnknownScenarioError
+from .fixed_length import FOOT, FixedLength
+from .root_finding import ConvergenceError
+from .scenario_core import ScenarioInputs
+from .solve_cache import SolveCache, solve_cached
+from .toolkit_enums import MaterialType, RoofingType
+from livingspacetoolkit.models import BillOfMaterials
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectRoom:
+    """One room of a project, everything solve_cached needs for it."""
+    inputs: ScenarioInputs
+    roofing_type: RoofingType | None = None
+    fascia: bool = False
+    name: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class RoomFailure:
+    """A room that couldn't be solved and why."""
+    name: str
+    error: str
+
+
+@dataclass(frozen=True, slots=True)
+class TakeoffKey:
+    """A stock item and the length it is cut to. Only roof panels have a roofing type and thickness. Armstrong boxes
+    have no length."""
+    material: MaterialType
+    length: FixedLength | None = None
+    roofing_type: RoofingType | None = None
+    thickness: FixedLength | None = None
+
+    @property
+    def sku(self) -> str:
+        parts = [self.material.name]
+        if self.roofing_type is not None:
+            parts.append(self.roofing_type.name)
+        if self.thickness is not None:
+            parts.append(self.thickness.format_inches())
+        return " ".join(parts)
+
+    def sort_key(self) -> tuple:
+        return (self.material.value, self.roofing_type.value if self.roofing_type else 0,
+                self.thickness.ticks if self.thickness else 0, self.length.ticks if self.length else 0)
+
+
+class MaterialTakeoff:
+    """Running totals of the materials for any number of rooms. Each bill of materials is folded in as it is added, so
+    memory only grows with the number of different items, not the number of rooms. Takeoffs built separately, e.g. in
+    other processes, can be merged. A room that can't be solved is left out and kept in failures, so one bad room
+    doesn't stop the rest."""
+
+    def __init__(self, panel_bucket: FixedLength = FOOT) -> None:
+        """
+        :param panel_bucket: FixedLength: Roof panels are counted by their length rounded up to this
+        """
+        if panel_bucket.ticks <= 0:
+            raise ValueError(f"Invalid panel bucket: {panel_bucket}")
+        self.panel_bucket = panel_bucket
+        self.quantities: Counter[TakeoffKey] = Counter()
+        self.rooms = 0
+        self.roof_area = 0  # Sq. ft.
+        self.overhang_warnings = 0
+        self.failures: list[RoomFailure] = []
+
+    def __eq__(self, other):
+        if not isinstance(other, MaterialTakeoff):
+            return NotImplemented
+        return ((self.panel_bucket, self.quantities, self.rooms, self.roof_area, self.overhang_warnings,
+                 self.failures) == (other.panel_bucket, other.quantities, other.rooms, other.roof_area,
+                                    other.overhang_warnings, other.failures))
+
+    def add(self, bill: BillOfMaterials, roofing_type: RoofingType | None = None,
+            thickness: FixedLength | None = None) -> None:
+        """
+        Adds one room's bill of materials.
+        :param bill: BillOfMaterials
+        :param roofing_type: RoofingType | None: The roof panels' roofing type
+        :param thickness: FixedLength | None: The roof panels' thickness
+        :return:
+        """
+        for item in bill.items:
+            if item.material == MaterialType.ROOF_PANEL:
+                key = TakeoffKey(item.material, item.cut_length.ceil_to(self.panel_bucket), roofing_type, thickness)
+            else:
+                key = TakeoffKey(item.material, item.cut_length)
+            self.quantities[key] += item.quantity
+        self.rooms += 1
+        self.roof_area += bill.roof_area
+        self.overhang_warnings += len(bill.warnings)
+
+    def add_room(self, room: ProjectRoom, cache: SolveCache | None = None) -> BillOfMaterials | None:
+        """
+        Solves a room and adds its bill of materials. A room that can't be solved adds nothing but a RoomFailure.
+        :param room: ProjectRoom
+        :param cache: SolveCache | None
+        :return: BillOfMaterials | None: None if the room couldn't be solved
+        """
+        try:
+            bill = solve_cached(room.inputs, room.roofing_type, room.fascia, cache).bill_of_materials
+        except (ValueError, TypeError, ZeroDivisionError, UnknownScenarioError, ConvergenceError) as err:
+            logger.warning(f"Couldn't solve room {room.name!r}: {err}")
+            self.failures.append(RoomFailure(room.name, str(err)))
+            return None
+        self.add(bill, room.roofing_type, FixedLength.from_inches(room.inputs.thickness))
+        return bill
+
+    def merge(self, other: "MaterialTakeoff") -> None:
+        if other.panel_bucket != self.panel_bucket:
+            raise ValueError(f"Can't merge takeoffs with panel buckets of {self.panel_bucket} and "
+                             f"{other.panel_bucket}.")
+        self.quantities.update(other.quantities)
+        self.rooms += other.rooms
+        self.roof_area += other.roof_area
+        self.overhang_warnings += other.overhang_warnings
+        self.failures.extend(other.failures)
+
+    def lines(self) -> list[tuple[TakeoffKey, int]]:
+        """Every item and its quantity, sorted by material, SKU and length."""
+        return sorted(self.quantities.items(), key=lambda line: line[0].sort_key())
+
+    def quantity(self, material: MaterialType) -> int:
+        """The total pieces, or boxes, of a material."""
+        return sum(count for key, count in self.quantities.items() if key.material == material)
+
+    def pieces(self, material: MaterialType) -> Iterator[FixedLength]:
+        """Every piece of a material, one per piece, e.g. for cut_list.optimize_cuts."""
+        for key, count in self.quantities.items():
+            if key.material == material:
+                for _ in range(count):
+                    yield key.length
+
+
+def takeoff_project(rooms: Iterable[ProjectRoom], cache: SolveCache | None = None,
+                    panel_bucket: FixedLength = FOOT) -> MaterialTakeoff:
+    """
+    Solves every room in a single pass and totals their materials. Rooms can come from a generator, e.g. rows of a
+    file, and are not kept. Rooms that can't be solved are skipped and listed in the takeoff's failures.
+    :param rooms: Iterable[ProjectRoom]
+    :param cache: SolveCache | None: Rooms that repeat in a project are only solved once with a cache
+    :param panel_bucket: FixedLength
+    :return: MaterialTakeoff
+    """
+    takeoff = MaterialTakeoff(panel_bucket)
+    for room in rooms:
+        takeoff.add_room(room, cache)
+    logger.debug(f"Took off materials for {takeoff.rooms} rooms, {len(takeoff.quantities)} different items, "
+                 f"{len(takeoff.failures)} rooms failed.")
+    return takeoff
@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from math import acos, cbrt, copysign, cos, pi, sqrt
+from typing import Callable
+
+from livingspacetoolkit.config.log_config import logger
+
+
+class ConvergenceError(ArithmeticError):
+    """Raised when a root finder cannot bracket a root or does not converge within the allowed iterations."""
+    def __init__(self, message: str, iterations: int = 0) -> None:
+        super().__init__(message)
+        self.iterations = iterations
+
+
+@dataclass(frozen=True)
+class RootResult:
+    """The outcome of a root search. The root is the abscissa where the function crosses zero."""
+    root: float
+    iterations: int
+    function_calls: int
+
+
+def _check_bracket(f_lower: float, f_upper: float, lower: float, upper: float) -> None:
+    if f_lower * f_upper > 0:
+        raise ConvergenceError(f"The interval [{lower}, {upper}] does not bracket a root: "
+                               f"f(lower)={f_lower}, f(upper)={f_upper}")
+
+
+def bisect(func: Callable[[float], float], lower: float, upper: float, tolerance: float = 1e-9,
+           max_iterations: int = 200) -> RootResult:
+    """
+    Finds the root of a function with the Bisection Method. Slow but it can't fail once the root is bracketed.
+    :param func: Callable: The function to find the root of.
+    :param lower: float: The lower end of the bracket.
+    :param upper: float: The upper end of the bracket.
+    :param tolerance: float: The width of the bracket that counts as converged.
+    :param max_iterations: int: Gives up and raises ConvergenceError after this many iterations.
+    :return: RootResult
+    """
+    f_lower = func(lower)
+    f_upper = func(upper)
+    calls = 2
+    if f_lower == 0:
+        return RootResult(lower, 0, calls)
+    if f_upper == 0:
+        return RootResult(upper, 0, calls)
+    _check_bracket(f_lower, f_upper, lower, upper)
+    for iteration in range(1, max_iterations + 1):
+        middle = (lower + upper) / 2
+        f_middle = func(middle)
+        calls += 1
+        if f_middle == 0 or abs(upper - lower) / 2 < tolerance:
+            return RootResult(middle, iteration, calls)
+        if (f_middle > 0) == (f_lower > 0):
+            lower, f_lower = middle, f_middle
+        else:
+            upper = middle
+    raise ConvergenceError(f"Bisection did not converge in {max_iterations} iterations.", max_iterations)
+
+
+def brent(func: Callable[[float], float], lower: float, upper: float, tolerance: float = 1e-9,
+          max_iterations: int = 100) -> RootResult:
+    """
+    Finds the root of a function with Brent's Method. It mixes inverse quadratic interpolation, the secant method and
+    bisection so it converges much faster than bisection while keeping the root bracketed the whole time.
+    :param func: Callable: The function to find the root of.
+    :param lower: float: The lower end of the bracket.
+    :param upper: float: The upper end of the bracket.
+    :param tolerance: float: The width of the bracket that counts as converged.
+    :param max_iterations: int: Gives up and raises ConvergenceError after this many iterations.
+    :return: RootResult
+    """
+    a, b = lower, upper
+    f_a, f_b = func(a), func(b)
+    calls = 2
+    if f_a == 0:
+        return RootResult(a, 0, calls)
+    if f_b == 0:
+        return RootResult(b, 0, calls)
+    _check_bracket(f_a, f_b, lower, upper)
+    c, f_c = a, f_a
+    d = e = b - a
+    for iteration in range(1, max_iterations + 1):
+        if (f_b > 0) == (f_c > 0):
+            # Keep the root between b and c
+            c, f_c = a, f_a
+            d = e = b - a
+        if abs(f_c) < abs(f_b):
+            a, b, c = b, c, b
+            f_a, f_b, f_c = f_b, f_c, f_b
+        tol = 2 * 2.220446049250313e-16 * abs(b) + tolerance / 2
+        half_width = (c - b) / 2
+        if abs(half_width) <= tol or f_b == 0:
+            return RootResult(b, iteration, calls)
+        if abs(e) >= tol and abs(f_a) > abs(f_b):
+            s = f_b / f_a
+            if a == c:
+                # Secant method
+                p = 2 * half_width * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q = f_a / f_c
+                r = f_b / f_c
+                p = s * (2 * half_width * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * half_width * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = half_width
+        else:
+            d = e = half_width
+        a, f_a = b, f_b
+        b += d if abs(d) > tol else (tol if half_width > 0 else -tol)
+        f_b = func(b)
+        calls += 1
+    logger.debug(f"Brent's method stopped at {b} after {max_iterations} iterations.")
+    raise ConvergenceError(f"Brent's method did not converge in {max_iterations} iterations.", max_iterations)
+
+
+def solve_quadratic(a: float, b: float, c: float) -> list[float]:
+    """
+    Returns the real roots of a*x^2 + b*x + c = 0 in ascending order. Uses the numerically stable form of the
+    quadratic formula so a small root isn't lost to cancellation.
+    :param a: float
+    :param b: float
+    :param c: float
+    :return: list[float]
+    """
+    if a == 0:
+        if b == 0:
+            return []
+        return [-c / b]
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return []
+    q = -(b + copysign(sqrt(discriminant), b)) / 2
+    if q == 0:
+        return [0.0]
+    return sorted({q / a, c / q})
+
+
+def solve_cubic(a: float, b: float, c: float, d: float) -> list[float]:
+    """
+    Returns the real roots of a*x^3 + b*x^2 + c*x + d = 0 in ascending order using Cardano's method, or the
+    trigonometric method when there are three real roots.
+    :param a: float
+    :param b: float
+    :param c: float
+    :param d: float
+    :return: list[float]
+    """
+    if a == 0:
+        return solve_quadratic(b, c, d)
+    b, c, d = b / a, c / a, d / a
+    shift = b / 3
+    # Depressed cubic t^3 + p*t + q = 0 where x = t - b/3
+    p = c - b * b / 3
+    q = 2 * b ** 3 / 27 - b * c / 3 + d
+    discriminant = (q / 2) ** 2 + (p / 3) ** 3
+    # Round off can push a repeated root's discriminant just above zero so compare it to the size of its terms.
+    if discriminant > 1e-12 * max((q / 2) ** 2, abs(p / 3) ** 3):
+        root = sqrt(discriminant)
+        return [cbrt(-q / 2 + root) + cbrt(-q / 2 - root) - shift]
+    if p == 0:
+        return [-shift]
+    radius = 2 * sqrt(-p / 3)
+    angle = acos(max(-1.0, min(1.0, 3 * q / (p * radius)))) / 3
+    return sorted(radius * cos(angle - 2 * pi * k / 3) - shift for k in range(3))
+
+
+def solve_quartic(a: float, b: float, c: float, d: float, e: float) -> list[float]:
+    """
+    Returns the real roots of a*x^4 + b*x^3 + c*x^2 + d*x + e = 0 in ascending order using Ferrari's method. Each root
+    is polished with a couple of Newton steps on the original polynomial since the closed form loses a few digits.
+    :param a: float
+    :param b: float
+    :param c: float
+    :param d: float
+    :param e: float
+    :return: list[float]
+    """
+    if a == 0:
+        return solve_cubic(b, c, d, e)
+    coefficients = (a, b, c, d, e)
+    b, c, d, e = b / a, c / a, d / a, e / a
+    shift = b / 4
+    # Depressed quartic y^4 + p*y^2 + q*y + r = 0 where x = y - b/4
+    p = c - 3 * b * b / 8
+    q = d - b * c / 2 + b ** 3 / 8
+    r = e - b * d / 4 + b * b * c / 16 - 3 * b ** 4 / 256
+    roots: list[float] = []
+    if abs(q) < 1e-14 * max(1.0, abs(p), abs(r)):
+        # Biquadratic, solve for y^2
+        for square in solve_quadratic(1, p, r):
+            if square >= 0:
+                roots += [sqrt(square), -sqrt(square)]
+    else:
+        # The resolvent cubic always has a positive root when q isn't zero
+        m = max(solve_cubic(8, 8 * p, 2 * p * p - 8 * r, -q * q))
+        root_2m = sqrt(2 * m)
+        for sign in (1, -1):
+            radicand = -(2 * p + 2 * m + sign * sqrt(2) * q / sqrt(m))
+            if radicand >= 0:
+                roots += [(sign * root_2m + sqrt(radicand)) / 2, (sign * root_2m - sqrt(radicand)) / 2]
+    return sorted(_polish_root(coefficients, root - shift) for root in roots)
+
+
+def _polish_root(coefficients: tuple[float, ...], x: float, steps: int = 2) -> float:
+    for _ in range(steps):
+        value = derivative = 0.0
+        for coefficient in coefficients:
+            derivative = derivative * x + value
+            value = value * x + coefficient
+        if derivative == 0:
+            break
+        x -= value / derivative
+    return x
@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+from math import sin, cos, tan, atan, atan2, pi
+
+from livingspacetoolkit.config.log_config import logger
+from .root_finding import brent, solve_quadratic, solve_quartic
+from .toolkit_enums import Scenario, SunroomType, EndCutType, SunroomSide, LengthType
+
+POST_WIDTH = 3.25  # Business logic. The width of the center post. Used in cathedral calculations.
+MAX_PITCH = atan2(21, 12)  # Business logic. The steepest pitch ToolkitPitch will accept.
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioInputs:
+    """Everything a scenario needs to solve a sunroom. Lengths are in inches and pitches in radians. Only the pitch
+    and heights of the selected scenario are used, the rest are ignored."""
+    scenario: Scenario
+    sunroom_type: SunroomType
+    end_cuts: EndCutType
+    overhang: float
+    thickness: float
+    wall_width_a: float
+    wall_width_b: float
+    wall_width_c: float
+    pitch_a: float = 0.0
+    pitch_b: float = 0.0
+    pitch_c: float = 0.0
+    peak_height: float = 0.0
+    max_height: float = 0.0
+    wall_height_a: float = 0.0
+    wall_height_b: float = 0.0
+    wall_height_c: float = 0.0
+    soffit_height_a: float = 0.0
+    soffit_height_b: float = 0.0
+    soffit_height_c: float = 0.0
+    drip_edge_height_a: float = 0.0
+    drip_edge_height_b: float = 0.0
+    drip_edge_height_c: float = 0.0
+
+    @classmethod
+    def from_toolkit_state(cls, toolkit_state) -> "ScenarioInputs":
+        """Reads the inputs out of a ToolkitStateModel."""
+        wall_heights = toolkit_state.wall_heights
+        return cls(
+            scenario=toolkit_state.scenario,
+            sunroom_type=toolkit_state.sunroom_type,
+            end_cuts=toolkit_state.end_cuts,
+            overhang=toolkit_state.overhang.length,
+            thickness=toolkit_state.thickness.length,
+            wall_width_a=toolkit_state.floor_walls[SunroomSide.A_SIDE].length,
+            wall_width_b=toolkit_state.floor_walls[SunroomSide.B_SIDE].length,
+            wall_width_c=toolkit_state.floor_walls[SunroomSide.C_SIDE].length,
+            pitch_a=toolkit_state.pitch[SunroomSide.A_SIDE].pitch_value,
+            pitch_b=toolkit_state.pitch[SunroomSide.B_SIDE].pitch_value,
+            pitch_c=toolkit_state.pitch[SunroomSide.C_SIDE].pitch_value,
+            peak_height=wall_heights[(None, LengthType.PEAK_HEIGHT)].length,
+            max_height=wall_heights[(None, LengthType.MAX_HEIGHT)].length,
+            wall_height_a=wall_heights[(SunroomSide.A_SIDE, LengthType.WALL_HEIGHT)].length,
+            wall_height_b=wall_heights[(SunroomSide.B_SIDE, LengthType.WALL_HEIGHT)].length,
+            wall_height_c=wall_heights[(SunroomSide.C_SIDE, LengthType.WALL_HEIGHT)].length,
+            soffit_height_a=wall_heights[(SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT)].length,
+            soffit_height_b=wall_heights[(SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT)].length,
+            soffit_height_c=wall_heights[(SunroomSide.C_SIDE, LengthType.SOFFIT_HEIGHT)].length,
+            drip_edge_height_a=wall_heights[(SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT)].length,
+            drip_edge_height_b=wall_heights[(SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT)].length,
+            drip_edge_height_c=wall_heights[(SunroomSide.C_SIDE, LengthType.DRIP_EDGE_HEIGHT)].length,
+        )
+
+    @property
+    def studio_gable_wall(self) -> float:
+        # The scenario classes used to take max(floor_walls[A_SIDE], floor_walls[C_SIDE]). ToolkitLength only compares
+        # lengths on the same side so that was always the A wall.
+        return self.wall_width_a
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioOutputs:
+    """The values a scenario solved for. Lengths are in inches and pitches in radians. Values the scenario doesn't
+    calculate, like its inputs or the A side pitch of a studio, are None."""
+    peak_height: float | None = None
+    max_height: float | None = None
+    pitch_a: float | None = None
+    pitch_b: float | None = None
+    pitch_c: float | None = None
+    wall_height_a: float | None = None
+    wall_height_b: float | None = None
+    wall_height_c: float | None = None
+    soffit_height_a: float | None = None
+    soffit_height_b: float | None = None
+    soffit_height_c: float | None = None
+    drip_edge_height_a: float | None = None
+    drip_edge_height_b: float | None = None
+    drip_edge_height_c: float | None = None
+    gable_wall_a: float | None = None
+    gable_wall_b: float | None = None
+    gable_wall_c: float | None = None
+
+
+def calculate_hypotenuse(opposite: float, pitch: float) -> float:
+    """
+    Calculates the hypotenuse given pitch and the opposite (panel thickness). Pitch has to be in radians.
+    :param opposite: float
+    :param pitch: float
+    :return: float
+    """
+    if pitch == pi/2:
+        raise ZeroDivisionError("The pitch is 90 degrees?")
+    return opposite * (sin(pi / 2) / sin(pi / 2 - pitch))
+
+
+def calculate_drip_edge(thickness: float, soffit: float, pitch: float, end_cuts: EndCutType) -> float:
+    """
+    Returns the drip edge height given the soffit and angled thickness. Returns in units of inches.
+    :param thickness: float: Panel thickness in inches
+    :param soffit: float: Soffit height in inches
+    :param pitch: float: Pitch in radians
+    :param end_cuts: EndCutType
+    :return: float
+    """
+    if end_cuts == EndCutType.PLUMB_CUT_TOP_BOTTOM:
+        return soffit + calculate_hypotenuse(opposite=thickness, pitch=pitch)
+    return soffit + thickness * cos(pitch)
+
+
+def calculate_triangle_height(angle_1: float, angle_2: float, base_length: float) -> float:
+    """
+    Uses the Sine Rule to get the height of a triangle from its two base angles and base width. This is used primarily
+    to find the difference between the calculated peak height and the peak height used in Fenevision which is at the
+    base of the post sitting at the center of a cathedral sunroom.
+    :param angle_1: float: Radians
+    :param angle_2: float: Radians
+    :param base_length: float: Inches
+    :return: float: Returns the height of the triangle.
+    """
+    return base_length * sin(angle_1) * sin(angle_2) / sin(pi - angle_1 - angle_2)
+
+
+def estimate_drip_from_peak(peak: float, overhang: float, thickness: float, pitch: float,
+                            pitched_wall_length: float, end_cuts: EndCutType) -> float:
+    """
+    Returns the drip edge height of a room with the given peak and pitch.
+    :param peak: float: Sunroom peak in inches
+    :param overhang: float: Overhang in inches
+    :param thickness: float: Panel thickness in inches
+    :param pitch: float: The pitch of the room in radians
+    :param pitched_wall_length: float: The length of the pitched-side wall in inches
+    :param end_cuts: EndCutType
+    :return: float: Returns the drip edge height in inches
+    """
+    wall_height = peak - pitched_wall_length * tan(pitch)
+    soffit = wall_height - overhang * tan(pitch)
+    return calculate_drip_edge(thickness, soffit, pitch, end_cuts)
+
+
+def pitch_from_drip_edge(peak: float, overhang: float, thickness: float, drip_edge: float,
+                         pitched_wall_length: float, end_cuts: EndCutType, max_pitch: float = MAX_PITCH) -> float | None:
+    """
+    The analytical inverse of estimate_drip_from_peak. With k = pitched_wall_length + overhang and
+    c = drip_edge - peak the drip edge equation is c + k*tan(pitch) = angled thickness.
+
+    For plumb cut top and bottom the angled thickness is thickness/cos(pitch). Squaring gives a quadratic in
+    t = tan(pitch): (k^2 - thickness^2)*t^2 + 2*c*k*t + (c^2 - thickness^2) = 0.
+
+    Otherwise it is thickness*cos(pitch). Substituting u = tan(pitch/2) gives a quartic:
+    -(c + thickness)*u^4 + 2*k*u^3 + 2*thickness*u^2 + 2*k*u + (c - thickness) = 0.
+
+    Squaring can add roots that don't solve the original equation so those are thrown out. Returns None if there
+    is no root between 0 and max_pitch.
+    :param peak: float: Sunroom peak in inches
+    :param overhang: float: Overhang in inches
+    :param thickness: float: Panel thickness in inches
+    :param drip_edge: float: The drip edge height in inches
+    :param pitched_wall_length: float: The length of the pitched-side wall in inches
+    :param end_cuts: EndCutType
+    :param max_pitch: float: The steepest pitch allowed in radians
+    :return: float | None: The pitch in radians
+    """
+    k = pitched_wall_length + overhang
+    c = drip_edge - peak
+    if end_cuts == EndCutType.PLUMB_CUT_TOP_BOTTOM:
+        pitches = [atan(t) for t in solve_quadratic(k * k - thickness * thickness, 2 * c * k,
+                                                    c * c - thickness * thickness)
+                   if c + k * t >= 0]
+    else:
+        pitches = [2 * atan(u) for u in solve_quartic(-(c + thickness), 2 * k, 2 * thickness, 2 * k,
+                                                      c - thickness)]
+    pitches = [pitch for pitch in pitches if 0 <= pitch <= max_pitch]
+    if not pitches:
+        return None
+    return min(pitches)
+
+
+def solve_pitch_from_drip_edge(peak: float, overhang: float, thickness: float, drip_edge: float,
+                               pitched_wall_length: float, end_cuts: EndCutType, max_pitch: float = MAX_PITCH,
+                               use_analytic: bool = True, cross_check_tolerance: float = 1e-6,
+                               tolerance: float = 1e-9, max_iterations: int = 100) -> float:
+    """
+    Finds the pitch that gives the requested drip edge for a given peak height. It uses the analytical solution
+    from pitch_from_drip_edge and checks it by plugging it back into estimate_drip_from_peak. If that fails it
+    falls back to Brent's method. The drip edge drops as the pitch rises so [0, max_pitch] brackets the root
+    whenever a solution exists. Raises ConvergenceError otherwise.
+    :param peak: float: Sunroom peak in inches
+    :param overhang: float: Overhang in inches
+    :param thickness: float: Panel thickness in inches
+    :param drip_edge: float: The drip edge height in inches
+    :param pitched_wall_length: float: The length of the pitched-side wall in inches
+    :param end_cuts: EndCutType
+    :param max_pitch: float: The steepest pitch allowed in radians
+    :param use_analytic: bool: Skips straight to Brent's method when False
+    :param cross_check_tolerance: float: How far in inches the analytical drip edge can be from the input
+    :param tolerance: float: Brent's method tolerance in radians
+    :param max_iterations: int: Brent's method iteration limit
+    :return: float: The pitch in radians
+    """
+    if use_analytic:
+        pitch = pitch_from_drip_edge(peak, overhang, thickness, drip_edge, pitched_wall_length, end_cuts, max_pitch)
+        if pitch is not None:
+            residual = estimate_drip_from_peak(peak, overhang, thickness, pitch, pitched_wall_length,
+                                               end_cuts) - drip_edge
+            if abs(residual) <= cross_check_tolerance:
+                return pitch
+            logger.warning(f"Analytical pitch {pitch} is off by {residual} in. Falling back to Brent's method.")
+    result = brent(lambda pitch: estimate_drip_from_peak(peak, overhang, thickness, pitch, pitched_wall_length,
+                                                         end_cuts) - drip_edge,
+                   0.0, max_pitch, tolerance, max_iterations)
+    logger.debug(f"Estimated the pitch from the drip edge in {result.iterations} iterations.")
+    return result.root
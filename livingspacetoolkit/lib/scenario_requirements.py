@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+from .toolkit_enums import Scenario, SunroomType, SunroomSide, LengthType
+
+HeightKey = tuple[SunroomSide | None, LengthType]
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioRequirements:
+    """The inputs a scenario needs on top of the ones every scenario needs. The pitch sides are keys of
+    ToolkitStateModel.pitch and the wall heights are keys of ToolkitStateModel.wall_heights, in the order they are
+    checked."""
+    pitch_sides: tuple[SunroomSide, ...] = ()
+    wall_heights: tuple[HeightKey, ...] = ()
+
+
+_STUDIO = (SunroomSide.B_SIDE,)
+_CATHEDRAL = (SunroomSide.A_SIDE, SunroomSide.C_SIDE)
+_SIDES = {SunroomType.STUDIO: _STUDIO, SunroomType.CATHEDRAL: _CATHEDRAL}
+_PEAK = (None, LengthType.PEAK_HEIGHT)
+_MAX = (None, LengthType.MAX_HEIGHT)
+
+
+def _build_requirements() -> Mapping[tuple[Scenario, SunroomType], ScenarioRequirements]:
+    table = {}
+    for sunroom_type, sides in _SIDES.items():
+        def heights(length_type: LengthType) -> tuple[HeightKey, ...]:
+            return tuple((side, length_type) for side in sides)
+
+        table.update({
+            (Scenario.WALL_HEIGHT_PITCH, sunroom_type):
+                ScenarioRequirements(sides, heights(LengthType.WALL_HEIGHT)),
+            (Scenario.WALL_HEIGHT_PEAK_HEIGHT, sunroom_type):
+                ScenarioRequirements((), heights(LengthType.WALL_HEIGHT) + (_PEAK,)),
+            (Scenario.MAX_HEIGHT_PITCH, sunroom_type): ScenarioRequirements(sides, (_MAX,)),
+            (Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT, sunroom_type):
+                ScenarioRequirements((), heights(LengthType.SOFFIT_HEIGHT) + (_PEAK,)),
+            (Scenario.SOFFIT_HEIGHT_PITCH, sunroom_type):
+                ScenarioRequirements(sides, heights(LengthType.SOFFIT_HEIGHT)),
+            # The peak height comes first here. It's the order the inputs were always checked in.
+            (Scenario.DRIP_EDGE_PEAK_HEIGHT, sunroom_type):
+                ScenarioRequirements((), (_PEAK,) + heights(LengthType.DRIP_EDGE_HEIGHT)),
+            (Scenario.DRIP_EDGE_PITCH, sunroom_type):
+                ScenarioRequirements(sides, heights(LengthType.DRIP_EDGE_HEIGHT)),
+        })
+    return MappingProxyType(table)
+
+
+# Built once at import. Read only so nothing can change what a scenario needs at runtime.
+SCENARIO_REQUIREMENTS = _build_requirements()
+
+
+def get_requirements(scenario: Scenario, sunroom_type: SunroomType) -> ScenarioRequirements:
+    """
+    The pitch sides and wall heights a scenario needs for a sunroom type.
+    :param scenario: Scenario
+    :param sunroom_type: SunroomType
+    :return: ScenarioRequirements
+    """
+    return SCENARIO_REQUIREMENTS[(scenario, sunroom_type)]
+
+
+class MissingInputsError(TypeError):
+    """Raised by ToolkitStateModel.check_calculation_ready. The message has one line per missing input and the same
+    lines are in missing. It is a TypeError so callers that caught the first missing input still work."""
+
+    def __init__(self, missing: list[str]):
+        super().__init__("\n".join(missing))
+        self.missing = list(missing)
@@ -0,0 +1,246 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable
+
+from livingspacetoolkit.config.log_config import logger
+from .base_scenario_class import ScenarioSelector, UnknownScenarioError, solve
+from .fixed_length import TICKS_PER_INCH
+from .scenario_core import ScenarioInputs
+from .scenario_requirements import get_requirements
+from .sunroom_builder import SunroomBuilder
+from .toolkit_enums import LengthType, PitchType, RoofingType, Scenario, SunroomSide, SunroomType
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, SunroomResult
+
+# Bump when a change to the scenarios or SunroomBuilder would change a result, so old cache files are ignored.
+CACHE_FORMAT_VERSION = 3
+_COMMON_INPUTS = ("scenario", "sunroom_type", "end_cuts", "overhang", "thickness", "wall_width_a", "wall_width_b",
+                  "wall_width_c")
+_INPUT_NAMES = tuple(input_field.name for input_field in fields(ScenarioInputs))
+_LENGTH_INPUTS = frozenset(input_field.name for input_field in fields(ScenarioInputs) if input_field.type is float
+                           and not input_field.name.startswith("pitch"))
+
+SolveKey = tuple[ScenarioInputs, RoofingType | None, bool]
+
+
+def _side_suffix(side: SunroomSide) -> str:
+    return side.name[0].lower()
+
+
+def _input_name(side: SunroomSide | None, length_type: LengthType) -> str:
+    name = length_type.name.lower()
+    return name if side is None else f"{name}_{_side_suffix(side)}"
+
+
+@lru_cache(maxsize=None)
+def _used_inputs(scenario: Scenario, sunroom_type: SunroomType) -> frozenset[str]:
+    try:
+        requirements = get_requirements(scenario, sunroom_type)
+    except KeyError:
+        raise UnknownScenarioError(scenario, sunroom_type) from None
+    used = set(_COMMON_INPUTS)
+    used.update(f"pitch_{_side_suffix(side)}" for side in requirements.pitch_sides)
+    used.update(_input_name(side, length_type) for side, length_type in requirements.wall_heights)
+    return frozenset(used)
+
+
+def canonical_inputs(inputs: ScenarioInputs) -> ScenarioInputs:
+    """
+    The inputs the scenario actually reads, with lengths rounded to the nearest 1/64". Pitches are kept exactly as
+    radians because the same ratio or angle always converts to the same float. Everything else is zero. Two rooms
+    with the same canonical inputs get the same result.
+    :param inputs: ScenarioInputs
+    :return: ScenarioInputs
+    """
+    used = _used_inputs(inputs.scenario, inputs.sunroom_type)
+    values = {}
+    for name in _INPUT_NAMES:
+        value = getattr(inputs, name)
+        if name not in used:
+            value = 0.0
+        elif name in _LENGTH_INPUTS:
+            value = round(value * TICKS_PER_INCH) / TICKS_PER_INCH
+        values[name] = value
+    return ScenarioInputs(**values)
+
+
+def solve_key(inputs: ScenarioInputs, roofing_type: RoofingType | None, fascia: bool) -> SolveKey:
+    return canonical_inputs(inputs), roofing_type, bool(fascia)
+
+
+def fill_toolkit_state(toolkit_state: ToolkitStateModel, inputs: ScenarioInputs,
+                       roofing_type: RoofingType | None = None, fascia: bool = False,
+                       pitch_types: tuple[PitchType, ...] | None = None) -> None:
+    """
+    Writes inputs into toolkit_state the way the views would. Only the inputs the scenario reads are written, the
+    pitches and heights it solves are left as they are.
+    :param toolkit_state: ToolkitStateModel
+    :param inputs: ScenarioInputs
+    :param roofing_type: RoofingType | None
+    :param fascia: bool
+    :param pitch_types: tuple[PitchType, ...] | None: The pitch type of each side in the order of SunroomSide. They set
+        which limit a solved pitch is checked against. The pitch types already in toolkit_state are kept if None.
+    :return:
+    """
+    toolkit_state.sunroom_type = inputs.sunroom_type
+    toolkit_state.scenario = inputs.scenario
+    toolkit_state.roofing_type = roofing_type
+    toolkit_state.end_cuts = inputs.end_cuts
+    toolkit_state.fascia = fascia
+    toolkit_state.overhang.length = inputs.overhang
+    toolkit_state.thickness.length = inputs.thickness
+    for side in SunroomSide:
+        toolkit_state.floor_walls[side].length = getattr(inputs, f"wall_width_{_side_suffix(side)}")
+    if pitch_types is not None:
+        for side, pitch_type in zip(SunroomSide, pitch_types):
+            toolkit_state.pitch[side].pitch_type = pitch_type
+    requirements = get_requirements(inputs.scenario, inputs.sunroom_type)
+    for side in requirements.pitch_sides:
+        toolkit_state.pitch[side].radians = getattr(inputs, f"pitch_{_side_suffix(side)}")
+    for side, length_type in requirements.wall_heights:
+        toolkit_state.wall_heights[(side, length_type)].length = getattr(inputs, _input_name(side, length_type))
+
+
+def calculate_sunroom(inputs: ScenarioInputs, roofing_type: RoofingType | None = None,
+                      fascia: bool = False) -> SunroomResult:
+    """
+    Runs the scenario and SunroomBuilder on fresh models. Only the inputs the scenario reads are used.
+    :param inputs: ScenarioInputs
+    :param roofing_type: RoofingType | None
+    :param fascia: bool
+    :return: SunroomResult
+    """
+    toolkit_state = ToolkitStateModel()
+    fill_toolkit_state(toolkit_state, inputs, roofing_type, fascia)
+    sunroom_model = SunroomModel()
+    outputs = solve(inputs)
+    ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).apply_outputs(outputs)
+    SunroomBuilder(toolkit_state, sunroom_model).build_roof_components()
+    return SunroomResult.from_models(outputs, sunroom_model)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int  # Dropped to stay under maxsize
+    expirations: int  # Dropped because they were older than the ttl
+    size: int
+    maxsize: int
+
+
+class SolveCache:
+    """A bounded LRU cache of SunroomResult records keyed by canonical_inputs. Entries older than ttl seconds are
+    solved again. Nothing uses it unless it is passed in, see solve_cached. Safe to share between threads."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None,
+                 clock: Callable[[], float] = time.time) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1: {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[SolveKey, tuple[SunroomResult, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: SolveKey) -> bool:
+        return self.get(key, count=False) is not None
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.expirations, len(self._entries), self.maxsize)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: SolveKey, count: bool = True) -> SunroomResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and self._clock() - entry[1] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                if count:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self.hits += 1
+            return entry[0]
+
+    def put(self, key: SolveKey, result: SunroomResult) -> None:
+        with self._lock:
+            self._entries[key] = (result, self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def save(self, path: str | Path) -> None:
+        """Writes every entry to a file that load can read in a later session."""
+        with self._lock:
+            entries = list(self._entries.items())
+        with open(path, "wb") as file:
+            pickle.dump((CACHE_FORMAT_VERSION, entries), file, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.debug(f"Saved {len(entries)} solve cache entries to {path}.")
+
+    def load(self, path: str | Path) -> int:
+        """
+        Adds the entries saved in a file. The file is unpickled, so only load files this program wrote. A missing file
+        or one from a different CACHE_FORMAT_VERSION is skipped.
+        :param path: str | Path
+        :return: int: The number of entries loaded
+        """
+        try:
+            with open(path, "rb") as file:
+                version, entries = pickle.load(file)
+        except FileNotFoundError:
+            return 0
+        if version != CACHE_FORMAT_VERSION:
+            logger.warning(f"Ignoring solve cache {path}. It is version {version}, not {CACHE_FORMAT_VERSION}.")
+            return 0
+        loaded = 0
+        with self._lock:
+            for key, (result, created) in entries:
+                if self.ttl is not None and self._clock() - created > self.ttl:
+                    continue
+                self._entries[key] = (result, created)
+                loaded += 1
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        logger.debug(f"Loaded {loaded} solve cache entries from {path}.")
+        return loaded
+
+
+def solve_cached(inputs: ScenarioInputs, roofing_type: RoofingType | None = None, fascia: bool = False,
+                 cache: SolveCache | None = None) -> SunroomResult:
+    """
+    calculate_sunroom through a cache. The room is solved from its canonical inputs, so with or without a cache the
+    result only depends on the key. Without a cache every call solves.
+    :param inputs: ScenarioInputs
+    :param roofing_type: RoofingType | None
+    :param fascia: bool
+    :param cache: SolveCache | None
+    :return: SunroomResult
+    """
+    key = solve_key(inputs, roofing_type, fascia)
+    if cache is None:
+        return calculate_sunroom(*key)
+    result = cache.get(key)
+    if result is None:
+        result = calculate_sunroom(*key)
+        cache.put(key, result)
+    return result
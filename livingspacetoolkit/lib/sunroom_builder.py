@@ -1,12 +1,19 @@
 from math import sin, cos
-from math import floor as math_floor
 from math import ceil as math_ceil
 
 from livingspacetoolkit.config.log_config import logger
-from .toolkit_enums import EndCutType, LengthType, SunroomSide, SunroomType
+from .fixed_length import FOOT, INCH, TICKS_PER_FOOT, FixedLength
+from .toolkit_enums import EndCutType, LengthType, MaterialType, SunroomSide, SunroomType
 from .toolkit_length import ToolkitLength
-from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, BillOfMaterials, BomLineItem, OverhangWarning
 
+# Business logic. Roof panels are 32" wide and the side overhang is at most 16".
+PANEL_WIDTH = FixedLength.from_fraction(32)
+HALF_PANEL_WIDTH = PANEL_WIDTH // 2
+MAX_SIDE_OVERHANG = FixedLength.from_fraction(16)
+PANEL_TOLERANCE = INCH
+# The roof sides that are pitched. A studio pitches toward the B wall and a cathedral toward the A and C walls.
+ROOF_SIDES = {SunroomType.STUDIO: (SunroomSide.B_SIDE,), SunroomType.CATHEDRAL: (SunroomSide.A_SIDE, SunroomSide.C_SIDE)}
 
 
 class SunroomBuilder:
@@ -41,21 +48,23 @@ class SunroomBuilder:
             p_bottom = (gable_wall + overhang) / cos(pitch)
             p_top = (gable_wall + overhang + thickness * sin(pitch)) / cos(pitch)
             p_length = max(p_bottom, p_top)
-        if p_length % 12 <= 1:  # This checks to see if the panel length is a maximum 1inch past the nearest foot
+        # From here on the panel length is a whole number of 1/64" so the foot rounding is exact.
+        p_length = FixedLength.from_inches(p_length)
+        if p_length % FOOT <= PANEL_TOLERANCE:  # Checks if the panel length is a maximum 1inch past the nearest foot
             self.sunroom_model.panel_tolerance[roof_side] = True
             # Returns panel length (in inches) rounded down to nearest foot and adds the 1inch tolerance
             # CORRECTION: We will NOT add 1 inch. Just round down instead
             # panel_length = mfloor(p_length / 12) * 12 + 1
-            value = math_floor(p_length / 12) * 12
+            value = p_length.floor_to(FOOT)
         else:
             # Returns panel length (in inches) rounded up to nearest foot
-            value = math_ceil(p_length / 12) * 12
+            value = p_length.ceil_to(FOOT)
         try:
-            panel_length.length = value
+            panel_length.length = value.inches
         except ValueError as err:
             logger.warning(err)
             self.sunroom_model.max_panel_length[roof_side] = True
-            panel_length.length = value/2
+            panel_length.length = value.inches / 2
         self.sunroom_model.panel_length[roof_side].length = panel_length.length
 
     def _calculate_roof_panels(self, roof_side: SunroomSide):
@@ -64,56 +73,58 @@ class SunroomBuilder:
         :param roof_side:
         :return:
         """
-        overhang = self.toolkit_state_model.overhang.length
-        flat_wall = self.toolkit_state_model.floor_walls[roof_side].length
-        panel_length = self.sunroom_model.panel_length[roof_side].length
+        overhang = self.toolkit_state_model.overhang.fixed
+        flat_wall = self.toolkit_state_model.floor_walls[roof_side].fixed
+        panel_length = self.sunroom_model.panel_length[roof_side].fixed
         max_panel_length = self.sunroom_model.max_panel_length[roof_side]
-        roof_panels = 0
-        if overhang > 16:
-            side_overhang = 16
-        else:
-            side_overhang = overhang
+        half_panels = 0  # Cathedral roofs can end on half a panel so count in halves.
+        side_overhang = min(overhang, MAX_SIDE_OVERHANG)
         # TODO: This doesn't account for when the gable side overhang is negative from calculations.
-        side_overhang_limit = 0
+        # The overhang past the flat wall on all the gable sides together. A studio shares it between the A and C sides.
+        gable_overhang = FixedLength(0)
+        gable_sides = 1
         side_overhang_roof_side = []
         match self.toolkit_state_model.sunroom_type:
             case SunroomType.STUDIO:
                 roof_width = flat_wall + side_overhang * 2
-                roof_panels = math_ceil(roof_width / 32)
-                side_overhang_limit = (roof_panels * 32 - flat_wall) / 2
+                half_panels = roof_width.ceil_div(PANEL_WIDTH) * 2
+                gable_overhang = HALF_PANEL_WIDTH * half_panels - flat_wall
+                gable_sides = 2
                 side_overhang_roof_side = [SunroomSide.A_SIDE, SunroomSide.C_SIDE]
             case SunroomType.CATHEDRAL:
                 roof_width = flat_wall + side_overhang
-                if (roof_width / 32) == math_floor(roof_width / 32):
-                    # If the roof width/32 is exactly a whole number then keep it a whole number
-                    roof_panels = math_floor(roof_width / 32)
-                elif (roof_width / 32) <= math_floor(roof_width / 32) + 0.5:
+                remainder = roof_width % PANEL_WIDTH
+                # If the roof width/32 is exactly a whole number then keep it a whole number
+                half_panels = roof_width // PANEL_WIDTH * 2
+                if remainder and remainder <= HALF_PANEL_WIDTH:
                     # If the roof width/32 is less than #.5 then cut it in half
-                    roof_panels = math_floor(roof_width / 32) + 0.5
+                    half_panels += 1
                     self.sunroom_model.roof_panels_split[roof_side] = True
-                else:
+                elif remainder:
                     # if the roof width/32 is greater than #.5 then add a panel
-                    roof_panels = math_ceil(roof_width / 32)
-                side_overhang_limit = roof_panels * 32 - flat_wall
+                    half_panels += 2
+                gable_overhang = HALF_PANEL_WIDTH * half_panels - flat_wall
                 side_overhang_roof_side = [SunroomSide.B_SIDE]
             case _:
                 raise NotImplementedError
-        self.sunroom_model.roof_panels[roof_side] = roof_panels
+        self.sunroom_model.roof_panels[roof_side] = half_panels // 2 if half_panels % 2 == 0 else half_panels / 2
+        # An odd tick count shared between two sides ends on 1/128", so the checks compare the total before it is
+        # divided and the overhang shown is rounded half up to the nearest 1/64".
+        side_overhang_limit = FixedLength((2 * gable_overhang.ticks + gable_sides) // (2 * gable_sides))
         for overhang_side in side_overhang_roof_side:
-            if side_overhang_limit < side_overhang:
+            if gable_overhang < side_overhang * gable_sides:
                 # Overhang too short
                 self.sunroom_model.roof_overhang[overhang_side]["short_check"] = True
-                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang_limit
-            elif side_overhang_limit > 16:
+                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang_limit.inches
+            elif gable_overhang > MAX_SIDE_OVERHANG * gable_sides:
                 # Overhang too long
                 self.sunroom_model.roof_overhang[overhang_side]["long_check"] = True
-                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang_limit
+                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang_limit.inches
             else:
-                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang
-        if max_panel_length:
-            self.sunroom_model.roof_area[roof_side] = math_ceil((panel_length * 2 * roof_panels * 32) / 144)
-        else:
-            self.sunroom_model.roof_area[roof_side] = math_ceil((panel_length * roof_panels * 32) / 144)
+                self.sunroom_model.roof_overhang[overhang_side]["value"].length = side_overhang.inches
+        # Roof area in sq. ft. rounded up. Split panels double the area.
+        roof_area_ticks = panel_length.ticks * (HALF_PANEL_WIDTH * half_panels).ticks * (2 if max_panel_length else 1)
+        self.sunroom_model.roof_area[roof_side] = -(-roof_area_ticks // TICKS_PER_FOOT ** 2)
 
     def _calculate_hang_rail(self, roof_side: SunroomSide):
         hang_rails = 0
@@ -170,36 +181,75 @@ class SunroomBuilder:
                     self.sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length = fascia_half_gable / 2
 
 
+    def build_panel_lengths(self) -> None:
+        for roof_side in ROOF_SIDES.get(self.toolkit_state_model.sunroom_type, ()):
+            self._calculate_panel_length(roof_side)
 
-    def build_roof_components(self) -> None:
-        match self.toolkit_state_model.sunroom_type:
-            case SunroomType.STUDIO:
-                self._calculate_panel_length(SunroomSide.B_SIDE)
-                self._calculate_roof_panels(SunroomSide.B_SIDE)
-                self._calculate_hang_rail(SunroomSide.B_SIDE)
-                self._calculate_fascia(SunroomSide.B_SIDE)
-                pitch = self.toolkit_state_model.pitch[SunroomSide.B_SIDE].pitch_value
-                flat_wall = self.toolkit_state_model.floor_walls[SunroomSide.B_SIDE].length
-                gable_wall = self.sunroom_model.gable_wall[SunroomSide.B_SIDE].length
-                armstrong_b_side = self._calculate_armstrong_panels(pitch, gable_wall, flat_wall)
-                self.sunroom_model.armstrong_panels = armstrong_b_side
-            case SunroomType.CATHEDRAL:
-                self._calculate_panel_length(SunroomSide.A_SIDE)
-                self._calculate_panel_length(SunroomSide.C_SIDE)
-                self._calculate_roof_panels(SunroomSide.A_SIDE)
-                self._calculate_roof_panels(SunroomSide.C_SIDE)
-                self._calculate_hang_rail(SunroomSide.A_SIDE)
-                self._calculate_hang_rail(SunroomSide.C_SIDE)
-                self._calculate_fascia(SunroomSide.A_SIDE)
-                self._calculate_fascia(SunroomSide.C_SIDE)
-
-                pitch_a_side = self.toolkit_state_model.pitch[SunroomSide.A_SIDE].pitch_value
-                flat_wall_a_side = self.toolkit_state_model.floor_walls[SunroomSide.A_SIDE].length
-                gable_wall_a_side = self.sunroom_model.gable_wall[SunroomSide.A_SIDE].length
-                pitch_c_side = self.toolkit_state_model.pitch[SunroomSide.C_SIDE].pitch_value
-                flat_wall_c_side = self.toolkit_state_model.floor_walls[SunroomSide.C_SIDE].length
-                gable_wall_c_side = self.sunroom_model.gable_wall[SunroomSide.C_SIDE].length
-
-                armstrong_a_side = self._calculate_armstrong_panels(pitch_a_side, gable_wall_a_side, flat_wall_a_side)
-                armstrong_c_side = self._calculate_armstrong_panels(pitch_c_side, gable_wall_c_side, flat_wall_c_side)
-                self.sunroom_model.armstrong_panels = armstrong_a_side + armstrong_c_side
\ No newline at end of file
+    def build_roof_panels(self) -> None:
+        for roof_side in ROOF_SIDES.get(self.toolkit_state_model.sunroom_type, ()):
+            self._calculate_roof_panels(roof_side)
+
+    def build_hang_rails(self) -> None:
+        for roof_side in ROOF_SIDES.get(self.toolkit_state_model.sunroom_type, ()):
+            self._calculate_hang_rail(roof_side)
+
+    def build_fascia(self) -> None:
+        if not self.toolkit_state_model.fascia:
+            return
+        for roof_side in ROOF_SIDES.get(self.toolkit_state_model.sunroom_type, ()):
+            self._calculate_fascia(roof_side)
+
+    def build_armstrong_panels(self) -> None:
+        armstrong_panels = 0
+        for roof_side in ROOF_SIDES.get(self.toolkit_state_model.sunroom_type, ()):
+            pitch = self.toolkit_state_model.pitch[roof_side].pitch_value
+            flat_wall = self.toolkit_state_model.floor_walls[roof_side].length
+            gable_wall = self.sunroom_model.gable_wall[roof_side].length
+            armstrong_panels += self._calculate_armstrong_panels(pitch, gable_wall, flat_wall)
+        self.sunroom_model.armstrong_panels = armstrong_panels
+
+    def build_bill_of_materials(self) -> BillOfMaterials:
+        """
+        Collects the panels, hang rails, fascia, Armstrong boxes and overhang warnings the other stages worked out.
+        :return: BillOfMaterials: Also saved to the sunroom model
+        """
+        sunroom_type = self.toolkit_state_model.sunroom_type
+        items = []
+        for roof_side in ROOF_SIDES.get(sunroom_type, ()):
+            halved = self.sunroom_model.max_panel_length[roof_side]
+            items.append(BomLineItem(MaterialType.ROOF_PANEL, roof_side,
+                                     math_ceil(self.sunroom_model.roof_panels[roof_side]) * (2 if halved else 1),
+                                     self.sunroom_model.panel_length[roof_side].fixed, halved,
+                                     self.sunroom_model.roof_panels_split[roof_side]))
+        for roof_side in ROOF_SIDES.get(sunroom_type, ()):
+            hang_rails = self.sunroom_model.hang_rails[roof_side]
+            items.append(BomLineItem(MaterialType.HANG_RAIL, roof_side, 4 if hang_rails["max_length"] else 2,
+                                     hang_rails["value"].fixed, hang_rails["max_length"]))
+        if self.toolkit_state_model.fascia:
+            for side in SunroomSide:
+                fascia = self.sunroom_model.fascia[side]
+                # A studio only uses the first B wall piece.
+                for length in fascia["value"]:
+                    if length.modified:
+                        items.append(BomLineItem(MaterialType.FASCIA, side, 2 if fascia["max_length"] else 1,
+                                                 length.fixed, fascia["max_length"]))
+        items.append(BomLineItem(MaterialType.ARMSTRONG_BOX, None, self.sunroom_model.armstrong_panels))
+        warnings = []
+        for side in SunroomSide:
+            roof_overhang = self.sunroom_model.roof_overhang[side]
+            if roof_overhang["short_check"] or roof_overhang["long_check"]:
+                warnings.append(OverhangWarning(side, roof_overhang["value"].fixed, roof_overhang["short_check"]))
+        bill_of_materials = BillOfMaterials(sunroom_type, tuple(items), tuple(warnings),
+                                            sum(self.sunroom_model.roof_area.values()))
+        self.sunroom_model.bill_of_materials = bill_of_materials
+        return bill_of_materials
+
+    def build_roof_components(self) -> BillOfMaterials:
+        """Runs every stage in order. Each stage only reads the stages before it so SunroomCalculator can rerun a
+        stage and everything after it on its own."""
+        self.build_panel_lengths()
+        self.build_roof_panels()
+        self.build_hang_rails()
+        self.build_fascia()
+        self.build_armstrong_panels()
+        return self.build_bill_of_materials()
@@ -0,0 +1,169 @@
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable
+
+from livingspacetoolkit.config.log_config import logger
+from .base_scenario_class import ScenarioSelector, solve
+from .scenario_core import ScenarioInputs, ScenarioOutputs
+from .sunroom_builder import SunroomBuilder
+from .toolkit_enums import SunroomSide
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, SunroomResult
+
+SCENARIO = "scenario"
+PANEL_LENGTH = "panel_length"
+ROOF_PANELS = "roof_panels"
+HANG_RAILS = "hang_rails"
+FASCIA = "fascia"
+ARMSTRONG_PANELS = "armstrong_panels"
+BILL_OF_MATERIALS = "bill_of_materials"
+
+_SCENARIO_INPUTS = tuple(input_field.name for input_field in fields(ScenarioInputs))
+# How each side's pitch is written, in the order of SunroomSide. It sets the steepest pitch the scenario may solve.
+_PITCH_TYPES = ("pitch_type_a", "pitch_type_b", "pitch_type_c")
+# Every input a node can read. The scenario inputs, the pitch types and the fascia checkbox, which only the builder
+# uses.
+INPUT_NAMES = _SCENARIO_INPUTS + _PITCH_TYPES + ("fascia",)
+_WALL_WIDTHS = ("wall_width_a", "wall_width_b", "wall_width_c")
+
+
+@dataclass(frozen=True, slots=True)
+class CalculationNode:
+    """One stage of a sunroom calculation.
+    after: The stages whose results this stage reads
+    inputs: The inputs this stage reads directly, names from INPUT_NAMES
+    outputs: The SunroomModel fields this stage writes. They are reset before the stage runs again."""
+    name: str
+    after: tuple[str, ...]
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+
+
+# In the order they run. A node only comes after the nodes it reads.
+NODES = (
+    # The scenario reads every height and pitch and writes the solved ones back. Watching them all means editing a
+    # solved value puts it back the way a full calculation would.
+    CalculationNode(SCENARIO, (), INPUT_NAMES[:-1], ("gable_wall",)),
+    CalculationNode(PANEL_LENGTH, (SCENARIO,), ("sunroom_type", "overhang", "thickness", "end_cuts"),
+                    ("panel_length", "panel_tolerance", "max_panel_length")),
+    CalculationNode(ROOF_PANELS, (PANEL_LENGTH,), ("sunroom_type", "overhang") + _WALL_WIDTHS,
+                    ("roof_panels", "roof_panels_split", "roof_overhang", "roof_area")),
+    CalculationNode(HANG_RAILS, (ROOF_PANELS,), ("sunroom_type",), ("hang_rails",)),
+    CalculationNode(FASCIA, (ROOF_PANELS,), ("sunroom_type", "fascia"), ("fascia",)),
+    CalculationNode(ARMSTRONG_PANELS, (SCENARIO,), ("sunroom_type",) + _WALL_WIDTHS, ("armstrong_panels",)),
+    CalculationNode(BILL_OF_MATERIALS, (ROOF_PANELS, HANG_RAILS, FASCIA, ARMSTRONG_PANELS), ("sunroom_type", "fascia"),
+                    ("bill_of_materials",)),
+)
+
+
+def _downstream(nodes: Iterable[CalculationNode]) -> Dict[str, frozenset[str]]:
+    """Each node and every node that reads it, directly or through other nodes."""
+    downstream: Dict[str, set[str]] = {}
+    for node in nodes:
+        downstream[node.name] = {node.name}
+        for name, names in downstream.items():
+            if names & set(node.after):
+                names.add(node.name)
+    return {name: frozenset(names) for name, names in downstream.items()}
+
+
+DOWNSTREAM = _downstream(NODES)
+_NODES_BY_INPUT: Dict[str, frozenset[str]] = {
+    input_name: frozenset(node.name for node in NODES if input_name in node.inputs) for input_name in INPUT_NAMES}
+
+
+class SunroomCalculator:
+    """Calculates a sunroom the same way as running the scenario and SunroomBuilder.build_roof_components, but keeps
+    the results and only reruns the stages whose inputs changed since the last calculation. Changing the overhang
+    reruns everything, while the fascia checkbox only reruns the fascia. Call invalidate when a business rule behind a
+    stage changes."""
+
+    def __init__(self, toolkit_state_model: ToolkitStateModel, sunroom_model: SunroomModel | None = None) -> None:
+        self.toolkit_state_model = toolkit_state_model
+        self.sunroom_model = sunroom_model if sunroom_model is not None else SunroomModel()
+        # What the scenario solved the last time it ran.
+        self.outputs: ScenarioOutputs | None = None
+        self._last_inputs: Dict[str, object] | None = None
+        self._invalid: set[str] = set(DOWNSTREAM)
+
+    def _read_inputs(self) -> Dict[str, object]:
+        inputs = ScenarioInputs.from_toolkit_state(self.toolkit_state_model)
+        values = {name: getattr(inputs, name) for name in _SCENARIO_INPUTS}
+        for side, name in zip(SunroomSide, _PITCH_TYPES):
+            values[name] = self.toolkit_state_model.pitch[side].pitch_type
+        values["fascia"] = self.toolkit_state_model.fascia
+        return values
+
+    def changed_inputs(self) -> set[str]:
+        """The inputs that are different from the last calculation. Every input before the first calculation."""
+        current = self._read_inputs()
+        if self._last_inputs is None:
+            return set(current)
+        return {name for name, value in current.items() if self._last_inputs[name] != value}
+
+    def stale_nodes(self) -> set[str]:
+        """The stages the next calculate will rerun."""
+        stale = set(self._invalid)
+        for input_name in self.changed_inputs():
+            for name in _NODES_BY_INPUT[input_name]:
+                stale |= DOWNSTREAM[name]
+        return stale
+
+    def invalidate(self, *names: str) -> None:
+        """
+        Marks stages, and every stage after them, to be rerun. With no names everything is rerun.
+        :param names: str: Node names like PANEL_LENGTH
+        :return:
+        """
+        for name in names or DOWNSTREAM:
+            self._invalid |= DOWNSTREAM[name]
+
+    def calculate(self) -> list[str]:
+        """
+        Reruns the stale stages in order. If a stage raises, everything is rerun next time.
+        :return: list[str]: The names of the stages that ran
+        """
+        stale = self.stale_nodes()
+        ran: list[str] = []
+        try:
+            for node in NODES:
+                if node.name not in stale:
+                    continue
+                self.sunroom_model.reset(*node.outputs)
+                self._run(node.name)
+                ran.append(node.name)
+        except Exception:
+            self._last_inputs = None
+            self._invalid = set(DOWNSTREAM)
+            raise
+        # Read after running so the values the scenario wrote back don't count as changes next time.
+        self._last_inputs = self._read_inputs()
+        self._invalid.clear()
+        logger.debug(f"Recalculated {ran or 'nothing'} for the {self.toolkit_state_model.sunroom_type.name} sunroom.")
+        return ran
+
+    def result(self) -> SunroomResult:
+        """An immutable copy of the last calculation."""
+        if self.outputs is None:
+            raise RuntimeError("Nothing has been calculated yet.")
+        return SunroomResult.from_models(self.outputs, self.sunroom_model)
+
+    def _run(self, name: str) -> None:
+        builder = SunroomBuilder(self.toolkit_state_model, self.sunroom_model)
+        match name:
+            case "scenario":
+                scenario = ScenarioSelector(self.toolkit_state_model).identify_scenario(self.sunroom_model)
+                self.outputs = solve(ScenarioInputs.from_toolkit_state(self.toolkit_state_model))
+                scenario.apply_outputs(self.outputs)
+            case "panel_length":
+                builder.build_panel_lengths()
+            case "roof_panels":
+                builder.build_roof_panels()
+            case "hang_rails":
+                builder.build_hang_rails()
+            case "fascia":
+                builder.build_fascia()
+            case "armstrong_panels":
+                builder.build_armstrong_panels()
+            case "bill_of_materials":
+                builder.build_bill_of_materials()
+            case _:
+                raise NotImplementedError
@@ -48,4 +48,18 @@ class LengthType(Enum):
     WALL_WIDTH = auto()
     PANEL = auto()
     HANG_RAIL = auto()
-    FASCIA = auto()
\ No newline at end of file
+    FASCIA = auto()
+
+class LengthError(Enum):
+    # These numbers are the per-row error codes of the bulk length parser.
+    OK = 0
+    EMPTY = 1
+    INVALID = 2
+    NEGATIVE = 3
+    TOO_LONG = 4
+
+class MaterialType(Enum):
+    ROOF_PANEL = auto()
+    HANG_RAIL = auto()
+    FASCIA = auto()
+    ARMSTRONG_BOX = auto()
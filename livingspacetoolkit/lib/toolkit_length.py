@@ -1,53 +1,55 @@
 import re
+from functools import lru_cache
+from math import isfinite, isnan
 
+from .fixed_length import FixedLength
 from .toolkit_enums import LengthType, SunroomSide
 from livingspacetoolkit.config.log_config import logger
 
+PARSE_CACHE_SIZE = 4096
+# Business logic. Hang rails and fascia cannot exceed 216" and the maximum panel length is 288".
+LENGTH_LIMITS = {LengthType.HANG_RAIL: 216, LengthType.FASCIA: 216, LengthType.PANEL: 288}
 
-class ToolkitLength:
-    """This class is used for all length calculations. It includes regex to convert imperial units into inches, the
-    ability to determine which side sunroom the length is for, and what type of feature the length is for."""
-
-    IMPERIAL_REGEX = re.compile(
-        r"""
-        ^\s*
+IMPERIAL_REGEX = re.compile(
+    r"""
+    ^\s*
 
-        # -------- FEET (optional) --------
+    # -------- FEET (optional) --------
+    (?:
+        (?:(?P<f_whole>\d+)\s+)?
         (?:
-            (?:(?P<f_whole>\d+)\s+)?                 
-            (?:
-                (?P<f_num>\d+)\s*/\s*(?P<f_den>\d+)  
-                |
-                (?P<f_int>\d+)                       
-            )
-            \s*
-            (?:'|ft\.?|feet)
-        )?
-
+            (?P<f_num>\d+)\s*/\s*(?P<f_den>\d+)
+            |
+            (?P<f_int>\d+)
+        )
         \s*
+        (?:'|ft\.?|feet)
+    )?
 
-        # -------- OPTIONAL SEPARATOR --------
-        (?:
-            \s*(?:-|–|—|to)\s*
-        )?
+    \s*
+
+    # -------- OPTIONAL SEPARATOR --------
+    (?:
+        \s*(?:-|–|—|to)\s*
+    )?
 
-        # -------- INCHES (optional) --------
+    # -------- INCHES (optional) --------
+    (?:
+        (?:(?P<i_whole>\d+)\s+)?
         (?:
-            (?:(?P<i_whole>\d+)\s+)?                 
-            (?:
-                (?P<i_num>\d+)\s*/\s*(?P<i_den>\d+)  
-                |
-                (?P<i_int>\d+)                       
-            )
-            \s?
-            (?:"|in\.?|inches|inch)?
-        )?
-
-        \s*$
-        """,
-        re.IGNORECASE | re.VERBOSE
-    )
-    BARE_NUMBER_REGEX = re.compile(
+            (?P<i_num>\d+)\s*/\s*(?P<i_den>\d+)
+            |
+            (?P<i_int>\d+)
+        )
+        \s?
+        (?:"|in\.?|inches|inch)?
+    )?
+
+    \s*$
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+BARE_NUMBER_REGEX = re.compile(
     r"""
     ^\s*
     (?P<value>\d+(?:\.\d+)?)     # Integer or decimal
@@ -56,8 +58,65 @@ class ToolkitLength:
     \s*$
     """,
     re.IGNORECASE | re.VERBOSE
-    )
+)
+
+
+def _to_float(whole: str | None, numerator: str | None, denominator: str | None, integer: str | None) -> float | None:
+    """The value of one side of IMPERIAL_REGEX, or None if its denominator is zero."""
+    value = 0.0
+    if integer:
+        value += float(integer)
+    if denominator:
+        if int(denominator) == 0:
+            return None
+        value += int(numerator) / int(denominator)
+    if whole:
+        value += int(whole)
+    return value
+
+
+def scan_imperial_to_inches(text: str) -> float:
+    """
+    Converts an imperial measurement into inches. Accepts bare numbers like 15.75 or 15.75in, feet and inches like
+    1' - 6", 1ft 6in or 1 1/2 feet - 1 1/2 inches and fractions like 1/2". Case is ignored. Returns NaN for anything
+    else instead of raising.
+    :param text: str
+    :return: float: The length in inches
+    """
+    # ---- Case 1: Bare number → inches ----
+    match = BARE_NUMBER_REGEX.match(text)
+    if match:
+        return float(match.group("value"))
+    # ---- Case 2: Imperial measurement ----
+    match = IMPERIAL_REGEX.match(text)
+    if not match:
+        return float("nan")
+    feet = _to_float(*match.group("f_whole", "f_num", "f_den", "f_int"))
+    inches = _to_float(*match.group("i_whole", "i_num", "i_den", "i_int"))
+    if feet is None or inches is None:
+        return float("nan")
+    return feet * 12 + inches
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_imperial_to_inches(text: str) -> float:
+    """
+    Same as scan_imperial_to_inches but raises ValueError for an invalid measurement. Recent inputs are cached.
+    :param text: str
+    :return: float: The length in inches
+    """
+    inches = scan_imperial_to_inches(text)
+    if isnan(inches):
+        raise ValueError(f"Invalid imperial format: {text}")
+    return inches
+
+
+class ToolkitLength:
+    """This class is used for all length calculations. It includes regex to convert imperial units into inches, the
+    ability to determine which side sunroom the length is for, and what type of feature the length is for."""
+
     NEGATIVE_MEASUREMENT_REGEX = re.compile(r"^\s*-\s*\d")
+    __slots__ = ("_length", "_length_type", "_sunroom_side", "_modified")
 
     def __init__(self, length_type: LengthType, sunroom_side: SunroomSide | None = None):
         self._length: float = 0
@@ -66,41 +125,41 @@ class ToolkitLength:
         self._modified: bool = False
 
     def __repr__(self) -> str:
-        return f"ToolkitLength({self.length_type}, {self.sunroom_side}).length({self.length})"
+        return f"{type(self).__name__}({self.length_type}, {self.sunroom_side}).length({self.length})"
 
     def __eq__(self, other):
         if isinstance(other, ToolkitLength):
             return (self.length_type == other.length_type and self.sunroom_side == other.sunroom_side
                     and self.length == other.length)
-        return NotImplementedError
+        return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, ToolkitLength):
             return (self.length_type == other.length_type and self.sunroom_side == other.sunroom_side
                     and self.length < other.length)
-        return NotImplementedError
+        return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, ToolkitLength):
             return (self.length_type == other.length_type and self.sunroom_side == other.sunroom_side
                     and self.length > other.length)
-        return NotImplementedError
+        return NotImplemented
 
     def __add__(self, other):
         if isinstance(other, ToolkitLength):
             if self.length_type == other.length_type and self.sunroom_side == other.sunroom_side:
                 return  self.length + other.length
             else:
-                return ValueError("The length type and sunroom side must be the same.")
-        return NotImplementedError
+                raise ValueError("The length type and sunroom side must be the same.")
+        return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, ToolkitLength):
             if self.length_type == other.length_type and self.sunroom_side == other.sunroom_side:
                 return  self.length - other.length
             else:
-                return ValueError("The length type and sunroom side must be the same.")
-        return NotImplementedError
+                raise ValueError("The length type and sunroom side must be the same.")
+        return NotImplemented
 
     @property
     def length(self):
@@ -108,6 +167,11 @@ class ToolkitLength:
 
     @length.setter
     def length(self, value: str|float|int) -> None:
+        if isinstance(value, float|int) and not isinstance(value, bool):
+            # Numbers from calculations skip the regex entirely.
+            self._length = self._check_number(value)
+            self.modified = True
+            return
         if isinstance(value, str) and not value:
             raise ValueError("Length cannot be empty")
         if self._is_negative_measurement(value):
@@ -115,6 +179,11 @@ class ToolkitLength:
         self._length = self._check_business_logic(value)
         self.modified = True
 
+    @property
+    def fixed(self) -> FixedLength:
+        """The length rounded to the nearest 1/64" for exact integer math."""
+        return FixedLength.from_inches(self._length)
+
     @property
     def length_type(self) -> LengthType:
         return self._length_type
@@ -135,62 +204,73 @@ class ToolkitLength:
     def modified(self, value: bool) -> None:
         self._modified = value
 
-    def _parse_imperial_to_inches(self, text: str) -> float:
-        # ---- Case 1: Bare number → inches ----
-        m = self.BARE_NUMBER_REGEX.match(text)
-        if m:
-            return float(m.group("value"))
-        # ---- Case 2: Imperial measurement ----
-        match = self.IMPERIAL_REGEX.match(text)
-        if not match:
-            raise ValueError(f"Invalid imperial format: {text}")
-
-        def to_float(whole, num, den, integer):
-            value = 0.0
-            if integer:
-                value += float(integer)
-            if num and den:
-                value += int(num) / int(den)
-            if whole:
-                value += int(whole)
-            return value
-
-        feet = to_float(
-            match.group("f_whole"),
-            match.group("f_num"),
-            match.group("f_den"),
-            match.group("f_int"),
-        )
-
-        inches = to_float(
-            match.group("i_whole"),
-            match.group("i_num"),
-            match.group("i_den"),
-            match.group("i_int"),
-        )
+    def freeze(self) -> "FrozenToolkitLength":
+        """An immutable, hashable copy of this length."""
+        return FrozenToolkitLength(self.length_type, self.sunroom_side, self.length if self.modified else None)
 
-        return feet * 12 + inches
+    @staticmethod
+    def _parse_imperial_to_inches(text: str) -> float:
+        return parse_imperial_to_inches(text)
 
     def _is_negative_measurement(self, value: str|float|int) -> bool:
         if isinstance(value, float|int):
             value = str(value) # Just turn it into a string and keep it simple.
         return bool(self.NEGATIVE_MEASUREMENT_REGEX.match(value))
 
+    def _check_number(self, value: float|int) -> float:
+        length = float(value)
+        if not isfinite(length):
+            raise ValueError(f"Invalid length: {value}")
+        if length < 0:
+            raise ValueError(f"Length cannot be negative: {value}")
+        return self._check_limits(length)
+
     def _check_business_logic(self, value: str|float|int) -> float:
         if isinstance(value, float|int):
             value = str(value)
-        length = self._parse_imperial_to_inches(value)
-        if self.length_type == LengthType.HANG_RAIL and length > 216:
+        return self._check_limits(self._parse_imperial_to_inches(value))
+
+    def _check_limits(self, length: float) -> float:
+        if self.length_type == LengthType.HANG_RAIL and length > LENGTH_LIMITS[LengthType.HANG_RAIL]:
             # Business logic. Hang rails and Fascia cannot exceed 216". Raise a ValueError, divide them in half,
             # try again
             logger.warning(f"The hang rails are too long: {length}")
             raise ValueError("Hang rails are too long. Divide them in half")
-        elif self.length_type == LengthType.FASCIA and length > 216:
+        elif self.length_type == LengthType.FASCIA and length > LENGTH_LIMITS[LengthType.FASCIA]:
             logger.warning(f"The fascia is too long: {length}")
             raise ValueError("Fascia is too long. Divide them in half")
-        elif self.length_type == LengthType.PANEL and length > 288:
+        elif self.length_type == LengthType.PANEL and length > LENGTH_LIMITS[LengthType.PANEL]:
             # Business logic. The maximum panel length is 288 in.
             logger.warning(f"The panel length has exceeded the max allowable: {length}")
             raise ValueError("The panel length has exceeded the max allowable.")
         else:
             return length
+
+
+class FrozenToolkitLength(ToolkitLength):
+    """A ToolkitLength that can't be changed once it is made. It is hashable so it can be used as a dictionary or cache
+    key. The length goes through the same parsing and business logic as ToolkitLength.length."""
+    __slots__ = ()
+
+    def __init__(self, length_type: LengthType, sunroom_side: SunroomSide | None = None,
+                 length: str | float | int | None = None):
+        value = ToolkitLength(length_type, sunroom_side)
+        if length is not None:
+            value.length = length
+        for name in ToolkitLength.__slots__:
+            object.__setattr__(self, name, getattr(value, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} cannot be changed")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} cannot be changed")
+
+    def __hash__(self) -> int:
+        return hash((self.length_type, self.sunroom_side, self.length))
+
+    def __reduce__(self):
+        return type(self), (self.length_type, self.sunroom_side, self.length if self.modified else None)
+
+    def freeze(self) -> "FrozenToolkitLength":
+        return self
@@ -1,5 +1,5 @@
 import re
-from math import atan, radians
+from math import atan, atan2, degrees, isfinite, radians, tan
 
 from .toolkit_enums import PitchType, SunroomSide
 from livingspacetoolkit.config.log_config import logger
@@ -38,6 +38,11 @@ class ToolkitPitch:
     )
 
     NEGATIVE_INPUT_REGEX = re.compile(r"^\s*-\s*\d")
+    # Business logic. Pitches must be less than 60 degrees or a 21/12 ratio.
+    MAX_ANGLE = 60
+    MAX_RATIO = 21
+    __slots__ = ("_pitch_type", "_roof_side", "_pitch_value", "_modified")
+
     def __init__(self, pitch_type: PitchType, roof_side: SunroomSide):
         self._pitch_type = pitch_type
         self._roof_side = roof_side
@@ -45,41 +50,41 @@ class ToolkitPitch:
         self._modified: bool = False
 
     def __repr__(self) -> str:
-        return f"ToolkitPitch({self.pitch_type}, {self.roof_side}).pitch_value({self.pitch_value})"
+        return f"{type(self).__name__}({self.pitch_type}, {self.roof_side}).pitch_value({self.pitch_value})"
 
     def __eq__(self, other):
         if isinstance(other, ToolkitPitch):
             return (self.pitch_type == other.pitch_type and self.roof_side == other.roof_side
                     and self.pitch_value == other.pitch_value)
-        return NotImplementedError
+        return NotImplemented
 
     def __lt__(self, other):
         if isinstance(other, ToolkitPitch):
             return (self.pitch_type == other.pitch_type and self.roof_side == other.roof_side
                     and self.pitch_value < other.pitch_value)
-        return NotImplementedError
+        return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, ToolkitPitch):
             return (self.pitch_type == other.pitch_type and self.roof_side == other.roof_side
                     and self.pitch_value > other.pitch_value)
-        return NotImplementedError
+        return NotImplemented
 
     def __add__(self, other):
         if isinstance(other, ToolkitPitch):
             if self.pitch_type == other.pitch_type and self.roof_side == other.roof_side:
                 return self.pitch_value + other.pitch_value
             else:
-                return ValueError("The pitch type and roof sides must be the same.")
-        return NotImplementedError
+                raise ValueError("The pitch type and roof sides must be the same.")
+        return NotImplemented
 
     def __sub__(self, other):
         if isinstance(other, ToolkitPitch):
             if self.pitch_type == other.pitch_type and self.roof_side == other.roof_side:
                 return self.pitch_value - other.pitch_value
             else:
-                return ValueError("The pitch type and roof sides must be the same.")
-        return NotImplementedError
+                raise ValueError("The pitch type and roof sides must be the same.")
+        return NotImplemented
 
     @property
     def pitch_value(self) -> float:
@@ -87,24 +92,87 @@ class ToolkitPitch:
 
     @pitch_value.setter
     def pitch_value(self, value: str|float|int) -> None:
-        # TODO: This currently accepts inches and degrees from user input but should add option for radians from calculations
+        # This parses user input in the units of pitch_type. Calculations should use the radians setter instead.
         if isinstance(value, str) and not value:
             raise ValueError("Angle/Ratio cannot be empty")
         if self._is_negative_input(value):
             raise ValueError(f"Input cannot be negative: {value}")
         match self.pitch_type:
             case PitchType.ANGLE:
-                angle = self.parse_angle(value)
-                if angle >= 60:
-                    raise ValueError(f"Angle is too high: {angle}")
-                self._pitch_value = radians(angle)
+                self.angle = self.parse_angle(value)
             case PitchType.RATIO:
-                ratio = self.parse_number(value)
-                if ratio >= 21:
-                    raise ValueError(f"Ratio is too high: {ratio}")
-                self._pitch_value = atan(ratio/12)
+                self.ratio = self.parse_number(value)
+
+    @property
+    def radians(self) -> float:
+        return self._pitch_value
+
+    @radians.setter
+    def radians(self, value: float) -> None:
+        # The limit that applies depends on the pitch type.
+        value = self._check_number(value)
+        match self.pitch_type:
+            case PitchType.ANGLE if value >= radians(self.MAX_ANGLE):
+                raise ValueError(f"Angle is too high: {degrees(value)}")
+            case PitchType.RATIO if value >= atan2(self.MAX_RATIO, 12):
+                raise ValueError(f"Ratio is too high: {tan(value) * 12}")
+        self._pitch_value = value
+        self.modified = True
+
+    @property
+    def angle(self) -> float:
+        return degrees(self._pitch_value)
+
+    @angle.setter
+    def angle(self, value: float) -> None:
+        value = self._check_number(value)
+        if value >= self.MAX_ANGLE:
+            raise ValueError(f"Angle is too high: {value}")
+        self._pitch_value = radians(value)
         self.modified = True
 
+    @property
+    def ratio(self) -> float:
+        return tan(self._pitch_value) * 12
+
+    @ratio.setter
+    def ratio(self, value: float) -> None:
+        value = self._check_number(value)
+        if value >= self.MAX_RATIO:
+            raise ValueError(f"Ratio is too high: {value}")
+        self._pitch_value = atan(value/12)
+        self.modified = True
+
+    @classmethod
+    def from_radians(cls, value: float, roof_side: SunroomSide,
+                     pitch_type: PitchType = PitchType.RATIO) -> "ToolkitPitch":
+        """
+        Makes a pitch straight from radians without parsing anything.
+        :param value: float: The pitch in radians
+        :param roof_side: SunroomSide
+        :param pitch_type: PitchType: Which limit applies and how the pitch is shown
+        :return: ToolkitPitch
+        """
+        pitch = cls(pitch_type, roof_side)
+        pitch.radians = value
+        return pitch
+
+    @classmethod
+    def from_angle(cls, value: float, roof_side: SunroomSide) -> "ToolkitPitch":
+        pitch = cls(PitchType.ANGLE, roof_side)
+        pitch.angle = value
+        return pitch
+
+    @classmethod
+    def from_ratio(cls, value: float, roof_side: SunroomSide) -> "ToolkitPitch":
+        pitch = cls(PitchType.RATIO, roof_side)
+        pitch.ratio = value
+        return pitch
+
+    def freeze(self) -> "FrozenToolkitPitch":
+        """An immutable, hashable copy of this pitch."""
+        return FrozenToolkitPitch(self.pitch_type, self.roof_side, self.radians if self.modified else None)
+
     @property
     def pitch_type(self) -> PitchType:
         return self._pitch_type
@@ -148,7 +216,43 @@ class ToolkitPitch:
 
         return int(m.group("fnum")) / int(m.group("fden"))
 
+    @staticmethod
+    def _check_number(value: float|int) -> float:
+        value = float(value)
+        if not isfinite(value):
+            raise ValueError(f"Invalid pitch: {value}")
+        if value < 0:
+            raise ValueError(f"Input cannot be negative: {value}")
+        return value
+
     def _is_negative_input(self, text: str|float|int) -> bool:
         if isinstance(text, float|int):
             text = str(text)
-        return bool(self.NEGATIVE_INPUT_REGEX.match(text))
\ No newline at end of file
+        return bool(self.NEGATIVE_INPUT_REGEX.match(text))
+
+class FrozenToolkitPitch(ToolkitPitch):
+    """A ToolkitPitch that can't be changed once it is made. It is hashable so it can be used as a dictionary or cache
+    key. The pitch is given in radians and is checked against the limit of the pitch type."""
+    __slots__ = ()
+
+    def __init__(self, pitch_type: PitchType, roof_side: SunroomSide, radians: float | None = None):
+        value = ToolkitPitch(pitch_type, roof_side)
+        if radians is not None:
+            value.radians = radians
+        for name in ToolkitPitch.__slots__:
+            object.__setattr__(self, name, getattr(value, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} cannot be changed")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} cannot be changed")
+
+    def __hash__(self) -> int:
+        return hash((self.pitch_type, self.roof_side, self.pitch_value))
+
+    def __reduce__(self):
+        return type(self), (self.pitch_type, self.roof_side, self.radians if self.modified else None)
+
+    def freeze(self) -> "FrozenToolkitPitch":
+        return self
@@ -2,28 +2,64 @@
 # nuitka-project: --mode=onefile
 # nuitka-project: --windows-console-mode=disable
 # nuitka-project: --windows-icon-from-ico=livingspacetoolkit/Resource/Livingspace_Sunrooms_icon.ico
+# nuitka-project: --include-data-files=livingspacetoolkit/Resource/resources.rcc=livingspacetoolkit/Resource/resources.rcc
 # nuitka-project: --output-dir=output
 # nuitka-project-if: {OS} == "Windows":
 #    nuitka-project: --output-filename=LivingspaceToolkit.exe
 # nuitka-project-else:
 #    nuitka-project: --output-filename=LivingspaceToolkit
 
-from PySide6.QtWidgets import QApplication
+import time
+# Before any other import, so a startup trace includes them. Starting the interpreter itself happens before this line
+# and isn't in the trace.
+STARTED_AT = time.perf_counter()
 
-from livingspacetoolkit.config.log_config import logger
-from livingspacetoolkit.main_window import MainWindow
-from livingspacetoolkit.theme_manager import apply_theme
-import livingspacetoolkit.Resource.resources_rc
+import argparse  # noqa: E402
+import sys  # noqa: E402
 
+from livingspacetoolkit.startup_trace import StartupTrace  # noqa: E402
 
-def main():
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog="livingspacetoolkit")
+    parser.add_argument("--trace-startup", nargs="?", const="", metavar="PATH",
+                        help="Write how long each step of startup took to PATH as JSON, the log directory by default")
+    parser.add_argument("--quit-after-startup", action="store_true",
+                        help="Quit as soon as the window is first painted, for timing startup")
+    # Anything else is left for Qt, e.g. -platform offscreen.
+    args, qt_args = parser.parse_known_args(argv)
+    trace = StartupTrace.from_environment(args.trace_startup, args.quit_after_startup, STARTED_AT)
+
+    # The imports are here so the trace can time them.
+    with trace.phase("import_pyside6"):
+        from PySide6.QtWidgets import QApplication
+    with trace.phase("import_toolkit"):
+        from livingspacetoolkit.config.log_config import logger, configure_logging
+        from livingspacetoolkit.main_window import MainWindow
+        from livingspacetoolkit.theme_manager import apply_theme
+        from livingspacetoolkit.resources import register_resources
+
+    with trace.phase("configure_logging"):
+        configure_logging()
     logger.info("Starting LivingSpace Toolkit…")
-    app = QApplication([])
-    apply_theme(app)
-    window = MainWindow()
-    window.show()
-    window.tabs_controller.set_to_default_state()
+    with trace.phase("create_application"):
+        app = QApplication([sys.argv[0], *qt_args])
+    trace.watch_first_paint(app)
+    with trace.phase("register_resources"):
+        register_resources()
+    with trace.phase("apply_theme"):
+        apply_theme(app)
+    with trace.phase("create_main_window"):
+        window = MainWindow()
+    with trace.phase("show"):
+        window.show()
+    with trace.phase("set_to_default_state"):
+        window.tabs_controller.set_to_default_state()
     app.exec()
+    # Nothing was painted, so write what there is.
+    trace.write()
+    if trace.enabled:
+        logger.info(f"Wrote the startup trace to {trace.report_path}")
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,16 @@
 from .toolkit_state_model import ToolkitStateModel
 from.roof_model import RoofModel
 from .sunroom_model import SunroomModel
+from .sunroom_result import SunroomResult, RoofSideResult
+from .bill_of_materials import BillOfMaterials, BomLineItem, OverhangWarning
 
-__all__ = ['ToolkitStateModel', 'RoofModel', 'SunroomModel']
\ No newline at end of file
+__all__ = ['ToolkitStateModel', 'RoofModel', 'SunroomModel', 'ToolkitStateTable', 'ToolkitStateRow', 'SunroomResult',
+           'RoofSideResult', 'BillOfMaterials', 'BomLineItem', 'OverhangWarning']
+
+
+def __getattr__(name):
+    # The table needs numpy, so it is only imported when it is used.
+    if name in ('ToolkitStateTable', 'ToolkitStateRow'):
+        from . import toolkit_state_table
+        return getattr(toolkit_state_table, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
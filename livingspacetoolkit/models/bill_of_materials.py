@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+from livingspacetoolkit.lib.fixed_length import FixedLength
+from livingspacetoolkit.lib.toolkit_enums import MaterialType, SunroomSide, SunroomType
+
+
+@dataclass(frozen=True, slots=True)
+class BomLineItem:
+    """A number of pieces of one material cut to the same length.
+    side: The wall the pieces go on. None for the whole roof, like Armstrong boxes.
+    quantity: Pieces, so a pair of hang rails is 2. Boxes for Armstrong ceiling panels.
+    cut_length: None for materials that aren't cut.
+    halved: The full length was over the material's limit so each piece is half of it and there are twice as many.
+    ripped: Roof panels only. The roof ends on half a panel so one of them is ripped to half its width."""
+    material: MaterialType
+    side: SunroomSide | None
+    quantity: int
+    cut_length: FixedLength | None = None
+    halved: bool = False
+    ripped: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class OverhangWarning:
+    """The side overhang the roof panels leave on a gable wall when it is outside what the overhang should be."""
+    side: SunroomSide
+    overhang: FixedLength
+    too_short: bool  # Otherwise too long
+
+    def __str__(self) -> str:
+        problem = "TOO SHORT" if self.too_short else "TOO LONG"
+        return f"The overhang on the {self.side.name[0]} wall is {problem} at {self.overhang}."
+
+
+@dataclass(frozen=True, slots=True)
+class BillOfMaterials:
+    """What SunroomBuilder.build_roof_components worked out the roof needs, as line items instead of the nested
+    SunroomModel dicts. It is hashable and can be pickled."""
+    sunroom_type: SunroomType
+    items: tuple[BomLineItem, ...] = ()
+    warnings: tuple[OverhangWarning, ...] = ()
+    roof_area: int = 0  # Sq. ft.
+
+    def lines(self, material: MaterialType) -> tuple[BomLineItem, ...]:
+        return tuple(item for item in self.items if item.material == material)
+
+    def quantity(self, material: MaterialType) -> int:
+        """The total pieces, or boxes, of a material."""
+        return sum(item.quantity for item in self.items if item.material == material)
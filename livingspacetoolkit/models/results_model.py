@@ -1,4 +1,3 @@
-from math import tan
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.lib.toolkit_enums import SunroomType, Scenario, SunroomSide, LengthType
 from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
@@ -27,7 +26,7 @@ def generate_results(toolkit_state: ToolkitStateModel, sunroom_model: SunroomMod
             results_text += 'Given drip edge and pitch...\n'
     match toolkit_state.sunroom_type:
         case SunroomType.STUDIO:
-            pitch = 12 * tan(toolkit_state.pitch[SunroomSide.B_SIDE].pitch_value)
+            pitch = toolkit_state.pitch[SunroomSide.B_SIDE].ratio
             peak = toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length
             max_height = toolkit_state.wall_heights[(None, LengthType.MAX_HEIGHT)].length
             soffit = toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT)].length
@@ -81,8 +80,8 @@ def generate_results(toolkit_state: ToolkitStateModel, sunroom_model: SunroomMod
                                      'for the C wall.').format(fascia_a_side,
                                                                fascia_c_side)
         case SunroomType.CATHEDRAL:
-            pitch_a_side = 12 * tan(toolkit_state.pitch[SunroomSide.A_SIDE].pitch_value)
-            pitch_c_side = 12 * tan(toolkit_state.pitch[SunroomSide.C_SIDE].pitch_value)
+            pitch_a_side = toolkit_state.pitch[SunroomSide.A_SIDE].ratio
+            pitch_c_side = toolkit_state.pitch[SunroomSide.C_SIDE].ratio
             peak = toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length
             max_height = toolkit_state.wall_heights[(None, LengthType.MAX_HEIGHT)].length
             soffit_a_side = toolkit_state.wall_heights[(SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT)].length
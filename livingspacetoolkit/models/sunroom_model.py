@@ -1,9 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from typing import Dict, List
 
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.lib.toolkit_enums import LengthType, SunroomSide
 from livingspacetoolkit.lib import ToolkitLength
+from .bill_of_materials import BillOfMaterials
 
 
 
@@ -63,6 +64,21 @@ class SunroomModel:
         SunroomSide.C_SIDE: {'value': [ToolkitLength(LengthType.FASCIA)], "max_length": False}
     })
     armstrong_panels: int = 0
+    bill_of_materials: BillOfMaterials | None = None  # Built last from everything above.
+
+    def reset(self, *names: str) -> None:
+        """
+        Puts the named fields back to their defaults so a calculation stage can be run again on this model.
+        :param names: str: Field names, e.g. "panel_length"
+        :return:
+        """
+        defaults = {model_field.name: model_field for model_field in fields(self)}
+        for name in names:
+            model_field = defaults[name]
+            if model_field.default_factory is not MISSING:
+                setattr(self, name, model_field.default_factory())
+            else:
+                setattr(self, name, model_field.default)
 
     def default_state(self):
         logger.debug("Setting sunroom model to default state.")
@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+
+from livingspacetoolkit.lib.toolkit_enums import SunroomSide
+from livingspacetoolkit.lib import FrozenToolkitLength, ToolkitLength, ScenarioOutputs
+from .sunroom_model import SunroomModel
+from .bill_of_materials import BillOfMaterials
+
+SIDES = tuple(SunroomSide)
+
+
+@dataclass(frozen=True, slots=True)
+class RoofSideResult:
+    """The SunroomModel values for one side of the roof."""
+    max_panel_length: bool
+    panel_tolerance: bool
+    panel_length: FrozenToolkitLength
+    roof_area: int
+    roof_panels: float
+    roof_panels_split: bool
+    overhang: FrozenToolkitLength
+    overhang_short: bool
+    overhang_long: bool
+    hang_rail: FrozenToolkitLength
+    hang_rail_max_length: bool
+    gable_wall: FrozenToolkitLength
+    fascia: tuple[FrozenToolkitLength, ...]
+    fascia_max_length: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SunroomResult:
+    """An immutable copy of a finished calculation: what the scenario solved and what SunroomBuilder built. It is
+    hashable and can be pickled, so it is safe to share between callers and to keep in a cache."""
+    outputs: ScenarioOutputs
+    sides: tuple[RoofSideResult, ...]  # In SunroomSide order
+    armstrong_panels: int
+    bill_of_materials: BillOfMaterials | None = None
+
+    def side(self, sunroom_side: SunroomSide) -> RoofSideResult:
+        return self.sides[SIDES.index(sunroom_side)]
+
+    @classmethod
+    def from_models(cls, outputs: ScenarioOutputs, sunroom_model: SunroomModel) -> "SunroomResult":
+        sides = []
+        for side in SIDES:
+            roof_overhang = sunroom_model.roof_overhang[side]
+            hang_rails = sunroom_model.hang_rails[side]
+            fascia = sunroom_model.fascia[side]
+            sides.append(RoofSideResult(
+                max_panel_length=sunroom_model.max_panel_length[side],
+                panel_tolerance=sunroom_model.panel_tolerance[side],
+                panel_length=sunroom_model.panel_length[side].freeze(),
+                roof_area=sunroom_model.roof_area[side],
+                roof_panels=sunroom_model.roof_panels[side],
+                roof_panels_split=sunroom_model.roof_panels_split[side],
+                overhang=roof_overhang["value"].freeze(),
+                overhang_short=roof_overhang["short_check"],
+                overhang_long=roof_overhang["long_check"],
+                hang_rail=hang_rails["value"].freeze(),
+                hang_rail_max_length=hang_rails["max_length"],
+                gable_wall=sunroom_model.gable_wall[side].freeze(),
+                fascia=tuple(length.freeze() for length in fascia["value"]),
+                fascia_max_length=fascia["max_length"],
+            ))
+        return cls(outputs, tuple(sides), sunroom_model.armstrong_panels, sunroom_model.bill_of_materials)
+
+    def to_sunroom_model(self) -> SunroomModel:
+        """A new, mutable SunroomModel with these values, e.g. for generate_results."""
+        sunroom_model = SunroomModel()
+        for side, result in zip(SIDES, self.sides):
+            sunroom_model.max_panel_length[side] = result.max_panel_length
+            sunroom_model.panel_tolerance[side] = result.panel_tolerance
+            _thaw(result.panel_length, sunroom_model.panel_length[side])
+            sunroom_model.roof_area[side] = result.roof_area
+            sunroom_model.roof_panels[side] = result.roof_panels
+            sunroom_model.roof_panels_split[side] = result.roof_panels_split
+            _thaw(result.overhang, sunroom_model.roof_overhang[side]["value"])
+            sunroom_model.roof_overhang[side]["short_check"] = result.overhang_short
+            sunroom_model.roof_overhang[side]["long_check"] = result.overhang_long
+            _thaw(result.hang_rail, sunroom_model.hang_rails[side]["value"])
+            sunroom_model.hang_rails[side]["max_length"] = result.hang_rail_max_length
+            _thaw(result.gable_wall, sunroom_model.gable_wall[side])
+            for frozen, length in zip(result.fascia, sunroom_model.fascia[side]["value"]):
+                _thaw(frozen, length)
+            sunroom_model.fascia[side]["max_length"] = result.fascia_max_length
+        sunroom_model.armstrong_panels = self.armstrong_panels
+        sunroom_model.bill_of_materials = self.bill_of_materials
+        return sunroom_model
+
+
+def _thaw(frozen: FrozenToolkitLength, length: ToolkitLength) -> None:
+    if frozen.modified:
+        length.length = frozen.length
@@ -5,6 +5,7 @@ from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.lib.toolkit_enums import (Scenario, RoofingType, EndCutType, SunroomType, LengthType, PitchType,
                                                   SunroomSide)
 from livingspacetoolkit.lib import ToolkitLength, ToolkitPitch
+from livingspacetoolkit.lib.scenario_requirements import MissingInputsError, get_requirements
 
 
 @dataclass()
@@ -69,93 +70,41 @@ class ToolkitStateModel:
             self.floor_walls[sunroom_side].length = 0
             self.floor_walls[sunroom_side].modified = False
 
-    def check_calculation_ready(self) -> None:
+    def missing_inputs(self) -> List[str]:
+        """
+        Checks every input the selected scenario needs in one pass.
+        :return: List[str]: A message for each missing input, empty when the model is ready for calculation
+        """
+        missing: List[str] = []
         if self.scenario is None:
-            raise TypeError("Please select a scenario.")
+            missing.append("Please select a scenario.")
         if self.roofing_type is None:
-            raise TypeError("Please select a roofing type.")
+            missing.append("Please select a roofing type.")
         if self.end_cuts is None:
-            raise TypeError("Please select an end cut type.")
+            missing.append("Please select an end cut type.")
         if not self.overhang.modified:
-            raise TypeError(f"Please input a value for the {self.overhang.length_type.name}.")
+            missing.append(f"Please input a value for the {self.overhang.length_type.name}.")
         if not self.thickness.modified:
-            raise TypeError(f"Please input a value for the {self.thickness.length_type.name}.")
-        for sunroom_side in self.floor_walls:
-            if not self.floor_walls[sunroom_side].modified:
-                raise TypeError(f"Please input a value for the {sunroom_side.name} WALL_HEIGHT.")
-        pitch_list: List[SunroomSide] = []
-        wall_height_list: List[tuple[SunroomSide|None, LengthType]] = []
-        match self.scenario:
-            case Scenario.WALL_HEIGHT_PITCH:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        pitch_list.append(SunroomSide.B_SIDE)
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.WALL_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        pitch_list.append(SunroomSide.A_SIDE)
-                        pitch_list.append(SunroomSide.C_SIDE)
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.WALL_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.WALL_HEIGHT))
-            case Scenario.WALL_HEIGHT_PEAK_HEIGHT:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.WALL_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.WALL_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.WALL_HEIGHT))
-                wall_height_list.append((None, LengthType.PEAK_HEIGHT))
-            case Scenario.MAX_HEIGHT_PITCH:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        pitch_list.append(SunroomSide.B_SIDE)
-                    case SunroomType.CATHEDRAL:
-                        pitch_list.append(SunroomSide.A_SIDE)
-                        pitch_list.append(SunroomSide.C_SIDE)
-                wall_height_list.append((None, LengthType.MAX_HEIGHT))
-            case Scenario.SOFFIT_HEIGHT_PEAK_HEIGHT:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.SOFFIT_HEIGHT))
-                wall_height_list.append((None, LengthType.PEAK_HEIGHT))
-            case Scenario.SOFFIT_HEIGHT_PITCH:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        pitch_list.append(SunroomSide.B_SIDE)
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        pitch_list.append(SunroomSide.A_SIDE)
-                        pitch_list.append(SunroomSide.C_SIDE)
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.SOFFIT_HEIGHT))
-            case Scenario.DRIP_EDGE_PEAK_HEIGHT:
-                wall_height_list.append((None, LengthType.PEAK_HEIGHT))
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-            case Scenario.DRIP_EDGE_PITCH:
-                match self.sunroom_type:
-                    case SunroomType.STUDIO:
-                        pitch_list.append(SunroomSide.B_SIDE)
-                        wall_height_list.append((SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-                    case SunroomType.CATHEDRAL:
-                        pitch_list.append(SunroomSide.A_SIDE)
-                        pitch_list.append(SunroomSide.C_SIDE)
-                        wall_height_list.append((SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-                        wall_height_list.append((SunroomSide.C_SIDE, LengthType.DRIP_EDGE_HEIGHT))
-        if len(pitch_list) > 0:
-            for sunroom_side in pitch_list:
-                if not self.pitch[sunroom_side].modified:
-                    raise TypeError(f"Please input a value for the {sunroom_side.name} pitch.")
-        if len(wall_height_list) > 0:
-            for sunroom_side in wall_height_list:
-                if not self.wall_heights[sunroom_side].modified:
-                    if sunroom_side[0] is None:
-                        raise TypeError(f"Please input a value for the {sunroom_side[1].name}.")
-                    else:
-                        raise TypeError(f"Please input a value for the {sunroom_side[0].name} {sunroom_side[1].name}.")
+            missing.append(f"Please input a value for the {self.thickness.length_type.name}.")
+        for sunroom_side, floor_wall in self.floor_walls.items():
+            if not floor_wall.modified:
+                missing.append(f"Please input a value for the {sunroom_side.name} {floor_wall.length_type.name}.")
+        if self.scenario is None:
+            return missing
+        requirements = get_requirements(self.scenario, self.sunroom_type)
+        for sunroom_side in requirements.pitch_sides:
+            if not self.pitch[sunroom_side].modified:
+                missing.append(f"Please input a value for the {sunroom_side.name} pitch.")
+        for sunroom_side, length_type in requirements.wall_heights:
+            if not self.wall_heights[(sunroom_side, length_type)].modified:
+                if sunroom_side is None:
+                    missing.append(f"Please input a value for the {length_type.name}.")
+                else:
+                    missing.append(f"Please input a value for the {sunroom_side.name} {length_type.name}.")
+        return missing
+
+    def check_calculation_ready(self) -> None:
+        missing = self.missing_inputs()
+        if missing:
+            logger.debug(f"{len(missing)} inputs are missing for {self.scenario}.")
+            raise MissingInputsError(missing)
@@ -0,0 +1,279 @@
+from enum import Enum
+from functools import cache
+from typing import Dict, Iterable, Iterator, List
+
+import numpy as np
+
+from livingspacetoolkit.config.log_config import logger
+from livingspacetoolkit.lib.toolkit_enums import (Scenario, RoofingType, EndCutType, SunroomType, LengthType, PitchType,
+                                                  SunroomSide)
+from livingspacetoolkit.lib import ToolkitLength, ToolkitPitch
+from livingspacetoolkit.lib.scenario_requirements import SCENARIO_REQUIREMENTS
+from .toolkit_state_model import ToolkitStateModel
+
+NO_CODE = -1  # The code of an enum field that is None.
+SIDES = tuple(SunroomSide)
+HEIGHT_KEYS: tuple[tuple[SunroomSide | None, LengthType], ...] = (
+    (None, LengthType.PEAK_HEIGHT),
+    (None, LengthType.MAX_HEIGHT),
+    *((side, LengthType.DRIP_EDGE_HEIGHT) for side in SIDES),
+    *((side, LengthType.SOFFIT_HEIGHT) for side in SIDES),
+    *((side, LengthType.WALL_HEIGHT) for side in SIDES),
+)
+# Every length of a ToolkitStateModel has one column in ToolkitStateTable.lengths, in this order.
+LENGTH_KEYS: tuple[tuple[SunroomSide | None, LengthType], ...] = (
+    (None, LengthType.OVERHANG),
+    (None, LengthType.THICKNESS),
+    *HEIGHT_KEYS,
+    *((side, LengthType.WALL_WIDTH) for side in SIDES),
+)
+LENGTH_COLUMNS: Dict[tuple[SunroomSide | None, LengthType], int] = {key: i for i, key in enumerate(LENGTH_KEYS)}
+SIDE_COLUMNS: Dict[SunroomSide, int] = {side: i for i, side in enumerate(SIDES)}
+
+
+@cache
+def _members(enum: type[Enum]) -> tuple[Enum, ...]:
+    return tuple(enum)
+
+
+def encode(member: Enum | None) -> int:
+    """The small int code of an enum member, its position in the enum. None is NO_CODE."""
+    if member is None:
+        return NO_CODE
+    return _members(type(member)).index(member)
+
+
+def decode(enum: type[Enum], code: int) -> Enum | None:
+    return None if code == NO_CODE else _members(enum)[code]
+
+
+class _LengthView(ToolkitLength):
+    """A ToolkitLength whose value lives in one cell of a ToolkitStateTable. Parsing and business logic are the same."""
+    __slots__ = ("_table", "_row", "_column")
+
+    def __init__(self, table: "ToolkitStateTable", row: int, key: tuple[SunroomSide | None, LengthType]):
+        # ToolkitLength.__init__ is skipped on purpose. It would reset the stored value.
+        self._table = table
+        self._row = row
+        self._column = LENGTH_COLUMNS[key]
+        self._length_type = key[1]
+        self._sunroom_side = key[0]
+
+    @property
+    def _length(self) -> float:
+        return float(self._table.lengths[self._row, self._column])
+
+    @_length.setter
+    def _length(self, value: float) -> None:
+        self._table.lengths[self._row, self._column] = value
+
+    @property
+    def _modified(self) -> bool:
+        return bool(self._table.length_modified[self._row, self._column])
+
+    @_modified.setter
+    def _modified(self, value: bool) -> None:
+        self._table.length_modified[self._row, self._column] = value
+
+
+class _PitchView(ToolkitPitch):
+    """A ToolkitPitch whose value lives in one cell of a ToolkitStateTable."""
+    __slots__ = ("_table", "_row", "_column")
+
+    def __init__(self, table: "ToolkitStateTable", row: int, roof_side: SunroomSide):
+        self._table = table
+        self._row = row
+        self._column = SIDE_COLUMNS[roof_side]
+        self._roof_side = roof_side
+
+    @property
+    def _pitch_type(self) -> PitchType:
+        return decode(PitchType, self._table.pitch_type[self._row, self._column])
+
+    @_pitch_type.setter
+    def _pitch_type(self, value: PitchType) -> None:
+        self._table.pitch_type[self._row, self._column] = encode(value)
+
+    @property
+    def _pitch_value(self) -> float:
+        return float(self._table.pitch[self._row, self._column])
+
+    @_pitch_value.setter
+    def _pitch_value(self, value: float) -> None:
+        self._table.pitch[self._row, self._column] = value
+
+    @property
+    def _modified(self) -> bool:
+        return bool(self._table.pitch_modified[self._row, self._column])
+
+    @_modified.setter
+    def _modified(self, value: bool) -> None:
+        self._table.pitch_modified[self._row, self._column] = value
+
+
+def _enum_column(name: str, enum: type[Enum]) -> property:
+    def getter(self: "ToolkitStateRow"):
+        return decode(enum, getattr(self.table, name)[self.row])
+
+    def setter(self: "ToolkitStateRow", value) -> None:
+        getattr(self.table, name)[self.row] = encode(value)
+    return property(getter, setter)
+
+
+class ToolkitStateRow:
+    """One row of a ToolkitStateTable. It has the same interface as ToolkitStateModel so the scenario classes and
+    ScenarioInputs.from_toolkit_state can use it directly. Reads and writes go straight to the table's arrays."""
+    __slots__ = ("table", "row", "pitch", "overhang", "thickness", "wall_heights", "floor_walls")
+
+    sunroom_type = _enum_column("sunroom_type", SunroomType)
+    scenario = _enum_column("scenario", Scenario)
+    roofing_type = _enum_column("roofing_type", RoofingType)
+    end_cuts = _enum_column("end_cuts", EndCutType)
+
+    def __init__(self, table: "ToolkitStateTable", row: int):
+        self.table = table
+        self.row = row
+        self.pitch: Dict[SunroomSide, ToolkitPitch] = {side: _PitchView(table, row, side) for side in SIDES}
+        self.overhang: ToolkitLength = _LengthView(table, row, (None, LengthType.OVERHANG))
+        self.thickness: ToolkitLength = _LengthView(table, row, (None, LengthType.THICKNESS))
+        self.wall_heights: Dict[tuple[SunroomSide | None, LengthType], ToolkitLength] = {
+            key: _LengthView(table, row, key) for key in HEIGHT_KEYS}
+        self.floor_walls: Dict[SunroomSide, ToolkitLength] = {
+            side: _LengthView(table, row, (side, LengthType.WALL_WIDTH)) for side in SIDES}
+
+    def __repr__(self) -> str:
+        return f"ToolkitStateRow({self.row})"
+
+    @property
+    def fascia(self) -> bool:
+        return bool(self.table.fascia[self.row])
+
+    @fascia.setter
+    def fascia(self, value: bool) -> None:
+        self.table.fascia[self.row] = value
+
+    default_state = ToolkitStateModel.default_state
+    missing_inputs = ToolkitStateModel.missing_inputs
+    check_calculation_ready = ToolkitStateModel.check_calculation_ready
+
+    def to_model(self) -> ToolkitStateModel:
+        """A standalone ToolkitStateModel copy of this row."""
+        model = ToolkitStateModel()
+        self.table.copy_to_model(self.row, model)
+        return model
+
+
+class ToolkitStateTable:
+    """Many ToolkitStateModels stored column by column, one row per quote. Enums are stored as small int codes (see
+    encode) with NO_CODE for None. Lengths are in inches and pitches in radians.
+    lengths/length_modified: One column per entry of LENGTH_KEYS
+    pitch/pitch_type/pitch_modified: One column per SunroomSide"""
+
+    def __init__(self, size: int = 0):
+        self.sunroom_type = np.full(size, encode(SunroomType.STUDIO), dtype=np.int8)
+        self.scenario = np.full(size, NO_CODE, dtype=np.int8)
+        self.roofing_type = np.full(size, NO_CODE, dtype=np.int8)
+        self.end_cuts = np.full(size, NO_CODE, dtype=np.int8)
+        self.fascia = np.zeros(size, dtype=bool)
+        self.lengths = np.zeros((size, len(LENGTH_KEYS)), dtype=np.float64)
+        self.length_modified = np.zeros((size, len(LENGTH_KEYS)), dtype=bool)
+        self.pitch = np.zeros((size, len(SIDES)), dtype=np.float64)
+        self.pitch_type = np.full((size, len(SIDES)), encode(PitchType.RATIO), dtype=np.int8)
+        self.pitch_modified = np.zeros((size, len(SIDES)), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.sunroom_type)
+
+    def __getitem__(self, row: int) -> ToolkitStateRow:
+        if not -len(self) <= row < len(self):
+            raise IndexError(f"Row {row} is out of range for a table of {len(self)} rows.")
+        return ToolkitStateRow(self, row % len(self))
+
+    def __iter__(self) -> Iterator[ToolkitStateRow]:
+        return (ToolkitStateRow(self, row) for row in range(len(self)))
+
+    @classmethod
+    def from_models(cls, models: Iterable[ToolkitStateModel]) -> "ToolkitStateTable":
+        models = list(models)
+        table = cls(len(models))
+        for row, model in enumerate(models):
+            table.copy_from_model(row, model)
+        return table
+
+    def copy_from_model(self, row: int, model: ToolkitStateModel) -> None:
+        self.sunroom_type[row] = encode(model.sunroom_type)
+        self.scenario[row] = encode(model.scenario)
+        self.roofing_type[row] = encode(model.roofing_type)
+        self.end_cuts[row] = encode(model.end_cuts)
+        self.fascia[row] = model.fascia
+        for column, length in enumerate(self._model_lengths(model)):
+            self.lengths[row, column] = length.length
+            self.length_modified[row, column] = length.modified
+        for column, side in enumerate(SIDES):
+            self.pitch[row, column] = model.pitch[side].radians
+            self.pitch_type[row, column] = encode(model.pitch[side].pitch_type)
+            self.pitch_modified[row, column] = model.pitch[side].modified
+
+    def copy_to_model(self, row: int, model: ToolkitStateModel) -> None:
+        model.sunroom_type = decode(SunroomType, self.sunroom_type[row])
+        model.scenario = decode(Scenario, self.scenario[row])
+        model.roofing_type = decode(RoofingType, self.roofing_type[row])
+        model.end_cuts = decode(EndCutType, self.end_cuts[row])
+        model.fascia = bool(self.fascia[row])
+        for column, length in enumerate(self._model_lengths(model)):
+            # Stored values were validated when they went in. Skip the parsing.
+            length._length = float(self.lengths[row, column])
+            length.modified = bool(self.length_modified[row, column])
+        for column, side in enumerate(SIDES):
+            pitch = model.pitch[side]
+            pitch.pitch_type = decode(PitchType, self.pitch_type[row, column])
+            pitch._pitch_value = float(self.pitch[row, column])
+            pitch.modified = bool(self.pitch_modified[row, column])
+
+    @staticmethod
+    def _model_lengths(model: ToolkitStateModel) -> List[ToolkitLength]:
+        lengths: List[ToolkitLength] = []
+        for side, length_type in LENGTH_KEYS:
+            match length_type:
+                case LengthType.OVERHANG:
+                    lengths.append(model.overhang)
+                case LengthType.THICKNESS:
+                    lengths.append(model.thickness)
+                case LengthType.WALL_WIDTH:
+                    lengths.append(model.floor_walls[side])
+                case _:
+                    lengths.append(model.wall_heights[(side, length_type)])
+        return lengths
+
+    def calculation_ready(self) -> np.ndarray:
+        """
+        Checks every row like ToolkitStateModel.check_calculation_ready but without raising.
+        :return: np.ndarray: True for each row that has everything its scenario needs
+        """
+        ready = ((self.scenario != NO_CODE) & (self.roofing_type != NO_CODE) & (self.end_cuts != NO_CODE)
+                 & self.length_modified[:, LENGTH_COLUMNS[(None, LengthType.OVERHANG)]]
+                 & self.length_modified[:, LENGTH_COLUMNS[(None, LengthType.THICKNESS)]])
+        for side in SIDES:
+            ready &= self.length_modified[:, LENGTH_COLUMNS[(side, LengthType.WALL_WIDTH)]]
+        for (scenario, sunroom_type), requirements in SCENARIO_REQUIREMENTS.items():
+            rows = (self.scenario == encode(scenario)) & (self.sunroom_type == encode(sunroom_type))
+            if not rows.any():
+                continue
+            for side in requirements.pitch_sides:
+                ready[rows] &= self.pitch_modified[rows, SIDE_COLUMNS[side]]
+            for key in requirements.wall_heights:
+                ready[rows] &= self.length_modified[rows, LENGTH_COLUMNS[key]]
+        return ready
+
+    def validation_errors(self) -> Dict[int, List[str]]:
+        """
+        Every missing input of each row that isn't ready, so a bulk import can be fixed in one pass.
+        :return: Dict[int, List[str]]: Row index to the messages from ToolkitStateModel.missing_inputs
+        """
+        errors: Dict[int, List[str]] = {}
+        for row in np.flatnonzero(~self.calculation_ready()):
+            errors[int(row)] = self[int(row)].missing_inputs()
+        if errors:
+            logger.debug(f"{len(errors)} of {len(self)} rows are not ready for calculation.")
+        return errors
+
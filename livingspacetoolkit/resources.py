@@ -0,0 +1,56 @@
+"""The images in Resource/resources.qrc are compiled into the binary Resource/resources.rcc. Registering it lets Qt map
+the file and read an image only when something asks for it, instead of importing a module of byte strings at startup.
+Rebuild it after changing resources.qrc or one of its images:
+
+    python -m livingspacetoolkit.resources
+"""
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import QResource
+
+from livingspacetoolkit.config.log_config import logger
+
+RESOURCE_DIR = Path(__file__).parent / "Resource"
+QRC_FILE = RESOURCE_DIR / "resources.qrc"
+RCC_FILE = RESOURCE_DIR / "resources.rcc"
+
+_registered: set[Path] = set()
+
+
+def build_resources(qrc_file: Path = QRC_FILE, rcc_file: Path = RCC_FILE) -> Path:
+    """
+    Compiles a .qrc file into a binary .rcc file with pyside6-rcc.
+    :param qrc_file: Path: The resource collection to compile
+    :param rcc_file: Path: Where to write the compiled resources
+    :return: Path: rcc_file
+    """
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        raise FileNotFoundError("pyside6-rcc was not found. It is installed with PySide6.")
+    subprocess.run([rcc, "--binary", str(qrc_file), "-o", str(rcc_file)], check=True)
+    logger.info(f"Compiled {qrc_file.name} into {rcc_file}")
+    return rcc_file
+
+
+def register_resources(rcc_file: Path = RCC_FILE) -> bool:
+    """
+    Makes the compiled resources available under :/LivingSpace. Registering the same file again does nothing.
+    :param rcc_file: Path: The compiled resources
+    :return: bool: Whether the resources are available. The app still runs without them, just without its images.
+    """
+    rcc_file = Path(rcc_file).resolve()
+    if rcc_file in _registered:
+        return True
+    if not QResource.registerResource(str(rcc_file)):
+        logger.error(f"Couldn't load the resources from {rcc_file}. Run python -m livingspacetoolkit.resources to "
+                     f"build them.")
+        return False
+    _registered.add(rcc_file)
+    return True
+
+
+if __name__ == "__main__":
+    build_resources(*map(Path, sys.argv[1:3]))
@@ -0,0 +1,115 @@
+"""Times each step of starting the app. It is off unless the app is started with --trace-startup [PATH] or with
+LIVINGSPACE_TRACE_STARTUP=PATH set. The report is written as JSON when the first frame is painted:
+
+    {"version": 1, "first_paint_ms": 412.3, "phases": [{"name": "import_pyside6", "start_ms": 0.0,
+     "duration_ms": 98.1}, ...]}
+
+Times are in milliseconds from started_at, which main.py takes from time.perf_counter before importing anything else,
+and come from time.perf_counter too. Starting the interpreter happens before that and isn't included. Nothing here
+imports PySide6 at the top, so the time it takes to import is part of the trace.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+ENV_VAR = "LIVINGSPACE_TRACE_STARTUP"
+REPORT_VERSION = 1
+DEFAULT_REPORT_NAME = "startup-trace.json"
+
+_imported_at = time.perf_counter()
+
+
+class StartupTrace:
+    """Records how long each phase of startup takes. When it's disabled the phases are only run."""
+
+    def __init__(self, report_path: Path | None = None, quit_after_paint: bool = False,
+                 started_at: float | None = None) -> None:
+        self.report_path: Path | None = report_path
+        self.started_at: float = started_at if started_at is not None else _imported_at
+        self.quit_after_paint: bool = quit_after_paint
+        self.phases: list[dict[str, float | str]] = []
+        self.first_paint_ms: float | None = None
+        self.written: bool = False
+        self._paint_filter = None
+
+    @classmethod
+    def from_environment(cls, path: str | None = None, quit_after_paint: bool = False,
+                         started_at: float | None = None) -> "StartupTrace":
+        """
+        Makes the trace for this run. path comes from --trace-startup. An empty path, or 1 in the environment variable,
+        writes the report to the log directory.
+        :param path: str | None: The --trace-startup value, None if it wasn't given
+        :param quit_after_paint: bool: Quit the app once the first frame is painted
+        :param started_at: float | None: time.perf_counter() when startup began, when this module was imported if None
+        :return: StartupTrace
+        """
+        if path is None:
+            path = os.environ.get(ENV_VAR)
+        if path is None:
+            return cls(None, quit_after_paint, started_at)
+        if path in ("", "1"):
+            from livingspacetoolkit.config.config import log_dir
+            return cls(log_dir / DEFAULT_REPORT_NAME, quit_after_paint, started_at)
+        return cls(Path(path), quit_after_paint, started_at)
+
+    @property
+    def enabled(self) -> bool:
+        return self.report_path is not None
+
+    def now_ms(self) -> float:
+        return (time.perf_counter() - self.started_at) * 1000
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = self.now_ms()
+        try:
+            yield
+        finally:
+            self.phases.append({"name": name, "start_ms": start, "duration_ms": self.now_ms() - start})
+
+    def watch_first_paint(self, app) -> None:
+        """
+        Records the first paint event of any widget in app, then writes the report and quits if quit_after_paint is set.
+        :param app: QApplication
+        :return:
+        """
+        if not self.enabled and not self.quit_after_paint:
+            return
+        from PySide6.QtCore import QObject, QEvent, QTimer
+
+        trace = self
+
+        class FirstPaintFilter(QObject):
+            def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+                if event.type() == QEvent.Type.Paint and trace.first_paint_ms is None:
+                    trace.first_paint_ms = trace.now_ms()
+                    app.removeEventFilter(self)
+                    # Write after this frame has been painted rather than in the middle of it.
+                    QTimer.singleShot(0, trace.finish_first_paint)
+                return False
+
+        self._paint_filter = FirstPaintFilter()
+        app.installEventFilter(self._paint_filter)
+
+    def finish_first_paint(self) -> None:
+        self.write()
+        if self.quit_after_paint:
+            from PySide6.QtWidgets import QApplication
+            QApplication.quit()
+
+    def report(self) -> dict:
+        return {"version": REPORT_VERSION, "first_paint_ms": self.first_paint_ms, "phases": self.phases}
+
+    def write(self) -> None:
+        """Writes the report once. Does nothing when tracing is off."""
+        if not self.enabled or self.written:
+            return
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        self.report_path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf8")
+        self.written = True
@@ -1,6 +1,9 @@
 from functools import wraps
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QWidget
+if TYPE_CHECKING:
+    # Only for the annotation, so to_nice_number can be imported without Qt.
+    from PySide6.QtWidgets import QWidget
 
 def temporary_change(
     object_attr: str,
@@ -33,7 +36,7 @@ def temporary_change(
     return decorator
 
 
-def set_strikethrough(widget: QWidget, enabled: bool) -> None:
+def set_strikethrough(widget: "QWidget", enabled: bool) -> None:
     """Enables or disables a strikethrough on a given label."""
     font = widget.font()
     font.setStrikeOut(enabled)
@@ -30,6 +30,10 @@ class CathedralRoofView(QWidget):
             SunroomSide.A_SIDE: self.pitch_a.pitch_input,
             SunroomSide.C_SIDE: self.pitch_c.pitch_input
         }
+        self.pitch_view_dict: Dict[SunroomSide, RoofPitchView] = {
+            SunroomSide.A_SIDE: self.pitch_a,
+            SunroomSide.C_SIDE: self.pitch_c
+        }
 
         self.overhang_edit.setPlaceholderText("0' or 0\"")
         self.overhang_edit.setMinimumSize(QSize(145, 35))
@@ -1,12 +1,12 @@
 from typing import Dict
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import QSize
 from PySide6.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QHBoxLayout, QSpacerItem, QSizePolicy, QLabel
-from PySide6.QtGui import QPixmap
 
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.utils.helpers import set_strikethrough
 from livingspacetoolkit.lib.toolkit_enums import LengthType, SunroomSide
+from .diagram_label import DiagramLabel
 
 
 class CathedralWallHeightView(QWidget):
@@ -15,10 +15,7 @@ class CathedralWallHeightView(QWidget):
         layout_heights: QVBoxLayout = QVBoxLayout()
         layout_img: QVBoxLayout = QVBoxLayout()
         spacer: QSpacerItem = QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        cathedral_image: QLabel = QLabel()
-        pix: QPixmap = QPixmap(":/LivingSpace/LivingSpace_Cathedral")
-        cathedral_image.setPixmap(
-            pix.scaled(360, 360, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        cathedral_image: DiagramLabel = DiagramLabel(":/LivingSpace/LivingSpace_Cathedral", QSize(360, 360))
         cathedral_image.setMinimumSize(QSize(500, 500))
         layout: QHBoxLayout = QHBoxLayout()
 
@@ -47,6 +44,15 @@ class CathedralWallHeightView(QWidget):
             (SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT): self.drip_edge_height_edit # There's only one drip edge
             # so use A_SIDE
         }
+        self.wall_height_label_dict: Dict[tuple[SunroomSide | None, LengthType], QLabel] = {
+            (None, LengthType.PEAK_HEIGHT): self.peak_height_label,
+            (None, LengthType.MAX_HEIGHT): self.max_height_label,
+            (SunroomSide.A_SIDE, LengthType.WALL_HEIGHT): self.a_wall_height_label,
+            (SunroomSide.C_SIDE, LengthType.WALL_HEIGHT): self.c_wall_height_label,
+            (SunroomSide.A_SIDE, LengthType.SOFFIT_HEIGHT): self.soffit_height_a_label,
+            (SunroomSide.C_SIDE, LengthType.SOFFIT_HEIGHT): self.soffit_height_c_label,
+            (SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT): self.drip_edge_height_label
+        }
 
         self.peak_height_edit.setPlaceholderText("0' or 0\"")
         self.peak_height_edit.setMaximumSize(QSize(150, 40))
@@ -74,7 +80,7 @@ class CathedralWallHeightView(QWidget):
         layout_heights.addSpacerItem(spacer)
 
         layout_img.addWidget(cathedral_image)
-        layout_img.addSpacerItem(spacer)
+        layout_img.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
 
         layout.addLayout(layout_heights)
         layout.addLayout(layout_img)
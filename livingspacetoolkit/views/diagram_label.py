@@ -0,0 +1,36 @@
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtWidgets import QLabel
+from PySide6.QtGui import QPixmap, QImageReader, QShowEvent
+
+from livingspacetoolkit.config.log_config import logger
+
+
+class DiagramLabel(QLabel):
+    """Shows one of the diagram images. The image is only decoded the first time the label is shown, so the diagrams on
+    tabs that are never opened are never read. Its size comes from the image header so the layout doesn't move when it
+    loads."""
+    def __init__(self, resource: str, max_size: QSize | None = None):
+        super().__init__()
+        self.resource: str = resource
+        self.max_size: QSize | None = max_size
+        self.loaded: bool = False
+
+        size: QSize = QImageReader(resource).size()
+        if size.isValid():
+            self.setMinimumSize(size if max_size is None else size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio))
+
+    def showEvent(self, event: QShowEvent) -> None:
+        if not self.loaded:
+            self.load()
+        super().showEvent(event)
+
+    def load(self) -> None:
+        pix: QPixmap = QPixmap(self.resource)
+        if pix.isNull():
+            logger.warning(f"Couldn't load the image {self.resource}")
+        elif self.max_size is not None:
+            pix = pix.scaled(self.max_size, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+        self.setPixmap(pix)
+        self.loaded = True
+        logger.debug(f"Loaded {self.resource}")
@@ -2,10 +2,10 @@ from typing import Dict
 
 from PySide6.QtCore import Qt, QSize
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QLineEdit, QVBoxLayout, QSpacerItem, QSizePolicy
-from PySide6.QtGui import QPixmap
 
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.lib.toolkit_enums import SunroomSide
+from .diagram_label import DiagramLabel
 
 
 class FloorPlanView(QWidget):
@@ -45,14 +45,13 @@ class FloorPlanView(QWidget):
         layout_wall.addWidget(self.wall_b)
         layout_wall.addWidget(label_c)
         layout_wall.addWidget(self.wall_c)
-        layout_wall.addSpacerItem(spacer)
+        layout_wall.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
         layout_wall.setAlignment(Qt.AlignmentFlag.AlignLeft)
 
-        floor_image: QLabel = QLabel()
-        floor_image.setPixmap( QPixmap(":/LivingSpace/LivingSpace_FloorPlan"))
+        floor_image: DiagramLabel = DiagramLabel(":/LivingSpace/LivingSpace_FloorPlan")
 
         layout_img.addWidget(floor_image)
-        layout_img.addSpacerItem(spacer)
+        layout_img.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
 
         layout.addLayout(layout_wall)
         layout.addLayout(layout_img)
@@ -28,6 +28,9 @@ class StudioRoofView(QWidget):
         self.pitch_dict: Dict[SunroomSide, QLineEdit] = {
             SunroomSide.B_SIDE: self.pitch.pitch_input
         }
+        self.pitch_view_dict: Dict[SunroomSide, RoofPitchView] = {
+            SunroomSide.B_SIDE: self.pitch
+        }
 
         self.overhang_edit.setPlaceholderText("0' or 0\"")
         self.overhang_edit.setMinimumSize(QSize(145, 35))
@@ -1,12 +1,12 @@
 from typing import Dict
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import QSize
 from PySide6.QtWidgets import QWidget, QLineEdit, QVBoxLayout, QHBoxLayout, QSpacerItem, QSizePolicy, QLabel
-from PySide6.QtGui import QPixmap
 
 from livingspacetoolkit.config.log_config import logger
 from livingspacetoolkit.utils.helpers import set_strikethrough
 from livingspacetoolkit.lib.toolkit_enums import LengthType, SunroomSide
+from .diagram_label import DiagramLabel
 
 
 class StudioWallHeightView(QWidget):
@@ -16,10 +16,7 @@ class StudioWallHeightView(QWidget):
         layout_heights: QVBoxLayout = QVBoxLayout()
         layout_img: QVBoxLayout = QVBoxLayout()
         spacer: QSpacerItem = QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        studio_image: QLabel = QLabel()
-        pix: QPixmap = QPixmap(":/LivingSpace/LivingSpace_Studio")
-        studio_image.setPixmap(
-            pix.scaled(360, 360, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        studio_image: DiagramLabel = DiagramLabel(":/LivingSpace/LivingSpace_Studio", QSize(360, 360))
         studio_image.setMinimumSize(QSize(500, 500))
         layout: QHBoxLayout = QHBoxLayout()
 
@@ -47,6 +44,13 @@ class StudioWallHeightView(QWidget):
             (SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT): self.soffit_height_edit,
             (SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT): self.drip_edge_height_edit
         }
+        self.wall_height_label_dict: Dict[tuple[SunroomSide | None, LengthType], QLabel] = {
+            (None, LengthType.PEAK_HEIGHT): self.peak_height_label,
+            (None, LengthType.MAX_HEIGHT): self.max_height_label,
+            (SunroomSide.B_SIDE, LengthType.WALL_HEIGHT): self.b_wall_height_label,
+            (SunroomSide.B_SIDE, LengthType.SOFFIT_HEIGHT): self.soffit_height_label,
+            (SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT): self.drip_edge_height_label
+        }
 
         layout_heights.addWidget(self.peak_height_label)
         layout_heights.addWidget(self.peak_height_edit)
@@ -61,7 +65,7 @@ class StudioWallHeightView(QWidget):
         layout_heights.addSpacerItem(spacer)
 
         layout_img.addWidget(studio_image)
-        layout_img.addSpacerItem(spacer)
+        layout_img.addSpacerItem(QSpacerItem(20, 40, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding))
 
         layout.addLayout(layout_heights)
         layout.addLayout(layout_img)
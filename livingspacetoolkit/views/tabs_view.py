@@ -1,20 +1,66 @@
-from PySide6.QtWidgets import QTabWidget, QMessageBox
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QTabWidget, QMessageBox, QWidget, QVBoxLayout
 
 from livingspacetoolkit.config.log_config import logger
+from livingspacetoolkit.lib.toolkit_enums import SunroomType
 from .studio_view import StudioView
 from .cathedral_view import CathedralView
 
+# The view and title of each tab, in the order of SunroomType.
+SUNROOM_TABS: dict[SunroomType, tuple[type[QWidget], str]] = {
+    SunroomType.STUDIO: (StudioView, "Studio"),
+    SunroomType.CATHEDRAL: (CathedralView, "Cathedral"),
+}
+
 
 class TabsView(QTabWidget):
+    """One tab per sunroom type. Each tab starts as an empty placeholder and its view is only made the first time the
+    tab is opened, or asked for, so a tab that isn't used costs nothing at startup."""
+    # Emitted with the SunroomType when its view has just been made, so a controller can be connected to it.
+    sunroom_view_created = Signal(object)
+
     def __init__(self):
         super().__init__()
 
-        self.studio_view = StudioView()
-        self.cathedral_view = CathedralView()
-
-        self.addTab(self.studio_view, "Studio")
-        self.addTab(self.cathedral_view, "Cathedral")
+        self.sunroom_views: dict[SunroomType, QWidget] = {}
+        self.placeholders: dict[SunroomType, QWidget] = {}
+        for sunroom_type, (_, title) in SUNROOM_TABS.items():
+            placeholder: QWidget = QWidget()
+            layout: QVBoxLayout = QVBoxLayout()
+            layout.setContentsMargins(0, 0, 0, 0)
+            placeholder.setLayout(layout)
+            self.placeholders[sunroom_type] = placeholder
+            self.addTab(placeholder, title)
         self.setMinimumSize(600, 400)
 
+        # Connected before any controller, so the view is made before anything handles the tab change.
+        self.currentChanged.connect(self.handle_current_changed)
+
+    @property
+    def studio_view(self) -> StudioView:
+        return self.sunroom_view(SunroomType.STUDIO)
+
+    @property
+    def cathedral_view(self) -> CathedralView:
+        return self.sunroom_view(SunroomType.CATHEDRAL)
+
+    def sunroom_view(self, sunroom_type: SunroomType) -> QWidget:
+        """
+        Returns the view on the tab for sunroom_type, making it in place of the placeholder if it hasn't been made yet.
+        :param sunroom_type: SunroomType
+        :return: QWidget: The StudioView or CathedralView
+        """
+        view = self.sunroom_views.get(sunroom_type)
+        if view is None:
+            logger.debug(f"Creating the {sunroom_type.name} tab.")
+            view = SUNROOM_TABS[sunroom_type][0]()
+            self.placeholders[sunroom_type].layout().addWidget(view)
+            self.sunroom_views[sunroom_type] = view
+            self.sunroom_view_created.emit(sunroom_type)
+        return view
+
+    def handle_current_changed(self, index: int) -> None:
+        self.sunroom_view(SunroomType(index))
+
     def show_warning(self, message: str) -> None:
         QMessageBox.warning(self, "WARNING", message, QMessageBox.StandardButton.Ok)
@@ -0,0 +1,47 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import pytest
+from collections import defaultdict
+from pathlib import Path
+
+# The stored time to first paint and how far past it a run may go. Set LIVINGSPACE_UPDATE_BASELINE=1 to store the
+# time of this run instead, e.g. after a change that is meant to make startup slower or on a new benchmark machine.
+BASELINE_FILE = Path(__file__).with_name("startup_baseline.json")
+RUNS = 5
+
+
+def launch(tmp_path: Path, run: int) -> dict:
+    """Starts the app offscreen in a new interpreter and returns its startup trace."""
+    report = tmp_path / f"startup-{run}.json"
+    env = os.environ | {"QT_QPA_PLATFORM": "offscreen", "HOME": str(tmp_path),
+                        "XDG_STATE_HOME": str(tmp_path / "state")}
+    # The exit status isn't checked, the report is written as soon as the window is painted.
+    subprocess.run([sys.executable, "-m", "livingspacetoolkit.main", "--trace-startup", str(report),
+                    "--quit-after-startup"], capture_output=True, env=env, timeout=60)
+    return json.loads(report.read_text())
+
+
+class TestStartup:
+
+    @pytest.mark.benchmark
+    def test_time_to_first_paint(self, tmp_path):
+        # Arrange
+        baseline = json.loads(BASELINE_FILE.read_text())
+        # Act
+        reports = [launch(tmp_path, run) for run in range(RUNS)]
+        first_paint = statistics.median(report["first_paint_ms"] for report in reports)
+        # Assert
+        if os.environ.get("LIVINGSPACE_UPDATE_BASELINE") == "1":
+            BASELINE_FILE.write_text(json.dumps(baseline | {"first_paint_ms": round(first_paint)}, indent=2) + "\n")
+            pytest.skip(f"Stored {first_paint:.0f} ms as the baseline.")
+        durations = defaultdict(list)
+        for report in reports:
+            for phase in report["phases"]:
+                durations[phase["name"]].append(phase["duration_ms"])
+        phases = {name: round(statistics.median(times), 1) for name, times in durations.items()}
+        limit = baseline["first_paint_ms"] * baseline["tolerance"]
+        assert first_paint <= limit, (f"The first paint took {first_paint:.0f} ms, more than {limit:.0f} ms. "
+                                      f"Median ms per phase: {phases}")
@@ -0,0 +1,81 @@
+import pytest
+import numpy as np
+from math import atan
+
+from livingspacetoolkit.lib import ScenarioInputs, solve
+from livingspacetoolkit.lib.batch_solver import solve_batch, BATCH_INPUT_COLUMNS, BATCH_OUTPUT_COLUMNS
+from livingspacetoolkit.lib.toolkit_enums import Scenario, SunroomType, EndCutType
+
+SIDES = ("a", "b", "c")
+HEIGHTS = ("wall_height", "soffit_height", "drip_edge_height")
+
+# Each row is (A wall, B wall, C wall, overhang, thickness, pitch ratio, peak, max height, wall height, soffit,
+# drip edge). Every scenario takes the inputs it needs from the row.
+ROWS = [
+    (120, 120, 120, 10, 6, 10, 220, 227.8125, 120, 111.6875, 116.25),
+    (144, 168, 150, 12, 8.25, 6, 190, 200, 110, 100, 104),
+    (100, 200, 96, 16, 3, 4.5, 150, 160, 105, 98, 100),
+]
+
+
+def room_inputs(scenario, sunroom_type, end_cuts, row) -> ScenarioInputs:
+    a_wall, b_wall, c_wall, overhang, thickness, ratio, peak, max_height, wall_height, soffit, drip_edge = row
+    values = {"wall_width_a": a_wall, "wall_width_b": b_wall, "wall_width_c": c_wall, "peak_height": peak,
+              "max_height": max_height}
+    for suffix in SIDES:
+        values[f"pitch_{suffix}"] = atan(ratio / 12)
+        for prefix, height in zip(HEIGHTS, (wall_height, soffit, drip_edge)):
+            values[f"{prefix}_{suffix}"] = height
+    return ScenarioInputs(scenario, sunroom_type, end_cuts, overhang, thickness, **values)
+
+
+class TestBatchSolver:
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type", list(SunroomType))
+    @pytest.mark.parametrize("scenario", list(Scenario))
+    def test_matches_solve(self, scenario, sunroom_type):
+        # Arrange
+        rooms = [room_inputs(scenario, sunroom_type, end_cuts, row) for row in ROWS for end_cuts in EndCutType]
+        columns = {name: np.array([getattr(inputs, name) for inputs in rooms], dtype=float)
+                   for name in BATCH_INPUT_COLUMNS if name != "end_cuts"}
+        columns["end_cuts"] = np.array([inputs.end_cuts.value for inputs in rooms])
+        # Act
+        batch = solve_batch(scenario, sunroom_type, columns)
+        # Assert
+        for index, inputs in enumerate(rooms):
+            outputs = solve(inputs)
+            for name in BATCH_OUTPUT_COLUMNS:
+                expected = getattr(outputs, name)
+                if expected is None:
+                    # solve leaves out its inputs and the values that don't apply, the batch copies the inputs.
+                    expected = getattr(inputs, name, np.nan)
+                    if np.isnan(batch[name][index]):
+                        continue
+                assert batch[name][index] == pytest.approx(expected, abs=1e-9), (name, inputs.end_cuts)
+
+    @pytest.mark.unit
+    def test_not_applicable_outputs_are_nan(self):
+        batch = solve_batch(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, {
+            "wall_width_a": [120], "wall_width_b": [120], "wall_width_c": [120], "overhang": [10], "thickness": [6],
+            "end_cuts": [EndCutType.UNCUT_TOP_BOTTOM.value], "pitch_b": [atan(10 / 12)], "wall_height_b": [120]})
+
+        assert batch["peak_height"][0] == pytest.approx(220)
+        assert np.isnan(batch["pitch_a"][0])
+        assert np.isnan(batch["soffit_height_c"][0])
+
+    @pytest.mark.unit
+    def test_unreachable_drip_edge_is_nan(self):
+        batch = solve_batch(Scenario.DRIP_EDGE_PEAK_HEIGHT, SunroomType.STUDIO, {
+            "wall_width_a": [120, 120], "wall_width_b": [120, 120], "wall_width_c": [120, 120], "overhang": [10, 10],
+            "thickness": [6, 6], "end_cuts": [1, 1], "peak_height": [220, 220], "drip_edge_height_b": [116.25, 300]})
+
+        assert batch["pitch_b"][0] == pytest.approx(atan(10 / 12), abs=1e-3)
+        assert np.isnan(batch["pitch_b"][1])
+
+    @pytest.mark.unit
+    def test_missing_columns(self):
+        with pytest.raises(ValueError, match="pitch_b"):
+            solve_batch(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, {
+                "wall_width_a": [120], "wall_width_b": [120], "wall_width_c": [120], "overhang": [10],
+                "thickness": [6], "end_cuts": [1], "wall_height_b": [120]})
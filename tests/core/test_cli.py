@@ -0,0 +1,134 @@
+import csv
+import json
+import subprocess
+import sys
+import pytest
+from math import atan
+
+from livingspacetoolkit import cli
+from livingspacetoolkit.lib.toolkit_enums import PitchType, RoofingType, SunroomType
+
+ROOMS = [
+    {"name": "Smith", "scenario": "wall_height_pitch", "sunroom_type": "studio", "end_cuts": "uncut_top_bottom",
+     "roofing_type": "eco_green", "fascia": "yes", "overhang": "12", "thickness": "6", "wall_width_a": "120",
+     "wall_width_b": "130", "wall_width_c": "120", "pitch_b": "10", "wall_height_b": "120"},
+    {"name": "Jones", "scenario": "WALL_HEIGHT_PITCH", "sunroom_type": "CATHEDRAL", "end_cuts": "UNCUT_TOP_BOTTOM",
+     "pitch_type": "ANGLE", "overhang": "1'", "thickness": "6", "wall_width_a": "10' 0\"", "wall_width_b": "300",
+     "wall_width_c": "120", "pitch_a": "40", "pitch_c": "40", "wall_height_a": "120", "wall_height_c": "120"},
+    {"name": "Bad", "scenario": "WALL_HEIGHT_PITCH", "sunroom_type": "STUDIO", "end_cuts": "UNCUT_TOP_BOTTOM",
+     "overhang": "12", "thickness": "6", "wall_width_a": "120", "wall_width_b": "130", "wall_width_c": "120",
+     "pitch_b": "30", "wall_height_b": "120"},
+]
+
+
+@pytest.fixture
+def rooms_csv(tmp_path):
+    path = tmp_path / "rooms.csv"
+    columns = sorted({column for room in ROOMS for column in room})
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, columns)
+        writer.writeheader()
+        writer.writerows(ROOMS)
+    return path
+
+
+class TestParseRoom:
+
+    @pytest.mark.unit
+    def test_parse_room(self):
+        # Act
+        room, pitch_type = cli.parse_room(ROOMS[0])
+        # Assert
+        assert (room.name, room.roofing_type, room.fascia, pitch_type) == ("Smith", RoofingType.ECO_GREEN, True,
+                                                                           PitchType.RATIO)
+        assert room.inputs.sunroom_type == SunroomType.STUDIO
+        assert room.inputs.pitch_b == pytest.approx(atan(10 / 12))
+        assert room.inputs.peak_height == 0
+
+    @pytest.mark.unit
+    def test_imperial_lengths_and_angles(self):
+        # Act
+        room, pitch_type = cli.parse_room(ROOMS[1])
+        # Assert
+        assert (room.inputs.overhang, room.inputs.wall_width_a) == (12, 120)
+        assert pitch_type == PitchType.ANGLE
+        assert room.roofing_type is None and room.fascia is False
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("change", [{"scenario": ""}, {"sunroom_type": "igloo"}, {"wall_width_b": "-5"},
+                                        {"pitch_b": "30"},
+                                        {"scenario": "wall_height_peak_height", "peak_height": "100"}])
+    def test_invalid_rows(self, change):
+        # Act
+        record = cli.solve_record(ROOMS[0] | change)
+        # Assert
+        assert record["name"] == "Smith"
+        assert record["error"]
+
+    @pytest.mark.unit
+    def test_missing_required_columns(self):
+        # Arrange
+        record = {column: value for column, value in ROOMS[0].items() if column != "wall_width_a"}
+        # Act
+        result = cli.solve_record(record | {"wall_height_b": " ", "overhang": ""})
+        # Assert
+        assert result["error"] == "Missing required columns: overhang, wall_width_a, wall_height_b"
+
+    @pytest.mark.unit
+    def test_cathedral_needs_both_sides(self):
+        with pytest.raises(ValueError, match="pitch_c, wall_height_c$"):
+            cli.parse_room({column: value for column, value in ROOMS[1].items()
+                            if column not in ("pitch_c", "wall_height_c")})
+
+
+class TestMain:
+
+    @pytest.mark.integration
+    def test_csv_to_jsonl(self, rooms_csv, tmp_path):
+        # Arrange
+        output = tmp_path / "results.jsonl"
+        # Act
+        status = cli.main([str(rooms_csv), "-o", str(output)])
+        # Assert
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        assert status == 1
+        assert [result["name"] for result in results] == ["Smith", "Jones", "Bad"]
+        assert results[0]["error"] is None
+        assert (results[0]["roof_area"], results[0]["armstrong_boxes"]) == (200, 6)
+        assert {"material": "HANG_RAIL", "side": "B_SIDE", "quantity": 2, "cut_length": 160, "halved": False,
+                "ripped": False} in results[0]["items"]
+        assert results[1]["warnings"] == ['The overhang on the B wall is TOO LONG at 24".']
+        assert results[2]["error"] == "Ratio is too high: 30.0"
+
+    @pytest.mark.integration
+    def test_workers_give_the_same_results(self, rooms_csv, tmp_path):
+        # Arrange
+        single, pooled = tmp_path / "single.csv", tmp_path / "pooled.csv"
+        # Act
+        cli.main([str(rooms_csv), "-o", str(single)])
+        cli.main([str(rooms_csv), "-o", str(pooled), "--workers", "2"])
+        # Assert
+        assert pooled.read_text() == single.read_text()
+        assert single.read_text().splitlines()[1].startswith("Smith,,220.0,")
+
+    @pytest.mark.integration
+    def test_invalid_json_lines(self, tmp_path):
+        # Arrange
+        path = tmp_path / "rooms.jsonl"
+        path.write_text(json.dumps(ROOMS[0]) + "\n\n{not json\n[1, 2]\n")
+        output = tmp_path / "results.jsonl"
+        # Act
+        cli.main([str(path), "-o", str(output)])
+        # Assert
+        results = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [result["name"] for result in results] == ["Smith", "line 3", "line 4"]
+        assert results[1]["error"].startswith("Invalid JSON")
+
+    @pytest.mark.integration
+    def test_does_not_import_qt(self):
+        # Act
+        imported = subprocess.run([sys.executable, "-c", "import sys, livingspacetoolkit.cli; "
+                                   "print(any(name.startswith('PySide6') for name in sys.modules))"],
+                                  capture_output=True, text=True, check=True).stdout
+        # Assert
+        assert imported.strip() == "False"
@@ -0,0 +1,95 @@
+import pytest
+from itertools import combinations
+from dataclasses import replace
+from math import atan
+
+from livingspacetoolkit.lib import ScenarioInputs, solve
+from livingspacetoolkit.lib.constraint_graph import (RoofPlane, compile_plan, solve_roof, HEIGHTS, PITCH,
+                                                     WALL_HEIGHT, PEAK_HEIGHT, DRIP_EDGE_HEIGHT)
+from livingspacetoolkit.lib.root_finding import ConvergenceError
+from livingspacetoolkit.lib.toolkit_enums import Scenario, SunroomType, EndCutType
+
+PLANES = [
+    RoofPlane(120, 10, 6, EndCutType.UNCUT_TOP_BOTTOM),
+    RoofPlane(144, 16, 8.25, EndCutType.PLUMB_CUT_TOP_BOTTOM),
+    RoofPlane(58.375, 12, 3, EndCutType.PLUMB_CUT_TOP, 1.625),
+]
+PAIRS = list(combinations((PITCH,) + HEIGHTS, 2))
+
+
+class TestConstraintGraph:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("plane", PLANES)
+    @pytest.mark.parametrize("pair", PAIRS)
+    def test_any_pair_solves_the_room(self, plane, pair):
+        # Arrange
+        expected = solve_roof(plane, pitch=atan(7 / 12), wall_height=100)
+        # Act
+        actual = solve_roof(plane, **{name: expected[name] for name in pair})
+        # Assert
+        for name, value in expected.items():
+            assert actual[name] == pytest.approx(value, abs=1e-9), name
+
+    @pytest.mark.unit
+    def test_plans_are_compiled_once(self):
+        assert compile_plan(frozenset((PEAK_HEIGHT, WALL_HEIGHT))) is compile_plan(
+            frozenset((WALL_HEIGHT, PEAK_HEIGHT)))
+        assert not compile_plan(frozenset((PITCH, WALL_HEIGHT))).pitch_path
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("knowns", [
+        {"wall_height": 100},
+        {"wall_height": 100, "peak_height": 150, "pitch": 0.5},
+        {"wall_height": 100, "gable_height": 150},
+    ])
+    def test_invalid_knowns(self, knowns):
+        with pytest.raises(ValueError):
+            solve_roof(PLANES[0], **knowns)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("knowns", [
+        {"wall_height": 150, "peak_height": 100},
+        {"drip_edge_height": 300, "peak_height": 220},
+    ])
+    def test_inconsistent_knowns(self, knowns):
+        with pytest.raises(ConvergenceError):
+            solve_roof(PLANES[0], **knowns)
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type", list(SunroomType))
+    @pytest.mark.parametrize("end_cuts", list(EndCutType))
+    @pytest.mark.parametrize("scenario, knowns", [
+        (Scenario.WALL_HEIGHT_PEAK_HEIGHT, (WALL_HEIGHT, PEAK_HEIGHT)),
+        (Scenario.DRIP_EDGE_PEAK_HEIGHT, (DRIP_EDGE_HEIGHT, PEAK_HEIGHT)),
+    ])
+    def test_matches_scenario_classes(self, sunroom_type, end_cuts, scenario, knowns):
+        # Arrange
+        inputs = ScenarioInputs(scenario, sunroom_type, end_cuts, 10, 6, 120, 150, 120, peak_height=190,
+                                wall_height_a=110, wall_height_b=110, wall_height_c=110, drip_edge_height_a=102,
+                                drip_edge_height_b=102, drip_edge_height_c=102)
+        side = "b" if sunroom_type == SunroomType.STUDIO else "a"
+        # Act
+        outputs = solve(inputs)
+        actual = solve_roof(RoofPlane.from_inputs(inputs), **{
+            name: getattr(inputs, name if name == PEAK_HEIGHT else f"{name}_{side}") for name in knowns})
+        # Assert
+        assert actual[PITCH] == pytest.approx(getattr(outputs, f"pitch_{side}"))
+        assert actual["max_height"] == pytest.approx(outputs.max_height)
+        assert actual["soffit_height"] == pytest.approx(getattr(outputs, f"soffit_height_{side}"))
+
+    @pytest.mark.integration
+    def test_studio_scenarios_run_a_plan(self):
+        # Arrange
+        inputs = ScenarioInputs(Scenario.WALL_HEIGHT_PEAK_HEIGHT, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 10,
+                                6, 120, 150, 120, peak_height=190, wall_height_b=110)
+        calls = compile_plan.cache_info().hits + compile_plan.cache_info().misses
+        # Act
+        outputs = solve(inputs)
+        # Assert
+        assert compile_plan.cache_info().hits + compile_plan.cache_info().misses == calls + 1
+        assert outputs.pitch_b == pytest.approx(atan(80 / 120))
+        assert outputs.wall_height_a == outputs.wall_height_c == 110
+        assert outputs.wall_height_b is None
+        with pytest.raises(ConvergenceError):
+            solve(replace(inputs, peak_height=100))
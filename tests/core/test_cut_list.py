@@ -0,0 +1,86 @@
+import pytest
+
+from livingspacetoolkit.lib.cut_list import optimize_cuts, cut_list, cut_pieces
+from livingspacetoolkit.lib.fixed_length import FixedLength
+from livingspacetoolkit.lib.toolkit_enums import MaterialType, SunroomSide, SunroomType
+from livingspacetoolkit.models import BillOfMaterials, BomLineItem
+
+
+def inches(*values: int) -> list[FixedLength]:
+    return [FixedLength.from_fraction(value) for value in values]
+
+
+class TestOptimizeCuts:
+
+    @pytest.mark.unit
+    def test_exact_search_beats_first_fit_decreasing(self):
+        # Arrange: First fit decreasing puts both 40s on one bar and needs three bars.
+        pieces = inches(40, 40, 30, 30, 30, 30)
+        stock = inches(100)
+        # Act
+        heuristic = optimize_cuts(pieces, stock, FixedLength(0), exact_piece_limit=0)
+        exact = optimize_cuts(pieces, stock, FixedLength(0))
+        # Assert
+        assert (len(heuristic.bars), heuristic.optimal) == (3, False)
+        assert (len(exact.bars), exact.optimal) == (2, True)
+        assert [bar.cuts for bar in exact.bars] == [tuple(inches(40, 30, 30))] * 2
+
+    @pytest.mark.unit
+    def test_kerf(self):
+        # Act
+        with_kerf = optimize_cuts(inches(108, 108))
+        without_kerf = optimize_cuts(inches(108, 108), kerf=FixedLength(0))
+        # Assert
+        assert len(with_kerf.bars) == 2
+        assert with_kerf.bars[0].offcut == FixedLength.from_fraction(108)
+        assert len(without_kerf.bars) == 1
+        assert without_kerf.waste == FixedLength(0)
+
+    @pytest.mark.unit
+    def test_shortest_stock_that_fits(self):
+        # Act
+        plan = optimize_cuts(inches(110, 110), inches(216, 120))
+        # Assert
+        assert plan.stock_count() == {FixedLength.from_fraction(120): 2}
+        assert plan.stock_used == FixedLength.from_fraction(240)
+        assert plan.waste == FixedLength.from_fraction(20)
+
+    @pytest.mark.unit
+    def test_large_order_uses_first_fit_decreasing(self):
+        # Act
+        plan = optimize_cuts(inches(*range(40, 200)) * 10)
+        # Assert
+        assert not plan.optimal
+        assert sum(len(bar.cuts) for bar in plan.bars) == 1600
+        assert all(bar.offcut >= FixedLength(0) for bar in plan.bars)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pieces, stock", [
+        (inches(217), inches(216)),
+        (inches(0), inches(216)),
+        (inches(100), ()),
+    ])
+    def test_invalid_order(self, pieces, stock):
+        with pytest.raises(ValueError):
+            optimize_cuts(pieces, stock)
+
+
+class TestCutList:
+
+    @pytest.mark.unit
+    def test_pieces_from_many_rooms(self):
+        # Arrange
+        bill = BillOfMaterials(SunroomType.STUDIO, (
+            BomLineItem(MaterialType.HANG_RAIL, SunroomSide.B_SIDE, 2, FixedLength.from_fraction(150)),
+            BomLineItem(MaterialType.FASCIA, SunroomSide.A_SIDE, 1, FixedLength.from_fraction(60)),
+            BomLineItem(MaterialType.FASCIA, SunroomSide.C_SIDE, 1, FixedLength.from_fraction(60)),
+            BomLineItem(MaterialType.ARMSTRONG_BOX, None, 6),
+        ))
+        # Act
+        plans = cut_list([bill, bill])
+        # Assert
+        assert cut_pieces([bill, bill], MaterialType.FASCIA) == inches(60, 60, 60, 60)
+        assert list(plans) == [MaterialType.HANG_RAIL, MaterialType.FASCIA]
+        assert len(plans[MaterialType.HANG_RAIL].bars) == 4
+        # Three 60" pieces fit on one 216" bar with kerf, the fourth needs another.
+        assert len(plans[MaterialType.FASCIA].bars) == 2
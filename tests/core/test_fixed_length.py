@@ -0,0 +1,83 @@
+import pytest
+
+from livingspacetoolkit.lib import ToolkitLength
+from livingspacetoolkit.lib.fixed_length import FixedLength, FOOT, INCH, TICKS_PER_INCH
+from livingspacetoolkit.lib.toolkit_enums import LengthType
+
+
+class TestFixedLength:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("inches, ticks", [(0, 0), (1, 64), (150.5, 9632), (1 / 128 + 1e-9, 1), (-0.25, -16),
+                                               (12.000000000001, 768)])
+    def test_from_inches(self, inches, ticks):
+        assert FixedLength.from_inches(inches).ticks == ticks
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("variable", [float("nan"), float("inf")])
+    def test_invalid_inches(self, variable):
+        with pytest.raises(ValueError):
+            FixedLength.from_inches(variable)
+
+    @pytest.mark.unit
+    def test_ticks_must_be_int(self):
+        with pytest.raises(TypeError):
+            FixedLength(1.5)
+
+    @pytest.mark.unit
+    def test_arithmetic(self):
+        # Arrange
+        length = FixedLength.from_fraction(150, 1, 2)
+        # Act / Assert
+        assert length + INCH == FixedLength.from_inches(151.5)
+        assert length - FOOT == FixedLength.from_inches(138.5)
+        assert length * 2 == 2 * length == FixedLength.from_inches(301)
+        assert length // 2 == FixedLength.from_inches(75.25)
+        assert length // FOOT == 12
+        assert length % FOOT == FixedLength.from_inches(6.5)
+        assert -length == FixedLength.from_inches(-150.5)
+        assert length.ceil_div(FOOT) == 13
+        assert length.floor_to(FOOT) == FixedLength.from_inches(144)
+        assert length.ceil_to(FOOT) == FixedLength.from_inches(156)
+        assert float(length) == length.inches == 150.5
+        assert length.__add__(1) is NotImplemented
+
+    @pytest.mark.unit
+    def test_comparison(self):
+        assert INCH < FOOT
+        assert FOOT >= FixedLength(12 * TICKS_PER_INCH)
+        assert not FixedLength(0)
+        assert len({FixedLength(64), INCH, FOOT}) == 2
+        assert INCH != 1
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("ticks, denominator, inches, feet_inches", [
+        (9632, 64, '150 1/2"', '12\' 6 1/2"'),
+        (9633, 64, '150 33/64"', '12\' 6 33/64"'),
+        (9633, 16, '150 1/2"', '12\' 6 1/2"'),
+        (9636, 16, '150 9/16"', '12\' 6 9/16"'),
+        (32, 64, '1/2"', '1/2"'),
+        (768, 16, '12"', '1\' 0"'),
+        (-9632, 64, '-150 1/2"', '-12\' 6 1/2"'),
+    ])
+    def test_formatting(self, ticks, denominator, inches, feet_inches):
+        length = FixedLength(ticks)
+        assert length.format_inches(denominator) == inches
+        assert length.format_feet_inches(denominator) == feet_inches
+
+    @pytest.mark.unit
+    def test_round_to(self):
+        assert FixedLength(9634).round_to(16) == FixedLength(9636)
+        assert FixedLength(-9634).round_to(16) == FixedLength(-9636)
+        with pytest.raises(ValueError):
+            FixedLength(1).round_to(10)
+
+    @pytest.mark.unit
+    def test_toolkit_length_fixed(self):
+        # Arrange
+        length = ToolkitLength(LengthType.PANEL)
+        # Act
+        length.length = "12' 6 1/2\""
+        # Assert
+        assert length.fixed == FixedLength.from_fraction(150, 1, 2)
+        assert str(length.fixed) == '150 1/2"'
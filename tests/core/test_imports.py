@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import pytest
+
+
+def run_python(code: str, tmp_path) -> str:
+    """Runs code in a fresh interpreter with the user directories moved to tmp_path."""
+    env = os.environ | {"HOME": str(tmp_path), "XDG_STATE_HOME": str(tmp_path / "state")}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env).stdout
+
+
+class TestImports:
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("module", ["livingspacetoolkit.lib", "livingspacetoolkit.models",
+                                        "livingspacetoolkit.lib.sunroom_builder",
+                                        "livingspacetoolkit.models.results_model"])
+    def test_core_has_no_side_effects(self, module, tmp_path):
+        # Act
+        output = run_python(f"import sys, logging, {module}\n"
+                            "from livingspacetoolkit.lib import SunroomBuilder, solve\n"
+                            "from livingspacetoolkit.models import ToolkitStateModel\n"
+                            "heavy = ('PySide6', 'numpy', 'platformdirs', 'logging.handlers')\n"
+                            "print([name for name in heavy if name in sys.modules])\n"
+                            "print(logging.getLogger('livingspace_toolkit').handlers)", tmp_path)
+        # Assert
+        assert output.splitlines() == ["[]", "[]"]
+        assert not (tmp_path / "state").exists()
+
+    @pytest.mark.integration
+    def test_configure_logging(self, tmp_path):
+        # Act
+        output = run_python("from livingspacetoolkit.config.log_config import logger, configure_logging\n"
+                            "configure_logging()\n"
+                            "configure_logging()\n"
+                            "logger.info('Started')\n"
+                            "print(len(logger.handlers))", tmp_path)
+        # Assert
+        assert output.strip() == "2"
+        log_files = list((tmp_path / "state").rglob("livingspace-toolkit.log"))
+        assert len(log_files) == 1
+        assert "Started" in log_files[0].read_text()
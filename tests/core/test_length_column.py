@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+
+from livingspacetoolkit.lib import ToolkitLength
+from livingspacetoolkit.lib.length_column import parse_length_column
+from livingspacetoolkit.lib.toolkit_enums import LengthError, LengthType
+
+CELLS = ["12' 6 1/2\"", "1 1/2ft - 1 1/2in", "15.75", "1/2 inch", 96, 0.5, "10FT", "1'6\""]
+
+
+class TestLengthColumn:
+
+    @pytest.mark.unit
+    def test_matches_toolkit_length(self):
+        # Arrange
+        expected = []
+        for cell in CELLS:
+            length = ToolkitLength(LengthType.WALL_WIDTH)
+            length.length = cell
+            expected.append(length.length)
+        # Act
+        column = parse_length_column(CELLS, LengthType.WALL_WIDTH)
+        # Assert
+        assert column.inches.dtype == np.float64
+        assert column.inches.tolist() == expected
+        assert column.valid.all()
+        assert (column.errors == LengthError.OK.value).all()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cell, error", [
+        ("", LengthError.EMPTY),
+        ("   ", LengthError.EMPTY),
+        (None, LengthError.EMPTY),
+        ("-5", LengthError.NEGATIVE),
+        ("- 1' 6\"", LengthError.NEGATIVE),
+        (-0.5, LengthError.NEGATIVE),
+        ("abc", LengthError.INVALID),
+        ("1/0\"", LengthError.INVALID),
+        (float("nan"), LengthError.INVALID),
+        (True, LengthError.INVALID),
+    ])
+    def test_error_codes(self, cell, error):
+        # Act
+        column = parse_length_column(["10'", cell, "6in"])
+        # Assert
+        assert column.errors.tolist() == [0, error.value, 0]
+        assert column.valid.tolist() == [True, False, True]
+        assert np.isnan(column.inches[1])
+        assert column.error_rows(error).tolist() == [1]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("length_type, valid", [(LengthType.HANG_RAIL, [True, False, False, False]),
+                                                    (LengthType.FASCIA, [True, False, False, False]),
+                                                    (LengthType.PANEL, [True, True, True, True]),
+                                                    (None, [True, True, True, True])])
+    def test_limits(self, length_type, valid):
+        # Act
+        column = parse_length_column(["18'", "24'", 216.5, "288in"], length_type)
+        # Assert
+        assert column.valid.tolist() == valid
+        assert column.error_rows(LengthError.TOO_LONG).tolist() == [i for i, ok in enumerate(valid) if not ok]
+        assert parse_length_column(["288 1/16\""], LengthType.PANEL).errors.tolist() == [LengthError.TOO_LONG.value]
+
+    @pytest.mark.unit
+    def test_empty_column(self):
+        column = parse_length_column(iter([]), LengthType.PANEL)
+        assert len(column) == 0
+        assert column.inches.shape == column.valid.shape == column.errors.shape == (0,)
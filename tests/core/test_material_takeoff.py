@@ -0,0 +1,110 @@
+import dataclasses
+import pickle
+import pytest
+from math import atan
+
+from livingspacetoolkit.lib import ScenarioInputs
+from livingspacetoolkit.lib.cut_list import optimize_cuts
+from livingspacetoolkit.lib.fixed_length import FixedLength, INCH
+from livingspacetoolkit.lib.material_takeoff import (MaterialTakeoff, ProjectRoom, RoomFailure, TakeoffKey,
+                                                        takeoff_project)
+from livingspacetoolkit.lib.solve_cache import SolveCache
+from livingspacetoolkit.lib.toolkit_enums import (Scenario, SunroomType, SunroomSide, EndCutType, RoofingType,
+                                                  MaterialType)
+from livingspacetoolkit.models import BillOfMaterials, BomLineItem
+
+STUDIO = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 12, 6, 120, 130,
+                        120, pitch_b=atan(10 / 12), wall_height_b=120)
+CATHEDRAL = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL, EndCutType.UNCUT_TOP_BOTTOM, 12, 6, 120,
+                           300, 120, pitch_a=atan(10 / 12), pitch_c=atan(10 / 12), wall_height_a=120,
+                           wall_height_c=120)
+
+
+def project(count: int):
+    for index in range(count):
+        inputs = STUDIO if index % 2 else dataclasses.replace(CATHEDRAL, wall_width_b=300 + index % 5 * 12)
+        yield ProjectRoom(inputs, RoofingType.ECO_GREEN, fascia=True, name=f"Room {index}")
+
+
+class TestMaterialTakeoff:
+
+    @pytest.mark.unit
+    def test_add(self):
+        # Arrange
+        bill = BillOfMaterials(SunroomType.STUDIO, (
+            BomLineItem(MaterialType.ROOF_PANEL, SunroomSide.B_SIDE, 5, FixedLength.from_fraction(174, 1, 2)),
+            BomLineItem(MaterialType.HANG_RAIL, SunroomSide.B_SIDE, 2, FixedLength.from_fraction(160)),
+            BomLineItem(MaterialType.ARMSTRONG_BOX, None, 6),
+        ), roof_area=200)
+        takeoff = MaterialTakeoff()
+        # Act
+        takeoff.add(bill, RoofingType.ALUMINUM, 6 * INCH)
+        takeoff.add(bill, RoofingType.ALUMINUM, 6 * INCH)
+        # Assert
+        assert takeoff.lines() == [
+            (TakeoffKey(MaterialType.ROOF_PANEL, FixedLength.from_fraction(180), RoofingType.ALUMINUM, 6 * INCH), 10),
+            (TakeoffKey(MaterialType.HANG_RAIL, FixedLength.from_fraction(160)), 4),
+            (TakeoffKey(MaterialType.ARMSTRONG_BOX), 12),
+        ]
+        assert takeoff.lines()[0][0].sku == 'ROOF_PANEL ALUMINUM 6"'
+        assert (takeoff.rooms, takeoff.roof_area) == (2, 400)
+
+    @pytest.mark.integration
+    def test_single_pass_matches_merged_takeoffs(self):
+        # Arrange
+        rooms = list(project(40))
+        first, second = MaterialTakeoff(), MaterialTakeoff()
+        for room in rooms[:25]:
+            first.add_room(room)
+        for room in rooms[25:]:
+            second.add_room(room)
+        # Act
+        takeoff = takeoff_project(project(40), SolveCache())
+        first.merge(pickle.loads(pickle.dumps(second)))
+        # Assert
+        assert takeoff == first
+        assert takeoff.rooms == 40
+        assert takeoff.quantity(MaterialType.ARMSTRONG_BOX) == sum(
+            MaterialTakeoff().add_room(room).quantity(MaterialType.ARMSTRONG_BOX) for room in rooms)
+
+    @pytest.mark.integration
+    def test_memory_does_not_grow_with_rooms(self):
+        # Arrange
+        cache = SolveCache()
+        # Act
+        small = takeoff_project(project(10), cache)
+        large = takeoff_project(project(2000), cache)
+        # Assert
+        assert large.quantities.keys() == small.quantities.keys()
+        assert large.quantity(MaterialType.HANG_RAIL) == 200 * small.quantity(MaterialType.HANG_RAIL)
+        assert len(cache) == 6
+
+    @pytest.mark.integration
+    def test_pieces_feed_the_cut_list(self):
+        # Arrange
+        takeoff = takeoff_project(project(6))
+        # Act
+        plan = optimize_cuts(takeoff.pieces(MaterialType.FASCIA))
+        # Assert
+        assert sum(len(bar.cuts) for bar in plan.bars) == takeoff.quantity(MaterialType.FASCIA)
+
+    @pytest.mark.unit
+    def test_merge_needs_the_same_panel_bucket(self):
+        with pytest.raises(ValueError):
+            MaterialTakeoff().merge(MaterialTakeoff(INCH))
+
+    @pytest.mark.integration
+    def test_rooms_that_fail_are_skipped(self):
+        # Arrange
+        unsolvable = dataclasses.replace(STUDIO, scenario=Scenario.DRIP_EDGE_PEAK_HEIGHT, peak_height=100,
+                                         drip_edge_height_b=120)
+        rooms = [ProjectRoom(unsolvable, name="Too low"), *project(4),
+                 ProjectRoom(dataclasses.replace(STUDIO, scenario=None), name="No scenario")]
+        # Act
+        takeoff = takeoff_project(rooms)
+        # Assert
+        assert takeoff.rooms == 4
+        assert takeoff.quantities == takeoff_project(project(4)).quantities
+        assert [failure.name for failure in takeoff.failures] == ["Too low", "No scenario"]
+        assert takeoff.failures[1] == RoomFailure("No scenario", "There is no solver for scenario None on a STUDIO "
+                                                                 "sunroom.")
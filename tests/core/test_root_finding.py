@@ -0,0 +1,84 @@
+import pytest
+from math import cos, sqrt
+
+from livingspacetoolkit.lib.root_finding import (bisect, brent, ConvergenceError, solve_quadratic, solve_cubic,
+                                                  solve_quartic)
+
+
+class TestRootFinding:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method", [bisect, brent])
+    def test_finds_root(self, method):
+        # Act
+        result = method(lambda x: x ** 2 - 2, 0, 2, tolerance=1e-12)
+        # Assert
+        assert result.root == pytest.approx(sqrt(2), abs=1e-11)
+        assert result.iterations > 0
+        assert result.function_calls >= result.iterations
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method", [bisect, brent])
+    def test_root_on_bracket_end(self, method):
+        result = method(lambda x: x - 1, 1, 3)
+
+        assert result.root == 1
+        assert result.iterations == 0
+
+    @pytest.mark.unit
+    def test_brent_faster_than_bisect(self):
+        # Arrange
+        func = lambda x: cos(x) - x
+        # Act
+        brent_result = brent(func, 0, 1, tolerance=1e-12)
+        bisect_result = bisect(func, 0, 1, tolerance=1e-12)
+        # Assert
+        assert brent_result.root == pytest.approx(bisect_result.root, abs=1e-11)
+        assert brent_result.iterations < bisect_result.iterations
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method", [bisect, brent])
+    def test_no_bracket(self, method):
+        with pytest.raises(ConvergenceError):
+            method(lambda x: x ** 2 + 1, -1, 1)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method", [bisect, brent])
+    def test_max_iterations(self, method):
+        with pytest.raises(ConvergenceError) as err:
+            method(lambda x: x ** 3 - 2, 0, 2, tolerance=1e-15, max_iterations=3)
+        assert err.value.iterations == 3
+
+
+class TestPolynomialRoots:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("coefficients, expected", [
+        ((1, -3, 2), [1, 2]),
+        ((1, 2, 1), [-1]),
+        ((1, 0, 1), []),
+        ((0, 2, -4), [2]),
+    ])
+    def test_quadratic(self, coefficients, expected):
+        assert solve_quadratic(*coefficients) == pytest.approx(expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("coefficients, expected", [
+        ((1, -6, 11, -6), [1, 2, 3]),
+        ((1, 0, 0, -8), [2]),
+        ((2, -4, 2, 0), [0, 1]),
+    ])
+    def test_cubic(self, coefficients, expected):
+        roots = solve_cubic(*coefficients)
+        for root in expected:
+            assert min(abs(root - found) for found in roots) < 1e-6
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("coefficients, expected", [
+        ((1, -10, 35, -50, 24), [1, 2, 3, 4]),
+        ((1, 0, -5, 0, 4), [-2, -1, 1, 2]),
+        ((1, 0, 0, 0, 1), []),
+        ((-3, 2, 1, 4, -2), [0.43770371033129507, 1.3646037537884421]),
+    ])
+    def test_quartic(self, coefficients, expected):
+        assert solve_quartic(*coefficients) == pytest.approx(expected)
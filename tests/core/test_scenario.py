@@ -6,6 +6,7 @@ from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
 from livingspacetoolkit.utils.helpers import to_nice_number
 from livingspacetoolkit.lib.toolkit_enums import Scenario, SunroomSide, RoofingType, SunroomType, EndCutType
 from livingspacetoolkit.lib.toolkit_length import LengthType
+from livingspacetoolkit.lib.root_finding import ConvergenceError
 
 
 class TestScenarioSelection:
@@ -31,6 +32,16 @@ class TestScenarioSelection:
         # Assert
         assert scenario.__class__.__name__ == expected
 
+    @pytest.mark.unit
+    def test_unknown_scenario(self):
+        # Arrange
+        toolkit_state = ToolkitStateModel()
+        toolkit_state.sunroom_type = SunroomType.STUDIO
+        toolkit_state.scenario = None
+        # Act / Assert
+        with pytest.raises(UnknownScenarioError):
+            ScenarioSelector(toolkit_state).identify_scenario(SunroomModel())
+
 
 # Note the parametrized tests changes the End Cuts type because the function, calculate_drip_edge in base_scenario_class
 # calculates the drip edge differently for EndCutType.PLUMB_CUT_TOP_BOTTOM. This also means that scenario
@@ -257,11 +268,13 @@ class TestStudioScenarios:
     @pytest.mark.parametrize("actual, expected",
                              [
                                  (EndCutType.UNCUT_TOP_BOTTOM, [111.625, 227.8125, 120, 10]),
-                                 (EndCutType.PLUMB_CUT_TOP_BOTTOM, [108.375, 227.9375, 116.9375, 10.5]),
+                                 (EndCutType.PLUMB_CUT_TOP_BOTTOM, [108.3125, 227.9375, 116.9375, 10.5]),
                              ])
     def test_drip_edge_peak_height(self, actual, expected):
         # Arrange
         # expected = [soffit, max_height, wall_heights (a,b,c), pitch]
+        # The previous version stepped the pitch until the drip edge was within 0.01" and overshot the plumb cut soffit
+        # to 108.375. The pitch is now solved to the root so the soffit is 108.3406 which rounds to 108.3125.
         toolkit_state = ToolkitStateModel()
         sunroom_model = SunroomModel()
         toolkit_state.sunroom_type = SunroomType.STUDIO
@@ -718,4 +731,57 @@ class TestCathedralScenarios:
         assert to_nice_number(drip_edge_c_side, 16) == expected
         assert to_nice_number(max_height, 16) == 174.3125
         assert to_nice_number(a_wall_height, 16) == 116.5
-        assert to_nice_number(c_wall_height, 16) == 116.5
\ No newline at end of file
+        assert to_nice_number(c_wall_height, 16) == 116.5
+
+
+class TestDripEdgePeakHeightSolver:
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type, drip_edge_key", [
+        (SunroomType.STUDIO, (SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT)),
+        (SunroomType.CATHEDRAL, (SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT)),
+    ])
+    def test_unreachable_drip_edge(self, sunroom_type, drip_edge_key):
+        # Arrange: The drip edge is above the peak so no pitch can reach it.
+        toolkit_state = ToolkitStateModel()
+        sunroom_model = SunroomModel()
+        toolkit_state.sunroom_type = sunroom_type
+        toolkit_state.scenario = Scenario.DRIP_EDGE_PEAK_HEIGHT
+        toolkit_state.overhang.length = 10
+        toolkit_state.thickness.length = 6
+        toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+        toolkit_state.wall_heights[drip_edge_key].length = 300
+        toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 220
+        for sunroom_side in SunroomSide:
+            toolkit_state.floor_walls[sunroom_side].length = 120
+        scenario = ScenarioSelector(toolkit_state).identify_scenario(sunroom_model)
+        # Act / Assert
+        with pytest.raises(ConvergenceError):
+            scenario.calculate_sunroom_properties()
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type", [SunroomType.STUDIO, SunroomType.CATHEDRAL])
+    @pytest.mark.parametrize("end_cuts", list(EndCutType))
+    @pytest.mark.parametrize("drip_edge", [80, 100.5, 116.25, 130])
+    def test_analytic_matches_iterative(self, monkeypatch, sunroom_type, end_cuts, drip_edge):
+        # Arrange
+        pitches = []
+        for use_analytic in (True, False):
+            toolkit_state = ToolkitStateModel()
+            toolkit_state.sunroom_type = sunroom_type
+            toolkit_state.scenario = Scenario.DRIP_EDGE_PEAK_HEIGHT
+            toolkit_state.overhang.length = 10
+            toolkit_state.thickness.length = 8.25
+            toolkit_state.end_cuts = end_cuts
+            toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 168
+            for sunroom_side in SunroomSide:
+                toolkit_state.wall_heights[(sunroom_side, LengthType.DRIP_EDGE_HEIGHT)].length = drip_edge
+                toolkit_state.floor_walls[sunroom_side].length = 150
+            monkeypatch.setattr(DripEdgePeakHeight, "use_analytic", use_analytic)
+            scenario = ScenarioSelector(toolkit_state).identify_scenario(SunroomModel())
+            # Act
+            scenario.calculate_sunroom_properties()
+            pitches.append(toolkit_state.pitch[SunroomSide.B_SIDE if sunroom_type == SunroomType.STUDIO
+                                               else SunroomSide.A_SIDE].pitch_value)
+        # Assert
+        assert pitches[0] == pytest.approx(pitches[1], abs=1e-8)
@@ -0,0 +1,139 @@
+import pytest
+from dataclasses import FrozenInstanceError, fields, replace
+from math import atan
+
+from livingspacetoolkit.lib import (ScenarioInputs, ScenarioOutputs, ScenarioSelector, UnknownScenarioError,
+                                    WallHeightPitch, get_solver, register_solver, solve, base_scenario_class)
+from livingspacetoolkit.lib.base_scenario_class import RegisteredSolverScenario
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
+from livingspacetoolkit.lib.toolkit_enums import Scenario, SunroomSide, SunroomType, EndCutType, LengthType
+
+
+def make_state(scenario: Scenario, sunroom_type: SunroomType) -> ToolkitStateModel:
+    toolkit_state = ToolkitStateModel()
+    toolkit_state.sunroom_type = sunroom_type
+    toolkit_state.scenario = scenario
+    toolkit_state.end_cuts = EndCutType.PLUMB_CUT_TOP_BOTTOM
+    toolkit_state.overhang.length = 10
+    toolkit_state.thickness.length = 6
+    for sunroom_side in SunroomSide:
+        toolkit_state.floor_walls[sunroom_side].length = 120
+        toolkit_state.pitch[sunroom_side].pitch_value = 10
+        toolkit_state.wall_heights[(sunroom_side, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.wall_heights[(sunroom_side, LengthType.SOFFIT_HEIGHT)].length = 111.6875
+        toolkit_state.wall_heights[(sunroom_side, LengthType.DRIP_EDGE_HEIGHT)].length = 116.25
+    toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 220
+    toolkit_state.wall_heights[(None, LengthType.MAX_HEIGHT)].length = 227.8125
+    return toolkit_state
+
+
+class TestScenarioCore:
+
+    @pytest.mark.unit
+    def test_records_are_immutable(self):
+        inputs = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 10, 6,
+                                120, 120, 120, pitch_b=atan(10 / 12), wall_height_b=120)
+        outputs = solve(inputs)
+        with pytest.raises(FrozenInstanceError):
+            inputs.overhang = 12
+        with pytest.raises(FrozenInstanceError):
+            outputs.peak_height = 0
+        assert hash(inputs) == hash(ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO,
+                                                   EndCutType.UNCUT_TOP_BOTTOM, 10, 6, 120, 120, 120,
+                                                   pitch_b=atan(10 / 12), wall_height_b=120))
+
+    @pytest.mark.unit
+    def test_solve_is_repeatable(self):
+        inputs = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 10, 6,
+                                120, 120, 120, pitch_b=atan(10 / 12), wall_height_b=120)
+        assert solve(inputs) == solve(inputs)
+        assert solve(inputs).pitch_b is None
+        assert solve(inputs).wall_height_b is None
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type", list(SunroomType))
+    @pytest.mark.parametrize("scenario", list(Scenario))
+    def test_matches_scenario_classes(self, scenario, sunroom_type):
+        # Arrange
+        toolkit_state = make_state(scenario, sunroom_type)
+        sunroom_model = SunroomModel()
+        inputs = ScenarioInputs.from_toolkit_state(toolkit_state)
+        # Act
+        outputs = solve(inputs)
+        ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+        # Assert
+        solved = {field.name for field in fields(ScenarioOutputs) if getattr(outputs, field.name) is not None}
+        after = ScenarioInputs.from_toolkit_state(toolkit_state)
+        for name in solved - {"gable_wall_a", "gable_wall_b", "gable_wall_c"}:
+            assert getattr(after, name) == pytest.approx(getattr(outputs, name)), name
+        for suffix, sunroom_side in (("a", SunroomSide.A_SIDE), ("b", SunroomSide.B_SIDE), ("c", SunroomSide.C_SIDE)):
+            if f"gable_wall_{suffix}" in solved:
+                assert sunroom_model.gable_wall[sunroom_side].length == getattr(outputs, f"gable_wall_{suffix}")
+
+    @pytest.mark.unit
+    def test_unknown_scenario(self):
+        inputs = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 10, 6,
+                                120, 120, 120)
+        with pytest.raises(UnknownScenarioError, match="WALL_HEIGHT_PITCH"):
+            solve(replace(inputs, sunroom_type=None))
+
+
+class TestSolverRegistry:
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sunroom_type", list(SunroomType))
+    @pytest.mark.parametrize("scenario", list(Scenario))
+    def test_every_scenario_is_registered(self, scenario, sunroom_type):
+        assert callable(get_solver(scenario, sunroom_type))
+
+    @pytest.mark.unit
+    def test_solvers_are_bound(self):
+        assert get_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO) == WallHeightPitch.solve_studio
+        assert get_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL) == WallHeightPitch.solve_cathedral
+
+    @pytest.mark.unit
+    def test_register_plugin_solver(self):
+        # Arrange
+        original = get_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)
+        inputs = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, EndCutType.UNCUT_TOP_BOTTOM, 10, 6,
+                                120, 120, 120)
+
+        @register_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)
+        def plugin(plugin_inputs: ScenarioInputs) -> ScenarioOutputs:
+            return ScenarioOutputs(peak_height=plugin_inputs.wall_width_a)
+
+        try:
+            # Act / Assert
+            assert solve(inputs) == ScenarioOutputs(peak_height=120)
+        finally:
+            register_solver(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO, original)
+        assert solve(inputs) != ScenarioOutputs(peak_height=120)
+
+    @pytest.mark.integration
+    def test_registered_solver_is_used_by_the_scenario_class(self, monkeypatch):
+        # Arrange
+        monkeypatch.setitem(base_scenario_class._SCENARIO_SOLVERS, (Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO),
+                            lambda inputs: ScenarioOutputs(peak_height=200))
+        toolkit_state = make_state(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)
+        scenario = ScenarioSelector(toolkit_state).identify_scenario(SunroomModel())
+        # Act
+        scenario.calculate_sunroom_properties()
+        # Assert
+        assert isinstance(scenario, WallHeightPitch)
+        assert toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length == 200
+
+    @pytest.mark.integration
+    def test_solver_without_a_scenario_class(self, monkeypatch):
+        # Arrange
+        monkeypatch.delitem(base_scenario_class._SCENARIO_CLASSES, Scenario.WALL_HEIGHT_PITCH)
+        monkeypatch.setitem(base_scenario_class._SCENARIO_SOLVERS, (Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL),
+                            lambda inputs: ScenarioOutputs(peak_height=200, gable_wall_a=inputs.wall_width_b / 2))
+        toolkit_state = make_state(Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL)
+        sunroom_model = SunroomModel()
+        scenario = ScenarioSelector(toolkit_state).identify_scenario(sunroom_model)
+        # Act
+        scenario.calculate_sunroom_properties()
+        # Assert
+        assert isinstance(scenario, RegisteredSolverScenario)
+        assert toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length == 200
+        assert sunroom_model.gable_wall[SunroomSide.A_SIDE].length == 60
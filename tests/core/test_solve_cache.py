@@ -0,0 +1,171 @@
+import dataclasses
+import pickle
+import pytest
+from math import atan
+
+from livingspacetoolkit.lib import ScenarioInputs, ScenarioSelector, SunroomBuilder, UnknownScenarioError
+from livingspacetoolkit.lib.solve_cache import (SolveCache, CACHE_FORMAT_VERSION, canonical_inputs, solve_cached,
+                                                solve_key)
+from livingspacetoolkit.lib.toolkit_enums import (Scenario, SunroomType, SunroomSide, EndCutType, RoofingType,
+                                                  LengthType)
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, SunroomResult
+
+INPUTS = ScenarioInputs(Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL, EndCutType.UNCUT_TOP_BOTTOM, 10, 6, 120, 150,
+                        120, pitch_a=atan(5 / 12), pitch_c=atan(5 / 12), wall_height_a=100, wall_height_c=100)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def room(width: float) -> ScenarioInputs:
+    return dataclasses.replace(INPUTS, wall_width_b=width)
+
+
+class TestCanonicalInputs:
+
+    @pytest.mark.unit
+    def test_unused_inputs_are_dropped(self):
+        # Arrange
+        solved_once = dataclasses.replace(INPUTS, peak_height=190.123, pitch_b=0.3, soffit_height_a=95)
+        # Act
+        canonical = canonical_inputs(solved_once)
+        # Assert
+        assert canonical == canonical_inputs(INPUTS)
+        assert canonical.peak_height == 0
+        assert canonical.pitch_a == INPUTS.pitch_a
+
+    @pytest.mark.unit
+    def test_lengths_are_rounded(self):
+        # Act
+        canonical = canonical_inputs(dataclasses.replace(INPUTS, overhang=10.001, wall_width_b=150 + 1 / 64))
+        # Assert
+        assert canonical.overhang == 10
+        assert canonical.wall_width_b == 150 + 1 / 64
+
+    @pytest.mark.unit
+    def test_unknown_scenario(self):
+        with pytest.raises(UnknownScenarioError):
+            solve_key(dataclasses.replace(INPUTS, scenario=None), None, False)
+
+
+class TestSolveCache:
+
+    @pytest.mark.integration
+    def test_matches_full_calculation(self):
+        # Arrange
+        toolkit_state = ToolkitStateModel(sunroom_type=SunroomType.CATHEDRAL, scenario=Scenario.WALL_HEIGHT_PITCH,
+                                          roofing_type=RoofingType.ECO_GREEN, end_cuts=EndCutType.UNCUT_TOP_BOTTOM,
+                                          fascia=True)
+        toolkit_state.overhang.length = 10
+        toolkit_state.thickness.length = 6
+        for side, width in zip(SunroomSide, (120, 150, 120)):
+            toolkit_state.floor_walls[side].length = width
+        for side in (SunroomSide.A_SIDE, SunroomSide.C_SIDE):
+            toolkit_state.pitch[side].pitch_value = '5'
+            toolkit_state.wall_heights[(side, LengthType.WALL_HEIGHT)].length = 100
+        inputs = ScenarioInputs.from_toolkit_state(toolkit_state)
+        sunroom_model = SunroomModel()
+        ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+        SunroomBuilder(toolkit_state, sunroom_model).build_roof_components()
+        # Act
+        result = solve_cached(inputs, RoofingType.ECO_GREEN, True, SolveCache())
+        # Assert
+        assert result.to_sunroom_model() == sunroom_model
+        assert result.outputs.peak_height == pytest.approx(
+            toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length)
+
+    @pytest.mark.integration
+    def test_hits_and_misses(self):
+        # Arrange
+        cache = SolveCache()
+        # Act
+        first = solve_cached(INPUTS, RoofingType.ECO_GREEN, True, cache)
+        second = solve_cached(dataclasses.replace(INPUTS, peak_height=190), RoofingType.ECO_GREEN, True, cache)
+        solve_cached(INPUTS, RoofingType.ECO_GREEN, False, cache)
+        # Assert
+        assert second is first
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+        assert solve_cached(INPUTS, RoofingType.ECO_GREEN, True) == first
+
+    @pytest.mark.unit
+    def test_results_are_immutable(self):
+        # Arrange
+        result = solve_cached(INPUTS, RoofingType.ECO_GREEN, True)
+        # Assert
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.armstrong_panels = 0
+        with pytest.raises(AttributeError):
+            result.side(SunroomSide.A_SIDE).panel_length.length = 0
+        assert isinstance(result, SunroomResult)
+        assert hash(pickle.loads(pickle.dumps(result))) == hash(result)
+
+    @pytest.mark.integration
+    def test_least_recently_used_is_evicted(self):
+        # Arrange
+        cache = SolveCache(maxsize=2)
+        solve_cached(room(150), cache=cache)
+        solve_cached(room(160), cache=cache)
+        solve_cached(room(150), cache=cache)
+        # Act
+        solve_cached(room(170), cache=cache)
+        # Assert
+        assert cache.evictions == 1
+        assert solve_key(room(150), None, False) in cache
+        assert solve_key(room(160), None, False) not in cache
+
+    @pytest.mark.integration
+    def test_ttl(self):
+        # Arrange
+        clock = FakeClock()
+        cache = SolveCache(ttl=60, clock=clock)
+        first = solve_cached(INPUTS, cache=cache)
+        # Act
+        clock.now = 61
+        second = solve_cached(INPUTS, cache=cache)
+        # Assert
+        assert second is not first and second == first
+        assert (cache.hits, cache.misses, cache.expirations) == (0, 2, 1)
+
+    @pytest.mark.integration
+    def test_save_and_load(self, tmp_path):
+        # Arrange
+        path = tmp_path / "solve_cache.pickle"
+        cache = SolveCache()
+        result = solve_cached(INPUTS, RoofingType.ALUMINUM, True, cache)
+        cache.save(path)
+        loaded = SolveCache()
+        # Act
+        count = loaded.load(path)
+        # Assert
+        assert count == 1
+        assert solve_cached(INPUTS, RoofingType.ALUMINUM, True, loaded) == result
+        assert loaded.hits == 1
+        assert SolveCache().load(tmp_path / "missing.pickle") == 0
+
+    @pytest.mark.integration
+    def test_load_counts_evictions(self, tmp_path):
+        # Arrange
+        path = tmp_path / "solve_cache.pickle"
+        cache = SolveCache()
+        for width in (150, 160, 170):
+            solve_cached(room(width), cache=cache)
+        cache.save(path)
+        loaded = SolveCache(maxsize=2)
+        # Act
+        loaded.load(path)
+        # Assert
+        assert loaded.info().evictions == 1
+        assert loaded.info().size == 2
+
+    @pytest.mark.unit
+    def test_old_cache_file_is_ignored(self, tmp_path):
+        # Arrange
+        path = tmp_path / "solve_cache.pickle"
+        path.write_bytes(pickle.dumps((CACHE_FORMAT_VERSION - 1, [])))
+        # Assert
+        assert SolveCache().load(path) == 0
@@ -0,0 +1,59 @@
+import json
+import time
+import pytest
+
+from livingspacetoolkit.startup_trace import ENV_VAR, StartupTrace
+
+
+class TestStartupTrace:
+
+    @pytest.mark.unit
+    def test_disabled_by_default(self, monkeypatch):
+        # Arrange
+        monkeypatch.delenv(ENV_VAR, raising=False)
+        trace = StartupTrace.from_environment()
+        # Act
+        with trace.phase("import_pyside6"):
+            pass
+        trace.write()
+        # Assert
+        assert not trace.enabled
+        assert trace.phases == []
+
+    @pytest.mark.unit
+    def test_enabled_by_environment(self, monkeypatch, tmp_path):
+        # Arrange
+        monkeypatch.setenv(ENV_VAR, str(tmp_path / "trace.json"))
+        # Act
+        trace = StartupTrace.from_environment()
+        # Assert
+        assert trace.report_path == tmp_path / "trace.json"
+
+    @pytest.mark.unit
+    def test_phases_are_written_once(self, tmp_path):
+        # Arrange
+        trace = StartupTrace(tmp_path / "trace" / "startup.json")
+        # Act
+        with trace.phase("create_application"):
+            pass
+        with pytest.raises(RuntimeError):
+            with trace.phase("create_main_window"):
+                raise RuntimeError("No display")
+        trace.write()
+        trace.phases.clear()
+        trace.write()
+        # Assert
+        report = json.loads((tmp_path / "trace" / "startup.json").read_text())
+        assert [phase["name"] for phase in report["phases"]] == ["create_application", "create_main_window"]
+        assert report["phases"][0]["start_ms"] <= report["phases"][1]["start_ms"]
+        assert report["first_paint_ms"] is None
+
+    @pytest.mark.unit
+    def test_times_are_from_started_at(self, tmp_path):
+        # Arrange
+        trace = StartupTrace(tmp_path / "startup.json", started_at=time.perf_counter() - 2)
+        # Act
+        with trace.phase("import_pyside6"):
+            pass
+        # Assert
+        assert trace.phases[0]["start_ms"] >= 2000
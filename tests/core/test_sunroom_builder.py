@@ -1,7 +1,9 @@
 import pytest
 
-from livingspacetoolkit.lib.toolkit_enums import SunroomSide, SunroomType, Scenario, RoofingType, LengthType, EndCutType
-from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
+from livingspacetoolkit.lib.fixed_length import FixedLength
+from livingspacetoolkit.lib.toolkit_enums import (SunroomSide, SunroomType, Scenario, RoofingType, LengthType, EndCutType,
+                                                  MaterialType)
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, BomLineItem, OverhangWarning
 from livingspacetoolkit.lib import SunroomBuilder, ScenarioSelector
 
 
@@ -31,24 +33,24 @@ class TestStudioSunroomBuild:
         # Assert
         assert sunroom_model.max_panel_length[SunroomSide.B_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.B_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.B_SIDE] == 180
+        assert sunroom_model.panel_length[SunroomSide.B_SIDE].length == 180
         assert sunroom_model.roof_area[SunroomSide.B_SIDE] == 200
         assert sunroom_model.roof_panels[SunroomSide.B_SIDE] == 5
         assert sunroom_model.roof_panels_split[SunroomSide.B_SIDE] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"].length == 12
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"].length == 12
         assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"] == 160
+        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"].length == 160
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 172
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 172
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 186
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 186
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 186
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 186
         assert sunroom_model.armstrong_panels == 6
 
     @pytest.mark.integration
@@ -76,24 +78,24 @@ class TestStudioSunroomBuild:
         # Assert
         assert sunroom_model.max_panel_length[SunroomSide.B_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.B_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.B_SIDE] == 180
+        assert sunroom_model.panel_length[SunroomSide.B_SIDE].length == 180
         assert sunroom_model.roof_area[SunroomSide.B_SIDE] == 200
         assert sunroom_model.roof_panels[SunroomSide.B_SIDE] == 5
         assert sunroom_model.roof_panels_split[SunroomSide.B_SIDE] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"].length == 12
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"].length == 12
         assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"] == 160
+        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"].length == 160
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 0
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 0
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 0
         assert sunroom_model.armstrong_panels == 6
 
     @pytest.mark.integration
@@ -121,26 +123,76 @@ class TestStudioSunroomBuild:
         # Assert
         assert sunroom_model.max_panel_length[SunroomSide.B_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.B_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.B_SIDE] == 276
+        assert sunroom_model.panel_length[SunroomSide.B_SIDE].length == 276
         assert sunroom_model.roof_area[SunroomSide.B_SIDE] == 430
         assert sunroom_model.roof_panels[SunroomSide.B_SIDE] == 7
         assert sunroom_model.roof_panels_split[SunroomSide.B_SIDE] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.A_SIDE]["value"].length == 12
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["long_check"] == False
-        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"] == 12
+        assert sunroom_model.roof_overhang[SunroomSide.C_SIDE]["value"].length == 12
         assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["max_length"] == True
-        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"] == 112
+        assert sunroom_model.hang_rails[SunroomSide.B_SIDE]["value"].length == 112
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == True
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 118
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 118
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == True
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 141
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 141
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == True
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 141
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 141
         assert sunroom_model.armstrong_panels == 14
 
+    @pytest.mark.integration
+    @pytest.mark.parametrize("flat_wall, expected_overhang", [
+        # 32 1/64" of overhang shared by the A and C sides is 16 1/128" each, just over the 16" limit.
+        (159 + 63 / 64, 16 + 1 / 64),
+        (160 + 1 / 64, 32),
+    ])
+    def test_odd_tick_wall_width(self, flat_wall, expected_overhang):
+        # Arrange
+        toolkit_state = ToolkitStateModel()
+        sunroom_model = SunroomModel()
+        toolkit_state.sunroom_type = SunroomType.STUDIO
+        toolkit_state.overhang.length = 16
+        toolkit_state.floor_walls[SunroomSide.B_SIDE].length = flat_wall
+        sunroom_model.panel_length[SunroomSide.B_SIDE].length = 180
+        builder = SunroomBuilder(toolkit_state, sunroom_model)
+        # Act
+        builder.build_roof_panels()
+        # Assert
+        for side in (SunroomSide.A_SIDE, SunroomSide.C_SIDE):
+            assert sunroom_model.roof_overhang[side]["short_check"] == False
+            assert sunroom_model.roof_overhang[side]["long_check"] == True
+            assert sunroom_model.roof_overhang[side]["value"].length == expected_overhang
+
+
+class TestFascia:
+    @pytest.mark.integration
+    @pytest.mark.parametrize("sunroom_type", [SunroomType.STUDIO, SunroomType.CATHEDRAL])
+    def test_fascia_is_skipped_when_turned_off(self, sunroom_type):
+        # Arrange
+        toolkit_state = ToolkitStateModel()
+        sunroom_model = SunroomModel()
+        toolkit_state.sunroom_type = sunroom_type
+        toolkit_state.scenario = Scenario.WALL_HEIGHT_PITCH
+        toolkit_state.overhang.length = 12
+        toolkit_state.roofing_type = RoofingType.ECO_GREEN
+        toolkit_state.thickness.length = 6
+        toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+        toolkit_state.fascia = False
+        for side in SunroomSide:
+            toolkit_state.pitch[side].pitch_value = '10'
+            toolkit_state.wall_heights[(side, LengthType.WALL_HEIGHT)].length = 120
+            toolkit_state.floor_walls[side].length = 120
+        ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+        builder = SunroomBuilder(toolkit_state, sunroom_model)
+        # Act
+        builder.build_roof_components()
+        # Assert
+        assert sunroom_model.fascia == SunroomModel().fascia
+        assert sunroom_model.panel_length != SunroomModel().panel_length
+
 
 class TestCathedralSunroomBuild:
     @pytest.mark.integration
@@ -172,8 +224,8 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.max_panel_length[SunroomSide.C_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.A_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.C_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.A_SIDE] == 96
-        assert sunroom_model.panel_length[SunroomSide.C_SIDE] == 96
+        assert sunroom_model.panel_length[SunroomSide.A_SIDE].length == 96
+        assert sunroom_model.panel_length[SunroomSide.C_SIDE].length == 96
         assert (sunroom_model.roof_area[SunroomSide.A_SIDE] + sunroom_model.roof_area[SunroomSide.C_SIDE]) == 192
         assert sunroom_model.roof_panels[SunroomSide.A_SIDE] == 4.5
         assert sunroom_model.roof_panels[SunroomSide.C_SIDE] == 4.5
@@ -181,19 +233,19 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.roof_panels_split[SunroomSide.C_SIDE] == True
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["long_check"] == True
-        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"] == 24
+        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"].length == 24
         assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"].length == 96
         assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"].length == 96
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 102
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 102
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1] == 102
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1].length == 102
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 150
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 150
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 150
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 150
         assert sunroom_model.armstrong_panels == 6
 
     @pytest.mark.integration
@@ -225,8 +277,8 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.max_panel_length[SunroomSide.C_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.A_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.C_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.A_SIDE] == 96
-        assert sunroom_model.panel_length[SunroomSide.C_SIDE] == 96
+        assert sunroom_model.panel_length[SunroomSide.A_SIDE].length == 96
+        assert sunroom_model.panel_length[SunroomSide.C_SIDE].length == 96
         assert (sunroom_model.roof_area[SunroomSide.A_SIDE] + sunroom_model.roof_area[SunroomSide.C_SIDE]) == 192
         assert sunroom_model.roof_panels[SunroomSide.A_SIDE] == 4.5
         assert sunroom_model.roof_panels[SunroomSide.C_SIDE] == 4.5
@@ -234,19 +286,19 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.roof_panels_split[SunroomSide.C_SIDE] == True
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["long_check"] == True
-        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"] == 24
+        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"].length == 24
         assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"].length == 96
         assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"].length == 96
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 0
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1] == 0
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1].length == 0
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 0
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 0
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 0
         assert sunroom_model.armstrong_panels == 6
 
     @pytest.mark.integration
@@ -278,8 +330,8 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.max_panel_length[SunroomSide.C_SIDE] == True
         assert sunroom_model.panel_tolerance[SunroomSide.A_SIDE] == False
         assert sunroom_model.panel_tolerance[SunroomSide.C_SIDE] == False
-        assert sunroom_model.panel_length[SunroomSide.A_SIDE] == 174
-        assert sunroom_model.panel_length[SunroomSide.C_SIDE] == 174
+        assert sunroom_model.panel_length[SunroomSide.A_SIDE].length == 174
+        assert sunroom_model.panel_length[SunroomSide.C_SIDE].length == 174
         assert (sunroom_model.roof_area[SunroomSide.A_SIDE] + sunroom_model.roof_area[SunroomSide.C_SIDE]) == 1316
         assert sunroom_model.roof_panels[SunroomSide.A_SIDE] == 8.5
         assert sunroom_model.roof_panels[SunroomSide.C_SIDE] == 8.5
@@ -287,17 +339,88 @@ class TestCathedralSunroomBuild:
         assert sunroom_model.roof_panels_split[SunroomSide.C_SIDE] == True
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["short_check"] == False
         assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["long_check"] == True
-        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"] == 22
+        assert sunroom_model.roof_overhang[SunroomSide.B_SIDE]["value"].length == 22
         assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.A_SIDE]["value"].length == 174
         assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["max_length"] == False
-        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"] == 96
+        assert sunroom_model.hang_rails[SunroomSide.C_SIDE]["value"].length == 174
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0] == 180
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][0].length == 180
         assert sunroom_model.fascia[SunroomSide.B_SIDE]["max_length"] == False
-        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1] == 180
+        assert sunroom_model.fascia[SunroomSide.B_SIDE]["value"][1].length == 180
         assert sunroom_model.fascia[SunroomSide.A_SIDE]["max_length"] == True
-        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0] == 139
+        assert sunroom_model.fascia[SunroomSide.A_SIDE]["value"][0].length == 139
         assert sunroom_model.fascia[SunroomSide.C_SIDE]["max_length"] == True
-        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0] == 139
-        assert sunroom_model.armstrong_panels == 44
\ No newline at end of file
+        assert sunroom_model.fascia[SunroomSide.C_SIDE]["value"][0].length == 139
+        assert sunroom_model.armstrong_panels == 44
+
+
+class TestBillOfMaterials:
+    @pytest.mark.integration
+    def test_studio(self):
+        # Arrange
+        toolkit_state = ToolkitStateModel()
+        sunroom_model = SunroomModel()
+        toolkit_state.sunroom_type = SunroomType.STUDIO
+        toolkit_state.scenario = Scenario.WALL_HEIGHT_PITCH
+        toolkit_state.pitch[SunroomSide.B_SIDE].pitch_value = '10'
+        toolkit_state.overhang.length = 4
+        toolkit_state.thickness.length = 6
+        toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+        toolkit_state.fascia = True
+        toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.floor_walls[SunroomSide.A_SIDE].length = 120
+        toolkit_state.floor_walls[SunroomSide.B_SIDE].length = 250
+        toolkit_state.floor_walls[SunroomSide.C_SIDE].length = 120
+        ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+        # Act
+        bill_of_materials = SunroomBuilder(toolkit_state, sunroom_model).build_roof_components()
+        # Assert
+        assert sunroom_model.bill_of_materials is bill_of_materials
+        assert bill_of_materials.items == (
+            BomLineItem(MaterialType.ROOF_PANEL, SunroomSide.B_SIDE, 9, FixedLength.from_fraction(168)),
+            BomLineItem(MaterialType.HANG_RAIL, SunroomSide.B_SIDE, 4, FixedLength.from_fraction(144), halved=True),
+            BomLineItem(MaterialType.FASCIA, SunroomSide.A_SIDE, 1, FixedLength.from_fraction(174)),
+            BomLineItem(MaterialType.FASCIA, SunroomSide.B_SIDE, 2, FixedLength.from_fraction(150), halved=True),
+            BomLineItem(MaterialType.FASCIA, SunroomSide.C_SIDE, 1, FixedLength.from_fraction(174)),
+            BomLineItem(MaterialType.ARMSTRONG_BOX, None, 11),
+        )
+        assert bill_of_materials.warnings == (
+            OverhangWarning(SunroomSide.A_SIDE, FixedLength.from_fraction(19), too_short=False),
+            OverhangWarning(SunroomSide.C_SIDE, FixedLength.from_fraction(19), too_short=False),
+        )
+        assert bill_of_materials.roof_area == sunroom_model.roof_area[SunroomSide.B_SIDE]
+        assert str(bill_of_materials.warnings[0]) == 'The overhang on the A wall is TOO LONG at 19".'
+
+    @pytest.mark.integration
+    def test_cathedral_split_panels_without_fascia(self):
+        # Arrange
+        toolkit_state = ToolkitStateModel()
+        sunroom_model = SunroomModel()
+        toolkit_state.sunroom_type = SunroomType.CATHEDRAL
+        toolkit_state.scenario = Scenario.WALL_HEIGHT_PITCH
+        toolkit_state.pitch[SunroomSide.A_SIDE].pitch_value = '10'
+        toolkit_state.pitch[SunroomSide.C_SIDE].pitch_value = '10'
+        toolkit_state.overhang.length = 12
+        toolkit_state.thickness.length = 6
+        toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+        toolkit_state.fascia = False
+        toolkit_state.wall_heights[(SunroomSide.A_SIDE, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.wall_heights[(SunroomSide.C_SIDE, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.floor_walls[SunroomSide.A_SIDE].length = 250
+        toolkit_state.floor_walls[SunroomSide.B_SIDE].length = 500
+        toolkit_state.floor_walls[SunroomSide.C_SIDE].length = 250
+        ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+        # Act
+        bill_of_materials = SunroomBuilder(toolkit_state, sunroom_model).build_roof_components()
+        # Assert: 8.5 panels per side are 9 panels, one ripped, and each is cut in half because it is over 24ft.
+        assert bill_of_materials.lines(MaterialType.ROOF_PANEL) == (
+            BomLineItem(MaterialType.ROOF_PANEL, SunroomSide.A_SIDE, 18, FixedLength.from_fraction(174), True, True),
+            BomLineItem(MaterialType.ROOF_PANEL, SunroomSide.C_SIDE, 18, FixedLength.from_fraction(174), True, True),
+        )
+        assert bill_of_materials.quantity(MaterialType.HANG_RAIL) == 4
+        assert bill_of_materials.lines(MaterialType.FASCIA) == ()
+        assert bill_of_materials.quantity(MaterialType.ARMSTRONG_BOX) == 44
+        assert bill_of_materials.warnings == (
+            OverhangWarning(SunroomSide.B_SIDE, FixedLength.from_fraction(22), too_short=False),)
+        assert bill_of_materials.roof_area == 1316
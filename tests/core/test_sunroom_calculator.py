@@ -0,0 +1,159 @@
+import copy
+import pytest
+
+from livingspacetoolkit.lib.toolkit_enums import (SunroomSide, SunroomType, Scenario, RoofingType, LengthType,
+                                                  EndCutType, PitchType)
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel
+from livingspacetoolkit.lib import (SunroomBuilder, SunroomCalculator, ScenarioSelector, UnknownScenarioError,
+                                    ScenarioInputs)
+from livingspacetoolkit.lib.solve_cache import calculate_sunroom
+from livingspacetoolkit.lib.sunroom_calculator import (NODES, DOWNSTREAM, SCENARIO, PANEL_LENGTH, ROOF_PANELS,
+                                                       HANG_RAILS, FASCIA, ARMSTRONG_PANELS,
+                                                       BILL_OF_MATERIALS)
+
+ALL_NODES = [node.name for node in NODES]
+
+
+def studio_state() -> ToolkitStateModel:
+    toolkit_state = ToolkitStateModel()
+    toolkit_state.sunroom_type = SunroomType.STUDIO
+    toolkit_state.scenario = Scenario.WALL_HEIGHT_PITCH
+    toolkit_state.pitch[SunroomSide.B_SIDE].pitch_value = '10'
+    toolkit_state.overhang.length = 12
+    toolkit_state.roofing_type = RoofingType.ECO_GREEN
+    toolkit_state.thickness.length = 6
+    toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+    toolkit_state.fascia = True
+    toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.WALL_HEIGHT)].length = 120
+    toolkit_state.floor_walls[SunroomSide.A_SIDE].length = 120
+    toolkit_state.floor_walls[SunroomSide.B_SIDE].length = 130
+    toolkit_state.floor_walls[SunroomSide.C_SIDE].length = 120
+    return toolkit_state
+
+
+def full_calculation(toolkit_state: ToolkitStateModel) -> SunroomModel:
+    """The sunroom model from running the scenario and every builder stage on a copy of the state."""
+    toolkit_state = copy.deepcopy(toolkit_state)
+    sunroom_model = SunroomModel()
+    ScenarioSelector(toolkit_state).identify_scenario(sunroom_model).calculate_sunroom_properties()
+    SunroomBuilder(toolkit_state, sunroom_model).build_roof_components()
+    return sunroom_model
+
+
+class TestSunroomCalculator:
+
+    @pytest.mark.unit
+    def test_downstream(self):
+        assert DOWNSTREAM[SCENARIO] == frozenset(ALL_NODES)
+        assert DOWNSTREAM[PANEL_LENGTH] == {PANEL_LENGTH, ROOF_PANELS, HANG_RAILS, FASCIA, BILL_OF_MATERIALS}
+        assert DOWNSTREAM[FASCIA] == {FASCIA, BILL_OF_MATERIALS}
+        assert DOWNSTREAM[ARMSTRONG_PANELS] == {ARMSTRONG_PANELS, BILL_OF_MATERIALS}
+
+    @pytest.mark.integration
+    def test_first_calculation_runs_everything(self):
+        # Arrange
+        toolkit_state = studio_state()
+        expected = full_calculation(toolkit_state)
+        calculator = SunroomCalculator(toolkit_state)
+        # Act
+        ran = calculator.calculate()
+        # Assert
+        assert ran == ALL_NODES
+        assert calculator.sunroom_model == expected
+        assert calculator.calculate() == []
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("change, expected_ran", [
+        (lambda state: setattr(state, "fascia", False), [FASCIA, BILL_OF_MATERIALS]),
+        (lambda state: setattr(state.overhang, "length", 10), ALL_NODES),
+        (lambda state: setattr(state.floor_walls[SunroomSide.B_SIDE], "length", 200), ALL_NODES),
+        (lambda state: setattr(state, "roofing_type", RoofingType.ALUMINUM), []),
+        (lambda state: setattr(state.pitch[SunroomSide.B_SIDE], "pitch_type", PitchType.ANGLE), ALL_NODES),
+    ])
+    def test_only_changed_stages_run(self, change, expected_ran):
+        # Arrange
+        toolkit_state = studio_state()
+        calculator = SunroomCalculator(toolkit_state)
+        calculator.calculate()
+        # Act
+        change(toolkit_state)
+        expected = full_calculation(toolkit_state)
+        ran = calculator.calculate()
+        # Assert
+        assert ran == expected_ran
+        assert calculator.sunroom_model == expected
+
+    @pytest.mark.integration
+    def test_flags_are_reset_when_a_stage_reruns(self):
+        # Arrange
+        toolkit_state = studio_state()
+        toolkit_state.sunroom_type = SunroomType.CATHEDRAL
+        toolkit_state.pitch[SunroomSide.A_SIDE].pitch_value = '10'
+        toolkit_state.pitch[SunroomSide.C_SIDE].pitch_value = '10'
+        toolkit_state.wall_heights[(SunroomSide.A_SIDE, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.wall_heights[(SunroomSide.C_SIDE, LengthType.WALL_HEIGHT)].length = 120
+        toolkit_state.floor_walls[SunroomSide.B_SIDE].length = 300
+        calculator = SunroomCalculator(toolkit_state)
+        calculator.calculate()
+        # Act: A shorter room clears the split panel and long fascia flags of the first calculation.
+        toolkit_state.floor_walls[SunroomSide.B_SIDE].length = 130
+        calculator.calculate()
+        # Assert
+        assert calculator.sunroom_model == full_calculation(toolkit_state)
+
+    @pytest.mark.integration
+    def test_invalidate(self):
+        # Arrange
+        calculator = SunroomCalculator(studio_state())
+        calculator.calculate()
+        # Act
+        calculator.invalidate(ROOF_PANELS)
+        # Assert
+        assert calculator.stale_nodes() == {ROOF_PANELS, HANG_RAILS, FASCIA, BILL_OF_MATERIALS}
+        assert calculator.calculate() == [ROOF_PANELS, HANG_RAILS, FASCIA, BILL_OF_MATERIALS]
+        calculator.invalidate()
+        assert calculator.calculate() == ALL_NODES
+
+    @pytest.mark.integration
+    def test_failed_calculation_reruns_everything(self):
+        # Arrange
+        toolkit_state = studio_state()
+        calculator = SunroomCalculator(toolkit_state)
+        calculator.calculate()
+        toolkit_state.sunroom_type = None
+        # Act
+        with pytest.raises(UnknownScenarioError):
+            calculator.calculate()
+        toolkit_state.sunroom_type = SunroomType.STUDIO
+        # Assert
+        assert calculator.calculate() == ALL_NODES
+        assert calculator.sunroom_model == full_calculation(toolkit_state)
+
+    @pytest.mark.integration
+    def test_result(self):
+        # Arrange
+        toolkit_state = studio_state()
+        calculator = SunroomCalculator(toolkit_state)
+        # Act
+        calculator.calculate()
+        result = calculator.result()
+        toolkit_state.fascia = False
+        calculator.calculate()
+        # Assert
+        assert result == calculate_sunroom(ScenarioInputs.from_toolkit_state(toolkit_state), RoofingType.ECO_GREEN,
+                                           True)
+        assert result != calculator.result()
+
+    @pytest.mark.unit
+    def test_sunroom_model_reset(self):
+        # Arrange
+        sunroom_model = SunroomModel()
+        sunroom_model.armstrong_panels = 4
+        sunroom_model.panel_tolerance[SunroomSide.B_SIDE] = True
+        sunroom_model.roof_panels[SunroomSide.B_SIDE] = 5
+        # Act
+        sunroom_model.reset("armstrong_panels", "panel_tolerance")
+        # Assert
+        assert sunroom_model.armstrong_panels == 0
+        assert sunroom_model.panel_tolerance[SunroomSide.B_SIDE] == False
+        assert sunroom_model.roof_panels[SunroomSide.B_SIDE] == 5
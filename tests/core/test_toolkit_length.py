@@ -1,6 +1,8 @@
+import pickle
 import pytest
 
-from livingspacetoolkit.lib import ToolkitLength
+from livingspacetoolkit.lib import ToolkitLength, FrozenToolkitLength
+from livingspacetoolkit.lib.toolkit_length import parse_imperial_to_inches
 from livingspacetoolkit.lib.toolkit_enums import LengthType, SunroomSide
 
 
@@ -214,3 +216,117 @@ class TestToolkitLength:
         length = ToolkitLength(LengthType.PANEL)
         with pytest.raises(ValueError):
             length.length = 289
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("actual, expected",
+                             [
+                                 (1e-05, 1e-05),
+                                 (2.5e+20, 2.5e+20),
+                                 (108.34062457, 108.34062457),
+                                 (0, 0),
+                             ])
+    def test_numeric_input(self, actual, expected):
+        # Arrange
+        length_1 = ToolkitLength(LengthType.THICKNESS)
+        length_1.length = actual
+
+        assert length_1.length == expected
+        assert isinstance(length_1.length, float)
+        assert length_1.modified == True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("variable", [-1e-05, float("nan"), float("inf"), True])
+    def test_invalid_numeric_input(self, variable):
+        length_1 = ToolkitLength(LengthType.THICKNESS)
+        with pytest.raises(ValueError):
+            length_1.length = variable
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("length_type, limit", [(LengthType.HANG_RAIL, 216), (LengthType.FASCIA, 216),
+                                                    (LengthType.PANEL, 288)])
+    def test_numeric_limits(self, length_type, limit):
+        length = ToolkitLength(length_type)
+        length.length = float(limit)
+        assert length.length == limit
+        with pytest.raises(ValueError):
+            length.length = limit + 1e-09
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("actual, expected",
+                             [
+                                 ("1'6\"", 18),
+                                 ("10FT", 120),
+                                 ("1 ft to 6 in", 18),
+                                 ("12 6", 18),
+                                 ("  15.75 in  ", 15.75),
+                             ])
+    def test_parse(self, actual, expected):
+        assert parse_imperial_to_inches(actual) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("variable", ["1/0\"", "1'6 \"x", "1 2 3", "."])
+    def test_parse_invalid(self, variable):
+        with pytest.raises(ValueError):
+            parse_imperial_to_inches(variable)
+
+    @pytest.mark.unit
+    def test_parse_cache(self):
+        # Arrange
+        length_1 = ToolkitLength(LengthType.THICKNESS)
+        length_1.length = "7 3/8 ft - 5 1/4 in"
+        hits = parse_imperial_to_inches.cache_info().hits
+        # Act
+        length_1.length = "7 3/8 ft - 5 1/4 in"
+        # Assert
+        assert parse_imperial_to_inches.cache_info().hits == hits + 1
+        assert length_1.length == 93.75
+
+    @pytest.mark.unit
+    def test_slots(self):
+        length = ToolkitLength(LengthType.THICKNESS)
+        assert not hasattr(length, "__dict__")
+        with pytest.raises(AttributeError):
+            length.unknown = 1
+
+    @pytest.mark.unit
+    def test_comparison_with_other_types(self):
+        # Arrange
+        length_1 = ToolkitLength(LengthType.THICKNESS)
+        length_1.length = 12
+        length_2 = ToolkitLength(LengthType.OVERHANG)
+        # Assert
+        assert length_1.__eq__(12) is NotImplemented
+        assert length_1.__lt__(12) is NotImplemented
+        assert (length_1 == 12) is False
+        with pytest.raises(TypeError):
+            assert length_1 < 12
+        with pytest.raises(ValueError):
+            length_1 + length_2
+
+    @pytest.mark.unit
+    def test_frozen(self):
+        # Arrange
+        length = ToolkitLength(LengthType.OVERHANG, SunroomSide.B_SIDE)
+        length.length = "1' 6\""
+        # Act
+        frozen = length.freeze()
+        # Assert
+        assert isinstance(frozen, FrozenToolkitLength)
+        assert frozen == length
+        assert frozen.length == 18
+        assert frozen.freeze() is frozen
+        assert frozen == FrozenToolkitLength(LengthType.OVERHANG, SunroomSide.B_SIDE, 18.0)
+        assert {frozen: 1}[FrozenToolkitLength(LengthType.OVERHANG, SunroomSide.B_SIDE, '18"')] == 1
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+        with pytest.raises(AttributeError):
+            frozen.length = 12
+        with pytest.raises(AttributeError):
+            frozen.sunroom_side = SunroomSide.A_SIDE
+        with pytest.raises(TypeError):
+            hash(length)
+
+    @pytest.mark.unit
+    def test_frozen_limits(self):
+        with pytest.raises(ValueError):
+            FrozenToolkitLength(LengthType.PANEL, None, "25'")
+        assert FrozenToolkitLength(LengthType.PANEL).modified == False
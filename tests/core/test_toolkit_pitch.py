@@ -1,7 +1,8 @@
+import pickle
 import pytest
 from math import atan, radians
 
-from livingspacetoolkit.lib import ToolkitPitch
+from livingspacetoolkit.lib import ToolkitPitch, FrozenToolkitPitch
 from livingspacetoolkit.lib.toolkit_enums import PitchType, SunroomSide
 
 
@@ -166,3 +167,81 @@ class TestToolkitPitch:
         pitch = ToolkitPitch(PitchType.RATIO, SunroomSide.A_SIDE)
         with pytest.raises(ValueError):
             pitch.pitch_value = 'abc'
+
+    @pytest.mark.unit
+    def test_radians_setter(self):
+        # Arrange
+        pitch = ToolkitPitch(PitchType.RATIO, SunroomSide.B_SIDE)
+        # Act
+        pitch.radians = 0.6435011087932844
+        # Assert
+        assert pitch.pitch_value == 0.6435011087932844
+        assert pitch.ratio == pytest.approx(9)
+        assert pitch.modified == True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pitch, expected", [
+        (ToolkitPitch.from_radians(atan(6 / 12), SunroomSide.A_SIDE), atan(6 / 12)),
+        (ToolkitPitch.from_ratio(6, SunroomSide.A_SIDE), atan(6 / 12)),
+        (ToolkitPitch.from_angle(30, SunroomSide.A_SIDE), radians(30)),
+    ])
+    def test_constructors(self, pitch, expected):
+        assert pitch.roof_side == SunroomSide.A_SIDE
+        assert pitch.pitch_value == expected
+        assert pitch.modified == True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("pitch_type, value", [
+        (PitchType.ANGLE, radians(60)),
+        (PitchType.RATIO, atan(21 / 12)),
+        (PitchType.RATIO, -0.1),
+        (PitchType.RATIO, float("nan")),
+    ])
+    def test_radians_limits(self, pitch_type, value):
+        pitch = ToolkitPitch(pitch_type, SunroomSide.A_SIDE)
+        with pytest.raises(ValueError):
+            pitch.radians = value
+
+    @pytest.mark.unit
+    def test_typed_limits(self):
+        with pytest.raises(ValueError):
+            ToolkitPitch.from_angle(60, SunroomSide.A_SIDE)
+        with pytest.raises(ValueError):
+            ToolkitPitch.from_ratio(21, SunroomSide.A_SIDE)
+        assert ToolkitPitch.from_angle(59.9, SunroomSide.A_SIDE).angle == pytest.approx(59.9)
+
+    @pytest.mark.unit
+    def test_slots(self):
+        pitch = ToolkitPitch(PitchType.RATIO, SunroomSide.A_SIDE)
+        assert not hasattr(pitch, "__dict__")
+        with pytest.raises(AttributeError):
+            pitch.unknown = 1
+
+    @pytest.mark.unit
+    def test_comparison_with_other_types(self):
+        pitch = ToolkitPitch.from_ratio(6, SunroomSide.A_SIDE)
+        assert pitch.__eq__(0.5) is NotImplemented
+        assert pitch.__gt__(0.5) is NotImplemented
+        assert (pitch == atan(0.5)) is False
+        with pytest.raises(ValueError):
+            pitch - ToolkitPitch.from_ratio(6, SunroomSide.C_SIDE)
+
+    @pytest.mark.unit
+    def test_frozen(self):
+        # Arrange
+        pitch = ToolkitPitch(PitchType.ANGLE, SunroomSide.C_SIDE)
+        pitch.pitch_value = "30 deg"
+        # Act
+        frozen = pitch.freeze()
+        # Assert
+        assert isinstance(frozen, FrozenToolkitPitch)
+        assert frozen == pitch
+        assert frozen.angle == pytest.approx(30)
+        assert len({frozen, FrozenToolkitPitch(PitchType.ANGLE, SunroomSide.C_SIDE, radians(30))}) == 1
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+        with pytest.raises(AttributeError):
+            frozen.ratio = 6
+        with pytest.raises(AttributeError):
+            frozen.pitch_type = PitchType.RATIO
+        with pytest.raises(ValueError):
+            FrozenToolkitPitch(PitchType.ANGLE, SunroomSide.C_SIDE, radians(60))
@@ -2,6 +2,7 @@ import pytest
 from contextlib import nullcontext as does_not_raise
 
 from livingspacetoolkit.models import ToolkitStateModel
+from livingspacetoolkit.lib.scenario_requirements import SCENARIO_REQUIREMENTS, MissingInputsError
 from livingspacetoolkit.lib.toolkit_enums import Scenario, SunroomSide, RoofingType, SunroomType, EndCutType
 from livingspacetoolkit.lib.toolkit_length import LengthType
 
@@ -56,6 +57,53 @@ class TestToolkitStateModel:
         with pytest.raises(TypeError):
             toolkit.check_calculation_ready()
 
+    @pytest.mark.unit
+    def test_missing_inputs_reports_everything(self):
+        # Arrange
+        toolkit = ToolkitStateModel()
+        toolkit.sunroom_type = SunroomType.CATHEDRAL
+        toolkit.scenario = Scenario.DRIP_EDGE_PEAK_HEIGHT
+        toolkit.overhang.length = '10'
+        toolkit.floor_walls[SunroomSide.B_SIDE].length = "10'"
+        toolkit.wall_heights[(SunroomSide.A_SIDE, LengthType.DRIP_EDGE_HEIGHT)].length = "10'"
+        # Act
+        with pytest.raises(MissingInputsError) as err:
+            toolkit.check_calculation_ready()
+        # Assert
+        assert err.value.missing == [
+            "Please select a roofing type.",
+            "Please select an end cut type.",
+            "Please input a value for the THICKNESS.",
+            "Please input a value for the A_SIDE WALL_WIDTH.",
+            "Please input a value for the C_SIDE WALL_WIDTH.",
+            "Please input a value for the PEAK_HEIGHT.",
+            "Please input a value for the C_SIDE DRIP_EDGE_HEIGHT.",
+        ]
+        assert str(err.value) == "\n".join(err.value.missing)
+        assert toolkit.missing_inputs() == err.value.missing
+
+    @pytest.mark.unit
+    def test_missing_inputs_without_scenario(self):
+        # Arrange
+        toolkit = ToolkitStateModel()
+        # Act
+        missing = toolkit.missing_inputs()
+        # Assert
+        assert missing[0] == "Please select a scenario."
+        assert len(missing) == 8
+
+    @pytest.mark.unit
+    def test_requirements_are_read_only(self):
+        # Arrange
+        key = (Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)
+        # Assert
+        assert len(SCENARIO_REQUIREMENTS) == len(Scenario) * len(SunroomType)
+        assert SCENARIO_REQUIREMENTS[key].pitch_sides == (SunroomSide.B_SIDE,)
+        with pytest.raises(TypeError):
+            SCENARIO_REQUIREMENTS[key] = SCENARIO_REQUIREMENTS[key]
+        with pytest.raises(AttributeError):
+            SCENARIO_REQUIREMENTS[key].pitch_sides = ()
+
 
 class TestStudioToolkitStateModel:
     @pytest.mark.unit
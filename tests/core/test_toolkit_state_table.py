@@ -0,0 +1,138 @@
+import pytest
+from itertools import product
+from math import atan
+
+from livingspacetoolkit.lib import ScenarioSelector, ScenarioInputs
+from livingspacetoolkit.lib.scenario_requirements import MissingInputsError
+from livingspacetoolkit.models import ToolkitStateModel, SunroomModel, ToolkitStateTable
+from livingspacetoolkit.models.toolkit_state_table import LENGTH_COLUMNS, NO_CODE, decode, encode
+from livingspacetoolkit.lib.toolkit_enums import (Scenario, SunroomSide, RoofingType, SunroomType, EndCutType,
+                                                  LengthType, PitchType)
+
+
+def ready_model(scenario: Scenario, sunroom_type: SunroomType) -> ToolkitStateModel:
+    """A model with every input filled in."""
+    toolkit = ToolkitStateModel()
+    toolkit.sunroom_type = sunroom_type
+    toolkit.scenario = scenario
+    toolkit.roofing_type = RoofingType.ECO_GREEN
+    toolkit.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+    toolkit.overhang.length = '10'
+    toolkit.thickness.length = '6'
+    for sunroom_side in SunroomSide:
+        toolkit.pitch[sunroom_side].pitch_value = '10'
+        toolkit.floor_walls[sunroom_side].length = "10'"
+    for key, length in toolkit.wall_heights.items():
+        length.length = {LengthType.PEAK_HEIGHT: 220, LengthType.MAX_HEIGHT: 227.8125,
+                         LengthType.DRIP_EDGE_HEIGHT: 116.25, LengthType.SOFFIT_HEIGHT: 111.6875}.get(key[1], 120)
+    return toolkit
+
+
+class TestToolkitStateTable:
+
+    @pytest.mark.unit
+    def test_enum_codes(self):
+        assert encode(None) == NO_CODE
+        assert encode(SunroomType.CATHEDRAL) == SunroomType.CATHEDRAL.value
+        for enum in (SunroomType, Scenario, RoofingType, EndCutType, PitchType):
+            assert [decode(enum, encode(member)) for member in enum] == list(enum)
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        # Arrange
+        models = [ready_model(Scenario.DRIP_EDGE_PITCH, SunroomType.CATHEDRAL), ToolkitStateModel()]
+        models[0].pitch[SunroomSide.A_SIDE].pitch_type = PitchType.ANGLE
+        models[0].fascia = True
+        # Act
+        table = ToolkitStateTable.from_models(models)
+        # Assert
+        assert len(table) == 2
+        assert table.scenario.tolist() == [encode(Scenario.DRIP_EDGE_PITCH), NO_CODE]
+        assert [row.to_model() for row in table] == models
+
+    @pytest.mark.unit
+    def test_row_view_is_zero_copy(self):
+        # Arrange
+        table = ToolkitStateTable(3)
+        row = table[-1]
+        # Act
+        row.scenario = Scenario.MAX_HEIGHT_PITCH
+        row.wall_heights[(None, LengthType.MAX_HEIGHT)].length = "20'"
+        row.pitch[SunroomSide.B_SIDE].pitch_value = '6'
+        table.lengths[2, LENGTH_COLUMNS[(None, LengthType.OVERHANG)]] = 12
+        # Assert
+        assert table.scenario[2] == encode(Scenario.MAX_HEIGHT_PITCH)
+        assert table.lengths[2, LENGTH_COLUMNS[(None, LengthType.MAX_HEIGHT)]] == 240
+        assert table.length_modified[2, LENGTH_COLUMNS[(None, LengthType.MAX_HEIGHT)]]
+        assert table.pitch[2, 1] == pytest.approx(atan(0.5))
+        assert row.overhang.length == 12
+        assert row.pitch[SunroomSide.B_SIDE].ratio == pytest.approx(6)
+        assert table[0].scenario is None
+        with pytest.raises(IndexError):
+            table[3]
+
+    @pytest.mark.unit
+    def test_row_view_validates(self):
+        row = ToolkitStateTable(1)[0]
+        with pytest.raises(ValueError):
+            row.pitch[SunroomSide.B_SIDE].pitch_value = '21'
+        with pytest.raises(ValueError):
+            row.overhang.length = '-1'
+        assert not row.table.length_modified.any()
+
+    @pytest.mark.unit
+    def test_default_state(self):
+        # Arrange
+        table = ToolkitStateTable.from_models([ready_model(Scenario.WALL_HEIGHT_PITCH, SunroomType.CATHEDRAL)])
+        # Act
+        table[0].default_state()
+        # Assert
+        assert table[0].to_model() == ToolkitStateModel()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("scenario, sunroom_type", list(product(Scenario, SunroomType)))
+    def test_calculation_ready_matches_model(self, scenario, sunroom_type):
+        # Arrange: one row per input left out, plus one complete row.
+        models = []
+        for key in LENGTH_COLUMNS:
+            model = ready_model(scenario, sunroom_type)
+            length = {LengthType.OVERHANG: model.overhang, LengthType.THICKNESS: model.thickness}.get(key[1])
+            if length is None:
+                length = (model.floor_walls[key[0]] if key[1] == LengthType.WALL_WIDTH else model.wall_heights[key])
+            length.modified = False
+            models.append(model)
+        for sunroom_side in SunroomSide:
+            model = ready_model(scenario, sunroom_type)
+            model.pitch[sunroom_side].modified = False
+            models.append(model)
+        for name in ("roofing_type", "end_cuts", "scenario"):
+            model = ready_model(scenario, sunroom_type)
+            setattr(model, name, None)
+            models.append(model)
+        models.append(ready_model(scenario, sunroom_type))
+        expected = {}
+        for row, model in enumerate(models):
+            try:
+                model.check_calculation_ready()
+            except MissingInputsError as err:
+                expected[row] = err.missing
+        table = ToolkitStateTable.from_models(models)
+        # Act
+        ready = table.calculation_ready()
+        # Assert
+        assert [row for row in range(len(models)) if not ready[row]] == list(expected)
+        assert table.validation_errors() == expected
+
+    @pytest.mark.integration
+    def test_scenario_on_row(self):
+        # Arrange
+        table = ToolkitStateTable.from_models([ToolkitStateModel(),
+                                               ready_model(Scenario.WALL_HEIGHT_PITCH, SunroomType.STUDIO)])
+        row = table[1]
+        # Act
+        ScenarioSelector(row).identify_scenario(SunroomModel()).calculate_sunroom_properties()
+        # Assert
+        assert ScenarioInputs.from_toolkit_state(row).wall_height_b == 120
+        assert row.wall_heights[(None, LengthType.PEAK_HEIGHT)].length == pytest.approx(220)
+        assert table.lengths[1, LENGTH_COLUMNS[(None, LengthType.PEAK_HEIGHT)]] == pytest.approx(220)
+        assert table.lengths[0].sum() == 0
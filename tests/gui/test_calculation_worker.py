@@ -0,0 +1,237 @@
+import pytest
+import threading
+from math import atan
+
+from livingspacetoolkit.controllers.calculation_worker import CalculationRequest, CalculationRunner
+from livingspacetoolkit.lib.root_finding import ConvergenceError
+from livingspacetoolkit.lib.solve_cache import calculate_sunroom
+from livingspacetoolkit.lib.toolkit_enums import (Scenario, SunroomType, SunroomSide, LengthType, EndCutType,
+                                                  RoofingType, PitchType)
+from livingspacetoolkit.models import ToolkitStateModel
+
+
+def studio_state(toolkit_state: ToolkitStateModel | None = None) -> ToolkitStateModel:
+    """Fills in a studio for WALL_HEIGHT_PITCH, in toolkit_state or a new model."""
+    if toolkit_state is None:
+        toolkit_state = ToolkitStateModel(sunroom_type=SunroomType.STUDIO, scenario=Scenario.WALL_HEIGHT_PITCH)
+    toolkit_state.end_cuts = EndCutType.UNCUT_TOP_BOTTOM
+    toolkit_state.roofing_type = RoofingType.ECO_GREEN
+    toolkit_state.overhang.length = 12
+    toolkit_state.thickness.length = 6
+    for side in SunroomSide:
+        toolkit_state.floor_walls[side].length = 120
+    toolkit_state.pitch[SunroomSide.B_SIDE].radians = atan(10 / 12)
+    toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.WALL_HEIGHT)].length = 120
+    return toolkit_state
+
+
+def steep_studio_state(toolkit_state: ToolkitStateModel | None = None) -> ToolkitStateModel:
+    """A studio for WALL_HEIGHT_PEAK_HEIGHT that solves to about 60.14 degrees. That is under the 21/12 ratio limit and
+    over the 60 degree angle limit."""
+    toolkit_state = studio_state(toolkit_state)
+    toolkit_state.scenario = Scenario.WALL_HEIGHT_PEAK_HEIGHT
+    toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.WALL_HEIGHT)].length = 96
+    toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 305
+    return toolkit_state
+
+
+@pytest.fixture()
+def runner(qtbot):
+    runner = CalculationRunner()
+    yield runner
+    runner.cancel()
+    runner.wait()
+
+
+class TestCalculationRunner:
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_results_come_back_on_the_gui_thread(self, qtbot, runner):
+        # Arrange
+        toolkit_state = studio_state()
+        threads = []
+        runner.finished.connect(lambda *args: threads.append(threading.current_thread()))
+        # Act
+        with qtbot.waitSignal(runner.finished) as finished:
+            request = runner.submit(toolkit_state)
+        # Assert
+        assert finished.args[0] is request
+        assert finished.args[1] == calculate_sunroom(request.inputs)
+        assert threads == [threading.main_thread()]
+        assert not runner.busy
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_works_on_a_snapshot(self, qtbot, runner):
+        # Arrange
+        toolkit_state = studio_state()
+        # Act
+        with qtbot.waitSignal(runner.finished) as finished:
+            request = runner.submit(toolkit_state)
+            toolkit_state.overhang.length = 24
+        # Assert
+        assert request.inputs.overhang == 12
+        assert finished.args[1].outputs == calculate_sunroom(request.inputs).outputs
+        assert not request.matches(toolkit_state)
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_a_new_calculation_cancels_the_old_one(self, qtbot, runner):
+        # Arrange
+        toolkit_state = studio_state()
+        generations = []
+        runner.finished.connect(lambda request, result: generations.append(request.generation))
+        # Act
+        with qtbot.waitSignal(runner.finished):
+            runner.submit(toolkit_state)
+            toolkit_state.overhang.length = 24
+            runner.submit(toolkit_state)
+        runner.wait()
+        qtbot.wait(10)
+        # Assert
+        assert generations == [2]
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_only_changed_stages_are_rerun(self, qtbot, runner):
+        # Arrange
+        toolkit_state = studio_state()
+        calculate = runner.calculator.calculate
+        ran = []
+        runner.calculator.calculate = lambda: ran.append(calculate()) or ran[-1]
+        with qtbot.waitSignal(runner.finished):
+            runner.submit(toolkit_state)
+        toolkit_state.fascia = True
+        # Act
+        with qtbot.waitSignal(runner.finished) as finished:
+            request = runner.submit(toolkit_state)
+        toolkit_state.scenario = Scenario.WALL_HEIGHT_PEAK_HEIGHT
+        toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 160
+        with qtbot.waitSignal(runner.finished) as other_scenario:
+            other_request = runner.submit(toolkit_state)
+        # Assert
+        assert ran[1] == ["fascia", "bill_of_materials"]
+        assert finished.args[1] == calculate_sunroom(request.inputs, RoofingType.ECO_GREEN, True)
+        assert len(ran[2]) == len(ran[0])
+        assert other_scenario.args[1] == calculate_sunroom(other_request.inputs, RoofingType.ECO_GREEN, True)
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_a_solved_pitch_is_checked_against_its_pitch_type(self, qtbot, runner):
+        # Arrange
+        toolkit_state = steep_studio_state()
+        with qtbot.waitSignal(runner.finished):
+            runner.submit(toolkit_state)
+        toolkit_state.pitch[SunroomSide.B_SIDE].pitch_type = PitchType.ANGLE
+        # Act: The first is a cache hit and the second is solved again.
+        with qtbot.waitSignal(runner.failed) as cached:
+            runner.submit(toolkit_state)
+        runner.cache.clear()
+        with qtbot.waitSignal(runner.failed) as solved:
+            runner.submit(toolkit_state)
+        # Assert
+        assert isinstance(cached.args[1], ValueError)
+        assert isinstance(solved.args[1], ValueError)
+        assert "Angle is too high" in str(solved.args[1])
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_failures(self, qtbot, runner):
+        # Arrange
+        toolkit_state = studio_state()
+        toolkit_state.scenario = Scenario.DRIP_EDGE_PEAK_HEIGHT
+        toolkit_state.wall_heights[(None, LengthType.PEAK_HEIGHT)].length = 100
+        toolkit_state.wall_heights[(SunroomSide.B_SIDE, LengthType.DRIP_EDGE_HEIGHT)].length = 120
+        # Act
+        with qtbot.waitSignal(runner.failed) as failed:
+            runner.submit(toolkit_state)
+        # Assert
+        assert isinstance(failed.args[1], ConvergenceError)
+
+
+class TestBackgroundResults:
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_results_for_changed_inputs_are_dropped(self, qtbot, main_window, mock_warning):
+        # Arrange
+        controller = main_window.tabs_controller
+        main_window.scenarios_view.radio1.click()
+        studio_state(main_window.toolkit_state)
+        # Act
+        with qtbot.waitSignal(controller.calculation_runner.finished):
+            main_window.results_view.calculate_button.click()
+            assert main_window.results_view.results_view.toPlainText() == "Calculating..."
+            main_window.toolkit_state.overhang.length = 24
+        # Assert
+        assert main_window.results_view.results_view.toPlainText() == ""
+        assert mock_warning == {}
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_editing_an_input_cancels_the_calculation(self, qtbot, main_window, mock_warning):
+        # Arrange
+        controller = main_window.tabs_controller
+        overhang_edit = main_window.tabs_view.studio_view.sunroom_roof.overhang_edit
+        main_window.scenarios_view.radio1.click()
+        studio_state(main_window.toolkit_state)
+        # Act
+        with qtbot.assertNotEmitted(controller.calculation_runner.finished, wait=100):
+            main_window.results_view.calculate_button.click()
+            overhang_edit.setText("24")
+            overhang_edit.editingFinished.emit()
+            # Assert
+            assert not controller.calculation_runner.busy
+        assert main_window.results_view.results_view.toPlainText() == ""
+        assert mock_warning == {}
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_an_input_left_unchanged_keeps_the_calculation(self, qtbot, main_window, mock_warning):
+        # Arrange
+        controller = main_window.tabs_controller
+        overhang_edit = main_window.tabs_view.studio_view.sunroom_roof.overhang_edit
+        main_window.scenarios_view.radio1.click()
+        studio_state(main_window.toolkit_state)
+        overhang_edit.setText("12")
+        # Act
+        with qtbot.waitSignal(controller.calculation_runner.finished):
+            main_window.results_view.calculate_button.click()
+            overhang_edit.editingFinished.emit()
+            assert controller.calculation_runner.busy
+        # Assert
+        assert main_window.results_view.results_view.toPlainText().startswith("Now listing results.")
+        assert mock_warning == {}
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_changing_tabs_cancels_the_calculation(self, qtbot, main_window, mock_warning):
+        # Arrange
+        controller = main_window.tabs_controller
+        main_window.scenarios_view.radio1.click()
+        studio_state(main_window.toolkit_state)
+        # Act
+        with qtbot.assertNotEmitted(controller.calculation_runner.finished, wait=100):
+            main_window.results_view.calculate_button.click()
+            main_window.tabs_view.setCurrentIndex(1)
+        # Assert
+        assert main_window.results_view.results_view.toPlainText() == ""
+        assert mock_warning == {}
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_results_that_cannot_be_shown_are_a_warning(self, qtbot, main_window, mock_warning):
+        # Arrange: Solved with the ratio limit, then shown for a state that writes its pitch as an angle.
+        controller = main_window.tabs_controller
+        main_window.scenarios_view.radio1.click()
+        steep_studio_state(main_window.toolkit_state)
+        main_window.toolkit_state.pitch[SunroomSide.B_SIDE].pitch_type = PitchType.ANGLE
+        request = CalculationRequest.snapshot(main_window.toolkit_state, 1)
+        result = calculate_sunroom(request.inputs, request.roofing_type, request.fascia)
+        main_window.results_view.update_text("Calculating...")
+        # Act
+        controller.handle_calculation_finished(request, result)
+        # Assert
+        assert main_window.results_view.results_view.toPlainText() == ""
+        assert "Angle is too high" in mock_warning["text"]
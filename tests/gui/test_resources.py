@@ -0,0 +1,59 @@
+import pytest
+import xml.etree.ElementTree as ElementTree
+
+from PySide6.QtCore import QResource
+from PySide6.QtGui import QPixmap
+
+from livingspacetoolkit.resources import QRC_FILE, build_resources, register_resources
+from livingspacetoolkit.views.diagram_label import DiagramLabel
+
+ALIASES = [file.get("alias") for file in ElementTree.parse(QRC_FILE).getroot().iter("file")]
+
+
+class TestResources:
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    @pytest.mark.parametrize("alias", ALIASES)
+    def test_compiled_resources_have_every_image(self, qtbot, alias):
+        # Act
+        registered = register_resources()
+        # Assert
+        assert registered
+        assert not QPixmap(f":/LivingSpace/{alias}").isNull()
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_build_resources(self, qtbot, tmp_path):
+        # Act
+        rcc_file = build_resources(rcc_file=tmp_path / "resources.rcc")
+        # Assert
+        assert QResource.registerResource(str(rcc_file), "/rebuilt")
+        assert not QPixmap(f":/rebuilt/LivingSpace/{ALIASES[0]}").isNull()
+        assert QResource.unregisterResource(str(rcc_file), "/rebuilt")
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_missing_resources(self, tmp_path):
+        assert not register_resources(tmp_path / "missing.rcc")
+
+
+class TestDiagrams:
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_diagrams_load_when_their_tab_is_shown(self, qtbot, main_window):
+        # Arrange
+        register_resources()
+        studio = main_window.tabs_view.studio_view.findChildren(DiagramLabel)
+        cathedral = main_window.tabs_view.cathedral_view.findChildren(DiagramLabel)
+        assert len(studio) == len(cathedral) == 2
+        assert not any(label.loaded for label in studio + cathedral)
+        # Act
+        main_window.show()
+        qtbot.waitExposed(main_window)
+        # Assert
+        assert all(label.loaded for label in studio)
+        assert not any(label.loaded for label in cathedral)
+        main_window.tabs_view.setCurrentIndex(1)
+        assert all(label.loaded and not label.pixmap().isNull() for label in cathedral)
@@ -50,8 +50,9 @@ They were divided in half because the original length was longer than 216 in.
 There are 2 pieces of Fascia at 118.0 in. each for the B wall
 Their original length was more than 216 in. so they were cut in half.
 There is one piece of Fascia at 174 in. for the A Wall and one piece at 174 for the C wall."""
-        # Act
-        main_window.results_view.calculate_button.click()
+        # Act: The calculation runs in the background and the results are shown when it finishes
+        with qtbot.waitSignal(main_window.tabs_controller.calculation_runner.finished):
+            main_window.results_view.calculate_button.click()
 
         assert main_window.results_view.results_view.toPlainText() == expected.strip()
 
@@ -115,7 +116,8 @@ There is 1 pieces of Fascia at 166 in. for the A wall
 There is 1 pieces of Fascia at 166 in. for the C wall
 There is 1 pieces of Fascia for the A side B Wall at 114 in.
 There is 1 pieces of Fascia for the C side B Wall at 114 in."""
-        # Act
-        main_window.results_view.calculate_button.click()
+        # Act: The calculation runs in the background and the results are shown when it finishes
+        with qtbot.waitSignal(main_window.tabs_controller.calculation_runner.finished):
+            main_window.results_view.calculate_button.click()
 
         assert main_window.results_view.results_view.toPlainText() == expected
\ No newline at end of file
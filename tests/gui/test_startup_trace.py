@@ -0,0 +1,27 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+
+
+class TestStartupTrace:
+
+    @pytest.mark.gui
+    @pytest.mark.e2e
+    def test_trace_startup(self, tmp_path):
+        # Arrange
+        report = tmp_path / "startup.json"
+        # The platform is given on the command line, so the app only starts if the arguments reach Qt.
+        env = os.environ | {"HOME": str(tmp_path), "XDG_STATE_HOME": str(tmp_path / "state")}
+        env.pop("QT_QPA_PLATFORM", None)
+        # Act
+        subprocess.run([sys.executable, "-m", "livingspacetoolkit.main", "--trace-startup", str(report),
+                        "--quit-after-startup", "-platform", "offscreen"], capture_output=True, env=env, timeout=60)
+        # Assert
+        trace = json.loads(report.read_text())
+        phases = [phase["name"] for phase in trace["phases"]]
+        assert phases == ["import_pyside6", "import_toolkit", "configure_logging", "create_application",
+                          "register_resources", "apply_theme", "create_main_window", "show", "set_to_default_state"]
+        last = trace["phases"][-1]
+        assert trace["first_paint_ms"] >= last["start_ms"] + last["duration_ms"]
@@ -0,0 +1,54 @@
+import pytest
+
+from livingspacetoolkit.lib.toolkit_enums import SunroomType
+
+
+class TestLazyTabs:
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_only_the_open_tab_is_made_at_startup(self, qtbot, main_window):
+        # Assert
+        assert list(main_window.tabs_view.sunroom_views) == [SunroomType.STUDIO]
+        assert list(main_window.tabs_controller.sunroom_controllers) == [SunroomType.STUDIO]
+        assert main_window.tabs_view.placeholders[SunroomType.CATHEDRAL].layout().count() == 0
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_opening_a_tab_makes_its_view_and_controller(self, qtbot, main_window):
+        # Arrange
+        main_window.scenarios_view.radio1.click()
+        # Act
+        with qtbot.waitSignal(main_window.tabs_view.sunroom_view_created) as created:
+            main_window.tabs_view.setCurrentIndex(1)
+        main_window.scenarios_view.radio1.click()
+        # Assert
+        assert created.args == [SunroomType.CATHEDRAL]
+        assert main_window.toolkit_state.sunroom_type == SunroomType.CATHEDRAL
+        cathedral_view = main_window.tabs_view.cathedral_view
+        assert main_window.tabs_view.placeholders[SunroomType.CATHEDRAL].layout().itemAt(0).widget() is cathedral_view
+        assert main_window.tabs_controller.cathedral_controller.view is cathedral_view
+        assert cathedral_view.sunroom_floor.wall_a.isEnabled()
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_a_tab_is_only_made_once(self, qtbot, main_window):
+        # Arrange
+        main_window.tabs_view.setCurrentIndex(1)
+        cathedral_controller = main_window.tabs_controller.cathedral_controller
+        # Act
+        with qtbot.assertNotEmitted(main_window.tabs_view.sunroom_view_created):
+            main_window.tabs_view.setCurrentIndex(0)
+            main_window.tabs_view.setCurrentIndex(1)
+        # Assert
+        assert main_window.tabs_controller.cathedral_controller is cathedral_controller
+        assert main_window.toolkit_state.sunroom_type == SunroomType.CATHEDRAL
+
+    @pytest.mark.gui
+    @pytest.mark.integration
+    def test_a_view_asked_for_before_its_tab_is_opened_is_connected(self, qtbot, main_window):
+        # Act
+        cathedral_view = main_window.tabs_view.cathedral_view
+        # Assert
+        assert main_window.tabs_controller.sunroom_controllers[SunroomType.CATHEDRAL].view is cathedral_view
+        assert not cathedral_view.sunroom_floor.wall_a.isEnabled()